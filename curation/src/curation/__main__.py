@@ -11,7 +11,8 @@ import uvicorn
 from curation import art_root, logs
 from curation.acquisition.mat import MatEngine
 from curation.acquisition.preparation import PreparationSettings
-from curation.acquisition.service import AcquisitionSettings
+from curation.acquisition.queue import AcquisitionQueueSettings
+from curation.acquisition.service import AcquisitionSettings, TileFetcher
 from curation.acquisition.transport import http_stream
 from curation.app import create_app
 from curation.config import Settings
@@ -27,11 +28,15 @@ from curation.discovery.engine import DiscoveryEngine, unavailable_engine
 from curation.discovery.images import ImageSearch
 from curation.discovery.openrouter import OpenRouterClient
 from curation.discovery.phase_one import build_engine
+from curation.discovery.response_cache import ResponseCache
 from curation.persistence.file import open_catalogue_file
+from curation.persistence.profiler import StatementProfiler
 from curation.persistence.sqlite import SqliteCatalogue
 from curation.persistence.sqlite_discovery import SqliteDiscovery
+from curation.providers import ProviderGuard
 from curation.services.container import Services
 from curation.services.display import DisplaySettings
+from curation.services.imaging_pool import ImagingPool
 from curation.services.previews import PreviewSettings
 from curation.services.thumbnails import ThumbnailSettings
 
@@ -45,7 +50,7 @@ NO_KEY: str = (
 )
 
 
-def _engine(settings: Settings) -> DiscoveryEngine:
+def _engine(settings: Settings, guard: ProviderGuard | None = None) -> DiscoveryEngine:
     """The real engine when a key is configured, and an honest refusal when not.
 
     Deliberately not a stand-in. A convincing double reachable from a deployment
@@ -62,10 +67,11 @@ def _engine(settings: Settings) -> DiscoveryEngine:
         max_output_tokens=settings.discovery_max_output_tokens,
         search_results=settings.discovery_search_results,
         search_engine=settings.discovery_search_engine,
+        guard=guard,
     )
 
 
-def _mat_engine(settings: Settings) -> MatEngine:
+def _mat_engine(settings: Settings, imaging: ImagingPool, guard: ProviderGuard | None = None) -> MatEngine:
     """The mat engine, asking a vision model when there is a key to ask with.
 
     **Unlike `_engine` above, no key is not a refusal here.** Discovery with no
@@ -81,11 +87,12 @@ def _mat_engine(settings: Settings) -> MatEngine:
             settings.openrouter_api_key,
             model=settings.mat_model,
             max_output_tokens=settings.mat_max_output_tokens,
+            guard=guard,
         )
-    return MatEngine(client, image_max_edge=settings.mat_image_max_edge)
+    return MatEngine(client, image_max_edge=settings.mat_image_max_edge, imaging=imaging)
 
 
-def _conversation_engine(settings: Settings) -> ConversationEngine:
+def _conversation_engine(settings: Settings, guard: ProviderGuard | None = None) -> ConversationEngine:
     """The engine intent-forming asks, or one that refuses and says why.
 
     **Refuses like `_engine`, rather than falling back like `_mat_engine`.** A mat
@@ -99,10 +106,22 @@ def _conversation_engine(settings: Settings) -> ConversationEngine:
         settings.openrouter_api_key,
         model=settings.conversation_model,
         max_output_tokens=settings.conversation_max_output_tokens,
+        guard=guard,
     )
 
 
-def _image_search(settings: Settings) -> ImageSearch | None:
+def _museum_cache(settings: Settings) -> ResponseCache | None:
+    """Where the museum clients keep their answers, or nothing when no museum is asked.
+
+    One for both clients, because a browse and a search are questions to the
+    same collection and one directory is one budget on the health panel.
+    """
+    if not settings.artic_user_agent:
+        return None
+    return ResponseCache(settings.museum_cache_path)
+
+
+def _image_search(settings: Settings, cache: ResponseCache | None, guard: ProviderGuard | None = None) -> ImageSearch | None:
     """The museum provider phase 2 asks, or nothing when none is configured.
 
     `None` rather than a refusing stand-in, because the two say different things
@@ -117,10 +136,12 @@ def _image_search(settings: Settings) -> ImageSearch | None:
     return build_image_search(
         user_agent=settings.artic_user_agent,
         preview_max_bytes=settings.preview_max_bytes,
+        cache=cache,
+        guard=guard,
     )
 
 
-def _collection(settings: Settings) -> CollectionBrowse | None:
+def _collection(settings: Settings, cache: ResponseCache | None, guard: ProviderGuard | None = None) -> CollectionBrowse | None:
     """The collection a run supplements from, or nothing when none is configured.
 
     Gated on the same identifier as phase 2 and for the same reason: it is the
@@ -130,7 +151,7 @@ def _collection(settings: Settings) -> CollectionBrowse | None:
     """
     if not settings.artic_user_agent:
         return None
-    return build_collection_browse(user_agent=settings.artic_user_agent)
+    return build_collection_browse(user_agent=settings.artic_user_agent, cache=cache, guard=guard)
 
 
 def main(argv: Sequence[str] = ()) -> None:
@@ -228,7 +249,11 @@ def main(argv: Sequence[str] = ()) -> None:
     # Which museum phase 2 asks, and whether it can be asked at all. Logged for
     # the same reason the key's presence is: "is it even configured" is the first
     # question a run stuck at `resolving_images` raises.
-    image_search = _image_search(settings)
+    museum_cache = _museum_cache(settings)
+    # One for the whole process: two runs, a preview and an acquisition asking
+    # the same host are one load on it, and one outage to learn of.
+    providers = ProviderGuard()
+    image_search = _image_search(settings, museum_cache, providers)
     log.info(
         "phase2 image_provider=%s previews=%s preview_sweep=%s",
         "artic" if image_search is not None else "none (ARTIC_USER_AGENT unset)",
@@ -244,13 +269,22 @@ def main(argv: Sequence[str] = ()) -> None:
     # binary is the one dependency this plane does not install, it is resolved off
     # PATH at call time, and a deployment missing it fails every tiled fetch at
     # once — a state worth reading at startup rather than discovering per work.
+    # The in-process fetcher needs no binary, so its absence is only worth a
+    # warning when the binary is the fetcher in use.
     tile_binary = shutil.which(settings.tile_binary)
+    if settings.tile_fetcher is TileFetcher.IIIF:
+        tile_fetcher = f"iiif (in-process, {settings.tile_concurrency} at once)"
+    else:
+        tile_fetcher = tile_binary or f"MISSING ({settings.tile_binary} is not on PATH; tiled acquisition will refuse)"
     log.info(
-        "acquisition originals=%s tile_cache=%s tile_binary=%s min_free=%.1fGiB",
+        "acquisition originals=%s tile_cache=%s tile_fetcher=%s min_free=%.1fGiB workers=%d (tiled %d, direct %d)",
         settings.originals_path,
         settings.tile_cache_path,
-        tile_binary or f"MISSING ({settings.tile_binary} is not on PATH; tiled acquisition will refuse)",
+        tile_fetcher,
         settings.min_free_bytes / (1024**3),
+        settings.acquisition_workers,
+        settings.acquisition_tiled_workers,
+        settings.acquisition_direct_workers,
     )
 
     # Which model chooses mat colours, and where the composed canvases go. Worth
@@ -279,6 +313,29 @@ def main(argv: Sequence[str] = ()) -> None:
         "artic" if settings.artic_user_agent else "none (ARTIC_USER_AGENT unset; names carry no pictures)",
     )
 
+    # Whether the catalogue's statements are being timed, and what counts as
+    # slow. On its own line because a `store.slow_query` event is only ever
+    # absent for one of two reasons, and this is the line that says which.
+    profiler = StatementProfiler(slow_query_ms=settings.slow_query_ms) if settings.store_profiling else None
+    log.info(
+        "store profiling=%s",
+        f"on slow_query={settings.slow_query_ms}ms" if profiler is not None else "off (STORE_PROFILING unset)",
+    )
+
+    # Started lazily, on the first decode; built here so every service shares
+    # one queue and the health panel reads one set of figures.
+    imaging = ImagingPool(
+        workers=settings.imaging_workers,
+        memory_mb=settings.imaging_memory_mb,
+        task_seconds=settings.imaging_task_seconds,
+    )
+    log.info(
+        "imaging workers=%d memory=%dMiB task=%ds",
+        settings.imaging_workers,
+        settings.imaging_memory_mb,
+        settings.imaging_task_seconds,
+    )
+
     # Before anything is created, and before the catalogue is opened. The two
     # steps this replaces were individually reasonable and silent together: a
     # `mkdir(exist_ok=True)` followed by `CREATE TABLE IF NOT EXISTS` turned a
@@ -287,7 +344,7 @@ def main(argv: Sequence[str] = ()) -> None:
     # One connection behind both halves of the model: acceptance promotes a
     # candidate's image instances into a work's sources, and that has to commit
     # once or not at all.
-    catalogue_file = open_catalogue_file(settings.catalogue_path, wall_name=settings.wall_name)
+    catalogue_file = open_catalogue_file(settings.catalogue_path, wall_name=settings.wall_name, profiler=profiler)
     try:
         services = Services.bind(
             catalogue=SqliteCatalogue(catalogue_file),
@@ -299,10 +356,10 @@ def main(argv: Sequence[str] = ()) -> None:
             ),
             thumbnails=ThumbnailSettings(art_root=settings.art_root, directory=settings.thumbnails_path),
             artwork_box=box,
-            engine=_engine(settings),
+            engine=_engine(settings, providers),
             discovery_settings=settings.discovery_settings,
             image_search=image_search,
-            collection=_collection(settings),
+            collection=_collection(settings, museum_cache, providers),
             previews=(
                 None if image_search is None else PreviewSettings(art_root=settings.art_root, directory=settings.previews_path)
             ),
@@ -316,11 +373,18 @@ def main(argv: Sequence[str] = ()) -> None:
                 tile_timeout_seconds=settings.tile_timeout_seconds,
                 max_image_bytes=settings.max_image_bytes,
                 min_free_bytes=settings.min_free_bytes,
+                tile_fetcher=settings.tile_fetcher,
+                tile_concurrency=settings.tile_concurrency,
+            ),
+            acquisition_queue=AcquisitionQueueSettings(
+                workers=settings.acquisition_workers,
+                tiled_workers=settings.acquisition_tiled_workers,
+                direct_workers=settings.acquisition_direct_workers,
             ),
             # The one place a live transport is wired. Everything below the seam
             # takes it as an argument, so this line is what separates a process
             # that can fetch from a suite that cannot.
-            open_stream=http_stream(settings.acquisition_user_agent),
+            open_stream=http_stream(settings.acquisition_user_agent, guard=providers),
             preparation=PreparationSettings(
                 art_root=settings.art_root,
                 ready_path=settings.ready_path,
@@ -333,8 +397,13 @@ def main(argv: Sequence[str] = ()) -> None:
                 # about where the mat ends.
                 box=box,
             ),
-            mat_engine=_mat_engine(settings),
-            conversation_engine=_conversation_engine(settings),
+            mat_engine=_mat_engine(settings, imaging, providers),
+            conversation_engine=_conversation_engine(settings, providers),
+            profiler=profiler,
+            imaging=imaging,
+            storage=settings.storage_budgets,
+            museum_cache=museum_cache,
+            providers=providers,
         )
         # The catalogue file outlives any single version of this code, so rules
         # added since it was written are brought to it here rather than assumed
@@ -351,12 +420,17 @@ def main(argv: Sequence[str] = ()) -> None:
         # reconstructing a run quietly not working. With no config of its own,
         # uvicorn's loggers propagate to the root handler installed above.
         uvicorn.run(
-            create_app(services, preview_sweep_interval_seconds=settings.preview_sweep_interval_seconds),
+            create_app(
+                services,
+                preview_sweep_interval_seconds=settings.preview_sweep_interval_seconds,
+                warm_thumbnails=True,
+            ),
             host=settings.host,
             port=settings.port,
             log_config=None,
         )
     finally:
+        imaging.shutdown()
         catalogue_file.close()
 
 
@@ -0,0 +1,163 @@
+"""Each distinct master image held once, by its content hash, and linked to every work holding it.
+
+A work's original is still at `raw/{artwork_id}.jpg` — the row names that path,
+preparation reads it, and a person looking for a work's image looks there. What
+changed is what the path *is*: a hard link to `raw/by-hash/ab/abcd….jpg`, the
+one copy of those bytes. The same museum image accepted under two works, or
+fetched from two mirrors, is two names for one file rather than two files.
+
+**The link count is the reference count.** A blob linked from no work has a
+link count of one — its own name — and is removed when the work that last held
+it moves to a different image. Nothing else is counted anywhere, so nothing can
+disagree with the filesystem about it.
+
+**A filesystem that cannot link still works, and stores a file per work.** An
+`ART_ROOT` on exFAT, or a blob on a different device from the work's path, has
+no hard links to give; the bytes are then moved or copied to the work's path
+and no blob is kept, which is exactly how originals were held before this
+module. Nothing is shared, and nothing is lost.
+
+**A sync that does not preserve hard links copies each shared image once per
+work**, which costs the receiving side what this saves and no more: `rsync -H`
+keeps them shared.
+"""
+
+import errno
+import logging
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+log = logging.getLogger(__name__)
+
+#: Where the blobs live, under the originals directory. Beside the work paths
+#: rather than elsewhere under `ART_ROOT` because a hard link cannot cross a
+#: device, and the originals directory is the one place both are sure to share.
+BLOBS_DIRNAME: Final[str] = "by-hash"
+
+#: Why a link can be refused by a filesystem that is otherwise fine. Anything
+#: else is a real fault and is raised.
+_CANNOT_LINK: Final[frozenset[int]] = frozenset({errno.EPERM, errno.EXDEV, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP})
+
+
+@dataclass(frozen=True, slots=True)
+class Placed:
+    """How a work's path came to name its image."""
+
+    #: The image was already held — by another work, or by this one before.
+    shared: bool
+    #: The work's path is a link to the blob rather than a file of its own.
+    linked: bool
+
+
+class BlobStore:
+    """The content-addressed originals under one directory."""
+
+    def __init__(self, originals_path: Path) -> None:
+        self._root = originals_path / BLOBS_DIRNAME
+
+    def path_for(self, content_hash: str) -> Path:
+        """Where the image with this hash is held, whether or not it is yet.
+
+        Fanned out by the first two characters, so no one directory holds every
+        original in the collection.
+        """
+        return self._root / content_hash[:2] / f"{content_hash}.jpg"
+
+    def promote(self, staged: Path, *, content_hash: str, destination: Path) -> Placed:
+        """Make `destination` name the staged image, keeping one copy of it.
+
+        The staged file becomes the blob, or is discarded in favour of the blob
+        already holding the same bytes. Either way `destination` is replaced
+        whole, never written into, so a reader sees the old image or the new.
+        """
+        blob = self.path_for(content_hash)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shared = blob.is_file()
+        if shared:
+            staged.unlink(missing_ok=True)
+        else:
+            staged.replace(blob)
+        if _link_over(blob, destination):
+            return Placed(shared=shared, linked=True)
+        if shared:
+            # Unreachable on a filesystem that never links, where no blob is
+            # ever kept; reached when this one destination cannot be linked.
+            _copy_over(blob, destination)
+        else:
+            blob.replace(destination)
+        return Placed(shared=shared, linked=False)
+
+    def place(self, held: Path, *, content_hash: str, destination: Path) -> Placed:
+        """Make `destination` name an image already on disk at `held`, fetching nothing.
+
+        `held` is the blob, or another work's path for an image written before
+        this store — which is adopted as the blob on the way, so the next work
+        wanting it finds it by hash.
+        """
+        blob = self.path_for(content_hash)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        if not blob.is_file():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            if not _link_over(held, blob):
+                if held != destination:
+                    _copy_over(held, destination)
+                return Placed(shared=True, linked=False)
+        if destination.is_file() and os.path.samefile(blob, destination):
+            return Placed(shared=True, linked=True)
+        if _link_over(blob, destination):
+            return Placed(shared=True, linked=True)
+        _copy_over(blob, destination)
+        return Placed(shared=True, linked=False)
+
+    def release(self, content_hash: str) -> bool:
+        """Remove the blob for this hash if no work links it any more, saying whether it went."""
+        blob = self.path_for(content_hash)
+        try:
+            if blob.stat().st_nlink > 1:
+                return False
+            blob.unlink()
+        except FileNotFoundError:
+            return False
+        except OSError as exc:
+            # Left for the next release of the same hash, or for a person: an
+            # unreferenced blob costs disk, and refusing the acquisition that
+            # orphaned it would cost the work its new image.
+            log.warning("could not remove the unreferenced original at %s: %s", blob, exc)
+            return False
+        return True
+
+
+def _link_over(source: Path, destination: Path) -> bool:
+    """Replace `destination` with a hard link to `source`, or say the filesystem refused.
+
+    Linked beside the destination and renamed over it, so the destination's
+    name never stops naming a whole image.
+    """
+    temporary = destination.with_name(f"{destination.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        os.link(source, temporary)
+    except OSError as exc:
+        if exc.errno in _CANNOT_LINK:
+            return False
+        raise
+    try:
+        temporary.replace(destination)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _copy_over(source: Path, destination: Path) -> None:
+    temporary = destination.with_name(f"{destination.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        shutil.copyfile(source, temporary)
+        temporary.replace(destination)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        raise
@@ -6,6 +6,11 @@ land on a memory-capped Pi co-located with the display plane, to do arithmetic
 that is thirty lines and fully specified. The dependency list this plane keeps is
 argued package by package, and none of them could be argued for this.
 
+These are the **scalar reference**: one colour in, one colour out. The mat
+fallback's whole-picture analysis runs the same arithmetic over arrays in
+`palette.py`, which is held to agree with this module rather than re-proving the
+standard on its own.
+
 **Everything is D65 / sRGB.** That is what a JPEG from a museum is, what a
 television shows, and what a model returning "#27285b" means. No colour
 management, no ICC profiles: this product composes one flat colour behind a
@@ -24,16 +29,17 @@ from math import atan2, cos, degrees, exp, hypot, radians, sin, sqrt
 from typing import Final
 
 #: The D65 white point, the reference sRGB is defined against.
-_WHITE_X: Final[float] = 0.95047
-_WHITE_Y: Final[float] = 1.00000
-_WHITE_Z: Final[float] = 1.08883
+WHITE_X: Final[float] = 0.95047
+WHITE_Y: Final[float] = 1.00000
+WHITE_Z: Final[float] = 1.08883
 
-#: The CIE standard's own constants, named rather than inlined so the two places
-#: they appear cannot drift: 216/24389 is the linear/cubic crossover, 841/108 the
-#: linear segment's slope.
-_EPSILON: Final[float] = 216 / 24389
-_KAPPA_SLOPE: Final[float] = 841 / 108
-_KAPPA_OFFSET: Final[float] = 4 / 29
+#: The CIE standard's own constants, named rather than inlined so the places they
+#: appear — here and in `palette`'s array form of the same conversion — cannot
+#: drift: 216/24389 is the linear/cubic crossover, 841/108 the linear segment's
+#: slope.
+LAB_EPSILON: Final[float] = 216 / 24389
+LAB_KAPPA_SLOPE: Final[float] = 841 / 108
+LAB_KAPPA_OFFSET: Final[float] = 4 / 29
 
 
 class ColorError(ValueError):
@@ -93,20 +99,20 @@ def _delinearize(channel: float) -> float:
 
 
 def _f(ratio: float) -> float:
-    return ratio ** (1 / 3) if ratio > _EPSILON else _KAPPA_SLOPE * ratio + _KAPPA_OFFSET
+    return ratio ** (1 / 3) if ratio > LAB_EPSILON else LAB_KAPPA_SLOPE * ratio + LAB_KAPPA_OFFSET
 
 
 def _f_inverse(value: float) -> float:
     cubed = value**3
-    return cubed if cubed > _EPSILON else (value - _KAPPA_OFFSET) / _KAPPA_SLOPE
+    return cubed if cubed > LAB_EPSILON else (value - LAB_KAPPA_OFFSET) / LAB_KAPPA_SLOPE
 
 
 def rgb_to_lab(rgb: tuple[int, int, int]) -> Lab:
     """8-bit sRGB to CIE LAB."""
     red, green, blue = (_linearize(channel / 255) for channel in rgb)
-    x = (0.4124564 * red + 0.3575761 * green + 0.1804375 * blue) / _WHITE_X
-    y = (0.2126729 * red + 0.7151522 * green + 0.0721750 * blue) / _WHITE_Y
-    z = (0.0193339 * red + 0.1191920 * green + 0.9503041 * blue) / _WHITE_Z
+    x = (0.4124564 * red + 0.3575761 * green + 0.1804375 * blue) / WHITE_X
+    y = (0.2126729 * red + 0.7151522 * green + 0.0721750 * blue) / WHITE_Y
+    z = (0.0193339 * red + 0.1191920 * green + 0.9503041 * blue) / WHITE_Z
     fx, fy, fz = _f(x), _f(y), _f(z)
     return Lab(l=116 * fy - 16, a=500 * (fx - fy), b=200 * (fy - fz))
 
@@ -123,9 +129,9 @@ def lab_to_rgb(lab: Lab) -> tuple[int, int, int]:
     fy = (lab.l + 16) / 116
     fx = fy + lab.a / 500
     fz = fy - lab.b / 200
-    x = _f_inverse(fx) * _WHITE_X
-    y = _f_inverse(fy) * _WHITE_Y
-    z = _f_inverse(fz) * _WHITE_Z
+    x = _f_inverse(fx) * WHITE_X
+    y = _f_inverse(fy) * WHITE_Y
+    z = _f_inverse(fz) * WHITE_Z
     red = 3.2404542 * x - 1.5371385 * y - 0.4985314 * z
     green = -0.9692660 * x + 1.8760108 * y + 0.0415560 * z
     blue = 0.0556434 * x - 0.2040259 * y + 1.0572252 * z
@@ -218,6 +224,12 @@ def hex_distance(one: str, two: str) -> float:
 
 
 __all__ = [
+    "LAB_EPSILON",
+    "LAB_KAPPA_OFFSET",
+    "LAB_KAPPA_SLOPE",
+    "WHITE_X",
+    "WHITE_Y",
+    "WHITE_Z",
     "ColorError",
     "Lab",
     "delta_e",
@@ -28,6 +28,13 @@ destination up front — which the binary's refusal to overwrite invites — wou
 a re-fetch that then failed had already destroyed the image the work was
 displaying, while its `Original` row went on naming the deleted file.
 
+**A running fetch is watched, not waited on.** The binary says nothing useful
+until it exits, and a walk over hundreds of tiles can take the whole timeout —
+so progress is read from what it leaves behind while it runs: each tile it
+saves lands in the tile cache, and each tile it cannot get is a warning on
+stderr. Those two counts are reported as they change, and a server refusing
+nearly every tile it is asked for is stopped at once rather than waited out.
+
 **The binary is never given a shell, and never an unvalidated argument.** Its input
 argument accepts a local path as readily as a URL, so callers pass URLs that have
 already been through the fetch policy. `stdin` is closed and `--image-index` is
@@ -37,13 +44,20 @@ block on or answer with EOF, which it reports as a silent success.
 """
 
 import logging
+import os
 import re
 import shutil
 import subprocess
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Final
+from typing import IO, Final
+
+from curation.acquisition.witness import Witnessed
 
 log = logging.getLogger(__name__)
 
@@ -51,6 +65,24 @@ log = logging.getLogger(__name__)
 #: to decide whether the fetch worked — that question is answered by the file.
 _PARTIAL: Final[re.Pattern[str]] = re.compile(r"Only (\d+) tiles? out of (\d+) could be downloaded")
 
+#: A line on stderr saying one tile could not be had. Matched loosely — a
+#: warning or error that names a tile — because the wording is a log line, not
+#: an interface; the summary line above is excluded, since it counts tiles
+#: rather than being one.
+_TILE_REFUSED: Final[re.Pattern[str]] = re.compile(r"\[\s*(?:WARN|ERROR)\s*\].*\btiles?\b", re.IGNORECASE)
+
+#: How often a running fetch is looked at. Often enough that a poll reads as
+#: live; rarely enough that listing a cache of a few thousand tiles costs
+#: nothing a Pi would notice.
+_POLL_SECONDS: Final[float] = 0.5
+
+#: The last tile answers judged together, and the share of them refused that
+#: means the server is refusing rather than stumbling. Thirty-two, so a handful
+#: of transient failures in a healthy walk never fills it; nine in ten, so a
+#: server letting the odd tile through is still recognised for what it is.
+REFUSAL_WINDOW: Final[int] = 32
+REFUSAL_RATIO: Final[float] = 0.9
+
 #: Which image to take when a source offers several. Always passed: omitting it is
 #: what sends the binary to an interactive prompt inside a service.
 _IMAGE_INDEX: Final[str] = "0"
@@ -74,6 +106,10 @@ class TileResult:
     tiles_fetched: int | None
     tiles_expected: int | None
     detail: str
+    #: The stitched file's hash and head, when the fetcher wrote it itself and
+    #: could watch it being written. The binary writes its own, so this is
+    #: always `None` from `tile_fetch` and the service reads the file once.
+    witnessed: Witnessed | None = None
 
     @property
     def usable(self) -> bool:
@@ -81,6 +117,52 @@ class TileResult:
         return self.outcome in (TileOutcome.COMPLETE, TileOutcome.PARTIAL)
 
 
+@dataclass(frozen=True, slots=True)
+class TileProgress:
+    """How far a tiled fetch has got, as it goes.
+
+    `tiles_expected` is `None` until the fetcher knows it: the binary says only
+    at the end, the in-process fetcher as soon as it has read the grid.
+    """
+
+    tiles_fetched: int
+    tiles_refused: int
+    tiles_expected: int | None = None
+
+
+#: Told each new `TileProgress`, from the thread running the fetch.
+TileProgressSink = Callable[[TileProgress], None]
+
+
+class RefusalWindow:
+    """The last few tile answers, and whether they say the server is refusing.
+
+    Shared by both tile fetchers, so "stopped early" means the same thing
+    whichever of them a deployment runs.
+    """
+
+    def __init__(self, size: int = REFUSAL_WINDOW, ratio: float = REFUSAL_RATIO) -> None:
+        self._answers: deque[bool] = deque(maxlen=size)
+        self._ratio = ratio
+
+    def record(self, *, arrived: int = 0, refused: int = 0) -> None:
+        # Refusals first: within one look at the fetch, the tiles that did
+        # arrive are the more recent news, and a server sending tiles now is
+        # not one to give up on.
+        self._answers.extend([True] * refused + [False] * arrived)
+
+    @property
+    def refusing(self) -> bool:
+        full = len(self._answers) == self._answers.maxlen
+        return full and sum(self._answers) >= self._ratio * len(self._answers)
+
+    def describe(self) -> str:
+        return (
+            f"the image service refused {sum(self._answers)} of the last {len(self._answers)} tiles; "
+            "stopped early rather than waiting out the timeout"
+        )
+
+
 class DezoomifyUnavailable(RuntimeError):
     """The binary is not installed or not on `PATH`.
 
@@ -101,11 +183,13 @@ def tile_fetch(
     max_height: int,
     timeout_seconds: int,
     referer: str | None = None,
+    progress: TileProgressSink | None = None,
 ) -> TileResult:
     """Fetch a tiled image beside `destination`, reporting what actually arrived.
 
     Returns the **staged** path, not `destination`. Promoting it is the caller's
-    step; see the module docstring.
+    step; see the module docstring. `progress` is told each change in the tile
+    counts while the binary runs.
 
     `url` must already have passed the fetch policy; nothing here re-checks it,
     because a second opinion in a second place is how the two come to disagree.
@@ -163,26 +247,23 @@ def tile_fetch(
     # holds if `ALLOWED_SCHEMES` widens or a second caller arrives unguarded.
     argv += ["--", url, str(staged)]
 
-    try:
-        completed = subprocess.run(  # noqa: S603 - argv list, no shell, resolved binary
-            argv,
-            stdin=subprocess.DEVNULL,
-            capture_output=True,
-            timeout=timeout_seconds,
-            check=False,
-        )
-    except subprocess.TimeoutExpired:
+    run = _watch(argv, tile_cache=tile_cache, timeout_seconds=timeout_seconds, progress=progress)
+    if run.stopped is not None:
+        # Killed mid-walk, so whatever the binary left is not an image. The
+        # tiles it did save stay in the cache, which is what makes the retry
+        # after a refusing server recovers cheap.
         _discard(staged)
+        log.info("tile fetch of %s stopped early: %s", url, run.stopped)
         return TileResult(
             outcome=TileOutcome.FAILED,
             path=None,
             byte_size=0,
-            tiles_fetched=None,
+            tiles_fetched=run.fetched,
             tiles_expected=None,
-            detail=f"the tile fetch did not finish within {timeout_seconds}s",
+            detail=run.stopped,
         )
 
-    messages = completed.stderr.decode("utf-8", errors="replace")
+    messages = run.messages
     fetched, expected = _tile_counts(messages)
     size = staged.stat().st_size if staged.exists() else 0
 
@@ -197,7 +278,7 @@ def tile_fetch(
             byte_size=0,
             tiles_fetched=fetched,
             tiles_expected=expected,
-            detail=_failure_detail(messages, completed.returncode),
+            detail=_failure_detail(messages, run.returncode),
         )
 
     if fetched is not None and expected is not None and fetched < expected:
@@ -211,7 +292,7 @@ def tile_fetch(
             detail=f"{fetched} of {expected} tiles arrived; the image has gaps",
         )
 
-    if completed.returncode != 0:
+    if run.returncode != 0:
         # An image, a non-zero exit, and no tile counts to read. The binary said
         # something went wrong in wording this code does not recognise — a
         # rephrased message in a later release is the likely cause, and this is
@@ -222,7 +303,7 @@ def tile_fetch(
         # `ok` and reclaims the tiles that would have made the retry cheap.
         # Partial overstates at worst — the work is still held and still shown,
         # and the curator is told a retry may improve it.
-        log.warning("tile fetch of %s exited %s with an image and no tile counts", url, completed.returncode)
+        log.warning("tile fetch of %s exited %s with an image and no tile counts", url, run.returncode)
         return TileResult(
             outcome=TileOutcome.PARTIAL,
             path=staged,
@@ -231,7 +312,7 @@ def tile_fetch(
             tiles_expected=None,
             detail=(
                 f"the fetch reported a problem this version does not recognise "
-                f"(exit {completed.returncode}); the image may have gaps"
+                f"(exit {run.returncode}); the image may have gaps"
             ),
         )
 
@@ -258,6 +339,90 @@ def reclaim_tile_cache(tile_cache: Path) -> None:
     shutil.rmtree(tile_cache, ignore_errors=True)
 
 
+@dataclass(frozen=True, slots=True)
+class _Run:
+    """How the binary's run ended, and what it said on the way."""
+
+    returncode: int
+    messages: str
+    fetched: int
+    #: Why the run was killed before it finished, or `None` if it was not.
+    stopped: str | None
+
+
+def _watch(argv: list[str], *, tile_cache: Path, timeout_seconds: int, progress: TileProgressSink | None) -> _Run:
+    """Run the binary, reporting its progress and stopping it if it is refused.
+
+    Stderr is drained by a thread of its own, because a pipe nobody reads fills
+    and stalls the binary mid-walk; the loop here only ever reads what that
+    thread has already collected.
+    """
+    process = subprocess.Popen(  # noqa: S603 - argv list, no shell, resolved binary
+        argv,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    lines: list[str] = []
+    reader = threading.Thread(target=_drain, args=(process.stderr, lines), daemon=True)
+    reader.start()
+
+    deadline = time.monotonic() + timeout_seconds
+    window = RefusalWindow()
+    already = _cached_tiles(tile_cache)
+    read = refused = 0
+    fetched = already
+    reported: TileProgress | None = None
+    stopped: str | None = None
+    while True:
+        try:
+            process.wait(timeout=_POLL_SECONDS)
+            finished = True
+        except subprocess.TimeoutExpired:
+            finished = False
+
+        said, read = lines[read:], len(lines)
+        newly_refused = sum(1 for line in said if _TILE_REFUSED.search(line) and not _PARTIAL.search(line))
+        cached = _cached_tiles(tile_cache)
+        window.record(arrived=max(0, cached - fetched), refused=newly_refused)
+        fetched, refused = max(fetched, cached), refused + newly_refused
+        current = TileProgress(tiles_fetched=fetched, tiles_refused=refused)
+        if progress is not None and current != reported:
+            progress(current)
+            reported = current
+
+        if finished:
+            break
+        if window.refusing:
+            stopped = window.describe()
+        elif time.monotonic() >= deadline:
+            stopped = f"the tile fetch did not finish within {timeout_seconds}s"
+        if stopped is not None:
+            process.kill()
+            process.wait()
+            break
+
+    # Bounded after a kill: anything the binary spawned may hold the pipe open
+    # past its death, and nothing it says after being stopped is read anyway.
+    reader.join(timeout=None if stopped is None else _POLL_SECONDS)
+    return _Run(returncode=process.returncode, messages="".join(lines), fetched=fetched, stopped=stopped)
+
+
+def _drain(stream: IO[bytes], lines: list[str]) -> None:
+    with stream:
+        for raw in iter(stream.readline, b""):
+            lines.append(raw.decode("utf-8", errors="replace"))
+
+
+def _cached_tiles(tile_cache: Path) -> int:
+    """How many tiles the cache holds, which is how many the binary has saved."""
+    try:
+        with os.scandir(tile_cache) as entries:
+            return sum(1 for entry in entries if entry.is_file())
+    except OSError:
+        return 0
+
+
 def _tile_counts(messages: str) -> tuple[int | None, int | None]:
     match = _PARTIAL.search(messages)
     if match is None:
@@ -18,21 +18,70 @@ is one rule in one place because both fetch paths need it and the failure it
 prevents is the same either way — a failed *re*-fetch must not cost a work the
 image it was already displaying, and `Original` must never name a file that is not
 there.
+
+**An interrupted fetch is resumed, not restarted, when the server allows it.** A
+read timeout three hundred megabytes into a museum TIFF used to cost all three
+hundred. When the transport says the body can be asked for by range, and names
+it with a validator — a strong `ETag`, or `Last-Modified` — the staged bytes are
+kept beside a note of the URL and validator, and the next attempt asks for the
+rest with `If-Range`. A server whose file has changed since answers with the
+whole body, which simply starts the file again; nothing here has to guess
+whether the two halves belong together.
 """
 
-import hashlib
+import json
 import logging
-from collections.abc import Callable, Iterator
+from collections.abc import Iterator
 from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Final, Protocol
+
+from curation.acquisition.witness import Witness, Witnessed
 
 log = logging.getLogger(__name__)
 
-#: Opens a URL and yields its body in chunks. A seam rather than a direct httpx
-#: call so this module can be tested without a network, and so the transport can
-#: be shared with whatever else needs one.
-StreamOpener = Callable[[str], AbstractContextManager[Iterator[bytes]]]
+#: Read back when a resumed fetch re-hashes the bytes it already holds.
+_REHASH_BYTES: Final[int] = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeFrom:
+    """Where an interrupted fetch stopped, and what the server called the file."""
+
+    offset: int
+    #: Sent as `If-Range`: the server sends the rest only if this still names
+    #: the file it is serving.
+    validator: str
+
+
+@dataclass(frozen=True, slots=True)
+class ServedBody:
+    """A body as the transport served it, when it has more to say than bytes.
+
+    An opener may yield a plain iterator of chunks, which is a whole body that
+    cannot be resumed. This is the same iterator with where it starts in the
+    file, and the validator to resume it by if the server offered one.
+    """
+
+    chunks: Iterator[bytes]
+    offset: int = 0
+    validator: str | None = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+
+class StreamOpener(Protocol):
+    """Opens a URL and yields its body in chunks.
+
+    A seam rather than a direct httpx call so this module can be tested without
+    a network, and so the transport can be shared with whatever else needs one.
+    `resume` is passed only when there is something to resume, so an opener
+    that never offers a validator is never asked for a range.
+    """
+
+    def __call__(self, url: str, /, *, resume: ResumeFrom | None = None) -> AbstractContextManager[Iterator[bytes]]: ...
 
 
 @dataclass(frozen=True, slots=True)
@@ -40,14 +89,23 @@ class DirectResult:
     """What arrived, or why nothing did."""
 
     path: Path | None
-    byte_size: int
-    content_hash: str | None
     detail: str
+    #: Everything promotion needs to know about the staged file, learnt while it
+    #: was written; `None` exactly when nothing arrived.
+    witnessed: Witnessed | None = None
 
     @property
     def usable(self) -> bool:
         return self.path is not None
 
+    @property
+    def byte_size(self) -> int:
+        return 0 if self.witnessed is None else self.witnessed.byte_size
+
+    @property
+    def content_hash(self) -> str | None:
+        return None if self.witnessed is None else self.witnessed.content_hash
+
 
 def direct_fetch(
     url: str,
@@ -61,21 +119,29 @@ def direct_fetch(
     Returns the **staged** path, not `destination`; see the module docstring for
     why nothing here promotes it.
 
-    `url` must already have passed the fetch policy. The hash is computed while
-    the bytes stream past rather than by re-reading the file afterwards: the file
-    is potentially very large, and re-reading it to hash it is a second pass over
-    the slowest device in the deployment.
+    `url` must already have passed the fetch policy. The hash, and the head the
+    image is measured from, are taken while the bytes stream past rather than by
+    re-reading the file afterwards: the file is potentially very large, and
+    re-reading it is a second pass over the slowest device in the deployment. A
+    resumed fetch reads back only the part it kept.
     """
     destination.parent.mkdir(parents=True, exist_ok=True)
     staging = destination.with_name(f"{destination.name}.partial")
-    digest = hashlib.sha256()
+    note = staging.with_name(f"{staging.name}.resume")
+    resume = _resumable(staging, note, url=url)
+    _discard(note)
+    witness = Witness()
     written = 0
+    kept = 0
     over_ceiling = False
+    served = ServedBody(iter(()))
 
     try:
-        with open_stream(url) as chunks:
-            with staging.open("wb") as handle:
-                for chunk in chunks:
+        with open_stream(url) if resume is None else open_stream(url, resume=resume) as chunks:
+            served = chunks if isinstance(chunks, ServedBody) else ServedBody(chunks)
+            kept = written = _joined(staging, served, resume=resume, witness=witness)
+            with staging.open("ab" if kept else "wb") as handle:
+                for chunk in served:
                     if not chunk:
                         continue
                     written += len(chunk)
@@ -87,51 +153,117 @@ def direct_fetch(
                         # ceiling and not the disk.
                         over_ceiling = True
                         break
-                    digest.update(chunk)
+                    witness.update(chunk)
                     handle.write(chunk)
     except OSError as exc:
         # Covers both ends: a disk that cannot be written and a transport that
         # raises while streaming. Both mean no image, and the message says which.
-        _discard(staging)
-        return DirectResult(path=None, byte_size=0, content_hash=None, detail=f"the fetch failed: {exc}")
+        return _interrupted(staging, note, url=url, served=served, written=written, detail=f"the fetch failed: {exc}")
     except Exception as exc:  # prawduct:allow prawduct/broad-except -- a source fault must not end the run
         # The transport seam is free to raise anything — an httpx URL error is
         # not an `OSError` and not an `HTTPError` either — and one bad source
         # must degrade to a recorded fetch failure rather than ending an
         # acquisition pass over the works behind it.
-        _discard(staging)
         log.warning("direct fetch of %s raised %s", url, type(exc).__name__, exc_info=True)
-        return DirectResult(
-            path=None,
-            byte_size=0,
-            content_hash=None,
+        return _interrupted(
+            staging,
+            note,
+            url=url,
+            served=served,
+            written=written,
             detail=f"the source raised {type(exc).__name__}: {exc}",
         )
 
     if over_ceiling:
         _discard(staging)
-        return DirectResult(
-            path=None,
-            byte_size=0,
-            content_hash=None,
-            detail=f"the source served more than the {max_bytes} byte ceiling for a single image",
-        )
+        return DirectResult(path=None, detail=f"the source served more than the {max_bytes} byte ceiling for a single image")
 
     if written <= 0:
         # The zero-byte failure the catalogue refuses to record, caught before it
         # can be offered: a served-but-empty body is a real observed outcome and
         # is indistinguishable from a good file by name alone.
         _discard(staging)
-        return DirectResult(path=None, byte_size=0, content_hash=None, detail="the source returned no bytes")
+        return DirectResult(path=None, detail="the source returned no bytes")
 
+    if kept:
+        log.info(
+            "resumed a direct fetch of %s at byte %d",
+            url,
+            kept,
+            extra={
+                "event": "acquisition.direct_resumed",
+                "resumed_bytes": kept,
+                "fetched_bytes": written - kept,
+                "byte_size": written,
+            },
+        )
     return DirectResult(
         path=staging,
-        byte_size=written,
-        content_hash=digest.hexdigest(),
-        detail=f"{written} bytes arrived",
+        detail=f"{written} bytes arrived" if not kept else f"{written} bytes arrived, {kept} of them kept from before",
+        witnessed=witness.witnessed(),
     )
 
 
+def _resumable(staging: Path, note: Path, *, url: str) -> ResumeFrom | None:
+    """What an earlier, interrupted fetch of this same URL left to resume from.
+
+    Anything short of a note naming this URL beside a non-empty staged file is
+    nothing to resume: the staged bytes are then from another fetch, and are
+    overwritten.
+    """
+    try:
+        recorded = json.loads(note.read_text(encoding="utf-8"))
+        size = staging.stat().st_size
+    except (OSError, ValueError) as exc:
+        log.debug("nothing to resume at %s: %s", staging, exc)
+        return None
+    if not isinstance(recorded, dict) or recorded.get("url") != url or not isinstance(recorded.get("validator"), str):
+        return None
+    return ResumeFrom(offset=size, validator=recorded["validator"]) if size > 0 else None
+
+
+def _joined(staging: Path, served: ServedBody, *, resume: ResumeFrom | None, witness: Witness) -> int:
+    """How many staged bytes the served body continues, witnessed on the way.
+
+    Zero when it starts the file afresh — which is also how a server that will
+    not honour `If-Range` any more answers.
+    """
+    if served.offset == 0:
+        return 0
+    if resume is None or served.offset != resume.offset:
+        # A range nobody asked for, or not the one asked for. Neither can be
+        # joined to what is on disk.
+        raise OSError(f"the source served from byte {served.offset}, not from where this fetch stopped")
+    return _rehash(staging, witness, resume.offset)
+
+
+def _rehash(staging: Path, witness: Witness, length: int) -> int:
+    """Feed the kept bytes to the witness, so the hash covers the whole file."""
+    with staging.open("rb") as handle:
+        remaining = length
+        while remaining > 0:
+            block = handle.read(min(_REHASH_BYTES, remaining))
+            if not block:
+                raise OSError(f"the staged file ended {remaining} bytes short of where this fetch stopped")
+            witness.reread(block)
+            remaining -= len(block)
+    return length
+
+
+def _interrupted(staging: Path, note: Path, *, url: str, served: ServedBody, written: int, detail: str) -> DirectResult:
+    """A fetch that broke off: keep what arrived if the server let it be resumed."""
+    if served.validator is None or written <= 0:
+        _discard(staging)
+        return DirectResult(path=None, detail=detail)
+    try:
+        note.write_text(json.dumps({"url": url, "validator": served.validator}), encoding="utf-8")
+    except OSError as exc:
+        log.warning("could not keep the note that resumes %s: %s", staging, exc)
+        _discard(staging)
+        return DirectResult(path=None, detail=detail)
+    return DirectResult(path=None, detail=f"{detail}; {written} bytes were kept and the next attempt resumes from there")
+
+
 def _discard(path: Path) -> None:
     """Remove a staged file so no later step can mistake it for a finished one."""
     try:
@@ -0,0 +1,549 @@
+"""Fetching a IIIF image service's tiles in-process, as `dezoomify-rs` does out of it.
+
+The subprocess works, and it is a box: it learns nothing until it exits, reports
+how a fetch went as a log line parsed afterwards, and opens its own connections
+under its own limits. Every museum this plane fetches from today serves the IIIF
+Image API, which is small enough to speak directly — an `info.json` naming the
+image's size and its tile grid, and one URL shape per tile — so this does.
+
+**The same contract as `tile_fetch`, to the field.** Same arguments where they
+mean the same thing, same staged path beside the destination, same
+`TileResult`, and the same judgement of it: every tile is `complete`, some tiles
+is `partial` with the gaps left blank, no tiles is `failed` with nothing left
+behind, and running out of time is `failed` too. The service chooses between the
+two fetchers on a setting and does nothing else differently, which is what
+lets either be the one a deployment runs.
+
+**Two phases, and only the first talks to the network.** Tiles are fetched
+concurrently over one pooled client into the source's tile cache, and a tile
+already there from an earlier attempt is not fetched again — the resume the
+cache has always existed for. Then they are stitched from the cache on an
+imaging worker, under the same ceilings as every other decode — each tile is a
+stranger's JPEG — one row of tiles at a time, into a canvas file mapped from disk: the heap holds one strip,
+the canvas lives in pages the kernel can write back and drop, and the JPEG
+encoder reads it from there. A full-resolution canvas on the heap is what an
+8192-pixel master costs otherwise — a quarter of a gigabyte on a Pi.
+
+**Every address is checked, and not only the first.** The `id` in `info.json` is
+where every tile URL is built from, and it is the museum's answer rather than
+anything this deployment recorded — so it goes through the same fetch policy as
+the URL that found it, and no response is followed to a redirect.
+
+**Bytes from a stranger are still bounded.** A tile body past a ceiling is
+refused, a tile that decodes far larger than the grid says it should is treated
+as missing, and an `info.json` that does not describe an image is a failed fetch
+that says so — not an exception out of the acquisition.
+"""
+
+import asyncio
+import logging
+import math
+import mmap
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+import httpx
+from PIL import Image
+
+from curation.acquisition.dezoomify import RefusalWindow, TileOutcome, TileProgress, TileProgressSink, TileResult
+from curation.acquisition.transport import CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS
+from curation.acquisition.urls import UrlRefused
+from curation.acquisition.witness import Witness, Witnessed, WitnessedWriter
+from curation.providers import ProviderGuard
+from curation.services.imaging_pool import ImagingAborted, ImagingPool
+
+log = logging.getLogger(__name__)
+
+#: Tile requests in flight at once for one fetch. `dezoomify-rs` defaults to
+#: sixteen; a museum that throttles on purpose is asked more gently here, and a
+#: deployment that knows its source tolerates more sets `TILE_CONCURRENCY`.
+DEFAULT_TILE_CONCURRENCY: Final[int] = 4
+
+#: How often one tile is asked for before it is left as a gap. Two, as the
+#: binary's default is: once more catches a dropped connection, and a tile a
+#: server refuses twice is one it is refusing.
+_TILE_ATTEMPTS: Final[int] = 2
+
+#: The largest body one tile may be. Museum tiles are tens of kilobytes; this is
+#: the point past which a body has stopped being one.
+_TILE_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+
+#: How much larger than the grid promised a tile may decode before it is refused
+#: rather than scaled into place. Servers round; nothing honest is four times off.
+_TILE_AREA_SLACK: Final[int] = 4
+
+#: The largest `info.json` read. A real one is a few kilobytes.
+_INFO_MAX_BYTES: Final[int] = 1024 * 1024
+
+#: Four bytes a pixel on the canvas, because `RGBX` is the layout Pillow can map
+#: from a buffer without copying it — and the JPEG encoder takes it as it is.
+CANVAS_BYTES_PER_PIXEL: Final[int] = 4
+
+_CANVAS_FILENAME: Final[str] = "canvas.rgbx"
+_JPEG_QUALITY: Final[int] = 90
+
+#: The policy a URL is put through before anything is fetched from it.
+UrlCheck = Callable[[str], str]
+
+
+class IiifRefused(ValueError):
+    """An `info.json` that does not describe an image this fetcher can tile."""
+
+
+class _Refusing(Exception):
+    """The service is refusing nearly every tile; the walk stops here."""
+
+
+class _Tally:
+    """The tiles accounted for so far, told to `progress` as they change.
+
+    Touched only from the event loop's one thread, so it needs no lock.
+    """
+
+    def __init__(self, progress: TileProgressSink | None) -> None:
+        self.fetched = 0
+        self.refused = 0
+        self.expected: int | None = None
+        self._window = RefusalWindow()
+        self._progress = progress
+
+    def planned(self, tiles: int) -> None:
+        self.expected = tiles
+        self._report()
+
+    def arrived(self, *, cached: bool = False) -> None:
+        self.fetched += 1
+        if not cached:
+            # A tile from the cache is not the server's answer to anything.
+            self._window.record(arrived=1)
+        self._report()
+
+    def refused_one(self) -> None:
+        self.refused += 1
+        self._window.record(refused=1)
+        self._report()
+        if self._window.refusing:
+            raise _Refusing(self._window.describe())
+
+    def _report(self) -> None:
+        if self._progress is not None:
+            self._progress(TileProgress(tiles_fetched=self.fetched, tiles_refused=self.refused, tiles_expected=self.expected))
+
+
+@dataclass(frozen=True, slots=True)
+class ImageService:
+    """What an `info.json` says about one image, in the terms tiling needs."""
+
+    #: The base every tile URL is built on, with no trailing slash.
+    id: str
+    #: 2 or 3. They differ in one thing this fetcher uses: how a size is written.
+    version: int
+    width: int
+    height: int
+    tile_width: int
+    tile_height: int
+    scale_factors: tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Tile:
+    """One tile of a plan: where it comes from, and where it lands."""
+
+    column: int
+    row: int
+    #: The region in full-resolution pixels, as the URL names it.
+    x: int
+    y: int
+    region_width: int
+    region_height: int
+    #: Its size once scaled, which is its size on the canvas.
+    width: int
+    height: int
+
+    def url(self, service: ImageService) -> str:
+        # Version 2 writes a width alone, which every level-1 server honours;
+        # version 3 made the `w,h` form the canonical one.
+        size = f"{self.width}," if service.version == 2 else f"{self.width},{self.height}"
+        return f"{service.id}/{self.x},{self.y},{self.region_width},{self.region_height}/{size}/0/default.jpg"
+
+
+@dataclass(frozen=True, slots=True)
+class TilePlan:
+    """Every tile at one scale, and the canvas they make."""
+
+    service: ImageService
+    scale: int
+    width: int
+    height: int
+    columns: int
+    rows: int
+
+    def tiles(self) -> Iterator[Tile]:
+        for row in range(self.rows):
+            yield from self.row(row)
+
+    def row(self, row: int) -> Iterator[Tile]:
+        service, scale = self.service, self.scale
+        for column in range(self.columns):
+            x = column * service.tile_width * scale
+            y = row * service.tile_height * scale
+            region_width = min(service.tile_width * scale, service.width - x)
+            region_height = min(service.tile_height * scale, service.height - y)
+            yield Tile(
+                column=column,
+                row=row,
+                x=x,
+                y=y,
+                region_width=region_width,
+                region_height=region_height,
+                width=math.ceil(region_width / scale),
+                height=math.ceil(region_height / scale),
+            )
+
+    @property
+    def tile_count(self) -> int:
+        return self.columns * self.rows
+
+
+def parse_info(payload: object, *, check: UrlCheck) -> ImageService:
+    """Read an `info.json`, version 2 or 3, or refuse it by name.
+
+    An image with no tile grid is one tile — the whole image — scaled down by
+    powers of two, which is how a level-0 server that publishes only its full
+    size is still fetched at a bounded size.
+    """
+    if not isinstance(payload, Mapping):
+        raise IiifRefused("the image service's info.json is not a JSON object")
+    context = payload.get("@context")
+    contexts = context if isinstance(context, list) else [context]
+    version = 3 if any(isinstance(entry, str) and "/image/3" in entry for entry in contexts) else 2
+    identifier = payload.get("id") if version == 3 else payload.get("@id")
+    if not isinstance(identifier, str) or not identifier:
+        raise IiifRefused("the image service's info.json names no id to fetch tiles from")
+    width, height = payload.get("width"), payload.get("height")
+    if not (_positive(width) and _positive(height)):
+        raise IiifRefused("the image service's info.json gives no usable width and height")
+
+    tiles = payload.get("tiles")
+    grid = tiles[0] if isinstance(tiles, list) and tiles and isinstance(tiles[0], Mapping) else None
+    if grid is not None and _positive(grid.get("width")):
+        tile_width = grid["width"]
+        tile_height = grid["height"] if _positive(grid.get("height")) else tile_width
+        factors = grid.get("scaleFactors")
+        scale_factors = tuple(sorted({f for f in factors if _positive(f)})) if isinstance(factors, list) else ()
+    else:
+        tile_width, tile_height, scale_factors = width, height, ()
+    if not scale_factors:
+        scale_factors = tuple(2**power for power in range(max(width, height).bit_length()))
+
+    try:
+        base = check(identifier.rstrip("/"))
+    except UrlRefused as exc:
+        # Refused by name like every other unusable answer, so it ends as a
+        # failed fetch recorded against the source rather than out of `acquire`.
+        raise IiifRefused(f"the image service names its tiles at an address that may not be fetched: {exc}") from exc
+    return ImageService(
+        id=base,
+        version=version,
+        width=width,
+        height=height,
+        tile_width=tile_width,
+        tile_height=tile_height,
+        scale_factors=scale_factors,
+    )
+
+
+def plan_tiles(service: ImageService, *, max_width: int, max_height: int) -> TilePlan:
+    """The largest scale the service offers that fits the bound.
+
+    The smallest scale factor whose image fits both dimensions, as the binary's
+    `--max-width` and `--max-height` choose a zoom level. A service offering
+    nothing small enough is fetched at its smallest, because a slightly larger
+    master is a better outcome than none.
+    """
+    fitting = [
+        factor
+        for factor in service.scale_factors
+        if math.ceil(service.width / factor) <= max_width and math.ceil(service.height / factor) <= max_height
+    ]
+    scale = fitting[0] if fitting else service.scale_factors[-1]
+    width, height = math.ceil(service.width / scale), math.ceil(service.height / scale)
+    return TilePlan(
+        service=service,
+        scale=scale,
+        width=width,
+        height=height,
+        columns=math.ceil(width / service.tile_width),
+        rows=math.ceil(height / service.tile_height),
+    )
+
+
+def iiif_fetch(
+    url: str,
+    *,
+    destination: Path,
+    tile_cache: Path,
+    user_agent: str,
+    max_width: int,
+    max_height: int,
+    timeout_seconds: int,
+    check: UrlCheck,
+    concurrency: int = DEFAULT_TILE_CONCURRENCY,
+    progress: TileProgressSink | None = None,
+    guard: ProviderGuard | None = None,
+    imaging: ImagingPool | None = None,
+) -> TileResult:
+    """Fetch a IIIF image beside `destination`, reporting what actually arrived.
+
+    Returns the **staged** path, not `destination`, exactly as `tile_fetch`
+    does. `url` is the image service or its `info.json`, already through the
+    fetch policy; `check` is that policy, for the addresses the service answers
+    with. `progress` is told each tile as it is accounted for, and a service
+    refusing nearly every tile stops the walk as it stops the binary's. With a
+    `guard`, every request is paced and broken by its host, so a service that
+    has gone down refuses the remaining tiles at once and the walk stops early.
+    The stitch runs on `imaging`, or on this thread without one.
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    staged = destination.with_name(f"{destination.stem}.partial{destination.suffix}")
+    tile_cache.mkdir(parents=True, exist_ok=True)
+    _discard(staged)
+
+    tally = _Tally(progress)
+    try:
+        plan = asyncio.run(
+            _fetch_tiles(
+                url,
+                tally=tally,
+                tile_cache=tile_cache,
+                user_agent=user_agent,
+                max_width=max_width,
+                max_height=max_height,
+                timeout_seconds=timeout_seconds,
+                check=check,
+                concurrency=concurrency,
+                guard=guard,
+            )
+        )
+    except TimeoutError:
+        return _failed(f"the tile fetch did not finish within {timeout_seconds}s")
+    except IiifRefused as exc:
+        return _failed(str(exc))
+    except httpx.HTTPError as exc:
+        return _failed(f"the image service could not be read: {exc}")
+    except _Refusing as exc:
+        # The tiles that did arrive stay cached for the retry, as the binary's do.
+        log.info("tile fetch of %s stopped early: %s", url, exc)
+        return _failed(str(exc), fetched=tally.fetched, expected=tally.expected)
+
+    imaging = imaging or ImagingPool(workers=0)
+    try:
+        placed, witnessed = imaging.run("stitch", _stitch, plan, tile_cache=tile_cache, staged=staged)
+    except (OSError, ImagingAborted) as exc:
+        _discard(staged)
+        return _failed(f"the tiles could not be assembled: {exc}", expected=plan.tile_count)
+    finally:
+        _discard(tile_cache / _CANVAS_FILENAME)
+
+    if witnessed is None:
+        _discard(staged)
+        return _failed("no tile could be fetched from the image service", fetched=0, expected=plan.tile_count)
+    if placed < plan.tile_count:
+        log.info("tile fetch returned %s of %s tiles for %s", placed, plan.tile_count, url)
+        return TileResult(
+            outcome=TileOutcome.PARTIAL,
+            path=staged,
+            byte_size=witnessed.byte_size,
+            tiles_fetched=placed,
+            tiles_expected=plan.tile_count,
+            detail=f"{placed} of {plan.tile_count} tiles arrived; the image has gaps",
+            witnessed=witnessed,
+        )
+    return TileResult(
+        outcome=TileOutcome.COMPLETE,
+        path=staged,
+        byte_size=witnessed.byte_size,
+        tiles_fetched=placed,
+        tiles_expected=plan.tile_count,
+        detail="every tile arrived",
+        witnessed=witnessed,
+    )
+
+
+async def _fetch_tiles(
+    url: str,
+    *,
+    tally: _Tally,
+    tile_cache: Path,
+    user_agent: str,
+    max_width: int,
+    max_height: int,
+    timeout_seconds: int,
+    check: UrlCheck,
+    concurrency: int,
+    guard: ProviderGuard | None,
+) -> TilePlan:
+    """Read the service and fill the cache with every tile it will give."""
+    timeout = httpx.Timeout(READ_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with (
+        asyncio.timeout(timeout_seconds),
+        httpx.AsyncClient(
+            timeout=timeout,
+            limits=limits,
+            # The pool's limits given to the inner transport too: a client
+            # handed a transport builds none of its own to apply them to.
+            transport=None if guard is None else guard.async_transport(httpx.AsyncHTTPTransport(limits=limits)),
+            follow_redirects=False,
+            headers={"User-Agent": user_agent},
+        ) as client,
+    ):
+        info_url = url if url.rstrip("/").endswith("/info.json") else f"{url.rstrip('/')}/info.json"
+        response = await client.get(info_url)
+        if response.status_code != 200:
+            raise IiifRefused(f"the image service answered HTTP {response.status_code} for its info.json")
+        if len(response.content) > _INFO_MAX_BYTES:
+            raise IiifRefused("the image service's info.json is implausibly large")
+        try:
+            payload = response.json()
+        except ValueError as exc:
+            raise IiifRefused("the image service's info.json is not JSON; this source may not serve IIIF") from exc
+        plan = plan_tiles(parse_info(payload, check=check), max_width=max_width, max_height=max_height)
+        tally.planned(plan.tile_count)
+        gate = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(_fetch_tile(client, gate, plan, tile, tile_cache, tally) for tile in plan.tiles()))
+    return plan
+
+
+async def _fetch_tile(
+    client: httpx.AsyncClient, gate: asyncio.Semaphore, plan: TilePlan, tile: Tile, cache: Path, tally: _Tally
+) -> None:
+    """Fetch one tile into the cache, or leave it absent. A gap is not an error."""
+    path = _cached(cache, plan, tile)
+    if path.exists():
+        tally.arrived(cached=True)
+        return
+    url = tile.url(plan.service)
+    async with gate:
+        for attempt in range(1, _TILE_ATTEMPTS + 1):
+            try:
+                body = await _tile_body(client, url)
+            except httpx.HTTPError as exc:
+                log.debug("tile %s failed on attempt %d: %s", url, attempt, exc)
+                continue
+            if body is None:
+                break
+            # Written aside and renamed, so a fetch stopped mid-write leaves no
+            # truncated tile for the next attempt to trust.
+            partial = path.with_suffix(".part")
+            partial.write_bytes(body)
+            partial.replace(path)
+            tally.arrived()
+            return
+    tally.refused_one()
+
+
+async def _tile_body(client: httpx.AsyncClient, url: str) -> bytes | None:
+    async with client.stream("GET", url) as response:
+        if response.status_code != 200:
+            # Refused, redirected or missing: the server's answer for this tile,
+            # and asking again would get it again.
+            return None
+        chunks, total = [], 0
+        async for chunk in response.aiter_bytes():
+            total += len(chunk)
+            if total > _TILE_MAX_BYTES:
+                return None
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _stitch(plan: TilePlan, *, tile_cache: Path, staged: Path) -> tuple[int, Witnessed | None]:
+    """Assemble the cached tiles into `staged`, one row of tiles at a time.
+
+    Returns how many tiles were placed, and what was witnessed of the JPEG, or
+    `None` when no tile was and nothing was written. A missing or unreadable
+    tile is left black, as the binary leaves it. The JPEG is written through a
+    witness, so promotion has its hash and header without reading it back —
+    and the witness comes back by value, because this runs on an imaging worker.
+    """
+    placed = 0
+    witness = Witness()
+    row_bytes = plan.width * CANVAS_BYTES_PER_PIXEL
+    canvas_path = tile_cache / _CANVAS_FILENAME
+    with canvas_path.open("w+b") as handle:
+        handle.truncate(row_bytes * plan.height)
+        with mmap.mmap(handle.fileno(), 0) as canvas:
+            for row in range(plan.rows):
+                top = row * plan.service.tile_height
+                strip = Image.new("RGBX", (plan.width, min(plan.service.tile_height, plan.height - top)))
+                for tile in plan.row(row):
+                    left = tile.column * plan.service.tile_width
+                    if _place(strip, tile, _cached(tile_cache, plan, tile), left=left):
+                        placed += 1
+                pixels = strip.tobytes()
+                canvas[top * row_bytes : top * row_bytes + len(pixels)] = pixels
+            if placed:
+                image = Image.frombuffer("RGBX", (plan.width, plan.height), canvas, "raw", "RGBX", 0, 1)
+                try:
+                    with staged.open("wb") as out:
+                        image.save(WitnessedWriter(out, witness), format="JPEG", quality=_JPEG_QUALITY)
+                finally:
+                    # The image holds the mapping open; the map cannot be closed
+                    # while it does.
+                    del image
+    return placed, witness.witnessed() if placed else None
+
+
+def _place(strip: Image.Image, tile: Tile, path: Path, *, left: int) -> bool:
+    if not path.exists():
+        return False
+    try:
+        with Image.open(path) as decoded:
+            if decoded.width * decoded.height > _TILE_AREA_SLACK * tile.width * tile.height:
+                log.warning(
+                    "tile %s decodes to %s, far past the %sx%s its grid promised",
+                    path.name,
+                    decoded.size,
+                    tile.width,
+                    tile.height,
+                )
+                return False
+            picture = decoded.convert("RGB")
+    except (OSError, Image.DecompressionBombError, ValueError) as exc:
+        log.warning("tile %s could not be read: %s", path.name, exc)
+        return False
+    if picture.size != (tile.width, tile.height):
+        picture = picture.resize((tile.width, tile.height))
+    strip.paste(picture, (left, 0))
+    return True
+
+
+def _cached(cache: Path, plan: TilePlan, tile: Tile) -> Path:
+    """Where a tile is kept between attempts: its scale and place in the grid."""
+    return cache / f"{plan.scale}-{tile.column}-{tile.row}.jpg"
+
+
+def _failed(detail: str, *, fetched: int | None = None, expected: int | None = None) -> TileResult:
+    return TileResult(
+        outcome=TileOutcome.FAILED,
+        path=None,
+        byte_size=0,
+        tiles_fetched=fetched,
+        tiles_expected=expected,
+        detail=detail,
+    )
+
+
+def _positive(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
+
+
+def _discard(path: Path) -> None:
+    """Remove a leftover file, logging rather than raising, as `dezoomify._discard` does."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as exc:
+        log.warning("could not remove %s: %s", path, exc)
@@ -23,18 +23,27 @@ exercisable without a database or a network.
 import base64
 import json
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal
-from io import BytesIO
 from pathlib import Path
 from typing import Any, Final
 
+import numpy as np
 from PIL import Image, ImageOps
 
-from curation.acquisition.color import ColorError, Lab, delta_e, format_hex, lab_to_rgb, parse_hex, rgb_to_lab, scale_lightness
-from curation.discovery.openrouter import Completion, ImageAttachment, OpenRouterClient, OpenRouterError
+from curation.acquisition.color import ColorError, Lab, format_hex, lab_to_rgb, parse_hex, rgb_to_lab, scale_lightness
+from curation.acquisition.palette import covering_colours, delta_e_array, rgb_to_lab_array
+from curation.discovery.openrouter import (
+    Completion,
+    CompletionCall,
+    ImageAttachment,
+    OpenRouterClient,
+    OpenRouterError,
+)
 from curation.persistence.records import MatMethod
-from curation.services.imaging import reading
+from curation.services.imaging import encode_downscaled, reading
+from curation.services.imaging_pool import ImagingPool
 
 log = logging.getLogger(__name__)
 
@@ -88,7 +97,7 @@ MAT_SCHEMA: Final[dict[str, Any]] = {
 _FALLBACK_LIGHTNESS: Final[float] = 0.66
 
 #: How many colours the fallback clusters the work into before taking the largest.
-#: Five, as in 2024. Enough that a painting's background does not swallow its
+#: Five, as in 2024, whose k-means this is again. Enough that a painting's background does not swallow its
 #: subject, few enough that the largest cluster is a colour rather than a shade.
 _FALLBACK_CLUSTERS: Final[int] = 5
 
@@ -138,7 +147,7 @@ CORPUS_MAX_LIGHTNESS: Final[float] = 50.0
 #: figure to quote, because it is the one a reader can reproduce.)
 _DERIVED_LIGHTNESS_CEILING: Final[float] = 45.2
 
-#: How close two of the quantiser's colours must be, in CIEDE2000, to be counted as
+#: How close two of the clustering's colours must be, in CIEDE2000, to be counted as
 #: one colour when the largest is chosen. Ten is where that metric's own scale puts
 #: "plainly different colours", so merging below it groups shades of one thing and
 #: leaves genuinely different ones competing.
@@ -167,10 +176,16 @@ _CLUSTER_MERGE_DISTANCE: Final[float] = 10.0
 _GAMUT_SEARCH_STEPS: Final[int] = 20
 
 #: The longest edge the fallback examines. Dominance is a property of the picture,
-#: not of its resolution, and quantising a gigapixel master would spend minutes
+#: not of its resolution, and clustering a gigapixel master would spend minutes
 #: to reach the same answer.
 _FALLBACK_MAX_EDGE: Final[int] = 256
 
+#: How many vision calls a batch keeps in flight at once. Each call is a model
+#: looking at a picture for several seconds, so eight works chosen one after
+#: another wait on eight of those in turn; four at once is most of the saving
+#: without holding four encoded previews per worker in memory on the Pi.
+MAT_CALLS_IN_FLIGHT: Final[int] = 4
+
 #: What the fallback records as its reason, so a reader of the history sees why a
 #: colour was arrived at mechanically rather than an empty field.
 _FALLBACK_REASON: Final[str] = "Derived from the artwork's dominant colour, darkened; no vision model choice was available."
@@ -204,7 +219,7 @@ class MatChoice:
 class MatEngine:
     """Choose mat colours, preferring a vision model and always producing one."""
 
-    def __init__(self, client: OpenRouterClient | None, *, image_max_edge: int) -> None:
+    def __init__(self, client: OpenRouterClient | None, *, image_max_edge: int, imaging: ImagingPool | None = None) -> None:
         #: `None` is a deployment with no API key, and it is a supported one: the
         #: plane serves its whole catalogue without paying for anything. Works
         #: acquired there get mechanically-derived mats, recorded as such, rather
@@ -213,6 +228,9 @@ class MatEngine:
         if image_max_edge <= 0:
             raise ValueError(f"The mat image edge must be positive, got {image_max_edge}.")
         self._image_max_edge = image_max_edge
+        #: Where the image is decoded, for the model and for the fallback alike.
+        #: The calling thread when none is given.
+        self._imaging = imaging or ImagingPool(workers=0)
 
     @property
     def model_id(self) -> str | None:
@@ -230,25 +248,48 @@ class MatEngine:
         if self._client is None:
             return self._fallback(image_path, detail="no OpenRouter key is configured, so no vision model was asked")
         attachment = reading(image_path, lambda: self._encode(image_path))
-
         try:
-            completion = self._client.complete(prompt=MAT_PROMPT, schema=MAT_SCHEMA, image=attachment)
+            answer: Completion | OpenRouterError = self._client.complete(prompt=MAT_PROMPT, schema=MAT_SCHEMA, image=attachment)
         except OpenRouterError as exc:
+            answer = exc
+        return self._settle(image_path, answer)
+
+    def choose_many(self, image_paths: Sequence[Path], *, in_flight: int = MAT_CALLS_IN_FLIGHT) -> list[MatChoice]:
+        """Pick the mat colours for several images, asking the model about them at once.
+
+        The same choice `choose` makes for each path, in the same order, with up
+        to `in_flight` vision calls running together. Every image is encoded
+        before any call is sent, so an undecodable one is refused before the
+        batch has spent anything. A spent key stops the calls not yet sent —
+        those works fall back as they would have one at a time, each saying
+        the model was not asked.
+        """
+        if self._client is None or not image_paths:
+            return [self.choose(image_path) for image_path in image_paths]
+        attachments = [reading(image_path, lambda image_path=image_path: self._encode(image_path)) for image_path in image_paths]
+        answers = self._client.complete_many(
+            [CompletionCall(prompt=MAT_PROMPT, schema=MAT_SCHEMA, image=attachment) for attachment in attachments],
+            concurrency=in_flight,
+        )
+        return [self._settle(image_path, answer) for image_path, answer in zip(image_paths, answers, strict=True)]
+
+    def _settle(self, image_path: Path, answer: Completion | OpenRouterError) -> MatChoice:
+        """The model's answer as a choice, or the fallback with the reason it was needed."""
+        if isinstance(answer, OpenRouterError):
             # Includes the two money refusals. Neither is retried here: 403 means
             # the key is spent and will refuse identically, and 402 means the
             # reservation is too large for the credit left, which asking again
             # does not change. Both leave the work with a recorded mechanical mat
             # rather than with none.
-            log.info("the mat model could not be reached for %s: %s", image_path.name, exc)
-            return self._fallback(image_path, detail=f"the vision model could not be reached: {exc}")
-
-        choice = _read_choice(completion)
+            log.info("the mat model could not be reached for %s: %s", image_path.name, answer)
+            return self._fallback(image_path, detail=f"the vision model could not be reached: {answer}")
+        choice = _read_choice(answer)
         if choice is not None:
             return choice
         return self._fallback(
             image_path,
-            detail=_unusable_detail(completion),
-            cost_usd=completion.cost_usd,
+            detail=_unusable_detail(answer),
+            cost_usd=answer.cost_usd,
         )
 
     def _encode(self, image_path: Path) -> ImageAttachment:
@@ -259,20 +300,16 @@ class MatEngine:
         `measure()` applies it: a model shown a portrait work lying on its side
         reasons about a different picture than the one the wall will show.
         """
-        with Image.open(image_path) as image:
-            # Decodes at a reduced DCT scale where the format allows, so a
-            # 47-megapixel master never becomes a 47-megapixel bitmap on the way
-            # to a 768-pixel thumbnail on the smallest machine in the deployment.
-            image.draft("RGB", (self._image_max_edge, self._image_max_edge))
-            upright = ImageOps.exif_transpose(image) or image
-            frame = upright.convert("RGB")
-            frame.thumbnail((self._image_max_edge, self._image_max_edge), Image.Resampling.LANCZOS)
-            buffer = BytesIO()
-            frame.save(buffer, format="JPEG", quality=85, optimize=True)
-        return ImageAttachment(base64_data=base64.b64encode(buffer.getvalue()).decode("ascii"), media_type="image/jpeg")
+        # The thumbnails' decode, which reduces the DCT scale where the format
+        # allows, so a 47-megapixel master never becomes a 47-megapixel bitmap on
+        # the way to a 768-pixel thumbnail on the smallest machine in the
+        # deployment. This kept a copy of it until the decode moved onto the
+        # imaging pool, which can only run a function it can name.
+        frame = self._imaging.run("mat_image", encode_downscaled, image_path, max_edge=self._image_max_edge, quality=85)
+        return ImageAttachment(base64_data=base64.b64encode(frame.data).decode("ascii"), media_type="image/jpeg")
 
     def _fallback(self, image_path: Path, *, detail: str, cost_usd: Decimal = Decimal(0)) -> MatChoice:
-        rgb = reading(image_path, lambda: dominant_color(image_path))
+        rgb = reading(image_path, lambda: self._imaging.run("mat_colour", dominant_color, image_path))
         scaled = scale_lightness(rgb, _FALLBACK_LIGHTNESS)
         darkened = _under_the_corpus_bar(scaled)
         lab = rgb_to_lab(darkened)
@@ -369,51 +406,39 @@ def _fitted_to_the_gamut(lab: Lab) -> tuple[int, int, int]:
 def dominant_color(image_path: Path) -> tuple[int, int, int]:
     """The colour that covers most of the image.
 
-    Median-cut quantisation through Pillow rather than k-means through OpenCV,
-    NumPy and scikit-image — which is what 2024 used, and what this plane will not
-    install on a memory-capped Pi to answer a question about five colours.
-
-    The two agree on what they are asked for. Both partition the image and return
-    the most-populated partition's colour; median cut splits along the widest
-    channel where k-means iterates towards cluster centres, so an individual
-    answer can differ by a shade.
-
-    **A shade's difference here is not the small thing it reads as**, and this
-    docstring said it was until the derivation was measured against real paintings.
-    Which partition wins decides the mat outright, so a re-encode that moved the
-    split moved a work's colour from a near-black navy to a near-white. Darkening
-    the result by a third does not absorb that; it darkens the wrong colour.
-    **Shades of one colour are therefore counted once** — see `_most_covered_colour`
-    for the failure that forces it.
+    k-means in CIE LAB over a reduced-scale decode, through `palette` — which is
+    what 2024 did through OpenCV, and what this module did through Pillow's RGB
+    median cut in between. The median cut is gone because it partitioned along
+    the widest *channel* rather than the widest perceptual difference, and because
+    everything after it — the LAB conversion, the distances, the grouping — ran
+    one colour at a time in Python.
+
+    **Which cluster wins decides the mat outright**, so a partition that moves on a
+    re-encode moves a work's colour from a near-black navy to a near-white.
+    Darkening the result by a third does not absorb that; it darkens the wrong
+    colour. **Shades of one colour are therefore counted once** — see
+    `_most_covered_colour` for the failure that forces it.
     """
     with Image.open(image_path) as image:
         image.draft("RGB", (_FALLBACK_MAX_EDGE, _FALLBACK_MAX_EDGE))
         upright = ImageOps.exif_transpose(image) or image
         frame = upright.convert("RGB")
         frame.thumbnail((_FALLBACK_MAX_EDGE, _FALLBACK_MAX_EDGE), Image.Resampling.LANCZOS)
-        quantised = frame.quantize(colors=_FALLBACK_CLUSTERS, method=Image.Quantize.MEDIANCUT)
-        palette = quantised.getpalette() or []
-        # `getcolors` on a palette image returns (count, palette index) pairs.
-        # None would mean more distinct values than the limit, which quantising to
-        # five cannot produce — but a fallback that raised here would defeat its
-        # own purpose, so the guard is a value rather than an exception.
-        counts = quantised.getcolors(maxcolors=_FALLBACK_CLUSTERS) or [(1, 0)]
-    return _most_covered_colour(
-        [(count, (palette[index * 3], palette[index * 3 + 1], palette[index * 3 + 2])) for count, index in counts]
-    )
+        pixels = np.asarray(frame)
+    return _most_covered_colour(covering_colours(pixels, _FALLBACK_CLUSTERS))
 
 
 def _most_covered_colour(clusters: list[tuple[int, tuple[int, int, int]]]) -> tuple[int, int, int]:
     """The colour covering most of the image, counting shades of one colour once.
 
     **Taking the largest cluster straight is what made the derivation unstable.**
-    Median cut splits along the widest channel, so one perceptual colour spread
-    over a gradient — which is most of what paint does — routinely arrives as two
-    clusters, and then loses the vote to a smaller rival that happened not to be
-    divided. On the operator's masters this is not a shade's difference: one work's
-    dominant colour moved from a near-black navy to a near-white, and another from
-    a pale grey to a dark blue, on nothing worse than a benign re-encode. A
-    re-encode is enough because it is enough to move where the split falls.
+    A partition routinely divides one perceptual colour spread over a gradient —
+    which is most of what paint does — into two clusters, and it then loses the
+    vote to a smaller rival that happened not to be divided. On the operator's
+    masters this is not a shade's difference: one work's dominant colour moved
+    from a near-black navy to a near-white, and another from a pale grey to a dark
+    blue, on nothing worse than a benign re-encode. A re-encode is enough because
+    it is enough to move where the split falls.
 
     Grouping is **single-link**: a chain of shades each within the threshold of the
     next is one colour, because that is what a gradient is. Connected components do
@@ -423,25 +448,27 @@ def _most_covered_colour(clusters: list[tuple[int, tuple[int, int, int]]]) -> tu
     two real colours can produce a third that is nowhere in the picture, which is
     precisely the invented answer a dominant-colour derivation must not give.
     """
-    labs = {rgb: rgb_to_lab(rgb) for _, rgb in clusters}
-    remaining = list(clusters)
-    groups: list[list[tuple[int, tuple[int, int, int]]]] = []
-    while remaining:
-        group = [remaining.pop()]
-        absorbed = True
-        while absorbed:
-            absorbed = False
-            for candidate in list(remaining):
-                if any(delta_e(labs[candidate[1]], labs[member[1]]) < _CLUSTER_MERGE_DISTANCE for member in group):
-                    group.append(candidate)
-                    remaining.remove(candidate)
-                    absorbed = True
-        groups.append(group)
+    labs = rgb_to_lab_array(np.array([rgb for _, rgb in clusters], dtype=np.uint8))
+    linked = delta_e_array(labs[:, None, :], labs[None, :, :]) < _CLUSTER_MERGE_DISTANCE
+    # Closing the link relation under composition is single-link grouping: after
+    # it, two clusters are related exactly when a chain of near shades joins them.
+    # Squaring doubles the chain length each pass, so a handful of passes covers
+    # any chain the fallback's five clusters can form.
+    reachable = linked | np.eye(len(clusters), dtype=bool)
+    while True:
+        wider = (reachable.astype(np.int64) @ reachable.astype(np.int64)) > 0
+        if np.array_equal(wider, reachable):
+            break
+        reachable = wider
+    groups = {tuple(np.flatnonzero(row)) for row in reachable}
     # The colour, not just the count, breaks a tie — two groups covering exactly
     # equal area is reachable on flat synthetic input, and a derivation that
     # answered differently on two runs over one file would be the instability this
     # function exists to remove.
-    winner = max(groups, key=lambda group: (sum(count for count, _ in group), max(group)))
+    winner = max(
+        ([clusters[index] for index in group] for group in groups),
+        key=lambda group: (sum(count for count, _ in group), max(group)),
+    )
     return max(winner)[1]
 
 
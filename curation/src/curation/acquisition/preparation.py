@@ -28,7 +28,8 @@ remembered to do it.
 """
 
 import logging
-from dataclasses import dataclass
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
@@ -41,6 +42,7 @@ from curation.persistence.records import MatColor, MatMethod, RenditionKind
 from curation.services.catalogue import CatalogueService
 from curation.services.display_fit import ArtworkBox, DisplayFit
 from curation.services.errors import ServiceError
+from curation.services.imaging_pool import ImagingAborted, ImagingPool
 
 log = logging.getLogger(__name__)
 
@@ -137,10 +139,24 @@ class PreparationSettings:
 class PreparationService:
     """Give a work a mat and a television canvas."""
 
-    def __init__(self, catalogue: CatalogueService, mat_engine: MatEngine, settings: PreparationSettings) -> None:
+    def __init__(
+        self,
+        catalogue: CatalogueService,
+        mat_engine: MatEngine,
+        settings: PreparationSettings,
+        *,
+        warm: Callable[[str], None] | None = None,
+        imaging: ImagingPool | None = None,
+    ) -> None:
         self._catalogue = catalogue
         self._mat = mat_engine
         self._settings = settings
+        #: Where the canvas is composed. The calling thread when none is given.
+        self._imaging = imaging or ImagingPool(workers=0)
+        #: Told the id of every work given a new canvas, for the reason
+        #: acquisition is told of a new original: a thumbnail is drawn from the
+        #: canvas once there is one, so the one drawn before it is now stale.
+        self._warm = warm
 
     def prepare(self, artwork_id: str, *, force: bool = False) -> PreparationResult:
         """Make this work ready for the wall, doing only what is not already done.
@@ -160,21 +176,7 @@ class PreparationService:
         sentence and it would have been false at exactly the moment a curator
         relied on it.
         """
-        original = self._catalogue.get_original(artwork_id)
-        if original is None:
-            raise ServiceError(f"Artwork {artwork_id!r} has no acquired original to prepare; acquire it first.")
-
-        source = self._settings.art_root / original.relative_path
-        if not source.is_file():
-            # The row says the work holds an image and the disk disagrees. Worth
-            # its own message: this is what a restored catalogue looks like before
-            # re-acquisition refills the tree, and "no such file" from deep inside
-            # Pillow would send whoever reads it to the wrong place entirely.
-            raise ServiceError(
-                f"Artwork {artwork_id!r} records an original at {original.relative_path!r} that is not on disk. "
-                "Re-acquire it before preparing."
-            )
-
+        source = self._source(artwork_id)
         mat, chosen = self._current_or_chosen_mat(artwork_id, source=source)
         current = self._current_tv_rendition(artwork_id)
         if current is not None and not force:
@@ -199,14 +201,22 @@ class PreparationService:
         # is refused by name here as it is in the mat engine — and a disk that
         # will not take the canvas still raises `OSError`, which is a fault on
         # this host rather than in the museum's bytes.
-        composition = compose(
-            source,
-            destination=destination,
-            mat_hex=mat.hex_rgb,
-            panel_width=self._settings.panel_width,
-            panel_height=self._settings.panel_height,
-            box=self._settings.box,
-        )
+        try:
+            composition = self._imaging.run(
+                "compose",
+                compose,
+                source,
+                destination=destination,
+                mat_hex=mat.hex_rgb,
+                panel_width=self._settings.panel_width,
+                panel_height=self._settings.panel_height,
+                box=self._settings.box,
+            )
+        except ImagingAborted as exc:
+            # A ceiling the decode reached inside `compose` is translated there
+            # with the rest; what arrives here is the worker itself dying, which
+            # is as much a refusal of this work's bytes as any.
+            raise ServiceError(f"The canvas for work {artwork_id} could not be composed: {exc}") from exc
         relative = str(destination.relative_to(self._settings.art_root))
         # Recorded after the file exists, never before: a row naming a canvas that
         # was never written would be served to the television as current.
@@ -217,6 +227,8 @@ class PreparationService:
             target_height=composition.canvas_height,
             path=relative,
         )
+        if self._warm is not None:
+            self._warm(artwork_id)
         return PreparationResult(
             artwork_id=artwork_id,
             outcome=PreparationOutcome.PREPARED,
@@ -230,6 +242,37 @@ class PreparationService:
             mat_fallback_detail=None if chosen is None else chosen.fallback_detail,
         )
 
+    def prepare_many(self, artwork_ids: Sequence[str], *, force: bool = False) -> list[PreparationResult]:
+        """`prepare` for several works, with the mats they lack chosen together.
+
+        The vision calls are the slow half of a first preparation, and one work
+        at a time makes a batch wait on each in turn; here every work without a
+        mat has it chosen in one `MatEngine.choose_many`, several calls in
+        flight, before the canvases are composed one by one as `prepare` would.
+        A work that already has a mat is not asked about, for the reason
+        `prepare` gives.
+
+        **Every work is checked before anything is spent.** A work with no
+        original, or one missing from disk, refuses the batch by name before a
+        single call is sent, because the alternative is a batch that paid for
+        mats and then stopped. Each result reports what its own mat cost.
+        """
+        sources = {artwork_id: self._source(artwork_id) for artwork_id in artwork_ids}
+        unmatted = [artwork_id for artwork_id in sources if self._catalogue.current_mat_color(artwork_id) is None]
+        chosen = dict(zip(unmatted, self._mat.choose_many([sources[artwork_id] for artwork_id in unmatted]), strict=True))
+        for artwork_id, choice in chosen.items():
+            self._record_choice(artwork_id, choice)
+        results = []
+        for artwork_id in artwork_ids:
+            result = self.prepare(artwork_id, force=force)
+            choice = chosen.pop(artwork_id, None)
+            if choice is not None:
+                # Reported on the work it was paid for, and once: a work named
+                # twice in the batch is charged on its first result.
+                result = replace(result, cost_usd=choice.cost_usd, mat_fallback_detail=choice.fallback_detail)
+            results.append(result)
+        return results
+
     def choose_mat(self, artwork_id: str) -> PreparationResult:
         """Ask the vision model for this work's mat colour again, and re-render.
 
@@ -249,16 +292,7 @@ class PreparationService:
             )
 
         choice = self._mat.choose(source)
-        self._catalogue.record_mat_color(
-            artwork_id=artwork_id,
-            hex_rgb=choice.hex_rgb,
-            method=choice.method,
-            lab_l=choice.lab_l,
-            lab_a=choice.lab_a,
-            lab_b=choice.lab_b,
-            reason=choice.reason or None,
-            model_id=choice.model_id,
-        )
+        self._record_choice(artwork_id, choice)
         # Forced, because the canvas that exists was painted in the old colour and
         # is current by the only test the catalogue applies — the original has not
         # changed. Without this the work would keep showing the superseded mat
@@ -326,7 +360,27 @@ class PreparationService:
         if current is not None:
             return current, None
         choice = self._mat.choose(source)
-        recorded = self._catalogue.record_mat_color(
+        return self._record_choice(artwork_id, choice), choice
+
+    def _source(self, artwork_id: str) -> Path:
+        """Where the work's original is on disk, refusing a work that has none there."""
+        original = self._catalogue.get_original(artwork_id)
+        if original is None:
+            raise ServiceError(f"Artwork {artwork_id!r} has no acquired original to prepare; acquire it first.")
+        source = self._settings.art_root / original.relative_path
+        if not source.is_file():
+            # The row says the work holds an image and the disk disagrees. Worth
+            # its own message: this is what a restored catalogue looks like before
+            # re-acquisition refills the tree, and "no such file" from deep inside
+            # Pillow would send whoever reads it to the wrong place entirely.
+            raise ServiceError(
+                f"Artwork {artwork_id!r} records an original at {original.relative_path!r} that is not on disk. "
+                "Re-acquire it before preparing."
+            )
+        return source
+
+    def _record_choice(self, artwork_id: str, choice: MatChoice) -> MatColor:
+        return self._catalogue.record_mat_color(
             artwork_id=artwork_id,
             hex_rgb=choice.hex_rgb,
             method=choice.method,
@@ -336,7 +390,6 @@ class PreparationService:
             reason=choice.reason or None,
             model_id=choice.model_id,
         )
-        return recorded, choice
 
     def _current_tv_rendition(self, artwork_id: str) -> str | None:
         """The path of a television canvas that is current and actually on disk.
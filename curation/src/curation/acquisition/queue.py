@@ -0,0 +1,512 @@
+"""Acquiring many works at once, behind the call that asked for them.
+
+`AcquisitionService.acquire` fetches one work and returns once it is held, which
+is right for a retry a curator is watching and wrong for a batch: a tiled fetch
+can run for half an hour, and a tool call or an HTTP request held open across
+forty of them is abandoned by its client long before the first is done. This
+takes a list of works, returns a handle at once, and fetches behind it.
+
+**Bounded twice: in total, and per fetch method.** The two methods cost
+different things. A tiled fetch is a subprocess walking hundreds of tiles against
+a museum that throttles on purpose, with a tile cache on the disk beside it; two
+at once against one institution is the hammering the throttle asks us not to do.
+A direct fetch is one streamed body. So each has its own ceiling inside the
+total, and a job whose method is at its ceiling is passed over rather than
+waited on — a direct fetch is never held behind a tiled one only because the
+tiled lane is full.
+
+**Highest priority first, then oldest first.** Priority orders what is waiting
+and nothing else: a fetch already running is never interrupted for one that
+outranks it.
+
+**Each job reserves what it expects to write before it starts**, and the
+reservation is the acquisition service's rather than a second ledger kept here —
+see `space.py` — so a retry called directly from a tool and a queued job count
+against the same floor. A job that would not fit waits while this queue has
+fetches in flight, because their reservations may be most of what is in its way.
+With nothing in flight it is started anyway, and the refusal it meets is real.
+
+**Results are recorded as each job completes, by `acquire` itself** — the source's
+fetch status and the held original are written exactly as a single retry writes
+them — so nothing here is the record of what was fetched. The jobs are this
+process's memory of what it was asked to do, and a restart forgets the ones still
+waiting. That is deliberate rather than merely cheap: a forgotten job fetched
+nothing and recorded nothing, `sources` shows the fetch that never happened, and
+asking again is always safe.
+
+**A deployment fault stops the jobs it would fail, and nothing else.** A full
+disk refuses every job behind it; a missing tile binary or a provider with no
+image service refuses every waiting job of that method or provider. Those jobs
+are cancelled rather than tried, for the reason `space.py` gives for raising: the
+cause is one fact about the machine, and trying each would record that fact
+forty times as forty failures.
+"""
+
+import itertools
+import logging
+import threading
+import uuid
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Final
+
+from curation.acquisition.dezoomify import DezoomifyUnavailable, TileProgress
+from curation.acquisition.service import AcquisitionOutcome, AcquisitionService
+from curation.acquisition.space import NotEnoughSpace
+from curation.acquisition.tiles import TileTargetUnavailable
+from curation.persistence.records import AcquisitionMethod
+from curation.services.errors import ServiceError
+
+log = logging.getLogger(__name__)
+
+#: The most works one request may queue. A bound on what one call plans — every
+#: work is read from the catalogue before any is queued — rather than on the
+#: queue, which takes as many batches as it is given.
+MAX_ACQUISITION_BATCH: Final[int] = 500
+
+#: How a finished fetch can end with the work holding an image.
+_HOLDING: Final[frozenset[AcquisitionOutcome]] = frozenset(
+    {AcquisitionOutcome.ACQUIRED, AcquisitionOutcome.PARTIAL, AcquisitionOutcome.KEPT_HELD}
+)
+
+#: Jobs that have ended and are still answered for by `status`. The queue is this
+#: process's memory, not the catalogue's, so it is bounded like one: past this,
+#: the oldest ended jobs are forgotten. Their results are in the catalogue.
+_RETAINED_ENDED_JOBS: Final[int] = 1000
+
+
+class JobState(StrEnum):
+    """Where one queued acquisition has got to."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    #: Fetched, and the outcome recorded — a failed fetch is finished too, with
+    #: the failure against its source exactly as a retry would record it.
+    FINISHED = "finished"
+    #: Refused before any fetch was recorded: the disk, the deployment, or the
+    #: work itself no longer having a source to fetch from. The detail says which.
+    REFUSED = "refused"
+    #: Withdrawn before it started, by a caller or by a fault ahead of it.
+    CANCELLED = "cancelled"
+
+
+#: The states a job does not leave.
+_ENDED: Final[frozenset[JobState]] = frozenset({JobState.FINISHED, JobState.REFUSED, JobState.CANCELLED})
+
+#: What stops the jobs behind one that met it, as `_DEPLOYMENT_FAULTS` in the
+#: service lists what is raised rather than recorded. A condition added there is
+#: one to weigh adding here.
+_STOPPING_FAULTS: Final[tuple[type[Exception], ...]] = (NotEnoughSpace, DezoomifyUnavailable, TileTargetUnavailable)
+
+
+@dataclass(frozen=True, slots=True)
+class AcquisitionJob:
+    """One work this queue was asked to acquire, and what became of it."""
+
+    id: str
+    batch_id: str
+    artwork_id: str
+    #: The source chosen when the job was queued, by the rule `acquire` uses. Fixed
+    #: then, so a job fetches what the caller was told it would.
+    source_id: str
+    provider: str
+    method: AcquisitionMethod
+    priority: int
+    #: What the fetch reserves against the disk's floor when it starts.
+    expected_bytes: int
+    state: JobState
+    enqueued_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    #: How the fetch ended. Present only on a finished job.
+    outcome: AcquisitionOutcome | None = None
+    detail: str | None = None
+    #: How far a tiled fetch has got, updated while it runs and kept once it has
+    #: ended. `None` for a fetch that reports nothing, which a direct one does not.
+    progress: TileProgress | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AcquisitionBatch:
+    """The jobs one request queued, under the id that follows them.
+
+    A work already waiting or running when it was asked for again is not queued
+    twice: its existing job is returned here, under the batch that queued it.
+    """
+
+    batch_id: str
+    jobs: Sequence[AcquisitionJob]
+
+
+@dataclass(frozen=True, slots=True)
+class AcquisitionQueueStatus:
+    """The queue as a whole, and the jobs a caller asked about."""
+
+    #: Every job this process still holds, or one batch's, in the order queued.
+    jobs: Sequence[AcquisitionJob]
+    #: Across the whole queue, whatever `jobs` was narrowed to.
+    queued: int
+    running: int
+    #: What every fetch in flight has reserved against the disk, queued or not.
+    reserved_bytes: int
+
+
+@dataclass(frozen=True, slots=True)
+class AcquisitionQueueSettings:
+    """How many fetches run at once, in total and per method."""
+
+    workers: int
+    #: `dezoomify` fetches at once. Each is a subprocess and a tile cache.
+    tiled_workers: int
+    #: `direct_http` fetches at once.
+    direct_workers: int
+
+    def __post_init__(self) -> None:
+        for name in ("workers", "tiled_workers", "direct_workers"):
+            if getattr(self, name) <= 0:
+                raise ServiceError(f"The acquisition queue needs at least one of {name}, got {getattr(self, name)}.")
+
+
+def _daemon_thread(work: Callable[[], None]) -> None:
+    """Run one queue worker behind the handle that was already returned.
+
+    A daemon thread for the reason a discovery run's is one: a fetch in flight
+    when the process stops is a designed-for event. Its staged file is never
+    promoted, the held original is untouched, and asking again is safe.
+    """
+    threading.Thread(target=work, name="acquisition-worker", daemon=True).start()
+
+
+class AcquisitionQueue:
+    """Acquire works in the background, a bounded number at a time."""
+
+    def __init__(
+        self,
+        acquisition: AcquisitionService,
+        settings: AcquisitionQueueSettings,
+        *,
+        spawn: Callable[[Callable[[], None]], None] = _daemon_thread,
+    ) -> None:
+        self._acquisition = acquisition
+        self._settings = settings
+        self._spawn = spawn
+        #: Guards everything below, and is woken whenever a job changes state.
+        self._changed = threading.Condition()
+        #: Every job still answered for, in the order queued.
+        self._jobs: dict[str, AcquisitionJob] = {}
+        #: Queue order, for breaking a tie in priority. A counter rather than the
+        #: enqueue time, which two jobs of one batch share.
+        self._sequence: dict[str, int] = {}
+        self._counter = itertools.count()
+        #: Fetches in flight, per method.
+        self._running: Counter[AcquisitionMethod] = Counter()
+        #: Workers alive. Each takes jobs until none it may start is left.
+        self._workers = 0
+        self._closed = False
+
+    # -- reads ----------------------------------------------------------------
+
+    def status(self, *, batch_id: str | None = None) -> AcquisitionQueueStatus:
+        """The queue's depth, and every job it holds — or one batch's."""
+        with self._changed:
+            jobs = list(self._jobs.values())
+            if batch_id is not None:
+                jobs = [job for job in jobs if job.batch_id == batch_id]
+                if not jobs:
+                    raise ServiceError(f"No acquisition batch {batch_id!r} is known to this process. {_FORGOTTEN}")
+            queued = sum(job.state is JobState.QUEUED for job in self._jobs.values())
+            running = sum(self._running.values())
+        return AcquisitionQueueStatus(
+            jobs=jobs,
+            queued=queued,
+            running=running,
+            reserved_bytes=self._acquisition.reserved_bytes,
+        )
+
+    def held(self, batch_id: str) -> list[str]:
+        """The works a batch's finished fetches left holding an image, in the order queued.
+
+        What preparing the batch starts from. A fetch that failed, or was never
+        made, leaves nothing new to compose; a `kept_held` one leaves the image
+        the work already had, which is as composable as a fresh one.
+        """
+        return [
+            job.artwork_id
+            for job in self.status(batch_id=batch_id).jobs
+            if job.state is JobState.FINISHED and job.outcome in _HOLDING
+        ]
+
+    # -- writes ---------------------------------------------------------------
+
+    def enqueue(self, artwork_ids: Sequence[str], *, priority: int = 0) -> AcquisitionBatch:
+        """Queue these works for acquisition and return at once.
+
+        **Every work is checked before any is queued.** A work with no source to
+        fetch from refuses the whole request, naming it, rather than leaving a
+        batch half-queued for a caller to reconcile. Naming a work twice queues
+        it once.
+        """
+        if not artwork_ids:
+            raise ServiceError("Name at least one work to acquire.")
+        if len(artwork_ids) > MAX_ACQUISITION_BATCH:
+            raise ServiceError(
+                f"At most {MAX_ACQUISITION_BATCH} works can be queued at once, and {len(artwork_ids)} were named. "
+                "Queue them in several batches."
+            )
+        planned = []
+        for artwork_id in dict.fromkeys(artwork_ids):
+            source = self._acquisition.source_for(artwork_id)
+            planned.append((source, self._acquisition.expected_bytes(source)))
+
+        batch_id = str(uuid.uuid4())
+        now = datetime.now(UTC)
+        jobs = []
+        with self._changed:
+            if self._closed:
+                raise ServiceError("The acquisition queue stopped with the plane, so nothing was queued.")
+            waiting = {job.artwork_id: job for job in self._jobs.values() if job.state not in _ENDED}
+            for source, expected in planned:
+                if (existing := waiting.get(source.artwork_id)) is not None:
+                    if existing.state is JobState.QUEUED and priority > existing.priority:
+                        # Asked for again, and more urgently: the one job moves up
+                        # rather than a second being queued behind it.
+                        existing = replace(existing, priority=priority)
+                        self._jobs[existing.id] = existing
+                    jobs.append(existing)
+                    continue
+                job = AcquisitionJob(
+                    id=str(uuid.uuid4()),
+                    batch_id=batch_id,
+                    artwork_id=source.artwork_id,
+                    source_id=source.id,
+                    provider=source.provider,
+                    method=source.acquisition_method,
+                    priority=priority,
+                    expected_bytes=expected,
+                    state=JobState.QUEUED,
+                    enqueued_at=now,
+                )
+                self._jobs[job.id] = job
+                self._sequence[job.id] = next(self._counter)
+                jobs.append(job)
+            self._forget_oldest()
+        log.info(
+            "queued %d acquisitions",
+            len(jobs),
+            extra={"event": "acquisition.queued", "batch_id": batch_id, "jobs": len(jobs), "priority": priority},
+        )
+        self._top_up()
+        return AcquisitionBatch(batch_id=batch_id, jobs=jobs)
+
+    def cancel(self, job_id: str | None = None, *, batch_id: str | None = None) -> list[AcquisitionJob]:
+        """Withdraw one waiting job, or every waiting job of a batch.
+
+        Returns the jobs named — the whole batch, for a batch — as they stand
+        afterwards, so a caller sees what is still running as well as what was
+        withdrawn. **A running fetch is not interrupted**: it finishes and its
+        result is recorded, because a fetch stopped halfway leaves a tile cache
+        and a staged file for nothing.
+        """
+        if (job_id is None) == (batch_id is None):
+            raise ServiceError("Name either a job_id or a batch_id to cancel.")
+        with self._changed:
+            if job_id is not None:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    raise ServiceError(f"No acquisition job {job_id!r} is known to this process. {_FORGOTTEN}")
+                if job.state is not JobState.QUEUED:
+                    raise ServiceError(
+                        f"Acquisition job {job_id!r} is {job.state}, so there is nothing to cancel. "
+                        "A fetch already running is not interrupted; it finishes and its result is recorded."
+                    )
+                named = [job.id]
+            else:
+                named = [job.id for job in self._jobs.values() if job.batch_id == batch_id]
+                if not named:
+                    raise ServiceError(f"No acquisition batch {batch_id!r} is known to this process. {_FORGOTTEN}")
+            withdrawn = self._withdraw(
+                [self._jobs[name] for name in named if self._jobs[name].state is JobState.QUEUED],
+                detail="Cancelled before it started; nothing was fetched.",
+            )
+            answered = [self._jobs[name] for name in named]
+        log.info(
+            "cancelled %d queued acquisitions",
+            withdrawn,
+            extra={"event": "acquisition.cancelled", "job_id": job_id, "batch_id": batch_id, "cancelled": withdrawn},
+        )
+        return answered
+
+    def shutdown(self) -> None:
+        """Withdraw every waiting job and take no more. Fetches in flight finish."""
+        with self._changed:
+            self._closed = True
+            self._withdraw(
+                [job for job in self._jobs.values() if job.state is JobState.QUEUED],
+                detail="The plane stopped before this started; nothing was fetched.",
+            )
+
+    # -- workers --------------------------------------------------------------
+
+    def _top_up(self) -> None:
+        """Start workers for whatever is waiting, up to the total."""
+        with self._changed:
+            waiting = sum(job.state is JobState.QUEUED for job in self._jobs.values())
+            wanted = max(0, min(self._settings.workers - self._workers, waiting))
+            self._workers += wanted
+        # Outside the lock, because a test's `spawn` runs the worker right here.
+        for _ in range(wanted):
+            self._spawn(self._work)
+
+    def _work(self) -> None:
+        while (job := self._claim()) is not None:
+            self._finish(job, *self._run(job))
+            # A finished fetch may have freed a lane or the disk for more than
+            # the one job this worker takes next.
+            self._top_up()
+
+    def _claim(self) -> AcquisitionJob | None:
+        with self._changed:
+            job = self._next_startable()
+            if job is None:
+                self._workers -= 1
+                return None
+            job = replace(job, state=JobState.RUNNING, started_at=datetime.now(UTC))
+            self._jobs[job.id] = job
+            self._running[job.method] += 1
+        log.info(
+            "acquisition job started for %s",
+            job.artwork_id,
+            extra={"event": "acquisition.job_started", "job_id": job.id, "artwork_id": job.artwork_id, "method": job.method},
+        )
+        return job
+
+    def _next_startable(self) -> AcquisitionJob | None:
+        """The first waiting job by priority whose lane and the disk can take it."""
+        waiting = sorted(
+            (job for job in self._jobs.values() if job.state is JobState.QUEUED),
+            key=lambda job: (-job.priority, self._sequence[job.id]),
+        )
+        in_flight = sum(self._running.values())
+        for job in waiting:
+            if self._running[job.method] >= self._lane(job.method):
+                continue
+            if in_flight and not self._acquisition.has_room(job.expected_bytes):
+                continue
+            return job
+        return None
+
+    def _lane(self, method: AcquisitionMethod) -> int:
+        if method is AcquisitionMethod.DEZOOMIFY:
+            return self._settings.tiled_workers
+        if method is AcquisitionMethod.DIRECT_HTTP:
+            return self._settings.direct_workers
+        # No fetch path exists for any other method, so `acquire` records the
+        # refusal at once; nothing is gained by queueing it behind a lane.
+        return self._settings.workers
+
+    def _run(self, job: AcquisitionJob) -> tuple[JobState, AcquisitionOutcome | None, str, Exception | None]:
+        try:
+            result = self._acquisition.acquire(
+                job.artwork_id,
+                source_id=job.source_id,
+                progress=lambda report: self._progressed(job.id, report),
+            )
+        except _STOPPING_FAULTS as exc:
+            # Journalled by `acquire` as a deployment fault already.
+            return JobState.REFUSED, None, str(exc), exc
+        except ServiceError as exc:
+            # The work changed under the queue — archived, or its source removed.
+            return JobState.REFUSED, None, str(exc), None
+        except Exception as exc:  # prawduct:allow prawduct/broad-except -- one job's failure must not stop the jobs behind it
+            log.exception(
+                "acquisition job for %s raised %s",
+                job.artwork_id,
+                type(exc).__name__,
+                extra={"event": "acquisition.job_crashed", "job_id": job.id},
+            )
+            return JobState.REFUSED, None, f"The acquisition failed unexpectedly ({type(exc).__name__}).", None
+        return JobState.FINISHED, result.outcome, result.detail, None
+
+    def _progressed(self, job_id: str, report: TileProgress) -> None:
+        """Record how a running job's fetch is going, for the next poll to read."""
+        with self._changed:
+            job = self._jobs.get(job_id)
+            # A report racing a cancel or a finish is dropped rather than
+            # written over the job's ending.
+            if job is not None and job.state is JobState.RUNNING:
+                self._jobs[job_id] = replace(job, progress=report)
+
+    def _finish(
+        self,
+        job: AcquisitionJob,
+        state: JobState,
+        outcome: AcquisitionOutcome | None,
+        detail: str,
+        fault: Exception | None,
+    ) -> None:
+        with self._changed:
+            self._running[job.method] -= 1
+            # From the table rather than `job`, which was claimed before any
+            # progress was reported against it.
+            current = self._jobs.get(job.id, job)
+            self._jobs[job.id] = replace(current, state=state, finished_at=datetime.now(UTC), outcome=outcome, detail=detail)
+            stopped = 0 if fault is None else self._withdraw(self._behind(job, fault), detail=_stopped_by(fault))
+            self._forget_oldest()
+        log.info(
+            "acquisition job for %s %s",
+            job.artwork_id,
+            state if outcome is None else f"{state} ({outcome.value})",
+            extra={
+                "event": "acquisition.job_finished",
+                "job_id": job.id,
+                "artwork_id": job.artwork_id,
+                "state": state.value,
+                "outcome": None if outcome is None else outcome.value,
+            },
+        )
+        if stopped:
+            log.warning(
+                "cancelled %d queued acquisitions behind a deployment fault",
+                stopped,
+                extra={"event": "acquisition.queue_stopped", "condition": type(fault).__name__, "cancelled": stopped},
+            )
+
+    def _behind(self, refused: AcquisitionJob, fault: Exception) -> list[AcquisitionJob]:
+        """The waiting jobs `fault` would refuse too."""
+        waiting = [job for job in self._jobs.values() if job.state is JobState.QUEUED]
+        if isinstance(fault, NotEnoughSpace):
+            return waiting
+        if isinstance(fault, TileTargetUnavailable):
+            # One provider's image service, not every tiled fetch.
+            return [job for job in waiting if job.method is refused.method and job.provider == refused.provider]
+        return [job for job in waiting if job.method is refused.method]
+
+    def _withdraw(self, jobs: Sequence[AcquisitionJob], *, detail: str) -> int:
+        now = datetime.now(UTC)
+        for job in jobs:
+            self._jobs[job.id] = replace(job, state=JobState.CANCELLED, finished_at=now, detail=detail)
+        self._changed.notify_all()
+        return len(jobs)
+
+    def _forget_oldest(self) -> None:
+        ended = [job.id for job in self._jobs.values() if job.state in _ENDED]
+        for job_id in ended[: max(0, len(ended) - _RETAINED_ENDED_JOBS)]:
+            del self._jobs[job_id]
+            del self._sequence[job_id]
+
+
+#: Said wherever an id is not found, because the likeliest reason is not a typo.
+_FORGOTTEN: Final[str] = (
+    "The queue is held in memory, so a restart or a long enough history forgets it; "
+    "art_catalogue(action='sources') shows what each work's last fetch recorded."
+)
+
+
+def _stopped_by(fault: Exception) -> str:
+    return (
+        f"Not started: a job ahead of it was refused because {fault} Nothing was fetched or recorded for this work; "
+        "queue it again once that is resolved."
+    )
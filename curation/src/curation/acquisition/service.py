@@ -23,27 +23,36 @@ to a museum to look for a problem that is in this deployment.
 """
 
 import logging
-from collections.abc import Mapping
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, StrEnum
 from pathlib import Path
 from typing import Final
 
+from curation.acquisition.blobs import BlobStore
 from curation.acquisition.dezoomify import (
     DezoomifyUnavailable,
     TileOutcome,
+    TileProgressSink,
     reclaim_tile_cache,
     tile_fetch,
 )
 from curation.acquisition.direct import StreamOpener, direct_fetch
-from curation.acquisition.space import NotEnoughSpace, require_free_space
+from curation.acquisition.iiif import CANVAS_BYTES_PER_PIXEL, DEFAULT_TILE_CONCURRENCY, iiif_fetch
+from curation.acquisition.space import NotEnoughSpace, SpaceLedger
 from curation.acquisition.tiles import TileTargetResolver, TileTargetUnavailable, resolve_tile_target
 from curation.acquisition.urls import Resolver, UrlRefused, check_fetchable, system_resolver
+from curation.acquisition.witness import Witnessed, witness_file
 from curation.discovery.images import ImageSearchFailure
-from curation.persistence.records import AcquisitionMethod, FetchStatus, Source
+from curation.persistence.records import AcquisitionMethod, FetchStatus, Original, Source
+from curation.providers import ProviderGuard
 from curation.services.catalogue import CatalogueService
 from curation.services.errors import ServiceError
-from curation.services.imaging import measure
+from curation.services.imaging import measure, measure_head
+from curation.services.imaging_pool import ImagingPool
 
 log = logging.getLogger(__name__)
 
@@ -52,6 +61,12 @@ log = logging.getLogger(__name__)
 #: by title and could not hold two works with the same name.
 _FILENAME: Final[str] = "{artwork_id}.jpg"
 
+#: What a tiled fetch is expected to write per pixel of its ceiling, with no held
+#: image to go by: the tiles in their cache and the assembled master beside them,
+#: both JPEG. A museum scan at gallery quality runs well under a byte per pixel
+#: for either, so half a byte for the pair is the ceiling rather than the norm.
+_TILED_PIXELS_PER_EXPECTED_BYTE: Final[int] = 2
+
 #: The conditions acquisition **raises for rather than records**, gathered so the
 #: journal line below follows the condition instead of the caller. Every one of
 #: them breaks acquisition for the whole deployment rather than for one source: a
@@ -100,6 +115,20 @@ def _journal_deployment_fault(exc: Exception, *, artwork_id: str) -> None:
     )
 
 
+class TileFetcher(StrEnum):
+    """Which fetcher a tiled source is read with.
+
+    `dezoomify` is the subprocess this plane has always run, and stays the
+    default: it reads formats beyond IIIF that no source here uses yet, and a
+    deployment that has it working has no reason to change. `iiif` is the
+    in-process fetcher, which needs no binary and reuses one connection pool —
+    for the deployments where the binary is the thing that is missing.
+    """
+
+    DEZOOMIFY = "dezoomify"
+    IIIF = "iiif"
+
+
 class AcquisitionOutcome(Enum):
     """How an attempt ended, from the catalogue's point of view."""
 
@@ -158,6 +187,10 @@ class AcquisitionSettings:
     tile_timeout_seconds: int
     max_image_bytes: int
     min_free_bytes: int
+    tile_fetcher: TileFetcher = TileFetcher.DEZOOMIFY
+    #: Tile requests in flight at once, for the in-process fetcher only; the
+    #: binary keeps its own.
+    tile_concurrency: int = DEFAULT_TILE_CONCURRENCY
 
     def __post_init__(self) -> None:
         """Refuse a tree outside `ART_ROOT` at wiring time rather than mid-fetch.
@@ -183,6 +216,9 @@ class AcquisitionService:
         open_stream: StreamOpener,
         tile_targets: Mapping[str, TileTargetResolver],
         resolve: Resolver = system_resolver,
+        warm: Callable[[str], None] | None = None,
+        imaging: ImagingPool | None = None,
+        guard: ProviderGuard | None = None,
     ) -> None:
         self._catalogue = catalogue
         self._settings = settings
@@ -202,30 +238,137 @@ class AcquisitionService:
         #: would make every rule above it depend on the network the suite runs
         #: on, including the rules that have nothing to do with hosts.
         self._resolve = resolve
+        #: The process's pacing and breakers, for the in-process tile fetcher's
+        #: own client. The direct fetch's is in `open_stream` already.
+        self._guard = guard
+        #: Told the id of every work whose original this service just replaced,
+        #: so its thumbnails can be drawn before anyone opens the grid. Optional
+        #: because nothing here depends on it having happened: a work nobody
+        #: warmed is drawn on its first request, exactly as it always was.
+        self._warm = warm
+        #: Where a fetched file's header is read. A header is cheap, but these
+        #: are bytes a stranger chose, so they are parsed under the same
+        #: ceilings as every other decode.
+        self._imaging = imaging or ImagingPool(workers=0)
+        #: What the fetches in flight expect to write. Shared by every call into
+        #: this service, so the floor each fetch checks counts the others.
+        self._space = SpaceLedger()
+        #: Where each distinct image is held once. A work's path is a link into
+        #: it, so two works holding one museum image hold one file.
+        self._blobs = BlobStore(settings.originals_path)
+        #: The sources being fetched from now, counted because two callers may
+        #: fetch one source at once. Read by the storage governor, which must
+        #: never evict the tile cache a fetch is writing into.
+        self._fetching: Counter[str] = Counter()
+        self._fetching_lock = threading.Lock()
+
+    @property
+    def reserved_bytes(self) -> int:
+        """What the fetches in flight have reserved against the disk."""
+        return self._space.reserved_bytes
+
+    def fetching(self) -> frozenset[str]:
+        """The ids of the sources a fetch is running against, now."""
+        with self._fetching_lock:
+            return frozenset(self._fetching)
+
+    def source_for(self, artwork_id: str, *, source_id: str | None = None) -> Source:
+        """The source `acquire` would fetch from, refused on the same terms."""
+        return self._select_source(artwork_id, source_id=source_id)
+
+    def expected_bytes(self, source: Source) -> int:
+        """The most a fetch from `source` is expected to write, for its reservation.
+
+        The held image when there is one, which is the best evidence of what the
+        same work weighs — doubled for a tiled fetch, whose tiles sit in their
+        cache beside the assembled master until it is promoted. Without one, the
+        ceiling the fetch path itself enforces: a direct fetch's body limit, or a
+        tiled fetch's pixel limit at the rate above.
+
+        The in-process tile fetcher also stitches through an uncompressed canvas
+        file, briefly, and that is counted too: it is the largest thing the
+        fetch writes, and a floor that forgot it would be met by a full disk.
+        """
+        tiled = source.acquisition_method is AcquisitionMethod.DEZOOMIFY
+        held = self._catalogue.get_original(source.artwork_id)
+        canvas = 0
+        if tiled and self._settings.tile_fetcher is TileFetcher.IIIF:
+            if held is not None and held.width and held.height:
+                canvas = held.width * held.height * CANVAS_BYTES_PER_PIXEL
+            else:
+                canvas = self._settings.tile_max_pixels**2 * CANVAS_BYTES_PER_PIXEL
+        if held is not None and held.byte_size:
+            return held.byte_size * (2 if tiled else 1) + canvas
+        if tiled:
+            return self._settings.tile_max_pixels**2 // _TILED_PIXELS_PER_EXPECTED_BYTE + canvas
+        if source.acquisition_method is AcquisitionMethod.DIRECT_HTTP:
+            return self._settings.max_image_bytes
+        # A method with no fetch path writes nothing; see the end of `_fetch`.
+        return 0
+
+    def has_room(self, expected_bytes: int) -> bool:
+        """Whether a fetch expecting `expected_bytes` would clear the floor now."""
+        return self._space.fits(
+            self._settings.originals_path, floor_bytes=self._settings.min_free_bytes, expected_bytes=expected_bytes
+        )
 
-    def acquire(self, artwork_id: str, *, source_id: str | None = None) -> AcquisitionResult:
+    def acquire(
+        self, artwork_id: str, *, source_id: str | None = None, progress: TileProgressSink | None = None
+    ) -> AcquisitionResult:
         """Fetch this work's image and record what came back.
 
         `source_id` names which source to use; omitting it takes the work's
         primary, and a work with no primary source is a refusal rather than a
         guess — "which of these is the right one" is exactly the judgement
         acceptance already made, and re-making it here could silently disagree.
+
+        `progress` is told how a tiled fetch is going while it runs; a direct
+        fetch is one body and reports nothing.
         """
         try:
-            return self._acquire(artwork_id, source_id=source_id)
+            return self._acquire(artwork_id, source_id=source_id, progress=progress)
         except _DEPLOYMENT_FAULTS as exc:
             _journal_deployment_fault(exc, artwork_id=artwork_id)
             raise
 
-    def _acquire(self, artwork_id: str, *, source_id: str | None = None) -> AcquisitionResult:
+    def _acquire(self, artwork_id: str, *, source_id: str | None, progress: TileProgressSink | None) -> AcquisitionResult:
         source = self._select_source(artwork_id, source_id=source_id)
 
         # Before anything is fetched, and before the URL is even looked at: a disk
         # with no headroom is not a fact about this source, and checking it after
         # a 900 MB download would be checking it too late to prevent anything.
-        require_free_space(self._settings.originals_path, required_bytes=self._settings.min_free_bytes)
-
+        # Held until the fetch is recorded, so a fetch starting meanwhile counts
+        # what this one may yet write.
+        with (
+            self._space.reserve(
+                self._settings.originals_path,
+                floor_bytes=self._settings.min_free_bytes,
+                expected_bytes=self.expected_bytes(source),
+            ),
+            self._fetching_from(source.id),
+        ):
+            return self._fetch(source, artwork_id=artwork_id, progress=progress)
+
+    @contextmanager
+    def _fetching_from(self, source_id: str) -> Iterator[None]:
+        with self._fetching_lock:
+            self._fetching[source_id] += 1
+        try:
+            yield
+        finally:
+            with self._fetching_lock:
+                self._fetching[source_id] -= 1
+                if not self._fetching[source_id]:
+                    del self._fetching[source_id]
+
+    def _fetch(self, source: Source, *, artwork_id: str, progress: TileProgressSink | None) -> AcquisitionResult:
         destination = self._settings.originals_path / _FILENAME.format(artwork_id=artwork_id)
+        if (known := self._already_held(source)) is not None:
+            # Before the tile target is resolved, which is itself a request to
+            # the museum: a URL this catalogue has already turned into an image
+            # is answered from disk, whichever work it was fetched for.
+            held, path = known
+            return self._record_known(source, held=held, path=path, destination=destination)
         if source.acquisition_method is AcquisitionMethod.DEZOOMIFY:
             # The recorded URL identifies the object; the tile fetcher needs the
             # image service. For most providers those are the same string, and for
@@ -267,7 +410,7 @@ class AcquisitionService:
                 return self._record_failure(source, f"no image service could be reached for this source: {exc}")
             except UrlRefused as exc:
                 return self._record_failure(source, f"the resolved image service URL was refused: {exc}")
-            return self._acquire_tiled(source, url=url, destination=destination)
+            return self._acquire_tiled(source, url=url, destination=destination, progress=progress)
         if source.acquisition_method is AcquisitionMethod.DIRECT_HTTP:
             # Checked here rather than before the dispatch, and the difference is
             # not tidiness. `Source.url` identifies the object and is *not*
@@ -294,25 +437,46 @@ class AcquisitionService:
             "no source in this deployment records it",
         )
 
-    def _acquire_tiled(self, source: Source, *, url: str, destination: Path) -> AcquisitionResult:
+    def _acquire_tiled(
+        self, source: Source, *, url: str, destination: Path, progress: TileProgressSink | None
+    ) -> AcquisitionResult:
         # Its own directory per source, which is what makes the reclaim below
         # precise: one shared cache could only ever be emptied wholesale, taking
         # the tiles of a fetch that is still worth resuming.
         tile_cache = self._settings.tile_cache_path / source.id
-        # `DezoomifyUnavailable` is deliberately allowed to propagate rather than
-        # recorded against the source: no URL is at fault, and a `failed` row here
-        # would send whoever reads it to a museum rather than to the deployment
-        # that is missing a binary.
-        result = tile_fetch(
-            url,
-            destination=destination,
-            tile_cache=tile_cache,
-            binary=self._settings.tile_binary,
-            user_agent=self._settings.user_agent,
-            max_width=self._settings.tile_max_pixels,
-            max_height=self._settings.tile_max_pixels,
-            timeout_seconds=self._settings.tile_timeout_seconds,
-        )
+        if self._settings.tile_fetcher is TileFetcher.IIIF:
+            # The service answers with the addresses its tiles live at, so they
+            # are put through the same policy as the one that found it.
+            result = iiif_fetch(
+                url,
+                destination=destination,
+                tile_cache=tile_cache,
+                user_agent=self._settings.user_agent,
+                max_width=self._settings.tile_max_pixels,
+                max_height=self._settings.tile_max_pixels,
+                timeout_seconds=self._settings.tile_timeout_seconds,
+                check=lambda address: check_fetchable(address, resolve=self._resolve),
+                concurrency=self._settings.tile_concurrency,
+                progress=progress,
+                guard=self._guard,
+                imaging=self._imaging,
+            )
+        else:
+            # `DezoomifyUnavailable` is deliberately allowed to propagate rather
+            # than recorded against the source: no URL is at fault, and a `failed`
+            # row here would send whoever reads it to a museum rather than to the
+            # deployment that is missing a binary.
+            result = tile_fetch(
+                url,
+                destination=destination,
+                tile_cache=tile_cache,
+                binary=self._settings.tile_binary,
+                user_agent=self._settings.user_agent,
+                max_width=self._settings.tile_max_pixels,
+                max_height=self._settings.tile_max_pixels,
+                timeout_seconds=self._settings.tile_timeout_seconds,
+                progress=progress,
+            )
 
         if not result.usable:
             return self._record_failure(source, result.detail)
@@ -322,8 +486,10 @@ class AcquisitionService:
             source,
             staged=result.path,
             destination=destination,
-            byte_size=result.byte_size,
-            content_hash=_hash_file(result.path),
+            # The in-process fetcher watched its file being written; the binary
+            # wrote its own, so that one is read back — once, for both the hash
+            # and the header.
+            witnessed=result.witnessed or _witness_staged(result.path),
             status=status,
             detail=result.detail,
         )
@@ -348,8 +514,7 @@ class AcquisitionService:
             source,
             staged=result.path,
             destination=destination,
-            byte_size=result.byte_size,
-            content_hash=result.content_hash,
+            witnessed=result.witnessed,
             status=FetchStatus.OK,
             detail=result.detail,
         )
@@ -360,8 +525,7 @@ class AcquisitionService:
         *,
         staged: Path | None,
         destination: Path,
-        byte_size: int,
-        content_hash: str | None,
+        witnessed: Witnessed | None,
         status: FetchStatus,
         detail: str,
     ) -> AcquisitionResult:
@@ -385,8 +549,14 @@ class AcquisitionService:
         the surface recommends retrying after a partial result. So quality is
         compared here, and a result that would lower it is discarded with the held
         image untouched.
+
+        **Nothing here reads the staged file back when the fetch already has.**
+        `witnessed` carries the hash and the head of the file, learnt as it was
+        written, and the proof of readability is taken from that head. The file
+        is opened only when the head stops short of the header, which a format
+        keeping its header at the end can do.
         """
-        assert staged is not None and content_hash is not None  # noqa: S101 - guarded by `usable` above
+        assert staged is not None and witnessed is not None  # noqa: S101 - guarded by `usable` above
         # Derived rather than passed alongside `status`. Both call sites computed
         # it from `status` by the same rule, and taking the pair made the
         # disagreement representable — `status=OK` with `outcome=PARTIAL` would
@@ -420,7 +590,7 @@ class AcquisitionService:
                 detail=refusal,
             )
         try:
-            width, height = measure(staged)
+            (width, height), header_reread = self._imaging.run("measure", _measure_staged, staged, witnessed.head)
         except Exception as exc:  # prawduct:allow prawduct/broad-except -- attacker-influenced bytes, reported not raised
             # Bytes arrived and are not an image this process can read. A failed
             # acquisition rather than a held original: a row naming an undecodable
@@ -449,7 +619,8 @@ class AcquisitionService:
             _discard(staged)
             return self._record_failure(source, f"the fetched bytes are not a readable image: {exc}")
 
-        staged.replace(destination)
+        previous = self._catalogue.get_original(source.artwork_id)
+        placed = self._blobs.promote(staged, content_hash=witnessed.content_hash, destination=destination)
         relative = str(destination.relative_to(self._settings.art_root))
         self._catalogue.record_original(
             artwork_id=source.artwork_id,
@@ -457,24 +628,33 @@ class AcquisitionService:
             path=relative,
             width=width,
             height=height,
-            byte_size=byte_size,
-            content_hash=content_hash,
+            byte_size=witnessed.byte_size,
+            content_hash=witnessed.content_hash,
             fetch_status=status,
         )
         self._catalogue.record_fetch(source.id, status=status)
-        if not source.is_primary:
-            # The source that produced the held original is what `is_primary`
-            # means, so acquiring from a different one moves it rather than
-            # leaving the catalogue asserting something that is no longer true.
-            self._catalogue.set_primary_source(source.id)
+        self._now_held(source, previous=previous, content_hash=witnessed.content_hash)
         log.info(
             "acquired %s from %s as %s (%s bytes, %sx%s)",
             source.artwork_id,
             source.provider,
             status.value,
-            byte_size,
+            witnessed.byte_size,
             width,
             height,
+            extra={
+                "event": "acquisition.acquired",
+                "artwork_id": source.artwork_id,
+                "byte_size": witnessed.byte_size,
+                # What promotion cost in reads beyond the fetch itself: the
+                # bytes read back to hash them, and whether the header had to
+                # be opened from disk. Both are zero on a path that watched its
+                # file being written.
+                "reread_bytes": witnessed.reread_bytes,
+                "header_reread": header_reread,
+                "shared": placed.shared,
+                "linked": placed.linked,
+            },
         )
         return AcquisitionResult(
             artwork_id=source.artwork_id,
@@ -482,11 +662,95 @@ class AcquisitionService:
             outcome=outcome,
             detail=detail,
             relative_path=relative,
-            byte_size=byte_size,
+            byte_size=witnessed.byte_size,
             width=width,
             height=height,
         )
 
+    def _already_held(self, source: Source) -> tuple[Original, Path] | None:
+        """The original this source's URL already produced for another work, and a file holding it.
+
+        Keyed by the URL rather than by an ETag: a museum's image URLs name one
+        scan each, nothing here stores an ETag to compare, and asking for one is
+        the round trip this exists to skip. The cost is that a museum replacing
+        the image behind an unchanged URL is not noticed — which the fetch path
+        never noticed either, except by being asked again.
+
+        The file is checked against the row's size before it is trusted, so an
+        image replaced or truncated by hand is fetched afresh rather than linked
+        into a second work.
+        """
+        held = self._catalogue.find_held_original(source.url, other_than=source.artwork_id)
+        if held is None:
+            return None
+        for candidate in (self._blobs.path_for(held.content_hash), self._settings.art_root / held.relative_path):
+            try:
+                if candidate.stat().st_size == held.byte_size:
+                    return held, candidate
+            except OSError:
+                continue
+        return None
+
+    def _record_known(self, source: Source, *, held: Original, path: Path, destination: Path) -> AcquisitionResult:
+        """Hold an image already on disk for this work, and record it as this source's.
+
+        Recorded as an `ok` fetch of the source, because that is what a fetch
+        would establish and the bytes it would have returned are the ones held:
+        `last_fetched_at` is when this source was last answered, not when a
+        request last left the process.
+        """
+        previous = self._catalogue.get_original(source.artwork_id)
+        placed = self._blobs.place(path, content_hash=held.content_hash, destination=destination)
+        relative = str(destination.relative_to(self._settings.art_root))
+        self._catalogue.record_original(
+            artwork_id=source.artwork_id,
+            source_id=source.id,
+            path=relative,
+            width=held.width,
+            height=held.height,
+            byte_size=held.byte_size,
+            content_hash=held.content_hash,
+            fetch_status=held.fetch_status,
+        )
+        self._catalogue.record_fetch(source.id, status=FetchStatus.OK)
+        self._now_held(source, previous=previous, content_hash=held.content_hash)
+        log.info(
+            "acquired %s from %s without fetching: the image was already held",
+            source.artwork_id,
+            source.provider,
+            extra={
+                "event": "acquisition.reused",
+                "artwork_id": source.artwork_id,
+                "from_artwork_id": held.artwork_id,
+                "byte_size": held.byte_size,
+                "linked": placed.linked,
+            },
+        )
+        return AcquisitionResult(
+            artwork_id=source.artwork_id,
+            source_id=source.id,
+            outcome=AcquisitionOutcome.ACQUIRED,
+            detail=f"already held ({held.byte_size} bytes); nothing was fetched",
+            relative_path=relative,
+            byte_size=held.byte_size,
+            width=held.width,
+            height=held.height,
+        )
+
+    def _now_held(self, source: Source, *, previous: Original | None, content_hash: str) -> None:
+        """What follows a work's path coming to name a new image, however it came."""
+        if not source.is_primary:
+            # The source that produced the held original is what `is_primary`
+            # means, so acquiring from a different one moves it rather than
+            # leaving the catalogue asserting something that is no longer true.
+            self._catalogue.set_primary_source(source.id)
+        if previous is not None and previous.content_hash and previous.content_hash != content_hash:
+            # The work's path no longer links the old image; if no other work
+            # does either, its blob is the last copy of bytes nothing holds.
+            self._blobs.release(previous.content_hash)
+        if self._warm is not None:
+            self._warm(source.artwork_id)
+
     def _would_lower_quality(self, artwork_id: str, *, incoming: FetchStatus) -> str | None:
         """Say why this result must not replace the held original, or nothing.
 
@@ -558,21 +822,30 @@ class AcquisitionService:
         raise ServiceError(f"Artwork {artwork_id!r} has {len(sources)} sources and none is primary; " "name one with source_id.")
 
 
-def _hash_file(path: Path | None) -> str:
-    """Hash a file the fetch path did not hash while writing it.
+def _witness_staged(path: Path | None) -> Witnessed:
+    """Witness a file the fetch path could not watch being written.
 
-    The tiled path cannot: the bytes are assembled by another process, so there
-    is no stream to hash as it passes. The direct path hashes while streaming and
-    never reaches here.
+    The binary assembles its file in another process, so there is no stream to
+    see; this is the one pass over it that promotion then needs none beyond.
     """
-    import hashlib
-
     assert path is not None  # noqa: S101 - only called for a usable result
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(block)
-    return digest.hexdigest()
+    return witness_file(path)
+
+
+def _measure_staged(staged: Path, head: bytes) -> tuple[tuple[int, int], bool]:
+    """The staged image's size, and whether the file had to be opened for it.
+
+    From the head kept in flight when it reaches past the header, which for the
+    JPEGs this plane fetches it always does. Any failure there is only a short
+    head until the file says otherwise, so the file is asked before anything is
+    reported — and what it raises is the verdict.
+    """
+    if head:
+        try:
+            return measure_head(head), False
+        except Exception as exc:  # prawduct:allow prawduct/broad-except -- the file below is the verdict
+            log.debug("the kept head of %s did not measure: %s", staged.name, exc)
+    return measure(staged), True
 
 
 def _discard(path: Path) -> None:
@@ -19,9 +19,22 @@ says the opposite: it is a fact about the machine, every work behind this one wi
 hit it, and continuing means writing rows about failures that have one cause. So
 this stops, and the surface translates it into a refusal naming the remedy rather
 than letting it read as "the fetch failed unexpectedly".
+
+**Fetches in flight are counted against the floor, by what each expects to
+write.** A floor checked per fetch was sound while fetches ran one at a time. Run
+several together and each sees the disk as it was before any of them wrote, so
+four fetches that each fit could together land the catalogue's disk below the
+floor every one of them checked. So each fetch reserves what it expects to write
+before it starts, the check counts every reservation still held, and the
+reservation is released when the fetch ends, written or not. An expectation is an
+upper bound rather than a prediction, for the reason the floor is one: a guess
+that ran low is the one that fills the disk.
 """
 
 import shutil
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -61,15 +74,59 @@ def check_free_space(path: Path, *, required_bytes: int) -> SpaceCheck:
     return SpaceCheck(free_bytes=usage.free, required_bytes=required_bytes)
 
 
-def require_free_space(path: Path, *, required_bytes: int) -> SpaceCheck:
-    """Raise `NotEnoughSpace` unless the floor is clear, and say by how much."""
-    check = check_free_space(path, required_bytes=required_bytes)
-    if not check.sufficient:
-        raise NotEnoughSpace(
-            f"{_gib(check.free_bytes)} free where {_gib(check.required_bytes)} is required "
-            f"({_gib(check.shortfall_bytes)} short); acquisition would risk the catalogue on the same disk."
-        )
-    return check
+class SpaceLedger:
+    """The bytes promised to fetches in flight, so each floor check counts the others.
+
+    One per acquisition service, shared by every fetch it runs — a single call
+    from a tool and a queued job alike — because a reservation only protects
+    against the fetches that can see it.
+    """
+
+    def __init__(self) -> None:
+        self._guard = threading.Lock()
+        self._reserved = 0
+
+    @property
+    def reserved_bytes(self) -> int:
+        with self._guard:
+            return self._reserved
+
+    def fits(self, path: Path, *, floor_bytes: int, expected_bytes: int) -> bool:
+        """Whether a fetch expecting `expected_bytes` could reserve them now."""
+        with self._guard:
+            return check_free_space(path, required_bytes=floor_bytes + self._reserved + expected_bytes).sufficient
+
+    @contextmanager
+    def reserve(self, path: Path, *, floor_bytes: int, expected_bytes: int) -> Iterator[SpaceCheck]:
+        """Hold `expected_bytes` for the length of the block, or raise `NotEnoughSpace`.
+
+        The check and the reservation are one step under the lock, so two
+        fetches starting together cannot both pass a check that only one of
+        them fits.
+        """
+        with self._guard:
+            reserved = self._reserved
+            check = check_free_space(path, required_bytes=floor_bytes + reserved + expected_bytes)
+            if not check.sufficient:
+                raise NotEnoughSpace(_refusal(check, expected_bytes=expected_bytes, reserved_bytes=reserved))
+            self._reserved += expected_bytes
+        try:
+            yield check
+        finally:
+            with self._guard:
+                self._reserved -= expected_bytes
+
+
+def _refusal(check: SpaceCheck, *, expected_bytes: int, reserved_bytes: int) -> str:
+    """Say how short the disk is, and what the requirement was made of."""
+    counted = f"{_gib(expected_bytes)} this fetch may write"
+    if reserved_bytes:
+        counted += f" and {_gib(reserved_bytes)} reserved by fetches in flight"
+    return (
+        f"{_gib(check.free_bytes)} free where {_gib(check.required_bytes)} is required "
+        f"({_gib(check.shortfall_bytes)} short, counting {counted}); "
+        "acquisition would risk the catalogue on the same disk."
+    )
 
 
 def _gib(value: int) -> str:
@@ -7,14 +7,16 @@ This module is the thin part that is exercised live instead.
 """
 
 import logging
+import re
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from typing import Final, Never
 
 import httpx
 
-from curation.acquisition.direct import StreamOpener
+from curation.acquisition.direct import ResumeFrom, ServedBody, StreamOpener
 from curation.acquisition.urls import check_fetchable
+from curation.providers import ProviderGuard
 from curation.services.errors import ServiceError
 
 log = logging.getLogger(__name__)
@@ -36,12 +38,16 @@ CHUNK_BYTES: Final[int] = 64 * 1024
 #: trying to exhaust the follower.
 MAX_REDIRECTS: Final[int] = 5
 
+#: Where a ranged answer says its body starts. Only the start is read: the end
+#: and the total are the server's claims, and the ceiling is enforced on bytes.
+_CONTENT_RANGE: Final[re.Pattern[str]] = re.compile(r"^\s*bytes\s+(\d+)-\d+/(?:\d+|\*)\s*$")
+
 #: The policy each hop is put through. A parameter so the redirect handling can be
 #: exercised without a resolver, for the same reason the service takes one.
 UrlCheck = Callable[[str], str]
 
 
-def http_stream(user_agent: str, *, check: UrlCheck = check_fetchable) -> StreamOpener:
+def http_stream(user_agent: str, *, check: UrlCheck = check_fetchable, guard: ProviderGuard | None = None) -> StreamOpener:
     """Build a stream opener that identifies itself as this deployment asked.
 
     **Redirects are followed one hop at a time, and every hop is re-checked.**
@@ -53,39 +59,89 @@ def http_stream(user_agent: str, *, check: UrlCheck = check_fetchable) -> Stream
     to deny, through the one door it does not watch. So the following is done here
     rather than by the client, and each `Location` goes through the same check as
     the original.
+
+    **One client for every fetch this opener makes**, so a batch from one museum
+    reuses its connections rather than paying a TLS handshake per image. It
+    lives as long as the opener, which is as long as the process.
+
+    **A resumed fetch asks for the rest, and only if the file is the same one.**
+    `Range` with `If-Range` carrying the validator the interrupted fetch was
+    given: a server whose file changed answers `200` with all of it, which the
+    fetch takes as a fresh start. A validator is handed back only when the server
+    says it serves ranges, so nothing is kept for a resume that cannot happen.
+
+    **With a `guard`, every hop is paced and broken by its host**, redirects
+    included: a museum that moved its images to a CDN is asked at the CDN's
+    pace, and one that is down refuses the next fetch at once rather than after
+    a full connect timeout.
     """
+    timeout = httpx.Timeout(READ_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS)
+    client = httpx.Client(timeout=timeout, follow_redirects=False, transport=None if guard is None else guard.transport())
 
     @contextmanager
-    def open_stream(url: str) -> Iterator[Iterator[bytes]]:
-        timeout = httpx.Timeout(READ_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS)
-        with httpx.Client(timeout=timeout, follow_redirects=False) as client:
-            target = url
-            for _ in range(MAX_REDIRECTS + 1):
-                with client.stream("GET", target, headers={"User-Agent": user_agent}) as response:
-                    if response.is_redirect:
-                        location = response.headers.get("location")
-                        if not location:
-                            raise ServiceError(f"the source answered HTTP {response.status_code} with no location")
-                        # Resolved against the URL it came from, because a
-                        # `Location` may be relative — and a relative one that
-                        # went unresolved would be checked as a different string
-                        # than the one actually requested.
-                        target = check(str(response.url.join(location)))
-                        continue
-                    if response.status_code >= 400:
-                        # Read as a refusal rather than raised as a transport
-                        # fault: the caller records it against the source, which
-                        # is where a 404 from a museum that reorganised its site
-                        # belongs.
-                        raise ServiceError(f"the source answered HTTP {response.status_code}")
-                    yield response.iter_bytes(CHUNK_BYTES)
-                    return
-            raise ServiceError(f"the source redirected more than {MAX_REDIRECTS} times")
+    def open_stream(url: str, /, *, resume: ResumeFrom | None = None) -> Iterator[Iterator[bytes]]:
+        headers = {"User-Agent": user_agent}
+        if resume is not None:
+            headers |= {"Range": f"bytes={resume.offset}-", "If-Range": resume.validator}
+        target = url
+        for _ in range(MAX_REDIRECTS + 1):
+            with client.stream("GET", target, headers=headers) as response:
+                if response.is_redirect:
+                    location = response.headers.get("location")
+                    if not location:
+                        raise ServiceError(f"the source answered HTTP {response.status_code} with no location")
+                    # Resolved against the URL it came from, because a
+                    # `Location` may be relative — and a relative one that
+                    # went unresolved would be checked as a different string
+                    # than the one actually requested.
+                    target = check(str(response.url.join(location)))
+                    continue
+                if response.status_code == 416 and resume is not None:
+                    raise ServiceError(
+                        "the source could not serve the rest of the file (HTTP 416); the next attempt starts again"
+                    )
+                if response.status_code >= 400:
+                    # Read as a refusal rather than raised as a transport
+                    # fault: the caller records it against the source, which
+                    # is where a 404 from a museum that reorganised its site
+                    # belongs.
+                    raise ServiceError(f"the source answered HTTP {response.status_code}")
+                yield ServedBody(
+                    response.iter_bytes(CHUNK_BYTES),
+                    offset=_served_from(response),
+                    validator=_validator(response),
+                )
+                return
+        raise ServiceError(f"the source redirected more than {MAX_REDIRECTS} times")
 
     return open_stream
 
 
-def no_transport(_url: str) -> Never:
+def _served_from(response: httpx.Response) -> int:
+    """Where in the file this body starts: zero, unless the server sent a range."""
+    if response.status_code != 206:
+        return 0
+    match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+    if match is None:
+        raise ServiceError("the source answered with a range and did not say which")
+    return int(match.group(1))
+
+
+def _validator(response: httpx.Response) -> str | None:
+    """What to resume this body by, if the server serves ranges and names the file.
+
+    A weak `ETag` is passed over: `If-Range` accepts only a strong one, and a
+    server handed a weak one must answer with the whole body anyway.
+    """
+    if "bytes" not in response.headers.get("accept-ranges", "").lower():
+        return None
+    etag = response.headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("last-modified")
+
+
+def no_transport(_url: str, /, *, resume: ResumeFrom | None = None) -> Never:
     """The default when nothing wired a transport, and it says so.
 
     A deployment that reaches this has a wiring mistake rather than a bad source,
@@ -0,0 +1,114 @@
+"""What promotion needs to know about a fetched file, learnt while it is written.
+
+Promoting a staged fetch asks two things of it: its content hash, which the
+`Original` row records, and its header, which proves the bytes are an image and
+says how large. Both used to be answered by reading the file back once it was
+written — a full pass to hash it, and an open to measure it — and the files are
+museum masters on the slowest device in the deployment.
+
+**So the bytes are watched on the way to disk instead.** A `Witness` is handed
+every chunk as it is written: it hashes it, counts it, and keeps the first
+`HEAD_BYTES` of the file, which is where every format this plane fetches keeps
+the header and the orientation tag. The direct path feeds it from the response
+stream, and the in-process tile stitcher writes its JPEG through a
+`WitnessedWriter`.
+
+**One path cannot be watched, and is read once rather than twice.** The
+`dezoomify-rs` binary writes its file itself, so there is no stream to see; the
+file is read back in one pass by `witness_file`, which learns the head in the
+same pass that hashes it. Every byte read back rather than seen in flight is
+counted as `reread_bytes`, so the cost each path still pays is in the journal
+rather than in a comment.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Final
+
+#: How much of the start of a file is kept for measuring it. A JPEG's EXIF block
+#: is at most 64 KiB and sits before the frame header; the margin is for an ICC
+#: profile ahead of both. A header that does not fit is measured from the file,
+#: which costs an open rather than a wrong answer.
+HEAD_BYTES: Final[int] = 256 * 1024
+
+#: Read back in blocks when a file has to be witnessed from disk.
+_READ_BYTES: Final[int] = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Witnessed:
+    """What was learnt about one file: all of it hashed, the start of it kept."""
+
+    content_hash: str
+    byte_size: int
+    head: bytes
+    #: How many of `byte_size` were read back from disk rather than seen while
+    #: they were written. Zero is the point of this module.
+    reread_bytes: int = 0
+
+
+class Witness:
+    """Hashes, counts and keeps the head of a file as its bytes pass."""
+
+    __slots__ = ("_digest", "_head", "_reread", "_size")
+
+    def __init__(self) -> None:
+        self._digest = hashlib.sha256()
+        self._head = bytearray()
+        self._size = 0
+        self._reread = 0
+
+    def update(self, chunk: bytes) -> None:
+        """Take the next bytes of the file, in order."""
+        self._digest.update(chunk)
+        self._size += len(chunk)
+        if len(self._head) < HEAD_BYTES:
+            self._head += chunk[: HEAD_BYTES - len(self._head)]
+
+    def reread(self, chunk: bytes) -> None:
+        """Take the next bytes of the file, read back from disk to get them."""
+        self.update(chunk)
+        self._reread += len(chunk)
+
+    def witnessed(self) -> Witnessed:
+        return Witnessed(
+            content_hash=self._digest.hexdigest(),
+            byte_size=self._size,
+            head=bytes(self._head),
+            reread_bytes=self._reread,
+        )
+
+
+class WitnessedWriter:
+    """A binary file that shows every byte written through it to a witness.
+
+    **No `fileno`, on purpose.** Pillow's encoder writes straight to a file
+    descriptor when it is offered one, which would put the bytes on disk without
+    passing here; without it Pillow writes through `write`. **No `seek`
+    either**: a witness sees a file in order, and a writer that went back would
+    make the hash describe bytes nobody wrote. A format that needs to seek fails
+    loudly here rather than hashing wrongly.
+    """
+
+    __slots__ = ("_handle", "_witness")
+
+    def __init__(self, handle: BinaryIO, witness: Witness) -> None:
+        self._handle = handle
+        self._witness = witness
+
+    def write(self, data: bytes) -> int:
+        self._witness.update(data)
+        return self._handle.write(data)
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+
+def witness_file(path: Path) -> Witnessed:
+    """Witness a file some other process wrote, in one pass over it."""
+    witness = Witness()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(_READ_BYTES), b""):
+            witness.reread(block)
+    return witness.witnessed()
@@ -30,6 +30,7 @@ from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from starlette.types import Receive, Scope, Send
 
 from curation.http import api, pages
+from curation.http.assets import build_bundle
 from curation.mcp.server import build_server
 from curation.services.container import Services
 from curation.services.errors import ServiceError
@@ -57,7 +58,7 @@ MCP_SESSION_IDLE_TIMEOUT_SECONDS: Final[float] = 1800.0
 STATIC_PATH: Final[str] = "/static"
 
 
-def create_app(services: Services, *, preview_sweep_interval_seconds: int = 0) -> FastAPI:
+def create_app(services: Services, *, preview_sweep_interval_seconds: int = 0, warm_thumbnails: bool = False) -> FastAPI:
     """Build the application around already-constructed services.
 
     They are injected rather than assembled here so that a test can run the real
@@ -68,7 +69,9 @@ def create_app(services: Services, *, preview_sweep_interval_seconds: int = 0) -
     point is what asks. A background thread that deletes files is not something a
     test harness should acquire by constructing the application: a suite that
     accepted a work and then read its review card would be racing a reclamation
-    it never opted into, and the failure would be intermittent.
+    it never opted into, and the failure would be intermittent. **Thumbnail
+    warming is off on the same terms**: a test that acquires a work and then
+    asserts about the thumbnail cache would otherwise be asserting about a thread.
     """
     mcp_server = build_server(services)
     session_manager = StreamableHTTPSessionManager(
@@ -85,17 +88,23 @@ def create_app(services: Services, *, preview_sweep_interval_seconds: int = 0) -
         halt = (
             None
             if preview_sweep_interval_seconds <= 0
-            else start_sweeping(services.sweep, interval_seconds=preview_sweep_interval_seconds)
+            else start_sweeping(services.sweep, interval_seconds=preview_sweep_interval_seconds, governor=services.storage)
         )
         if halt is None:
-            log.info("candidate previews will not be swept; PREVIEW_SWEEP_INTERVAL_SECONDS is 0")
+            log.info("candidate previews will not be swept, nor the caches held to budget; PREVIEW_SWEEP_INTERVAL_SECONDS is 0")
         else:
             log.info("sweeping candidate previews every %ds", preview_sweep_interval_seconds)
+        stop_warming = services.warmer.start() if warm_thumbnails else None
         try:
             async with session_manager.run():
                 log.info("curation plane ready; MCP server mounted at %s", MCP_PATH)
                 yield
         finally:
+            # Waiting acquisitions are withdrawn rather than left to start
+            # against a catalogue about to close; fetches in flight finish.
+            services.acquisitions.shutdown()
+            if stop_warming is not None:
+                stop_warming()
             if halt is not None:
                 halt()
 
@@ -108,6 +117,10 @@ def create_app(services: Services, *, preview_sweep_interval_seconds: int = 0) -
     # once, at startup, over one open catalogue file — a per-request dependency
     # would advertise a lifetime they do not have.
     app.state.services = services
+    # Built here rather than at import, for the reason above: it reads the client
+    # tree off disk. Once per application, so a browser is never served a shell
+    # naming files from a bundle that has since been rebuilt.
+    app.state.assets = build_bundle(pages.STATIC_DIR, prefix=pages.ASSETS_PATH)
 
     async def handle_mcp(scope: Scope, receive: Receive, send: Send) -> None:
         await session_manager.handle_request(scope, receive, send)
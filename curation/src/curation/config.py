@@ -12,18 +12,29 @@ at process start, which is where a missing value should stop things.
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Final
 
 from dotenv import load_dotenv
 
+from curation.acquisition.iiif import DEFAULT_TILE_CONCURRENCY
+from curation.acquisition.service import TileFetcher
 from curation.manifest.builder import MANIFEST_FILENAME_TEMPLATE, manifest_path_in
 from curation.manifest.heartbeat import heartbeat_path_in
 from curation.persistence.migrations import DEFAULT_WALL_NAME
+from curation.persistence.profiler import DEFAULT_SLOW_QUERY_MS
 from curation.services.display_fit import ArtworkBox
+from curation.services.imaging_pool import DEFAULT_IMAGING_MEMORY_MB, DEFAULT_IMAGING_TASK_SECONDS, default_workers
 from curation.services.runner import DiscoverySettings
+from curation.services.storage import (
+    DEFAULT_MUSEUM_CACHE_BUDGET_BYTES,
+    DEFAULT_PREVIEWS_BUDGET_BYTES,
+    DEFAULT_THUMBNAILS_BUDGET_BYTES,
+    DEFAULT_TILE_CACHE_BUDGET_BYTES,
+    StorageBudgets,
+)
 
 #: The catalogue's filename under `ART_ROOT`. Not configurable: both planes
 #: and the backup path need to agree on where the catalogue is, and a setting
@@ -63,6 +74,11 @@ READY_DIRNAME: Final[str] = "ready"
 #: one case the tiles are worth what they cost.
 TILE_CACHE_DIRNAME: Final[str] = "tile-cache"
 
+#: Where the museum's metadata answers are kept under `ART_ROOT`, so a search or
+#: an image-service lookup asked again within its freshness is not asked of the
+#: museum. Derived and disposable: a lost entry is one request that refills it.
+MUSEUM_CACHE_DIRNAME: Final[str] = "museum-cache"
+
 #: How the loader names itself to the sites it fetches from.
 #:
 #: **Truthful by default, which is a change from the 2024 pipeline.** That code
@@ -133,6 +149,15 @@ DEFAULT_PREVIEW_MAX_BYTES: Final[int] = 16 * 1024 * 1024
 #: with ordinary headroom.
 DEFAULT_MIN_FREE_BYTES: Final[int] = 2 * 1024 * 1024 * 1024
 
+#: How many queued acquisitions run at once, and how many of those may be each
+#: fetch method. **The tiled ceiling is the one that matters and it is one**: a
+#: tiled fetch walks hundreds of tiles against a museum that throttles on purpose,
+#: and two at once against the same institution is what the throttle is asking us
+#: not to do. Direct fetches are one streamed body each, so two run beside it.
+DEFAULT_ACQUISITION_WORKERS: Final[int] = 3
+DEFAULT_ACQUISITION_TILED_WORKERS: Final[int] = 1
+DEFAULT_ACQUISITION_DIRECT_WORKERS: Final[int] = 2
+
 DEFAULT_HOST: Final[str] = "127.0.0.1"
 DEFAULT_PORT: Final[int] = 8770
 
@@ -149,9 +174,9 @@ DEFAULT_ROTATION_SHUFFLE: Final[bool] = True
 #: accumulate per image instance found, and instances are found by runs the
 #: curator starts. An hour is far shorter than the interval between a household's
 #: discovery sessions, so the directory is empty of decided works' previews
-#: whenever anyone looks — and the sweep is a walk over a household's rows plus a
-#: handful of unlinks, so running it more often than it has work to do costs
-#: nothing worth measuring.
+#: whenever anyone looks — and the sweep is one indexed query per batch of paths
+#: plus a handful of unlinks, so running it more often than it has work to do
+#: costs nothing worth measuring.
 #:
 #: It matters because `operational-spec.md` § Risks opens with the SD card, and
 #: this directory is the only one under `ART_ROOT` that nothing else reclaims.
@@ -353,6 +378,11 @@ DEFAULT_CONVERSATION_MAX_OUTPUT_TOKENS: Final[int] = 2_000
 #: master at gallery resolution would otherwise be sent whole.
 DEFAULT_MAT_IMAGE_MAX_EDGE: Final[int] = 768
 
+#: Whether the catalogue store times its statements. Off, because the figures
+#: answer a question somebody is asking — "which SQL is this screen waiting on" —
+#: and a plane nobody is asking it of should not pay even the clock reads.
+DEFAULT_STORE_PROFILING: Final[bool] = False
+
 #: Settings fields that must never reach a log line, declared once here rather
 #: than remembered at each site that logs. `Settings.redacted()` walks this set
 #: and so does the guard over it, so declaring a secret is what gets it both
@@ -458,6 +488,33 @@ class Settings:
     #: it to a third party. So there is no default, and a deployment that has not
     #: set one resolves no images rather than resolving them anonymously.
     artic_user_agent: str | None = None
+    #: Whether each catalogue statement's cost is recorded, and the time past
+    #: which one is journalled with its query plan as `store.slow_query`. The
+    #: threshold is read only while profiling is on.
+    store_profiling: bool = DEFAULT_STORE_PROFILING
+    slow_query_ms: int = DEFAULT_SLOW_QUERY_MS
+    #: How many processes decode and encode images, and the ceilings each task
+    #: runs under. Zero workers runs every decode on the thread that asked, with
+    #: no ceiling — the arrangement before the pool, kept as an escape hatch.
+    imaging_workers: int = field(default_factory=default_workers)
+    imaging_memory_mb: int = DEFAULT_IMAGING_MEMORY_MB
+    imaging_task_seconds: int = DEFAULT_IMAGING_TASK_SECONDS
+    #: How many queued acquisitions run at once, in total and per fetch method.
+    acquisition_workers: int = DEFAULT_ACQUISITION_WORKERS
+    acquisition_tiled_workers: int = DEFAULT_ACQUISITION_TILED_WORKERS
+    acquisition_direct_workers: int = DEFAULT_ACQUISITION_DIRECT_WORKERS
+    #: Which fetcher reads a tiled source, and how many tiles the in-process one
+    #: asks for at once. `TileFetcher` carries why the binary stays the default.
+    tile_fetcher: TileFetcher = TileFetcher.DEZOOMIFY
+    tile_concurrency: int = DEFAULT_TILE_CONCURRENCY
+    #: How many bytes each cache directory under `ART_ROOT` may hold before the
+    #: oldest of it is evicted. Zero measures the directory and evicts nothing.
+    #: Governed on the preview sweep's timer, so a zero interval there leaves
+    #: every directory unbounded whatever these say.
+    tile_cache_budget_bytes: int = DEFAULT_TILE_CACHE_BUDGET_BYTES
+    previews_budget_bytes: int = DEFAULT_PREVIEWS_BUDGET_BYTES
+    thumbnails_budget_bytes: int = DEFAULT_THUMBNAILS_BUDGET_BYTES
+    museum_cache_budget_bytes: int = DEFAULT_MUSEUM_CACHE_BUDGET_BYTES
 
     @property
     def discovery_settings(self) -> DiscoverySettings:
@@ -479,6 +536,16 @@ class Settings:
             phase1_output_tokens=self.phase1_output_tokens,
         )
 
+    @property
+    def storage_budgets(self) -> StorageBudgets:
+        """The cache directories' budgets, as the storage governor wants them."""
+        return StorageBudgets(
+            tile_cache_bytes=self.tile_cache_budget_bytes,
+            previews_bytes=self.previews_budget_bytes,
+            thumbnails_bytes=self.thumbnails_budget_bytes,
+            museum_cache_bytes=self.museum_cache_budget_bytes,
+        )
+
     def manifest_path(self, wall_id: str) -> Path:
         """Where one wall's manifest is published.
 
@@ -553,6 +620,11 @@ class Settings:
         """Working space for tiled fetches, reclaimed per work as each completes."""
         return self.art_root / TILE_CACHE_DIRNAME
 
+    @property
+    def museum_cache_path(self) -> Path:
+        """Where the museum's answers to metadata requests are kept between runs."""
+        return self.art_root / MUSEUM_CACHE_DIRNAME
+
     @property
     def previews_path(self) -> Path:
         """Where phase 2 caches the previews a review card shows.
@@ -692,6 +764,27 @@ class Settings:
             ),
             openrouter_api_key=os.environ.get("OPENROUTER_API_KEY") or None,
             artic_user_agent=os.environ.get("ARTIC_USER_AGENT") or None,
+            store_profiling=_flag("STORE_PROFILING", DEFAULT_STORE_PROFILING),
+            # Positive: a threshold of zero would explain every statement the
+            # plane runs, which is a profiler turned into a second workload.
+            slow_query_ms=_positive_int("STORE_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS),
+            # `_counted`: zero is a real answer, the one that turns the pool off.
+            imaging_workers=_counted("IMAGING_WORKERS", default_workers()),
+            imaging_memory_mb=_positive_int("IMAGING_MEMORY_MB", DEFAULT_IMAGING_MEMORY_MB),
+            imaging_task_seconds=_positive_int("IMAGING_TASK_SECONDS", DEFAULT_IMAGING_TASK_SECONDS),
+            # Positive rather than counted: a queue that may run nothing accepts
+            # work it will never start, which is worse than refusing to boot.
+            acquisition_workers=_positive_int("ACQUISITION_WORKERS", DEFAULT_ACQUISITION_WORKERS),
+            acquisition_tiled_workers=_positive_int("ACQUISITION_TILED_WORKERS", DEFAULT_ACQUISITION_TILED_WORKERS),
+            acquisition_direct_workers=_positive_int("ACQUISITION_DIRECT_WORKERS", DEFAULT_ACQUISITION_DIRECT_WORKERS),
+            tile_fetcher=_tile_fetcher(),
+            tile_concurrency=_positive_int("TILE_CONCURRENCY", DEFAULT_TILE_CONCURRENCY),
+            # `_counted`: zero is a real answer, the one that measures a
+            # directory without ever evicting from it.
+            tile_cache_budget_bytes=_counted("TILE_CACHE_BUDGET_BYTES", DEFAULT_TILE_CACHE_BUDGET_BYTES),
+            previews_budget_bytes=_counted("PREVIEWS_BUDGET_BYTES", DEFAULT_PREVIEWS_BUDGET_BYTES),
+            thumbnails_budget_bytes=_counted("THUMBNAILS_BUDGET_BYTES", DEFAULT_THUMBNAILS_BUDGET_BYTES),
+            museum_cache_budget_bytes=_counted("MUSEUM_CACHE_BUDGET_BYTES", DEFAULT_MUSEUM_CACHE_BUDGET_BYTES),
         )
 
     def redacted(self) -> dict[str, object]:
@@ -741,6 +834,17 @@ def _positive_int(name: str, default: int) -> int:
     return value
 
 
+def _tile_fetcher() -> TileFetcher:
+    raw = os.environ.get("TILE_FETCHER")
+    if not raw:
+        return TileFetcher.DEZOOMIFY
+    try:
+        return TileFetcher(raw.strip().lower())
+    except ValueError as exc:
+        choices = ", ".join(fetcher.value for fetcher in TileFetcher)
+        raise ConfigError(f"TILE_FETCHER must be one of {choices}, got {raw!r}. Check .env.") from exc
+
+
 def _positive_float(name: str, default: float) -> float:
     raw = os.environ.get(name)
     if not raw:
@@ -41,6 +41,7 @@ what this paragraph exists to prevent.
 
 import logging
 import re
+import threading
 from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Final
 from urllib.parse import quote
@@ -50,7 +51,9 @@ import httpx
 from curation.config import DEFAULT_PREVIEW_MAX_BYTES
 from curation.discovery.browse import BrowseQuery, CollectionBrowse, CollectionBrowseFailure, OfferedGroup
 from curation.discovery.images import FoundImage, ImageQuery, ImageSearch, ImageSearchFailure
+from curation.discovery.response_cache import HIT, MISS, REVALIDATED, ResponseCache
 from curation.persistence.records import AcquisitionMethod, RightsStatus, SourceClass
+from curation.providers import ProviderGuard
 
 log = logging.getLogger(__name__)
 
@@ -60,6 +63,25 @@ PROVIDER: Final[str] = "artic"
 
 _SEARCH_URL: Final[str] = "https://api.artic.edu/api/v1/artworks/search"
 
+#: Where several searches are sent as one request. Unlike everything else this
+#: module reads, **this shape is the published documentation's rather than a
+#: measurement**: an array of search bodies in, an array of search responses
+#: out, in the same order. `ArticImageSearch.prepare` is written so that a
+#: different answer costs nothing but the batch — see there.
+_MSEARCH_URL: Final[str] = "https://api.artic.edu/api/v1/msearch"
+
+#: How many searches ride in one multi-search. Small enough that one slow or
+#: refused batch strands few works on the per-work path, large enough that a
+#: forty-work run is two requests rather than forty.
+_MSEARCH_BATCH: Final[int] = 20
+
+#: How many prepared search answers are held at once, oldest dropped first.
+#: Enough for a few runs' worth in flight together; an answer whose run never
+#: asked for it — cancelled, or failed partway — would otherwise stay for the
+#: life of the process, and one dropped early costs only the per-work search,
+#: which the response cache usually answers anyway.
+_PREPARED_HELD: Final[int] = 10 * _MSEARCH_BATCH
+
 #: Where one object is read by id. The same collection the search endpoint is
 #: part of, named separately because a URL built by trimming another's last
 #: segment reads as a coincidence rather than as an address.
@@ -175,8 +197,21 @@ _CONNECT_TIMEOUT_SECONDS: Final[float] = 5.0
 #: search that has reached the server is worth waiting for.
 _READ_TIMEOUT_SECONDS: Final[float] = 20.0
 
-
-def _museum_client(user_agent: str, client: httpx.Client | None) -> tuple[httpx.Client, dict[str, str]]:
+#: How long each kind of answer is used from the response cache before the
+#: museum is asked again. **An object's image id is the longest-lived fact this
+#: module reads** — it changes only if the museum re-photographs the object — and
+#: it is asked before every tiled acquisition, so it is kept a month. A title
+#: search and a browse rank over a collection that gains works, and a curator
+#: re-searching a work the museum has since digitised should see it within a
+#: day, so those are kept a day.
+_OBJECT_FRESH_SECONDS: Final[float] = 30 * 24 * 3600.0
+_SEARCH_FRESH_SECONDS: Final[float] = 24 * 3600.0
+_BROWSE_FRESH_SECONDS: Final[float] = 24 * 3600.0
+
+
+def _museum_client(
+    user_agent: str, client: httpx.Client | None, guard: ProviderGuard | None = None
+) -> tuple[httpx.Client, dict[str, str]]:
     """One transport policy for every question this module asks the museum.
 
     Shared rather than repeated because the policy is a *measurement*, not a
@@ -185,6 +220,11 @@ def _museum_client(user_agent: str, client: httpx.Client | None) -> tuple[httpx.
     reasoning has to apply to whichever client is issuing the request. Two copies
     means whoever acts on it next — a retry, an async transport, a redirect
     policy — fixes one and leaves the other.
+
+    With a `guard`, the client sends through the process's pacing and breakers
+    (`providers.py`), so a search, a browse and a preview are one load on the
+    museum however many runs issue them. An injected `client` is used as it is:
+    whoever passed it is driving its transport.
     """
     if not user_agent:
         raise ValueError(
@@ -197,7 +237,8 @@ def _museum_client(user_agent: str, client: httpx.Client | None) -> tuple[httpx.
             read=_READ_TIMEOUT_SECONDS,
             write=_READ_TIMEOUT_SECONDS,
             pool=_READ_TIMEOUT_SECONDS,
-        )
+        ),
+        transport=None if guard is None else guard.transport(),
     )
     return http, {"AIC-User-Agent": user_agent}
 
@@ -211,18 +252,28 @@ class ArticImageSearch:
         user_agent: str,
         client: httpx.Client | None = None,
         preview_max_bytes: int = DEFAULT_PREVIEW_MAX_BYTES,
+        cache: ResponseCache | None = None,
+        guard: ProviderGuard | None = None,
     ) -> None:
         # Injectable so the suite can drive a recorded transport instead of the
         # network. The default is a real session; nothing else in the package
         # constructs one. No `base_url`: every request builds its full URL, and a
         # base half the code ignored would be a second answer to where the API
         # lives.
-        self._http, self._headers = _museum_client(user_agent, client)
+        self._http, self._headers = _museum_client(user_agent, client, guard)
         # Defaulted rather than required, so a caller that has no Settings in
         # hand — the live probes, a scratch script — still fetches under a
         # ceiling. An unbounded read must not be reachable by forgetting an
         # argument.
         self._preview_max_bytes = preview_max_bytes
+        #: Where the metadata answers are kept between runs. Not the previews:
+        #: those are bytes with a cache of their own, keyed by where they land.
+        self._cache = cache
+        #: Search answers a multi-search brought back, keyed by the single
+        #: search's URL and handed out once each, at most `_PREPARED_HELD` of
+        #: them. Locked because two runs can share this client from two workers.
+        self._prepared: dict[str, Mapping[str, Any]] = {}
+        self._prepared_lock = threading.Lock()
 
     @property
     def provider(self) -> str:
@@ -248,10 +299,13 @@ class ArticImageSearch:
         comparison above the seam that applies it, where a near miss is visible
         and refusable, rather than the ranker, where it is silent.
         """
-        payload = self._get(
-            f"{_SEARCH_URL}?q={quote(query.title)}&limit={_RESULT_LIMIT}&fields={_FIELDS}",
-            what=f"search the collection for {query.title!r}",
-        )
+        url = _search_url(query)
+        with self._prepared_lock:
+            prepared = self._prepared.pop(url, None)
+        if prepared is None:
+            payload = self._get(url, what=f"search the collection for {query.title!r}", fresh_for=_SEARCH_FRESH_SECONDS)
+        else:
+            payload = prepared
         iiif = _iiif_base(payload.get("config"))
         data = payload.get("data")
         if not isinstance(data, list):
@@ -269,6 +323,75 @@ class ArticImageSearch:
         )
         return found
 
+    def prepare(self, queries: Sequence[ImageQuery]) -> None:
+        """Ask the collection every search `queries` will need, twenty to a request.
+
+        A phase-2 pass asks one search per work, and on a forty-work run that is
+        forty round trips to a host whose connect phase is the slow one. Sent
+        here as multi-searches, the answers wait in memory for `find_images`,
+        which takes each once and reads it exactly as it would have read its
+        own request's — so judging, logging and the refusal vocabulary are the
+        per-work path's, unchanged.
+
+        **Nothing here can cost a work its search.** The multi-search shape is
+        documented rather than measured, so an answer that is not a list of the
+        expected length, or an entry without a `data` array, is dropped and the
+        work falls back to asking on its own. A batch that fails outright is
+        logged and likewise left to the per-work path, where an unreachable
+        collection is reported against the work it cost, as it always was.
+
+        A search already fresh in the response cache is not re-asked, and one
+        this brings back is stored under the single search's key, so the next
+        run's per-work ask finds it there.
+        """
+        wanted: dict[str, ImageQuery] = {}
+        held: set[str] = set()
+        for query in queries:
+            url = _search_url(query)
+            if url in wanted or url in held:
+                continue
+            if self._held_fresh(url):
+                held.add(url)
+            else:
+                wanted[url] = query
+        pending = list(wanted.items())
+        batches = answered = 0
+        for start in range(0, len(pending), _MSEARCH_BATCH):
+            batch = pending[start : start + _MSEARCH_BATCH]
+            batches += 1
+            try:
+                answers = self._multi_search([query for _, query in batch])
+            except ImageSearchFailure as exc:
+                log.warning(
+                    "a multi-search failed; its works will each be searched on their own: %s",
+                    exc,
+                    extra={"event": "phase_two.batch_failed", "provider": PROVIDER, "queries": len(batch)},
+                )
+                continue
+            for (url, _), payload in zip(batch, answers, strict=True):
+                if not isinstance(payload, dict) or not isinstance(payload.get("data"), list):
+                    continue
+                answered += 1
+                with self._prepared_lock:
+                    self._prepared.pop(url, None)
+                    self._prepared[url] = payload
+                    while len(self._prepared) > _PREPARED_HELD:
+                        del self._prepared[next(iter(self._prepared))]
+                if self._cache is not None:
+                    self._cache.store("GET", url, None, payload)
+                    self._cache.count(MISS)
+        log.info(
+            "searched a museum collection for a run's works in batches",
+            extra={
+                "event": "phase_two.prepared",
+                "provider": PROVIDER,
+                "queries": len(wanted),
+                "already_held": len(held),
+                "requests": batches,
+                "answered": answered,
+            },
+        )
+
     def tile_url(self, url: str) -> str:
         """The IIIF image service for the object `url` names.
 
@@ -293,6 +416,7 @@ class ArticImageSearch:
         payload = self._get(
             f"{_OBJECT_URL}/{object_id}?fields=id,image_id",
             what=f"look up the image service for object {object_id}",
+            fresh_for=_OBJECT_FRESH_SECONDS,
         )
         data = payload.get("data")
         image_id = _text(data.get("image_id")) if isinstance(data, dict) else ""
@@ -356,9 +480,52 @@ class ArticImageSearch:
             return None
         return b"".join(chunks)
 
-    def _get(self, url: str, *, what: str) -> Mapping[str, Any]:
+    def _held_fresh(self, url: str) -> bool:
+        """Whether the per-work search for `url` would be answered from disk."""
+        if self._cache is None:
+            return False
+        held = self._cache.lookup("GET", url, None)
+        return held is not None and self._cache.is_fresh(held, fresh_for=_SEARCH_FRESH_SECONDS)
+
+    def _multi_search(self, queries: Sequence[ImageQuery]) -> Sequence[object]:
+        """One multi-search for `queries`, answered in order, or `ImageSearchFailure`.
+
+        Returns the entries unread: which of them is a usable search answer is
+        the caller's to decide per entry, so one malformed entry costs one work
+        its batch answer rather than costing the whole batch.
+        """
+        what = f"search the collection for {len(queries)} works at once"
+        try:
+            response = self._http.post(
+                _MSEARCH_URL,
+                headers=self._headers,
+                json=[
+                    {"resources": "artworks", "q": query.title, "limit": _RESULT_LIMIT, "fields": _FIELDS} for query in queries
+                ],
+                follow_redirects=True,
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except httpx.HTTPError as exc:
+            raise ImageSearchFailure(f"Could not {what}: {exc}") from exc
+        except ValueError as exc:
+            raise ImageSearchFailure(f"Could not {what}: the response was not JSON ({exc}).") from exc
+        if not isinstance(payload, list) or len(payload) != len(queries):
+            raise ImageSearchFailure(f"Could not {what}: the response was not a list of {len(queries)} answers.")
+        return payload
+
+    def _get(self, url: str, *, what: str, fresh_for: float) -> Mapping[str, Any]:
         """One GET, with every transport and shape failure named as one kind."""
-        return _request(self._http, self._headers, "GET", url, what=what, failure=ImageSearchFailure)
+        return _request(
+            self._http,
+            self._headers,
+            "GET",
+            url,
+            what=what,
+            failure=ImageSearchFailure,
+            cache=self._cache,
+            fresh_for=fresh_for,
+        )
 
 
 def _request(
@@ -370,6 +537,8 @@ def _request(
     what: str,
     failure: type[Exception],
     json_body: Mapping[str, Any] | None = None,
+    cache: ResponseCache | None = None,
+    fresh_for: float = 0.0,
 ) -> Mapping[str, Any]:
     """One request, with every transport and shape failure named as one kind.
 
@@ -378,9 +547,37 @@ def _request(
     that cannot be run and a collection that cannot be browsed are different
     facts to whoever catches them — while the ways an HTTP call can go wrong are
     identical for both.
+
+    With a `cache`, an answer stored less than `fresh_for` seconds ago is
+    returned without asking, and an older one is asked about conditionally; see
+    `response_cache.py`. Only an answer that passed every check below is kept.
     """
+    held = None if cache is None else cache.lookup(method, url, json_body)
+    if cache is not None and held is not None and cache.is_fresh(held, fresh_for=fresh_for):
+        cache.count(HIT)
+        return held.payload
+    stale = held if method == "GET" else None
     try:
-        response = http.request(method, url, headers=dict(headers), json=json_body, follow_redirects=True)
+        response = http.request(
+            method,
+            url,
+            headers=dict(headers) | ({} if stale is None else stale.validators()),
+            json=json_body,
+            follow_redirects=True,
+        )
+        if cache is not None and stale is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            # Still the museum's answer: dated afresh, and carrying whichever
+            # validators it sent this time.
+            cache.store(
+                method,
+                url,
+                json_body,
+                stale.payload,
+                etag=response.headers.get("ETag") or stale.etag,
+                last_modified=response.headers.get("Last-Modified") or stale.last_modified,
+            )
+            cache.count(REVALIDATED)
+            return stale.payload
         response.raise_for_status()
         payload = response.json()
     except httpx.HTTPError as exc:
@@ -389,6 +586,17 @@ def _request(
         raise failure(f"Could not {what}: the response was not JSON ({exc}).") from exc
     if not isinstance(payload, dict):
         raise failure(f"Could not {what}: the response was {type(payload).__name__}, not an object.")
+    if cache is not None:
+        validated = method == "GET"
+        cache.store(
+            method,
+            url,
+            json_body,
+            payload,
+            etag=response.headers.get("ETag") if validated else None,
+            last_modified=response.headers.get("Last-Modified") if validated else None,
+        )
+        cache.count(MISS)
     return payload
 
 
@@ -413,8 +621,16 @@ class ArticCollectionBrowse:
     makes unreadable, and a prolific artist would fill it.
     """
 
-    def __init__(self, *, user_agent: str, client: httpx.Client | None = None) -> None:
-        self._http, self._headers = _museum_client(user_agent, client)
+    def __init__(
+        self,
+        *,
+        user_agent: str,
+        client: httpx.Client | None = None,
+        cache: ResponseCache | None = None,
+        guard: ProviderGuard | None = None,
+    ) -> None:
+        self._http, self._headers = _museum_client(user_agent, client, guard)
+        self._cache = cache
 
     @property
     def provider(self) -> str:
@@ -478,6 +694,8 @@ class ArticCollectionBrowse:
             _SEARCH_URL,
             what=f"ask how many artists {sorted(set(surnames.values()))} name",
             failure=CollectionBrowseFailure,
+            cache=self._cache,
+            fresh_for=_BROWSE_FRESH_SECONDS,
             json_body={
                 "limit": 0,
                 "query": {"bool": {"filter": [_any_of(surnames.values())]}},
@@ -539,6 +757,8 @@ class ArticCollectionBrowse:
             _SEARCH_URL,
             what=f"browse the collection for {sorted(facets.values())}",
             failure=CollectionBrowseFailure,
+            cache=self._cache,
+            fresh_for=_BROWSE_FRESH_SECONDS,
             json_body={
                 "limit": 0,
                 "query": {
@@ -583,6 +803,11 @@ class ArticCollectionBrowse:
         return holdings
 
 
+def _search_url(query: ImageQuery) -> str:
+    """The single search for a work: what `find_images` asks, and what its answer is kept under."""
+    return f"{_SEARCH_URL}?q={quote(query.title)}&limit={_RESULT_LIMIT}&fields={_FIELDS}"
+
+
 def _surname(artist: str) -> str:
     """The name a failed full-name match may be retried on, or empty.
 
@@ -785,11 +1010,19 @@ def build_image_search(
     user_agent: str,
     client: httpx.Client | None = None,
     preview_max_bytes: int = DEFAULT_PREVIEW_MAX_BYTES,
+    cache: ResponseCache | None = None,
+    guard: ProviderGuard | None = None,
 ) -> ImageSearch:
     """The image provider a deployment gets. One museum today, by name."""
-    return ArticImageSearch(user_agent=user_agent, client=client, preview_max_bytes=preview_max_bytes)
+    return ArticImageSearch(user_agent=user_agent, client=client, preview_max_bytes=preview_max_bytes, cache=cache, guard=guard)
 
 
-def build_collection_browse(*, user_agent: str, client: httpx.Client | None = None) -> CollectionBrowse:
+def build_collection_browse(
+    *,
+    user_agent: str,
+    client: httpx.Client | None = None,
+    cache: ResponseCache | None = None,
+    guard: ProviderGuard | None = None,
+) -> CollectionBrowse:
     """The collection a deployment supplements from. The same museum, asked differently."""
-    return ArticCollectionBrowse(user_agent=user_agent, client=client)
+    return ArticCollectionBrowse(user_agent=user_agent, client=client, cache=cache, guard=guard)
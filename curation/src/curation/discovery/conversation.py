@@ -25,13 +25,16 @@ its reasoning is bounded, and this evidence says an open question's is not.
 
 import json
 import logging
-from collections.abc import Mapping, Sequence
+import re
+import time
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, Final, Protocol, runtime_checkable
 
 from curation.discovery.engine import EngineSpend
 from curation.discovery.openrouter import Completion, KeyExhausted, Message, OpenRouterClient, OpenRouterError
 from curation.persistence.discovery_records import SpendCategory, TurnRole
+from curation.providers import ProviderGuard
 
 log = logging.getLogger(__name__)
 
@@ -175,9 +178,14 @@ class ConversationEngine(Protocol):
         describing whatever noticed.
         """
 
-    def answer(self, thread: Sequence[ThreadTurn]) -> ConversationReply:
+    def answer(self, thread: Sequence[ThreadTurn], *, on_text: Callable[[str], None] | None = None) -> ConversationReply:
         """Answer the last turn of `thread`, with the rest of it as context.
 
+        With `on_text`, the reply's text is handed to it piece by piece while
+        the answer is still being generated, so a curator can read the start of
+        it before the end exists. What is returned is the same either way; the
+        pieces are for showing, and the reply is what is recorded.
+
         Raises `ConversationFailure` when no usable answer came back.
         """
 
@@ -198,7 +206,7 @@ class UnavailableConversation:
     def unavailable_reason(self) -> str | None:
         return self.reason
 
-    def answer(self, thread: Sequence[ThreadTurn]) -> ConversationReply:
+    def answer(self, thread: Sequence[ThreadTurn], *, on_text: Callable[[str], None] | None = None) -> ConversationReply:
         raise ConversationFailure(self.reason)
 
 
@@ -219,8 +227,14 @@ class OpenRouterConversation:
         """Always available: a client cannot be constructed without a key."""
         return None
 
-    def answer(self, thread: Sequence[ThreadTurn]) -> ConversationReply:
-        """Ask once, pay once, and return the reply with its cost attached."""
+    def answer(self, thread: Sequence[ThreadTurn], *, on_text: Callable[[str], None] | None = None) -> ConversationReply:
+        """Ask once, pay once, and return the reply with its cost attached.
+
+        Streamed when there is someone to show the pieces to. The model answers
+        in the JSON envelope the schema asks for, so what streams is the
+        envelope; `_ReplyText` picks the reply's own text out of it as it grows,
+        and `on_text` never sees a brace or a suggestion list.
+        """
         if not thread:
             raise ConversationFailure("A conversation turn needs something to answer.")
         # Nothing is recorded here about what was sent. That the whole history
@@ -229,13 +243,31 @@ class OpenRouterConversation:
         # would be the same claim, weaker, and it would grow without bound in a
         # process that runs for months.
         messages = _wire(thread, history_turns=self.history_turns)
+        asked = time.monotonic()
+        first_token: list[float] = []
+
+        def arrived(piece: str) -> None:
+            if not first_token:
+                first_token.append(time.monotonic() - asked)
+            reply_text.feed(piece)
+
         try:
-            completion = self.client.complete_thread(
-                messages=messages,
-                schema=REPLY_SCHEMA,
-                schema_name="conversation_reply",
-                reasoning=REASONING_OFF,
-            )
+            if on_text is None:
+                completion = self.client.complete_thread(
+                    messages=messages,
+                    schema=REPLY_SCHEMA,
+                    schema_name="conversation_reply",
+                    reasoning=REASONING_OFF,
+                )
+            else:
+                reply_text = _ReplyText(on_text)
+                completion = self.client.stream_thread(
+                    messages=messages,
+                    on_text=arrived,
+                    schema=REPLY_SCHEMA,
+                    schema_name="conversation_reply",
+                    reasoning=REASONING_OFF,
+                )
         except KeyExhausted as exc:
             # No spend travels with this: the provider refuses before generating.
             # Named apart from every other failure because the answer is
@@ -266,11 +298,96 @@ class OpenRouterConversation:
                 "cost_usd": str(completion.cost_usd),
                 "input_tokens": completion.input_tokens,
                 "output_tokens": completion.output_tokens,
+                # What a curator watching the turn waits before anything moves,
+                # beside what they wait for all of it. None when the turn was
+                # not streamed, because then the two are the same wait.
+                "first_token_seconds": round(first_token[0], 3) if first_token else None,
+                "seconds": round(time.monotonic() - asked, 3),
+                "streamed": on_text is not None,
             },
         )
         return ConversationReply(text=reply, spend=spend, suggested=suggested, model_id=completion.model_id)
 
 
+#: Where the reply's text begins in the envelope. The schema names `reply`
+#: first and the model writes it first, so it is the text that streams first.
+_REPLY_OPENS: Final[re.Pattern[str]] = re.compile(r'"reply"\s*:\s*"')
+
+
+class _ReplyText:
+    """The `reply` of a JSON envelope still arriving, handed on as it decodes.
+
+    Fed the raw content as it streams. Once the `reply` string has opened, each
+    feed decodes as much of it as is complete — an escape cut in half waits for
+    its other half — and passes on only what was not passed before. Everything
+    after the string closes is the suggestions, which are read from the whole
+    answer once it is in, not from here.
+
+    **A fragment that will not decode ends the pieces, not the turn.** The model
+    can write what no JSON string holds — a raw control character, a `\\u` that
+    is not four hex digits — and the turn is paid for either way. So the
+    pieces stop there and the answer carries on arriving; the whole reply is
+    parsed once it is in, and what that makes of it is what the turn records.
+    """
+
+    def __init__(self, on_text: Callable[[str], None]) -> None:
+        self._on_text = on_text
+        self._content = ""
+        self._said = 0
+        self._closed = False
+
+    def feed(self, piece: str) -> None:
+        if self._closed:
+            return
+        self._content += piece
+        opened = _REPLY_OPENS.search(self._content)
+        if opened is None:
+            return
+        try:
+            raw, self._closed = _string_so_far(self._content[opened.end() :])
+            text = json.loads(f'"{raw}"')
+        except ValueError:
+            self._closed = True
+            log.info(
+                "a streamed reply stopped decoding; the rest arrives whole", extra={"event": "conversation.stream_undecodable"}
+            )
+            return
+        if len(text) > self._said:
+            self._on_text(text[self._said :])
+            self._said = len(text)
+
+
+def _string_so_far(tail: str) -> tuple[str, bool]:
+    """The longest decodable start of a JSON string's body, and whether it has closed."""
+    index = 0
+    while index < len(tail):
+        character = tail[index]
+        if character == '"':
+            return tail[:index], True
+        if character != "\\":
+            index += 1
+            continue
+        if index + 1 >= len(tail):
+            break
+        if tail[index + 1] != "u":
+            index += 2
+            continue
+        code = tail[index + 2 : index + 6]
+        if len(code) < 4:
+            break
+        index += 6
+        # Half of a surrogate pair decodes to nothing printable, so it waits
+        # for the escape that completes it.
+        if 0xD800 <= int(code, 16) <= 0xDBFF:
+            pair = tail[index : index + 6]
+            if len(pair) < 6 and "\\u".startswith(pair[:2]):
+                index -= 6
+                break
+            if pair.startswith("\\u"):
+                index += 6
+    return tail[:index], False
+
+
 def _wire(thread: Sequence[ThreadTurn], *, history_turns: int) -> list[Message]:
     """The thread as the provider takes it: a standing instruction, then the turns.
 
@@ -370,6 +487,7 @@ def build_conversation_engine(
     *,
     model: str,
     max_output_tokens: int,
+    guard: ProviderGuard | None = None,
 ) -> OpenRouterConversation:
     """The engine a real deployment uses, assembled from configuration.
 
@@ -379,5 +497,5 @@ def build_conversation_engine(
     points at. The same argument `mat_model` already records.
     """
     return OpenRouterConversation(
-        OpenRouterClient(api_key, model=model, max_output_tokens=max_output_tokens),
+        OpenRouterClient(api_key, model=model, max_output_tokens=max_output_tokens, guard=guard),
     )
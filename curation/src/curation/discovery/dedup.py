@@ -72,16 +72,31 @@ changes, or suppression splits into two regimes and the same work is proposed
 twice — once under each. **That migration is paid by a mechanism rather than by
 each change:** `DiscoveryService.reconcile` re-cleans every stored title at
 startup and rewrites the key of any it changed, so a rule improved here reaches
-rows already on disk. It is idempotent and normally a no-op. The debt was real —
-seven rows sat in a catalogue keyed under a citation this module now strips, and
-a rejection of any of them would not have suppressed the same painting proposed
-cleanly.
+rows already on disk. It is idempotent, and it runs once per version of the rules
+rather than at every start: `RULES_VERSION` below is a digest of this file, so any
+edit here — and only an edit here — owes the catalogue one more walk. The debt
+was real — seven rows sat in a catalogue keyed under a citation this module now
+strips, and a rejection of any of them would not have suppressed the same
+painting proposed cleanly.
 """
 
+import hashlib
 import re
 import unicodedata
+from pathlib import Path
+from typing import Final
 from urllib.parse import urlsplit
 
+#: Which rules produced a stored title and key. A digest of this module's own
+#: source and of the Unicode tables `unicodedata` normalises against, because
+#: those are the two things a cleaned title depends on: a rule edited here, or an
+#: interpreter upgrade that moves a character's category, both change what a row
+#: *should* read. Derived rather than bumped by hand, since a hand-kept number is
+#: one more thing a rule change can forget — and a forgotten bump is exactly the
+#: silent two-regime split the re-key exists to prevent. A comment edit costs one
+#: needless walk, which is the cheap direction to be wrong in.
+RULES_VERSION: Final[str] = hashlib.sha256(Path(__file__).read_bytes() + unicodedata.unidata_version.encode()).hexdigest()
+
 #: An inline markdown link, `[text](url)`. A search-augmented answer cites as it
 #: writes and does not confine that to prose: real runs returned titles like
 #: `The Night Watch (...) [rijksmuseum.nl](https://...)`.
@@ -119,6 +119,17 @@ class ImageSearch(Protocol):
         Raises `ImageSearchFailure` when the provider could not be asked.
         """
 
+    def prepare(self, queries: Sequence[ImageQuery]) -> None:
+        """Be told every work a pass is about to ask about, before it asks.
+
+        A hint, not a request: a provider that can answer several searches in
+        one round trip does so here and serves `find_images` from what came
+        back, and one that cannot does nothing. `find_images` must still answer
+        a query nothing prepared, and nothing here raises — a provider that
+        could not be asked says so when each work is, where the failure is
+        recorded against the work it cost.
+        """
+
     def fetch_preview(self, url: str) -> bytes | None:
         """The bytes behind a preview URL, or `None` if they could not be got.
 
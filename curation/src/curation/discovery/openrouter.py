@@ -31,14 +31,18 @@ refuses everything and a well-funded one refuses expensive models — at full
 credit, with nothing generated and nothing spent.
 """
 
+import asyncio
 import json
-from collections.abc import Mapping, Sequence
+import threading
+from collections.abc import Callable, Coroutine, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Final
 
 import httpx
 
+from curation.providers import ProviderGuard
+
 #: Where the provider lives. Not a deployment value: this client is written to
 #: one provider's measured response shapes, so a different base URL would be a
 #: different API wearing this one's parser.
@@ -87,6 +91,22 @@ KEY_TIMEOUT_SECONDS: Final[float] = 15.0
 #: being correctly configured.
 CONNECT_TIMEOUT_SECONDS: Final[float] = 5.0
 
+#: How long an idle connection to the provider is kept for the next call.
+#:
+#: httpx's own default is five seconds, which a plane that asks the model every
+#: few tens of seconds outlives on nearly every call — so each paid a fresh TCP
+#: and TLS handshake, and on the network `CONNECT_TIMEOUT_SECONDS` describes, a
+#: fresh connection is the expensive part. A minute covers a run's phase one and
+#: a conversation's turns. A connection the provider closed first is noticed
+#: before it is reused and replaced, so erring long costs only an idle socket.
+#:
+#: HTTP/1.1 rather than HTTP/2: httpx speaks HTTP/2 only with `h2` installed,
+#: and a handful of concurrent completions reuse a handful of pooled
+#: connections just as well, without another dependency on the Pi.
+KEEPALIVE_SECONDS: Final[float] = 60.0
+
+_LIMITS: Final[httpx.Limits] = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=KEEPALIVE_SECONDS)
+
 
 class OpenRouterError(Exception):
     """The provider could not be made to answer."""
@@ -269,18 +289,20 @@ class KeyStatus:
     resets: str | None
 
 
-class OpenRouterClient:
-    """Chat completions and the key's credit standing, over one HTTP session."""
+@dataclass(frozen=True, slots=True)
+class CompletionCall:
+    """One question in a batch handed to `complete_many`, as `complete` takes it."""
 
-    def __init__(
-        self,
-        api_key: str,
-        *,
-        model: str,
-        max_output_tokens: int,
-        search_engine: str | None = None,
-        client: httpx.Client | None = None,
-    ) -> None:
+    prompt: str
+    schema: Mapping[str, Any] | None = None
+    search_results: int = 0
+    image: ImageAttachment | None = None
+
+
+class _Completions:
+    """What both clients share: the account, the model, and the request they send."""
+
+    def __init__(self, api_key: str, *, model: str, max_output_tokens: int, search_engine: str | None) -> None:
         if not api_key:
             raise ValueError("An OpenRouter client needs an API key.")
         if max_output_tokens <= 0:
@@ -297,12 +319,7 @@ class OpenRouterClient:
         # unknown value is refused by the provider with its own message, which is
         # a better error than one written here from a stale list.
         self._search_engine = search_engine
-        # Injectable so the suite can drive a recorded transport instead of the
-        # network. The default is a real session; nothing else in the package
-        # constructs one. No `base_url` on it: every request below builds its
-        # full URL, and a base that half the code ignored would be a second
-        # answer to where the provider lives.
-        self._http = client or httpx.Client()
+        self._api_key = api_key
         self._headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
 
     @property
@@ -323,6 +340,78 @@ class OpenRouterClient:
         """
         return self._search_engine
 
+    def _thread_body(
+        self,
+        *,
+        messages: Sequence[Message],
+        schema: Mapping[str, Any] | None,
+        schema_name: str,
+        search_results: int,
+        reasoning: Mapping[str, Any] | None,
+    ) -> dict[str, Any]:
+        """The request `complete_thread` sends, built once for both clients."""
+        if not messages:
+            # Refused here rather than by the provider, which answers 400 with
+            # *"Input required: specify \"prompt\" or \"messages\""* — a true
+            # sentence about a request this method should never have sent.
+            raise ValueError("A thread needs at least one message; the provider refuses an empty one.")
+        body: dict[str, Any] = {
+            "model": self._model,
+            "messages": [message.wire() for message in messages],
+            # Deliberate, never omitted: this is the reservation the provider
+            # prices, and leaving it out invites a 402 at full credit.
+            "max_tokens": self._max_output_tokens,
+            # Without this the response carries no cost at all, and the run's
+            # actual spend would have to be computed from a price table — which
+            # is the one arithmetic that omits the search fee.
+            "usage": {"include": True},
+        }
+        if schema is not None:
+            body["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": schema_name, "strict": True, "schema": dict(schema)},
+            }
+        if search_results > 0:
+            plugin: dict[str, Any] = {"id": "web", "max_results": search_results}
+            if self._search_engine is not None:
+                plugin["engine"] = self._search_engine
+            body["plugins"] = [plugin]
+        if reasoning is not None:
+            body["reasoning"] = dict(reasoning)
+        return body
+
+
+class OpenRouterClient(_Completions):
+    """Chat completions and the key's credit standing, over one HTTP session."""
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        model: str,
+        max_output_tokens: int,
+        search_engine: str | None = None,
+        client: httpx.Client | None = None,
+        async_client: httpx.AsyncClient | None = None,
+        guard: ProviderGuard | None = None,
+    ) -> None:
+        super().__init__(api_key, model=model, max_output_tokens=max_output_tokens, search_engine=search_engine)
+        # Injectable so the suite can drive a recorded transport instead of the
+        # network. The default is a real session; nothing else in the package
+        # constructs one. No `base_url` on it: every request below builds its
+        # full URL, and a base that half the code ignored would be a second
+        # answer to where the provider lives. With a `guard`, the session sends
+        # through the process's breakers, so discovery, conversation and the mat
+        # engine learn together that the provider is down.
+        self._http = client or _session(guard)
+        #: What `complete_many` runs on, built by its first batch: an event loop
+        #: on a thread of its own and an async client bound to it. Injectable
+        #: for the reason `client` is.
+        self._async_http = async_client
+        self._guard = guard
+        self._concurrent: tuple[_LoopThread, AsyncOpenRouterClient] | None = None
+        self._concurrent_lock = threading.Lock()
+
     def complete(
         self,
         *,
@@ -385,38 +474,96 @@ class OpenRouterClient:
         Passed through rather than decided here: this client reports what a call
         cost and does not hold opinions about how the model should think.
         """
-        if not messages:
-            # Refused here rather than by the provider, which answers 400 with
-            # *"Input required: specify \"prompt\" or \"messages\""* — a true
-            # sentence about a request this method should never have sent.
-            raise ValueError("A thread needs at least one message; the provider refuses an empty one.")
-        body: dict[str, Any] = {
-            "model": self._model,
-            "messages": [message.wire() for message in messages],
-            # Deliberate, never omitted: this is the reservation the provider
-            # prices, and leaving it out invites a 402 at full credit.
-            "max_tokens": self._max_output_tokens,
-            # Without this the response carries no cost at all, and the run's
-            # actual spend would have to be computed from a price table — which
-            # is the one arithmetic that omits the search fee.
-            "usage": {"include": True},
-        }
-        if schema is not None:
-            body["response_format"] = {
-                "type": "json_schema",
-                "json_schema": {"name": schema_name, "strict": True, "schema": dict(schema)},
-            }
-        if search_results > 0:
-            plugin: dict[str, Any] = {"id": "web", "max_results": search_results}
-            if self._search_engine is not None:
-                plugin["engine"] = self._search_engine
-            body["plugins"] = [plugin]
-        if reasoning is not None:
-            body["reasoning"] = dict(reasoning)
-
+        body = self._thread_body(
+            messages=messages,
+            schema=schema,
+            schema_name=schema_name,
+            search_results=search_results,
+            reasoning=reasoning,
+        )
         payload = self._post("/chat/completions", body)
         return _read_completion(payload, fallback_model=self._model)
 
+    def complete_many(self, calls: Sequence[CompletionCall], *, concurrency: int) -> list[Completion | OpenRouterError]:
+        """Ask several questions at once, and wait here until each is answered or refused.
+
+        The bridge for a synchronous caller with a batch in hand. The calls run
+        on an `AsyncOpenRouterClient` whose event loop lives on a thread of this
+        client's own, at most `concurrency` in flight, while the calling thread
+        waits for the lot — so eight vision calls cost about as long as the
+        slowest of them rather than the sum. The loop and its pooled connections
+        outlive the batch, and the next one reuses them.
+
+        **A refusal is returned in its call's place rather than raised**, because
+        the calls beside it were answered and billed, and an exception would
+        carry none of their costs out. What a spent key does to the calls not yet
+        sent is `AsyncOpenRouterClient.complete_many`'s to say.
+        """
+        if not calls:
+            return []
+        with self._concurrent_lock:
+            if self._concurrent is None:
+                concurrent = AsyncOpenRouterClient(
+                    self._api_key,
+                    model=self._model,
+                    max_output_tokens=self._max_output_tokens,
+                    search_engine=self._search_engine,
+                    client=self._async_http,
+                    guard=self._guard,
+                )
+                self._concurrent = (_LoopThread(), concurrent)
+            loop, concurrent = self._concurrent
+        return loop.run(concurrent.complete_many(calls, concurrency=concurrency))
+
+    def stream_thread(
+        self,
+        *,
+        messages: Sequence[Message],
+        on_text: Callable[[str], None],
+        schema: Mapping[str, Any] | None = None,
+        schema_name: str = "work_list",
+        search_results: int = 0,
+        reasoning: Mapping[str, Any] | None = None,
+    ) -> Completion:
+        """`complete_thread`, with the answer handed to `on_text` as it is generated.
+
+        The provider streams a completion as server-sent events: a `data:` line
+        per chunk, each carrying the next piece of the content, and a last chunk
+        carrying the usage — so what the call cost arrives only once the answer
+        has. `on_text` is called on this thread with each piece as it lands, and
+        the `Completion` returned is read from the whole, exactly as
+        `complete_thread` reads a body: the same content, cost, citations and
+        finish reason, so a caller records a streamed answer the same way.
+
+        The two refusals arrive as statuses before any stream begins and raise
+        as they always have. **A stream that breaks off is a failure, and has no
+        cost to carry** — its usage was to come last, and the partial text
+        already handed to `on_text` was for showing, never for recording.
+        """
+        body = self._thread_body(
+            messages=messages,
+            schema=schema,
+            schema_name=schema_name,
+            search_results=search_results,
+            reasoning=reasoning,
+        )
+        body["stream"] = True
+        try:
+            with self._http.stream(
+                "POST",
+                f"{BASE_URL}/chat/completions",
+                headers=self._headers,
+                json=body,
+                timeout=_timeout(COMPLETION_TIMEOUT_SECONDS),
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    _read_body(response)
+                payload = _read_stream(response.iter_lines(), on_text)
+        except httpx.HTTPError as exc:
+            raise OpenRouterError(f"Could not reach OpenRouter: {exc}") from exc
+        return _read_completion(payload, fallback_model=self._model)
+
     def key_status(self) -> KeyStatus:
         """What the account says about the ceiling. For display, never for gating.
 
@@ -457,6 +604,140 @@ class OpenRouterClient:
         return _read_body(response)
 
 
+class AsyncOpenRouterClient(_Completions):
+    """The same completions over an `httpx.AsyncClient`, for asking several at once.
+
+    The same request, the same parsing and the same two refusals as
+    `OpenRouterClient`, through the same helpers — only the waiting differs. Its
+    session belongs to the event loop it is first used on; a synchronous caller
+    reaches it through `OpenRouterClient.complete_many`, which keeps one loop
+    for it.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        model: str,
+        max_output_tokens: int,
+        search_engine: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        guard: ProviderGuard | None = None,
+    ) -> None:
+        super().__init__(api_key, model=model, max_output_tokens=max_output_tokens, search_engine=search_engine)
+        self._http = client or _async_session(guard)
+
+    async def complete(
+        self,
+        *,
+        prompt: str,
+        schema: Mapping[str, Any] | None = None,
+        search_results: int = 0,
+        image: ImageAttachment | None = None,
+    ) -> Completion:
+        """`OpenRouterClient.complete`, awaited."""
+        return await self.complete_thread(
+            messages=[Message(role="user", text=prompt, image=image)],
+            schema=schema,
+            search_results=search_results,
+        )
+
+    async def complete_thread(
+        self,
+        *,
+        messages: Sequence[Message],
+        schema: Mapping[str, Any] | None = None,
+        schema_name: str = "work_list",
+        search_results: int = 0,
+        reasoning: Mapping[str, Any] | None = None,
+    ) -> Completion:
+        """`OpenRouterClient.complete_thread`, awaited."""
+        body = self._thread_body(
+            messages=messages,
+            schema=schema,
+            schema_name=schema_name,
+            search_results=search_results,
+            reasoning=reasoning,
+        )
+        try:
+            response = await self._http.post(
+                f"{BASE_URL}/chat/completions",
+                headers=self._headers,
+                json=body,
+                timeout=_timeout(COMPLETION_TIMEOUT_SECONDS),
+            )
+        except httpx.HTTPError as exc:
+            raise OpenRouterError(f"Could not reach OpenRouter: {exc}") from exc
+        return _read_completion(_read_body(response), fallback_model=self._model)
+
+    async def complete_many(self, calls: Sequence[CompletionCall], *, concurrency: int) -> list[Completion | OpenRouterError]:
+        """Every call, at most `concurrency` in flight, each answer in its call's place.
+
+        **A spent key stops the batch where it stands.** A 403 will refuse every
+        call after it identically until somebody raises the limit, so the calls
+        still waiting are not sent — each is answered with a `KeyExhausted` of
+        its own, saying it was never asked. The calls already in flight finish,
+        because they were sent and may yet be billed. A 402 does not stop the
+        rest: it prices one request's reservation, and the next may fit.
+        """
+        if concurrency <= 0:
+            raise ValueError(f"A batch needs at least one call in flight, got a concurrency of {concurrency}.")
+        gate = asyncio.Semaphore(concurrency)
+        spent: list[KeyExhausted] = []
+
+        async def ask(call: CompletionCall) -> Completion | OpenRouterError:
+            async with gate:
+                if spent:
+                    return KeyExhausted(f"Not sent: an earlier call in this batch found the key spent. {spent[0]}")
+                try:
+                    return await self.complete(
+                        prompt=call.prompt, schema=call.schema, search_results=call.search_results, image=call.image
+                    )
+                except KeyExhausted as exc:
+                    spent.append(exc)
+                    return exc
+                except OpenRouterError as exc:
+                    return exc
+
+        return list(await asyncio.gather(*(ask(call) for call in calls)))
+
+    async def aclose(self) -> None:
+        """Close the session and its pooled connections."""
+        await self._http.aclose()
+
+
+class _LoopThread:
+    """An event loop running on a daemon thread, for synchronous callers to wait on.
+
+    One loop for the client's whole life, because an `httpx.AsyncClient`'s
+    connections belong to the loop that opened them: a loop per batch would
+    throw the pool away each time, and the connection reuse with it.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="openrouter-loop", daemon=True).start()
+
+    def run[T](self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run `coroutine` on the loop, blocking this thread until it finishes."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+
+def _session(guard: ProviderGuard | None) -> httpx.Client:
+    """A session keeping connections for `KEEPALIVE_SECONDS`, through `guard` when there is one.
+
+    The limits go on the transport rather than the client: httpx ignores a
+    client's `limits` once it is handed a transport, and the guard is one.
+    """
+    transport = httpx.HTTPTransport(limits=_LIMITS)
+    return httpx.Client(transport=transport if guard is None else guard.transport(transport))
+
+
+def _async_session(guard: ProviderGuard | None) -> httpx.AsyncClient:
+    transport = httpx.AsyncHTTPTransport(limits=_LIMITS)
+    return httpx.AsyncClient(transport=transport if guard is None else guard.async_transport(transport))
+
+
 def _timeout(overall: float) -> httpx.Timeout:
     """A budget that bounds connecting far more tightly than waiting for an answer.
 
@@ -570,6 +851,50 @@ def _upstream_detail(raw: str) -> str:
     return ""
 
 
+def _read_stream(lines: Iterator[str], on_text: Callable[[str], None]) -> Mapping[str, Any]:
+    """A streamed completion put back into the shape a whole body has.
+
+    Lines that are not `data:` are skipped — blank separators, and the comment
+    lines the provider sends to keep a slow stream open while a search runs.
+    Each chunk's `delta` is the next piece of the one choice; the model, the
+    finish reason, the citations and the usage are taken from whichever chunk
+    carries them, which for the usage is the last.
+    """
+    pieces: list[str] = []
+    annotations: list[Any] = []
+    model: str | None = None
+    finish_reason: str | None = None
+    usage: Mapping[str, Any] = {}
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[len("data:") :].strip()
+        if data == "[DONE]":
+            break
+        try:
+            chunk = json.loads(data, parse_float=Decimal)
+        except json.JSONDecodeError as exc:
+            raise OpenRouterError(f"OpenRouter streamed a chunk that is not JSON: {exc}") from exc
+        if not isinstance(chunk, dict):
+            continue
+        error = chunk.get("error")
+        if isinstance(error, dict):
+            # The provider gave up after the status said it would answer. The
+            # status cannot say so any more, so the stream does.
+            raise OpenRouterError(f"OpenRouter broke off the answer: {error.get('message') or 'no reason was given'}")
+        model = chunk.get("model") or model
+        usage = chunk.get("usage") or usage
+        for choice in (chunk.get("choices") or [])[:1]:
+            delta = choice.get("delta") or {}
+            if content := delta.get("content"):
+                pieces.append(str(content))
+                on_text(str(content))
+            annotations.extend(delta.get("annotations") or ())
+            finish_reason = choice.get("finish_reason") or finish_reason
+    message = {"content": "".join(pieces), "annotations": annotations}
+    return {"model": model, "choices": [{"message": message, "finish_reason": finish_reason}], "usage": usage}
+
+
 def _read_completion(payload: Mapping[str, Any], *, fallback_model: str) -> Completion:
     """Read the one choice, its citations, and what the call cost."""
     # **Nothing here raises, and that is the rule rather than a series of
@@ -41,6 +41,7 @@ from curation.discovery.engine import (
 )
 from curation.discovery.openrouter import Completion, KeyExhausted, OpenRouterClient, OpenRouterError
 from curation.persistence.discovery_records import SpendCategory
+from curation.providers import ProviderGuard
 
 log = logging.getLogger(__name__)
 
@@ -278,6 +279,7 @@ def build_engine(
     max_output_tokens: int,
     search_results: int,
     search_engine: str | None = None,
+    guard: ProviderGuard | None = None,
 ) -> OpenRouterEngine:
     """The engine a deployment holding an API key gets.
 
@@ -287,6 +289,6 @@ def build_engine(
     has to know how to assemble.
     """
     return OpenRouterEngine(
-        OpenRouterClient(api_key, model=model, max_output_tokens=max_output_tokens, search_engine=search_engine),
+        OpenRouterClient(api_key, model=model, max_output_tokens=max_output_tokens, search_engine=search_engine, guard=guard),
         search_results=search_results,
     )
@@ -197,6 +197,10 @@ class PhaseTwoEngine:
         )
         return Resolution(instances=judged, refusals=frozenset(refusals))
 
+    def prepare(self, queries: Sequence[ImageQuery]) -> None:
+        """Tell the provider every work about to be resolved, so it can ask in batches."""
+        self._search.prepare(queries)
+
     def fetch_preview(self, url: str) -> bytes | None:
         """The preview bytes for an instance, or `None` when they could not be got."""
         return self._search.fetch_preview(url)
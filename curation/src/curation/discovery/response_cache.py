@@ -0,0 +1,186 @@
+"""The museum's answers, kept on disk so the same question is not asked twice.
+
+A run re-searches titles an earlier run already searched, a browse asks after
+artists the last one asked after, and every tiled acquisition asks the
+collection for an object's `image_id` immediately before fetching it — an answer
+that has not changed since the object was catalogued. None of these is a
+question whose answer moves by the hour, and each costs a round trip to a host
+this deployment reaches over a connect phase `artic.py` records as the slow one.
+
+**Keyed by method, URL and body, and nothing else.** The identifying header is
+the same on every request this deployment sends, and a key that folded it in
+would only make a changed contact address throw the cache away.
+
+**How long an answer stays fresh is the caller's to say, per question.** The
+client asking knows that an object's image id outlives a search's ranking; this
+module only stores and dates what it is given. An answer past its freshness is
+not discarded but revalidated: when the museum sent an `ETag` or a
+`Last-Modified` with a `GET`, the next one carries them, and a `304` refreshes
+the stored answer without its body crossing the network again. A `POST` is
+never made conditional: a precondition on one asks the server to refuse it.
+
+**A failure is never served from here.** Only answers that parsed are stored,
+and a stale answer is not offered in place of a failed request: "the collection
+could not be reached" and "the collection said so last week" are different
+facts, and the run reports them differently.
+
+**The directory's size is the storage governor's to hold**, like every other
+cache under `ART_ROOT`: an entry is one small file, least recently used goes
+first, and losing one costs only the request that refills it.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+
+from curation.logs import current_run_id
+
+log = logging.getLogger(__name__)
+
+#: How one question was answered, as `count` is told and `CacheCounts` reports.
+HIT: Final[str] = "hits"
+REVALIDATED: Final[str] = "revalidated"
+MISS: Final[str] = "misses"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAnswer:
+    """One stored answer, and what the museum said to revalidate it with."""
+
+    payload: Mapping[str, Any]
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        """The conditional headers that ask the museum whether this is still its answer."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True, slots=True)
+class CacheCounts:
+    """How a run's questions to the museum were answered."""
+
+    #: Answered from disk, with nothing sent.
+    hits: int = 0
+    #: Stale, and confirmed unchanged by a `304` — a round trip with no body.
+    revalidated: int = 0
+    #: Asked in full: never stored, stale without validators, or changed.
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """The share answered without a body crossing the network, or None when nothing was asked."""
+        asked = self.hits + self.revalidated + self.misses
+        return None if not asked else (self.hits + self.revalidated) / asked
+
+    def as_fields(self) -> dict[str, Any]:
+        """The counts as a log line's structured fields."""
+        return {
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "hit_rate": None if self.hit_rate is None else round(self.hit_rate, 3),
+        }
+
+
+class ResponseCache:
+    """Stored museum answers under one directory, and what each run made of them."""
+
+    def __init__(self, directory: Path, *, clock: Callable[[], float] = time.time) -> None:
+        self._directory = directory
+        self._clock = clock
+        #: Per run, because a run is the unit whose cost anyone reads. Asked
+        #: outside a run — an acquisition's image-service lookup — is served the
+        #: same and counted nowhere: there is no event for it to be reported in.
+        self._counts: dict[str, Counter[str]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self) -> Path:
+        """Where the answers are kept."""
+        return self._directory
+
+    def lookup(self, method: str, url: str, body: Mapping[str, Any] | None) -> CachedAnswer | None:
+        """The stored answer to this exact question, fresh or not, or None."""
+        path = self._path(method, url, body)
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            # A torn or foreign file is a question never asked: the answer that
+            # replaces it is written whole.
+            log.debug("ignoring an unreadable cached museum answer at %s: %s", path, exc)
+            return None
+        if not isinstance(stored, dict) or not isinstance(stored.get("payload"), dict):
+            return None
+        return CachedAnswer(
+            payload=stored["payload"],
+            stored_at=float(stored.get("stored_at") or 0.0),
+            etag=stored.get("etag"),
+            last_modified=stored.get("last_modified"),
+        )
+
+    def is_fresh(self, answer: CachedAnswer, *, fresh_for: float) -> bool:
+        """Whether `answer` may be used without asking the museum at all."""
+        return self._clock() - answer.stored_at < fresh_for
+
+    def store(
+        self,
+        method: str,
+        url: str,
+        body: Mapping[str, Any] | None,
+        payload: Mapping[str, Any],
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Keep an answer, dated now. A write that fails costs only the next request."""
+        path = self._path(method, url, body)
+        stored = {"stored_at": self._clock(), "etag": etag, "last_modified": last_modified, "payload": payload}
+        temporary = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(json.dumps(stored), encoding="utf-8")
+            temporary.replace(path)
+        except OSError as exc:
+            temporary.unlink(missing_ok=True)
+            log.warning(
+                "could not keep a museum answer; the same question will be asked again",
+                extra={"event": "museum_cache.store_failed", "reason": str(exc)},
+            )
+
+    def count(self, outcome: str) -> None:
+        """Record how one question was answered, against the run asking it."""
+        run_id = current_run_id()
+        if run_id is None:
+            return
+        with self._lock:
+            self._counts.setdefault(run_id, Counter())[outcome] += 1
+
+    def take(self, run_id: str) -> CacheCounts:
+        """How this run's questions were answered, forgetting them: a run is reported once."""
+        with self._lock:
+            counts = self._counts.pop(run_id, Counter())
+        return CacheCounts(hits=counts[HIT], revalidated=counts[REVALIDATED], misses=counts[MISS])
+
+    def _path(self, method: str, url: str, body: Mapping[str, Any] | None) -> Path:
+        # The body canonically serialised, so two dicts built in a different
+        # order are one question.
+        key = "\n".join((method.upper(), url, "" if body is None else json.dumps(body, sort_keys=True)))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._directory / digest[:2] / f"{digest}.json"
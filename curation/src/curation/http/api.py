@@ -25,22 +25,35 @@ downscale that can take a tenth of a second. Starlette runs a sync handler in a
 worker thread, so none of that sits on the event loop, where it would stall the
 MCP session manager sharing this process. The catalogue's one connection is
 opened `check_same_thread=False` behind a re-entrant lock, which is what makes
-that safe.
+that safe. The one `async def` is the run event stream, whose whole job is to
+wait without a thread; it sends each read to the same pool.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import secrets
+from collections.abc import AsyncIterator, Sequence
 from typing import Annotated
 
-from fastapi import APIRouter, Query, Request, Response
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
+from curation.acquisition.queue import AcquisitionJob
 from curation.http.models import (
+    AcquisitionBatchOut,
+    AcquisitionJobListOut,
+    AcquisitionJobOut,
+    AcquisitionQueueOut,
     AddWork,
     AffinityListOut,
     AffinityOut,
     ArtistOut,
     ArtworkBoxOut,
     BackupOut,
+    CacheUsageOut,
     CandidateCardOut,
     CandidatePageOut,
     CandidateWorkOut,
@@ -61,7 +74,10 @@ from curation.http.models import (
     HangTheme,
     HealthOut,
     HeartbeatOut,
+    HostOut,
     ImageOut,
+    ImagingKindProfileOut,
+    ImagingProfileOut,
     InstanceListingOut,
     InstanceOut,
     ManifestEntryOut,
@@ -69,6 +85,9 @@ from curation.http.models import (
     MatColorOut,
     MoveWork,
     OriginalOut,
+    OriginalsOut,
+    ProvidersOut,
+    QueueAcquisitions,
     RenameTheme,
     RenditionOut,
     RunListOut,
@@ -86,7 +105,10 @@ from curation.http.models import (
     SpendOut,
     StartResolve,
     StartRun,
+    StatementProfileOut,
     StepDisplay,
+    StorageOut,
+    StoreProfileOut,
     SuggestionOut,
     ThemeDetailOut,
     ThemeListOut,
@@ -112,16 +134,26 @@ from curation.persistence.discovery_records import (
     DiscoveryRun,
     InitiatedBy,
 )
-from curation.persistence.records import Artist, Directive, MatColor, Original, Source, Theme, WorkFacet
+from curation.persistence.profiler import StoreProfile
+from curation.persistence.records import Artist, Directive, MatColor, Original, OriginalsFootprint, Source, Theme, WorkFacet
+from curation.providers import ProvidersReading
 from curation.services.catalogue import FacetGroup, RenditionView
 from curation.services.container import Services
-from curation.services.conversation import ConversationDeletion, ConversationView, TurnView
+from curation.services.conversation import (
+    AskedTurn,
+    ConversationDeletion,
+    ConversationService,
+    ConversationView,
+    TurnView,
+)
 from curation.services.discovery import VerdictOutcome
 from curation.services.display import ThemePlacement, WallView
 from curation.services.display_fit import ArtworkBox
 from curation.services.health import HealthReading
+from curation.services.imaging_pool import ImagingProfile
 from curation.services.review import CandidatePage, CandidateView, InstanceListing, InstanceView
-from curation.services.runner import Estimate, RunView, SpendReport
+from curation.services.runner import DiscoveryRunner, Estimate, RunView, SpendReport
+from curation.services.storage import StorageReading
 from curation.services.survey import WorkDossier, WorkSurvey
 from curation.services.taste import AffinityView
 
@@ -151,6 +183,25 @@ THUMBNAIL_CACHE_CONTROL: str = "private, no-cache"
 #: never asks, and a copy still in a browser cache is never shown.
 PREVIEW_CACHE_CONTROL: str = "private, max-age=86400, immutable"
 
+#: A listing read from the catalogue is revalidated on every ask, like a
+#: thumbnail, and for the stronger reason: it is what the screens poll, and the
+#: next commit can change any of it. What makes that affordable is `_unchanged`
+#: below — a poll that lands between commits is answered with an empty 304
+#: rather than the listing recomputed and re-serialised.
+LISTING_CACHE_CONTROL: str = "private, no-cache"
+
+#: How long a run's event stream goes quiet before it says something anyway. A
+#: proxy or a browser may close a connection that carries nothing, and the
+#: comment line this sends is ignored by `EventSource`. The run is re-read at
+#: the same moment, for a change made where no wake could reach this process.
+RUN_EVENTS_KEEPALIVE_SECONDS: float = 15.0
+
+#: Which life of this process a listing's validator was minted in. The
+#: catalogue's generation starts at zero on every open, so without this a tag
+#: from before a restart could name a generation the new process has reached
+#: with different rows — and be answered 304 over a catalogue it never saw.
+_EPOCH: str = secrets.token_hex(4)
+
 
 def _services(request: Request) -> Services:
     """The services this application was built around.
@@ -168,6 +219,7 @@ def _services(request: Request) -> Services:
 @router.get("/works")
 def list_works(
     request: Request,
+    response: Response,
     status: Annotated[str | None, Query()] = None,
     q: Annotated[str | None, Query()] = None,
     artist: Annotated[list[str] | None, Query()] = None,
@@ -193,6 +245,7 @@ def list_works(
     parameter is what makes the filter set discoverable and an unknown one a
     stated refusal instead of a silent no-op.
     """
+    _unchanged(request, response)
     chosen = {"artist": artist, "movement": movement, "era": era, "subject": subject, "medium": medium, "palette": palette}
     page = _services(request).survey.list_works(
         status=status,
@@ -257,12 +310,57 @@ def restore_work(request: Request, artwork_id: str) -> WorkDetailOut:
     return _dossier(services.survey.get_work(artwork_id))
 
 
+# -- acquisitions -------------------------------------------------------------
+
+
+@router.post("/acquisitions")
+def queue_acquisitions(request: Request, body: QueueAcquisitions) -> AcquisitionBatchOut:
+    """Queue works for acquisition and return their handles at once.
+
+    The fetches run behind the response, for the reason a discovery run's do: a
+    tiled fetch takes minutes, and a request held open across a batch of them is
+    one no browser sits through.
+    """
+    batch = _services(request).acquisitions.enqueue(body.artwork_ids, priority=body.priority)
+    return AcquisitionBatchOut(
+        batch_id=batch.batch_id,
+        jobs=[_acquisition_job(job) for job in batch.jobs],
+        count=len(batch.jobs),
+    )
+
+
+@router.get("/acquisitions")
+def get_acquisitions(request: Request, batch_id: Annotated[str | None, Query()] = None) -> AcquisitionQueueOut:
+    """The acquisition queue, or one batch of it, answered immediately."""
+    status = _services(request).acquisitions.status(batch_id=batch_id)
+    return AcquisitionQueueOut(
+        jobs=[_acquisition_job(job) for job in status.jobs],
+        count=len(status.jobs),
+        queued=status.queued,
+        running=status.running,
+        reserved_bytes=status.reserved_bytes,
+    )
+
+
+@router.post("/acquisitions/batches/{batch_id}/cancel")
+def cancel_acquisition_batch(request: Request, batch_id: str) -> AcquisitionJobListOut:
+    """Withdraw a batch's waiting jobs. Fetches already running finish."""
+    return _acquisition_jobs(_services(request).acquisitions.cancel(batch_id=batch_id))
+
+
+@router.post("/acquisitions/{job_id}/cancel")
+def cancel_acquisition(request: Request, job_id: str) -> AcquisitionJobListOut:
+    """Withdraw one waiting job. A running one is refused, not interrupted."""
+    return _acquisition_jobs(_services(request).acquisitions.cancel(job_id))
+
+
 # -- themes -------------------------------------------------------------------
 
 
 @router.get("/themes")
-def list_themes(request: Request) -> ThemeListOut:
+def list_themes(request: Request, response: Response) -> ThemeListOut:
     """Every theme, and the walls each is hanging on."""
+    _unchanged(request, response)
     return ThemeListOut(themes=[_placement(placement) for placement in _services(request).display.survey_themes()])
 
 
@@ -358,8 +456,9 @@ def activate_theme(request: Request, theme_id: str, body: HangTheme) -> Manifest
 
 
 @router.get("/walls")
-def list_walls(request: Request) -> WallListOut:
+def list_walls(request: Request, response: Response) -> WallListOut:
     """Every wall, and what is hanging on each."""
+    _unchanged(request, response)
     return WallListOut(walls=[_wall(view) for view in _services(request).display.survey_walls()])
 
 
@@ -422,6 +521,7 @@ def step_display(request: Request, body: StepDisplay) -> DirectiveOut:
 @router.get("/manifest")
 def get_manifest(
     request: Request,
+    response: Response,
     wall_id: Annotated[str, Query()],
     theme_id: Annotated[str | None, Query()] = None,
 ) -> ManifestOut:
@@ -432,6 +532,7 @@ def get_manifest(
     exclusions belong to a wall once two walls can hang different themes, and the
     theme defaults to whatever is already hanging there.
     """
+    _unchanged(request, response)
     return _manifest(_services(request).display.build_manifest(wall_id, theme_id))
 
 
@@ -525,12 +626,83 @@ def get_run(request: Request, run_id: str) -> RunViewOut:
     from spinning. A browser is already an event loop: it polls on a timer, and a
     held request would occupy one of the worker threads Starlette runs these
     synchronous handlers in for the whole hold window — with a couple of tabs
-    open that starves the same pool that serves thumbnails. The client asks
-    again; nothing is lost but the hold.
+    open that starves the same pool that serves thumbnails. A browser that wants
+    to be told rather than to ask opens `stream_run` below; this is what it
+    falls back to.
     """
     return _run_view(_services(request).runner.run_status(run_id, wait=False))
 
 
+@router.get("/runs/{run_id}/events", response_class=StreamingResponse)
+async def stream_run(request: Request, run_id: str) -> StreamingResponse:
+    """Where a run is, pushed as it changes, until it stops.
+
+    The browser's counterpart to the MCP surface's held `status`, without the
+    hold's price. `get_run` answers at once because a held request occupies a
+    worker thread for its whole window; this one holds the connection and *no*
+    thread, so a tab watching a run costs the plane a socket between changes and
+    a few milliseconds of a worker per change. The browser's `EventSource`
+    reconnects on its own, and `core/poll.js` falls back to polling `get_run`
+    when a stream cannot be had.
+
+    **`async def`, like `stream_turn` and unlike everything else here.** A
+    stream that waited in a worker thread would be the held request again under
+    another name. The one blocking thing it does — reading the run — is sent to
+    the thread pool each time, so the event loop is never where the catalogue is
+    read.
+
+    The run is read once before the stream opens, so an unknown id is refused
+    with the surface's ordinary 400 rather than as an event on a stream that
+    has already said 200.
+    """
+    runner = _services(request).runner
+    first = await run_in_threadpool(runner.run_status, run_id, wait=False)
+    return StreamingResponse(
+        _run_events(runner, run_id, first),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _run_events(runner: DiscoveryRunner, run_id: str, first: RunView) -> AsyncIterator[str]:
+    """A `run` event per change a reader could see, and an `end` event when the run stops.
+
+    Each event carries the whole `RunViewOut`, not a diff of it: the screen
+    paints from a whole view and already skips a paint that would change
+    nothing, so a diff would move that comparison to the wire and make the
+    client reassemble what the server just took apart. What is withheld is a
+    view identical to the last one sent — a wake for a different run, or a
+    write that moved nothing this view shows.
+
+    A wake carries no payload; the view is re-read in the thread pool when one
+    lands, and also every `RUN_EVENTS_KEEPALIVE_SECONDS` without one, which is
+    both the keep-alive a proxy needs to see and the re-check `run_status`
+    makes for a change another process wrote. Starlette cancels this generator
+    when the client goes, and the `finally` is what takes the listener back.
+    """
+    loop = asyncio.get_running_loop()
+    woken = asyncio.Event()
+    stop = runner.watch(lambda: loop.call_soon_threadsafe(woken.set))
+    try:
+        view, sent = first, None
+        while True:
+            payload = _run_view(view).model_dump_json()
+            if view.run.status.is_terminal:
+                yield f"event: end\ndata: {payload}\n\n"
+                return
+            if payload != sent:
+                yield f"event: run\ndata: {payload}\n\n"
+                sent = payload
+            try:
+                await asyncio.wait_for(woken.wait(), timeout=RUN_EVENTS_KEEPALIVE_SECONDS)
+            except TimeoutError:
+                yield ": still watching\n\n"
+            woken.clear()
+            view = await run_in_threadpool(runner.run_status, run_id, wait=False)
+    finally:
+        stop()
+
+
 @router.post("/runs/{run_id}/approve")
 def approve_run(request: Request, run_id: str) -> RunViewOut:
     """Accept the work list and its price; phase 2 begins behind the response."""
@@ -582,6 +754,7 @@ def start_resolve_run(request: Request, body: StartResolve) -> RunOut:
 @router.get("/runs/{run_id}/candidates")
 def list_candidates(
     request: Request,
+    response: Response,
     run_id: str,
     limit: Annotated[int | None, Query()] = None,
     offset: Annotated[int, Query()] = 0,
@@ -593,6 +766,7 @@ def list_candidates(
     a card per work. A curator scrolls a grid; they do not scroll two hundred
     pictures fetched at once on a Pi.
     """
+    _unchanged(request, response)
     # `pictures=False`: this surface fetches each picture by URL, so inlining
     # them here would re-encode thirty images per page and discard the output.
     return _candidate_page(_services(request).review.list_works(run_id, limit=limit, offset=offset, pictures=False))
@@ -668,9 +842,15 @@ def get_candidate_preview(request: Request, image_id: str) -> Response:
 
 
 @router.get("/works/{artwork_id}/thumbnail", response_class=FileResponse)
-def get_thumbnail(request: Request, artwork_id: str) -> Response:
+def get_thumbnail(request: Request, artwork_id: str, w: Annotated[int | None, Query(ge=1)] = None) -> Response:
     """A small copy of the work's held image, generated on first ask.
 
+    `w` is the width the browser will draw it at — what a `srcset` candidate
+    names — and picks the smallest size on the ladder that covers it. The
+    encoding follows `Accept`: WebP to a browser that lists it, JPEG to anything
+    else. Both vary the bytes behind one URL, so the response says `Vary: Accept`
+    and a shared cache cannot hand a JPEG-only client the WebP.
+
     **The conditional check is done here because nothing else does it.**
     `FileResponse` *sets* an `ETag` and never *reads* one — only Starlette's
     `StaticFiles` compares them, and these files are generated rather than
@@ -681,17 +861,73 @@ def get_thumbnail(request: Request, artwork_id: str) -> Response:
     Starlette itself would have produced rather than a second implementation of
     its formula.
     """
-    path = _services(request).thumbnails.thumbnail(artwork_id)
-    headers = {"Cache-Control": THUMBNAIL_CACHE_CONTROL}
-    response = FileResponse(path, media_type="image/jpeg", headers=headers, stat_result=path.stat())
+    webp = _accepts_webp(request.headers.get("accept"))
+    path = _services(request).thumbnails.thumbnail(artwork_id, width=w, webp=webp)
+    headers = {"Cache-Control": THUMBNAIL_CACHE_CONTROL, "Vary": "Accept"}
+    media_type = "image/webp" if webp else "image/jpeg"
+    response = FileResponse(path, media_type=media_type, headers=headers, stat_result=path.stat())
     etag = response.headers.get("etag")
     if etag is not None and _matches(request.headers.get("if-none-match"), etag):
         return Response(status_code=304, headers={**headers, "ETag": etag})
     return response
 
 
+def _accepts_webp(header: str | None) -> bool:
+    """Whether an `Accept` header names WebP with a nonzero weight.
+
+    Named, not inferred from `*/*` or `image/*`: every browser that decodes WebP
+    says so in its image requests, and the ones that send only a wildcard include
+    the ones that cannot.
+    """
+    if not header:
+        return False
+    for offer in header.split(","):
+        media_type, _, parameters = offer.partition(";")
+        if media_type.strip().lower() != "image/webp":
+            continue
+        weight = parameters.strip()
+        if not weight.startswith("q="):
+            return True
+        try:
+            return float(weight.removeprefix("q=")) > 0
+        except ValueError:
+            return False
+    return False
+
+
+# -- revalidation -------------------------------------------------------------
+
+
+def _unchanged(request: Request, response: Response) -> None:
+    """Answer 304 if the caller already holds this listing, and label it if not.
+
+    **The third departure shape, and the only decision a listing handler makes
+    before calling its service.** The tag is the catalogue's generation and the
+    request's own path and query, so it is equal for two asks exactly when they
+    asked the same question with no commit between them — which is when the
+    answer cannot differ, and computing it again would be pure cost. Weak,
+    because it vouches for the answer's meaning rather than its bytes.
+
+    **Read before the service is called, never after**, and the order is the
+    correctness. A commit landing while the answer is computed then leaves a
+    tag older than the body it travels with, and the next ask gets a full
+    answer; a tag read afterwards could vouch for rows the body never saw.
+
+    The 304 is raised rather than returned so that every listing handler keeps
+    its return type — and with it the response schema FastAPI publishes for it.
+    An error raised by the service after this goes out through its own handler,
+    which builds a fresh response, so a refusal never carries a validator.
+    """
+    generation = _services(request).catalogue.generation()
+    asked = hashlib.blake2b(f"{request.url.path}?{request.url.query}".encode(), digest_size=8).hexdigest()
+    headers = {"Cache-Control": LISTING_CACHE_CONTROL, "ETag": f'W/"{_EPOCH}-{generation}-{asked}"'}
+    if _matches(request.headers.get("if-none-match"), headers["ETag"]):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
 def _matches(header: str | None, etag: str) -> bool:
-    """Whether an `If-None-Match` header already covers this thumbnail.
+    """Whether an `If-None-Match` header already covers this representation.
 
     Three cases, all of them real rather than defensive:
 
@@ -699,8 +935,11 @@ def _matches(header: str | None, etag: str) -> bool:
       both, so comparing the raw header against one tag would miss a match it was
       handed.
     * **`*`.** RFC 9110 makes it match any current representation. By the time
-      this is asked the file exists — `thumbnail()` returned its path — so there
-      is one, and the answer is yes.
+      a thumbnail asks, the file exists — `thumbnail()` returned its path — so
+      there is one, and the answer is yes. A listing asks before its service
+      runs, so `*` on one that would have been refused is answered 304 rather
+      than with the refusal; no browser sends `*` on a `GET`, and checking first
+      would cost the very computation the validator exists to skip.
     * **The weak marker.** `W/"abc"` and `"abc"` are the same tag for a weak
       comparison, which is what a conditional GET performs.
 
@@ -713,7 +952,7 @@ def _matches(header: str | None, etag: str) -> bool:
     offered = {tag.strip() for tag in header.split(",")}
     if "*" in offered:
         return True
-    return etag in {tag.removeprefix("W/") for tag in offered}
+    return etag.removeprefix("W/") in {tag.removeprefix("W/") for tag in offered}
 
 
 # -- shaping ------------------------------------------------------------------
@@ -940,6 +1179,31 @@ def _manifest(build: ManifestBuild) -> ManifestOut:
     )
 
 
+def _acquisition_job(job: AcquisitionJob) -> AcquisitionJobOut:
+    return AcquisitionJobOut(
+        job_id=job.id,
+        batch_id=job.batch_id,
+        artwork_id=job.artwork_id,
+        source_id=job.source_id,
+        method=str(job.method),
+        priority=job.priority,
+        state=str(job.state),
+        expected_bytes=job.expected_bytes,
+        outcome=None if job.outcome is None else job.outcome.value,
+        detail=job.detail,
+        enqueued_at=job.enqueued_at.isoformat(),
+        started_at=None if job.started_at is None else job.started_at.isoformat(),
+        finished_at=None if job.finished_at is None else job.finished_at.isoformat(),
+        tiles_fetched=None if job.progress is None else job.progress.tiles_fetched,
+        tiles_refused=None if job.progress is None else job.progress.tiles_refused,
+        tiles_expected=None if job.progress is None else job.progress.tiles_expected,
+    )
+
+
+def _acquisition_jobs(jobs: Sequence[AcquisitionJob]) -> AcquisitionJobListOut:
+    return AcquisitionJobListOut(jobs=[_acquisition_job(job) for job in jobs], count=len(jobs))
+
+
 def _run(run: DiscoveryRun) -> RunOut:
     return RunOut(
         run_id=run.id,
@@ -1162,6 +1426,11 @@ def _health(reading: HealthReading) -> HealthOut:
         description=reading.describe(),
         backup=_backup(reading.backup),
         artwork_box=_artwork_box(reading.artwork_box),
+        statements=None if reading.statements is None else _statements(reading.statements),
+        imaging=None if reading.imaging is None else _imaging(reading.imaging),
+        storage=None if reading.storage is None else _storage(reading.storage),
+        originals=None if reading.originals is None else _originals(reading.originals),
+        providers=None if reading.providers is None else _providers(reading.providers),
     )
 
 
@@ -1198,6 +1467,98 @@ def _artwork_box(box: ArtworkBox) -> ArtworkBoxOut:
     )
 
 
+def _statements(profile: StoreProfile) -> StoreProfileOut:
+    return StoreProfileOut(
+        since=profile.since.isoformat(),
+        slow_query_ms=profile.slow_query_ms,
+        statements=[
+            StatementProfileOut(
+                shape=statement.shape,
+                calls=statement.calls,
+                total_ms=statement.total_ms,
+                mean_ms=statement.mean_ms,
+                max_ms=statement.max_ms,
+                lock_wait_ms=statement.lock_wait_ms,
+                rows=statement.rows,
+                slow=statement.slow,
+                plan=statement.plan,
+            )
+            for statement in profile.statements
+        ],
+    )
+
+
+def _imaging(profile: ImagingProfile) -> ImagingProfileOut:
+    return ImagingProfileOut(
+        since=profile.since.isoformat(),
+        workers=profile.workers,
+        in_flight=profile.in_flight,
+        queued=profile.queued,
+        kinds=[
+            ImagingKindProfileOut(
+                kind=kind.kind,
+                calls=kind.calls,
+                failed=kind.failed,
+                wait_ms=kind.wait_ms,
+                mean_wait_ms=kind.mean_wait_ms,
+                run_ms=kind.run_ms,
+                mean_run_ms=kind.mean_run_ms,
+                max_run_ms=kind.max_run_ms,
+            )
+            for kind in profile.kinds
+        ],
+    )
+
+
+def _storage(reading: StorageReading) -> StorageOut:
+    return StorageOut(
+        since=reading.since.isoformat(),
+        caches=[
+            CacheUsageOut(
+                name=usage.name,
+                ceiling_bytes=usage.ceiling_bytes,
+                used_bytes=usage.used_bytes,
+                entries=usage.entries,
+                held_bytes=usage.held_bytes,
+                evicted=usage.evicted,
+                evicted_bytes=usage.evicted_bytes,
+                failed=usage.failed,
+                measured_at=None if usage.measured_at is None else usage.measured_at.isoformat(),
+            )
+            for usage in reading.caches
+        ],
+    )
+
+
+def _originals(footprint: OriginalsFootprint) -> OriginalsOut:
+    return OriginalsOut(
+        originals=footprint.originals,
+        images=footprint.images,
+        byte_size=footprint.byte_size,
+        image_bytes=footprint.image_bytes,
+        deduplicated_bytes=footprint.deduplicated_bytes,
+    )
+
+
+def _providers(reading: ProvidersReading) -> ProvidersOut:
+    return ProvidersOut(
+        since=reading.since.isoformat(),
+        hosts=[
+            HostOut(
+                host=host.host,
+                state=str(host.state),
+                consecutive_failures=host.consecutive_failures,
+                open_until=None if host.open_until is None else host.open_until.isoformat(),
+                last_failure=host.last_failure,
+                admitted=host.admitted,
+                refused=host.refused,
+                waited_seconds=host.waited_seconds,
+            )
+            for host in reading.hosts
+        ],
+    )
+
+
 # -- conversations ------------------------------------------------------------
 #
 # One block at the foot of the file rather than routes among the routes and
@@ -1246,6 +1607,80 @@ def speak(request: Request, conversation_id: str, body: Speak) -> ConversationVi
     return _conversation_view(_services(request).conversation.speak(conversation_id, body.text))
 
 
+@router.post("/conversations/{conversation_id}/turns/stream", response_class=StreamingResponse)
+async def stream_turn(request: Request, conversation_id: str, body: Speak) -> StreamingResponse:
+    """`speak`, with the answer's text pushed to the screen as it is generated.
+
+    A turn's answer takes seconds to write and the curator can read the start
+    of it long before the end exists, so this sends a `text` event per piece of
+    the reply as the model produces it, and then one `turn` event carrying the
+    whole `ConversationViewOut` — exactly what `speak` would have returned, and
+    what the screen repaints from. The pieces are only for reading along: the
+    turn recorded is the whole reply, suggestions and spend included, once it is
+    in.
+
+    The question is put in the thread before the stream opens, so everything
+    `speak` refuses — an unknown conversation, nothing to retry — is refused here
+    with the same 400 rather than as an event on a stream that has already said
+    200. An answer that fails is, as there, a `turn` event whose view carries
+    `failure`.
+    """
+    service = _services(request).conversation
+    asked = await run_in_threadpool(service.ask, conversation_id, body.text)
+    return StreamingResponse(
+        _turn_events(service, asked),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+#: Answers still being written for a stream whose reader has gone. Held so the
+#: event loop, which keeps only a weak reference to a task, does not collect one
+#: mid-answer.
+_ANSWERING: set[asyncio.Future[ConversationView]] = set()
+
+
+async def _turn_events(service: ConversationService, asked: AskedTurn) -> AsyncIterator[str]:
+    """A `text` event per piece of the reply as it arrives, then the `turn` it made.
+
+    The answer runs in the thread pool, because the model call blocks; each
+    piece crosses back to the event loop through a queue, and the end of the
+    answer is queued behind the last piece, so no piece is sent after the turn.
+
+    **A reader who leaves does not stop the answer.** It has been asked for and
+    will be billed whether or not anyone watches it arrive, so it is finished
+    and recorded, and a reload shows it — a turn cut off by a closed tab would be
+    paid for and missing.
+
+    **An answer that raises ends the stream with an `error` event.** The `200`
+    and the first pieces are already sent, so a status can no longer say it; a
+    failure the service knows how to answer comes back as the turn it records,
+    and anything else is logged and named here, and the screen reads the thread
+    for what was kept.
+    """
+    loop = asyncio.get_running_loop()
+    pieces: asyncio.Queue[str | None] = asyncio.Queue()
+    answering = asyncio.ensure_future(
+        run_in_threadpool(service.answer, asked, on_text=lambda piece: loop.call_soon_threadsafe(pieces.put_nowait, piece))
+    )
+    _ANSWERING.add(answering)
+    answering.add_done_callback(_ANSWERING.discard)
+    answering.add_done_callback(lambda _: pieces.put_nowait(None))
+    while (piece := await pieces.get()) is not None:
+        yield f"event: text\ndata: {json.dumps({'text': piece})}\n\n"
+    try:
+        view = answering.result()
+    except Exception:
+        log.exception(
+            "a streamed conversation turn failed after its stream opened",
+            extra={"event": "conversation.stream_failed", "conversation_id": asked.view.conversation.id},
+        )
+        detail = "The answer could not be finished. The thread shows what was kept."
+        yield f"event: error\ndata: {json.dumps({'detail': detail})}\n\n"
+        return
+    yield f"event: turn\ndata: {_conversation_view(view).model_dump_json()}\n\n"
+
+
 @router.post("/conversations/{conversation_id}/commit")
 def commit_conversation(request: Request, conversation_id: str, body: CommitDirection) -> ConversationViewOut:
     """Seed a discovery run from this thread, and stay in the thread.
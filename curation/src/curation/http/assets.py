@@ -0,0 +1,217 @@
+"""The client's files as a phone should fetch them: named by content, compressed once.
+
+`static/` is about twenty ES modules and a stylesheet, and the browser fetches
+each by URL. Served as they sit on disk, a cold load on a phone moves every byte
+uncompressed, and a warm one still asks about every module in turn — a chain of
+conditional requests as deep as the import graph, each a round trip over Wi-Fi
+to be told nothing changed.
+
+This builds, once per process and in memory, a second copy of the tree in which
+every file's name carries a hash of its content and every relative import names
+its target by that hashed name. A hashed URL can never answer with different
+bytes, so it is served `immutable` and a browser never asks about it again;
+what changes between deployments is which URLs the shell names, and the shell
+is the one file still revalidated. Each file is gzipped alongside, at build
+time rather than per request.
+
+**Hashed after what it imports, and that order is what makes the hash honest.**
+A module's text names its imports by their hashed names, so a change to
+`core/render.js` changes the bytes — and so the name — of every module that
+imports it, all the way up to `app.js`. Hashing a module's own text before
+rewriting would let a cached `app.js` keep importing a stale `render.js` forever.
+The graph must therefore be acyclic, and a cycle is refused when the bundle is
+built rather than served as a hash that depends on itself.
+
+**Built in memory rather than written beside the sources.** The package
+directory is not the plane's to write — an installed wheel may be read-only —
+and a build step that had to be remembered before deploying is a step that will
+one day be forgotten, leaving a shell that names files which do not exist. The
+untouched tree is still served at `/static`, for anything that names a file by
+its plain path.
+
+**gzip only.** Brotli compresses these files a further tenth or so, and costs a
+compiled dependency this plane does not otherwise have; the standard library's
+gzip takes the same files to a little over a third of their size, which is most of
+what there was to save.
+"""
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Final
+
+log = logging.getLogger(__name__)
+
+#: The shell every UI path answers with. Never hashed: its URL is the address
+#: a curator bookmarks, so it is the one file revalidated on every load.
+SHELL: Final[str] = "index.html"
+
+#: Hex digits of content hash in a bundled name. Forty bits is far beyond what
+#: two dozen files need to stay distinct, and short enough to read in a log.
+HASH_DIGITS: Final[int] = 10
+
+#: Compression level for the gzip siblings. Paid once per process over a few
+#: hundred kilobytes, so there is no reason to trade any of the ratio away.
+GZIP_LEVEL: Final[int] = 9
+
+#: A module's imports and re-exports of a relative path, static or dynamic. Bare
+#: names and absolute URLs are left alone: neither is a file in this tree.
+_IMPORT: Final[re.Pattern[str]] = re.compile(r"""(\b(?:from|import)\s*\(?\s*)(["'])(\.{1,2}/[^"'\s]+)\2""")
+
+#: The shell's references to the tree, which it names from the root.
+_SHELL_REFERENCE: Final[re.Pattern[str]] = re.compile(r"""((?:href|src)=)(["'])/static/([^"'\s]+)\2""")
+
+
+@dataclass(frozen=True, slots=True)
+class Asset:
+    """One file as it is sent, with the compressed copy when that is smaller."""
+
+    body: bytes
+    media_type: str
+    #: `None` when gzip would not have made the file smaller — a few hundred
+    #: bytes of already-terse text can grow under the header.
+    gzipped: bytes | None
+    #: A strong validator over `body`. The bundled name already carries it, so
+    #: it only ever matters for the shell.
+    etag: str
+
+
+@dataclass(frozen=True, slots=True)
+class AssetBundle:
+    """The hashed tree, and the shell that names it."""
+
+    #: Every bundled file, keyed by its hashed path under the bundle's root.
+    assets: Mapping[str, Asset]
+    #: `index.html`, its references rewritten to the hashed names.
+    shell: Asset
+    #: Each source path to the hashed path it is served under.
+    names: Mapping[str, str]
+
+
+def build_bundle(directory: Path, *, prefix: str) -> AssetBundle:
+    """Hash, rewrite and compress every file under `directory`.
+
+    `prefix` is where the bundle is served, and the shell's references are
+    rewritten to it. Modules import each other relatively, so nothing else in the
+    tree needs to know.
+    """
+    sources = {
+        path.relative_to(directory).as_posix(): path.read_bytes()
+        for path in sorted(directory.rglob("*"))
+        if path.is_file() and path.name != SHELL
+    }
+    names: dict[str, str] = {}
+    assets: dict[str, Asset] = {}
+
+    def bundle(name: str, entered: tuple[str, ...]) -> str:
+        if name in names:
+            return names[name]
+        if name in entered:
+            cycle = " -> ".join((*entered[entered.index(name) :], name))
+            raise ValueError(f"The client's modules import each other in a cycle, which cannot be content-hashed: {cycle}")
+        body = sources[name]
+        if name.endswith(".js"):
+            body = _rewrite_imports(name, body, lambda target: bundle(target, (*entered, name)), known=sources)
+        hashed = _hashed_name(name, body)
+        names[name] = hashed
+        assets[hashed] = _asset(name, body)
+        return hashed
+
+    for name in sources:
+        bundle(name, ())
+
+    shell = (directory / SHELL).read_text(encoding="utf-8")
+
+    def rename(match: re.Match[str]) -> str:
+        attribute, quote, name = match.groups()
+        if name not in names:
+            return match.group(0)
+        return f"{attribute}{quote}{prefix}/{names[name]}{quote}"
+
+    rewritten = _SHELL_REFERENCE.sub(rename, shell).encode("utf-8")
+    built = AssetBundle(assets=assets, shell=_asset(SHELL, rewritten), names=names)
+    log.info(
+        "bundled %d client files: %d bytes, %d gzipped",
+        len(assets),
+        sum(len(asset.body) for asset in assets.values()),
+        sum(len(asset.gzipped or asset.body) for asset in assets.values()),
+        extra={"event": "assets_bundled"},
+    )
+    return built
+
+
+def accepts_gzip(header: str | None) -> bool:
+    """Whether an `Accept-Encoding` header admits gzip.
+
+    Read properly rather than by substring, because `gzip;q=0` is a client
+    saying no in the same words as one saying yes.
+    """
+    if not header:
+        return False
+    for offer in header.split(","):
+        coding, _, parameters = offer.partition(";")
+        if coding.strip().lower() not in {"gzip", "*"}:
+            continue
+        weight = parameters.strip()
+        if not weight.startswith("q="):
+            return True
+        try:
+            return float(weight.removeprefix("q=")) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _rewrite_imports(name: str, body: bytes, bundled: Callable[[str], str], *, known: Mapping[str, bytes]) -> bytes:
+    """Point each relative import in `name` at its target's hashed name.
+
+    The specifier stays relative — only the final segment changes — so a
+    bundled module resolves its imports inside the bundle wherever that is
+    served. An import of a file the tree does not have is left as written; the
+    browser's 404 for it is the same one the unbundled tree would give.
+    """
+    here = PurePosixPath(name).parent
+
+    def rename(match: re.Match[str]) -> str:
+        keyword, quote, specifier = match.groups()
+        target = _normalise(here / specifier)
+        if target not in known:
+            return match.group(0)
+        hashed = PurePosixPath(bundled(target)).name
+        return f"{keyword}{quote}{specifier.rsplit('/', 1)[0]}/{hashed}{quote}"
+
+    return _IMPORT.sub(rename, body.decode("utf-8")).encode("utf-8")
+
+
+def _normalise(path: PurePosixPath) -> str:
+    """Resolve `.` and `..` the way a browser resolves a relative URL."""
+    parts: list[str] = []
+    for part in path.parts:
+        if part == "..":
+            if parts:
+                parts.pop()
+        elif part != ".":
+            parts.append(part)
+    return "/".join(parts)
+
+
+def _hashed_name(name: str, body: bytes) -> str:
+    path = PurePosixPath(name)
+    digest = hashlib.blake2b(body, digest_size=HASH_DIGITS // 2).hexdigest()
+    return str(path.with_name(f"{path.stem}.{digest}{path.suffix}"))
+
+
+def _asset(name: str, body: bytes) -> Asset:
+    compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    media_type, _ = mimetypes.guess_type(name)
+    return Asset(
+        body=body,
+        media_type=media_type or "application/octet-stream",
+        gzipped=compressed if len(compressed) < len(body) else None,
+        etag=f'"{hashlib.blake2b(body, digest_size=HASH_DIGITS // 2).hexdigest()}"',
+    )
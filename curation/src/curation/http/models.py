@@ -474,6 +474,128 @@ class WallHeartbeatOut(BaseModel):
     heartbeat: HeartbeatOut
 
 
+class StatementProfileOut(BaseModel):
+    """What one statement shape has cost since the process started.
+
+    Waiting for the store's lock and executing are separate figures because they
+    have separate fixes: the first is somebody else's transaction, the second is
+    this statement's plan.
+    """
+
+    shape: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    lock_wait_ms: float
+    rows: int
+    #: How many calls crossed the slow threshold.
+    slow: int
+    #: SQLite's `EXPLAIN QUERY PLAN`, captured the first time a call was slow.
+    plan: str | None
+
+
+class StoreProfileOut(BaseModel):
+    """Every statement shape the catalogue has run, costliest first."""
+
+    since: str
+    slow_query_ms: float
+    statements: list[StatementProfileOut]
+
+
+class ImagingKindProfileOut(BaseModel):
+    """What one kind of imaging work has cost since the process started.
+
+    Waiting for a worker and working are separate figures for the reason a
+    statement's lock wait is: a long wait is a queue, a long run is an image.
+    """
+
+    kind: str
+    calls: int
+    #: Calls that raised, a ceiling included.
+    failed: int
+    wait_ms: float
+    mean_wait_ms: float
+    run_ms: float
+    mean_run_ms: float
+    max_run_ms: float
+
+
+class ImagingProfileOut(BaseModel):
+    """The imaging pool's queue, and every kind of work it has run, costliest first."""
+
+    since: str
+    #: Zero when decodes run on the thread that asked.
+    workers: int
+    in_flight: int
+    #: Tasks waiting for a worker rather than running on one.
+    queued: int
+    kinds: list[ImagingKindProfileOut]
+
+
+class CacheUsageOut(BaseModel):
+    """One cache directory against its budget, as the governor's last pass found it."""
+
+    name: str
+    #: Zero when the directory is measured and never evicted from.
+    ceiling_bytes: int
+    #: Null until the first pass, which runs when the plane starts.
+    used_bytes: int | None
+    entries: int | None
+    #: What the directory's own rule kept — a fetch in flight, a preview still
+    #: under review. A cache over budget by no more than this is where it may be.
+    held_bytes: int | None
+    #: Since the process started.
+    evicted: int
+    evicted_bytes: int
+    failed: int
+    measured_at: str | None
+
+
+class StorageOut(BaseModel):
+    """Every governed cache directory."""
+
+    since: str
+    caches: list[CacheUsageOut]
+
+
+class OriginalsOut(BaseModel):
+    """What the held originals weigh, counted once per distinct image."""
+
+    originals: int
+    #: Distinct images by content hash. Fewer than `originals` when works share one.
+    images: int
+    byte_size: int
+    image_bytes: int
+    #: What holding each image once saves over a file per work.
+    deduplicated_bytes: int
+
+
+class HostOut(BaseModel):
+    """One outbound host as the process's pacing and breakers hold it."""
+
+    host: str
+    #: `closed` while it is being asked, `open` while requests to it fail at
+    #: once, `trial` once the pause is over and one request is finding out.
+    state: str
+    consecutive_failures: int
+    #: When the next request will be let through. Null while the host is closed.
+    open_until: str | None
+    #: Kept after the host recovers, so the panel can say what happened.
+    last_failure: str | None
+    #: Since the process started.
+    admitted: int
+    refused: int
+    waited_seconds: float
+
+
+class ProvidersOut(BaseModel):
+    """Every host the process has asked anything of."""
+
+    since: str
+    hosts: list[HostOut]
+
+
 class HealthOut(BaseModel):
     """Observations about the walls, the backup, and this deployment's geometry.
 
@@ -498,6 +620,21 @@ class HealthOut(BaseModel):
     description: str
     backup: BackupOut
     artwork_box: ArtworkBoxOut
+    #: Null when statement profiling is off, which is the default. Never an
+    #: empty table standing in for "not measured".
+    statements: StoreProfileOut | None
+    #: Null only for a plane assembled without an imaging pool, which the
+    #: entry point never is.
+    imaging: ImagingProfileOut | None = None
+    #: Null only for a plane assembled without a storage governor, which the
+    #: entry point never is.
+    storage: StorageOut | None = None
+    #: Null only for a plane assembled without the catalogue on its panel,
+    #: which the entry point never is.
+    originals: OriginalsOut | None = None
+    #: Null only for a plane assembled without the process's guard, which the
+    #: entry point never is.
+    providers: ProvidersOut | None = None
 
 
 class RunOut(BaseModel):
@@ -817,12 +954,78 @@ class SelectedImageOut(BaseModel):
     selection_rationale: str | None
 
 
+class AcquisitionJobOut(BaseModel):
+    """One queued acquisition, where it got to and how its fetch went.
+
+    `state` and `outcome` are two fields for the reason a run's status is never
+    a flag: a fetch that finished `failed` is a source's problem, and a job that
+    was `refused` is this deployment's.
+    """
+
+    job_id: str
+    batch_id: str
+    artwork_id: str
+    source_id: str
+    method: str
+    priority: int
+    state: str
+    #: What the fetch reserves against the disk's free-space floor when it starts.
+    #: An upper bound, not a prediction.
+    expected_bytes: int
+    #: Null until the fetch has finished.
+    outcome: str | None
+    detail: str | None
+    enqueued_at: str
+    started_at: str | None
+    finished_at: str | None
+    #: How far a tiled fetch has got, updated while it runs. Null for a job
+    #: that has not started or a fetch that reports nothing; `tiles_expected`
+    #: stays null until the fetcher knows the grid, which the binary says only
+    #: at the end.
+    tiles_fetched: int | None = None
+    tiles_refused: int | None = None
+    tiles_expected: int | None = None
+
+
+class AcquisitionBatchOut(BaseModel):
+    """The jobs one request queued, under the id that follows them."""
+
+    batch_id: str
+    jobs: list[AcquisitionJobOut]
+    count: int
+
+
+class AcquisitionQueueOut(BaseModel):
+    """The queue's depth, and the jobs asked about."""
+
+    jobs: list[AcquisitionJobOut]
+    count: int
+    #: Across the whole queue, whatever `jobs` was narrowed to.
+    queued: int
+    running: int
+    reserved_bytes: int
+
+
+class AcquisitionJobListOut(BaseModel):
+    """The jobs a cancel named, as they stand afterwards."""
+
+    jobs: list[AcquisitionJobOut]
+    count: int
+
+
 class StartRun(BaseModel):
     """An intent to search for, in the curator's own words."""
 
     intent: str
 
 
+class QueueAcquisitions(BaseModel):
+    """The works to acquire, and how soon among those still waiting."""
+
+    artwork_ids: list[str]
+    priority: int = 0
+
+
 class StartResolve(BaseModel):
     """The works to look again for images of."""
 
@@ -10,18 +10,39 @@ fragment, so the server sees one path in practice — but a bookmarked or reload
 deep link must not 404, and a catch-all that returned the shell for `/api/...`
 too would turn a mistyped endpoint into a page of HTML that a client parses as
 JSON. So the UI paths are listed rather than globbed.
+
+**The shell is revalidated and everything it names is not.** It is served from
+the bundle `assets.py` builds when the application starts, naming each file by
+a hash of its content under `/assets`, and those answers are `immutable`: a
+phone that has loaded the client once asks for the shell and nothing else until
+a deployment changes what the shell names.
 """
 
 from pathlib import Path
 from typing import Final
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Request
+from fastapi.responses import Response
+
+from curation.http.assets import Asset, AssetBundle, accepts_gzip
 
 router = APIRouter()
 
 STATIC_DIR: Final[Path] = Path(__file__).parent / "static"
 
+#: Where the content-hashed bundle of `STATIC_DIR` is served. A different prefix
+#: from the plain tree's rather than a second name inside it, so `/static` keeps
+#: answering exactly as it always has for anything that names a file directly.
+ASSETS_PATH: Final[str] = "/assets"
+
+#: A bundled file's name changes whenever its bytes do, so an answer for one can
+#: be kept for as long as a browser is willing to keep anything.
+ASSET_CACHE_CONTROL: Final[str] = "public, max-age=31536000, immutable"
+
+#: The shell is the one file whose name does not change, so it is asked about on
+#: every load — which costs an empty 304 while the deployment stands.
+SHELL_CACHE_CONTROL: Final[str] = "no-cache"
+
 #: Every path the client renders a view for. Adding a view means adding it here;
 #: a view reachable only by clicking is a view nobody can bookmark.
 #:
@@ -52,9 +73,42 @@ UI_PATHS: Final[tuple[str, ...]] = (
 )
 
 
-def index() -> FileResponse:
-    """The client shell."""
-    return FileResponse(STATIC_DIR / "index.html", media_type="text/html")
+def index(request: Request) -> Response:
+    """The client shell, naming the bundle's files."""
+    return _send(request, _bundle(request).shell, cache_control=SHELL_CACHE_CONTROL)
+
+
+def asset(request: Request, name: str) -> Response:
+    """One bundled file, by the hashed name the shell or another module gave it.
+
+    A name the bundle does not have is a 404 rather than a lookup in the plain
+    tree: it is a name from some other deployment, and answering it with
+    today's bytes under an `immutable` header would pin the wrong file.
+    """
+    found = _bundle(request).assets.get(name)
+    if found is None:
+        return Response(status_code=404)
+    return _send(request, found, cache_control=ASSET_CACHE_CONTROL)
+
+
+def _bundle(request: Request) -> AssetBundle:
+    bundle: AssetBundle = request.app.state.assets
+    return bundle
+
+
+def _send(request: Request, found: Asset, *, cache_control: str) -> Response:
+    """Answer with the compressed copy when the client takes it, or a 304 when it has it.
+
+    `Vary` is sent on both bodies, so a shared cache between here and the phone
+    cannot hand the gzipped bytes to a client that never said it could read them.
+    """
+    headers = {"Cache-Control": cache_control, "ETag": found.etag, "Vary": "Accept-Encoding"}
+    offered = request.headers.get("if-none-match")
+    if offered is not None and found.etag in {tag.strip() for tag in offered.split(",")}:
+        return Response(status_code=304, headers=headers)
+    if found.gzipped is not None and accepts_gzip(request.headers.get("accept-encoding")):
+        return Response(found.gzipped, media_type=found.media_type, headers={**headers, "Content-Encoding": "gzip"})
+    return Response(found.body, media_type=found.media_type, headers=headers)
 
 
 # Registered in a loop rather than with a decorator per path, so `UI_PATHS` is
@@ -63,3 +117,4 @@ def index() -> FileResponse:
 # call that silently double-registers every path.
 for _path in UI_PATHS:
     router.add_api_route(_path, index, methods=["GET"], include_in_schema=False)
+router.add_api_route(f"{ASSETS_PATH}/{{name:path}}", asset, methods=["GET"], include_in_schema=False)
@@ -4,12 +4,49 @@
  * refusal-versus-fault distinction below written once rather than per screen.
  */
 
+/* The last answer to each `GET` that came with a validator, by path.
+ *
+ * The listings carry an `ETag` that moves only when the catalogue commits, and
+ * the screens re-ask for them on every repaint and every poll. Sending the tag
+ * back turns an ask that lands between commits into an empty 304, and this is
+ * what the 304 is answered from. The text is held rather than the parsed body,
+ * so a screen that rearranges what it was handed cannot change what the next
+ * 304 hands back.
+ *
+ * Bounded, because the grid's paths carry its search and its facets and a
+ * curator typing into the search box mints a new path per keystroke. Oldest
+ * first out; a path asked again moves to the back. Losing one costs a full
+ * answer on its next ask and nothing else. */
+const answered = new Map();
+const ANSWERS_HELD = 64;
+
+function remember(path, etag, text) {
+  answered.delete(path);
+  answered.set(path, { etag, text });
+  if (answered.size > ANSWERS_HELD) answered.delete(answered.keys().next().value);
+}
+
 export async function api(path, options) {
+  const reading = !options || !options.method || options.method.toUpperCase() === "GET";
+  const held = reading ? answered.get(path) : undefined;
   const response = await fetch(path, {
-    headers: { "content-type": "application/json" },
+    headers: {
+      "content-type": "application/json",
+      ...(held ? { "if-none-match": held.etag } : {}),
+    },
     ...options,
   });
-  const body = await response.json().catch(() => null);
+  if (response.status === 304 && held) {
+    remember(path, held.etag, held.text);
+    return JSON.parse(held.text);
+  }
+  const text = await response.text().catch(() => "");
+  let body = null;
+  try {
+    body = text ? JSON.parse(text) : null;
+  } catch {
+    body = null;
+  }
   if (!response.ok) {
     // The service layer writes its refusals to be shown; anything else is a
     // fault, and saying which is which beats one apologetic sentence for both.
@@ -19,9 +56,24 @@ export async function api(path, options) {
         : `The server answered ${response.status} for ${path}.`;
     throw new Error(message);
   }
+  const etag = response.headers.get("etag");
+  if (reading && etag && body !== null) remember(path, etag, text);
   return body;
 }
 
+/* Every width the plane draws a thumbnail at, as a `srcset` for one work's.
+ *
+ * The same ladder as `THUMBNAIL_EDGES_PX`, and it has to be: a width named here
+ * that the plane does not draw is served at the next size up, which is correct
+ * and wasted. The browser picks by the pixels the image will occupy, so a phone
+ * column takes the smallest and a retina grid the largest; the plain `src` is
+ * still the grid's default size for anything that reads no `srcset`. */
+const THUMBNAIL_WIDTHS = [240, 480, 960];
+
+export function thumbnailSrcset(path) {
+  return THUMBNAIL_WIDTHS.map((width) => `${path}?w=${width} ${width}w`).join(", ");
+}
+
 /* Both the grid and the theme picker page through to the end rather than showing
  * the first page. The picker is the one that made this necessary: a truncated
  * grid is a visible short list, but a truncated picker means a curator simply
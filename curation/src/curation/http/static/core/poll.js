@@ -33,6 +33,7 @@
  * in flight, which is the counter's other job and not a poll chain.
  */
 
+import { api } from "./api.js";
 import { refresh } from "./router.js";
 import { state } from "./state.js";
 
@@ -61,6 +62,15 @@ export function pollIsCurrent(generation) {
 }
 
 /* The next look at what is being watched, unless it has stopped.
+ *
+ * **A run is streamed rather than polled when it can be.** A screen watching a
+ * run passes `runId`, and the look is then an `EventSource` on
+ * `/api/runs/{id}/events`: the server pushes the run when it changes, holding a
+ * connection and no thread, and each push repaints through `refresh` exactly as
+ * a timer tick would — the screen reads the pushed view through `readRun` in
+ * place of asking for it. The timer below is the fallback, for a browser with
+ * no `EventSource` and for a run whose stream failed, and it is also the whole
+ * mechanism for anything that is not a run.
  *
  * The timer's conditions are checked when it *fires* rather than cancelled on
  * navigation: a stale timer that finds the world moved on simply does nothing,
@@ -84,9 +94,100 @@ export function pollIsCurrent(generation) {
  * between them. Passing it here rather than wrapping the call in an `if` is what
  * makes "poll only while something is still happening" one decision instead of
  * one per call site. */
-export function schedulePollUnlessDone({ view, detailId, generation, intervalMs, done }) {
-  if (done) return;
+export function schedulePollUnlessDone({ view, detailId, generation, intervalMs, done, runId = null }) {
+  if (done) {
+    closeStream();
+    return;
+  }
+  if (runId !== null && streamable(runId)) {
+    openStream({ view, detailId, runId, intervalMs });
+    return;
+  }
   window.setTimeout(() => {
     if (pollIsCurrent(generation) && state.view === view && state.detailId === detailId) refresh();
   }, intervalMs);
 }
+
+/* A run, from the stream if it has just pushed one and from the server if not.
+ *
+ * The pushed view is taken rather than read, so it answers exactly one paint:
+ * the paint its arrival caused. Any later paint — a curator's own action, a
+ * fallback tick — asks the server, which is never older than the push. */
+export async function readRun(runId) {
+  const view = pushed.get(runId);
+  if (view !== undefined) {
+    pushed.delete(runId);
+    return view;
+  }
+  return api(`/api/runs/${encodeURIComponent(runId)}`);
+}
+
+/* The one open stream, and what it is for. One at a time, because one screen is
+ * on the page at a time: opening a second run's stream closes the first. */
+let stream = null;
+
+/* The last view a stream pushed and no paint has yet read, by run. */
+const pushed = new Map();
+
+/* Runs whose stream failed on this page. Not retried: the timer takes over for
+ * them and carries the failure handling the run view already has, and a stream
+ * re-opened on every tick would be a poll with extra steps. */
+const unstreamable = new Set();
+
+function streamable(runId) {
+  return typeof window.EventSource === "function" && !unstreamable.has(runId);
+}
+
+function watching({ view, detailId }) {
+  return state.view === view && state.detailId === detailId;
+}
+
+function openStream(watch) {
+  if (stream !== null && stream.runId === watch.runId && stream.view === watch.view && stream.detailId === watch.detailId) {
+    return;
+  }
+  closeStream();
+  const source = new EventSource(`/api/runs/${encodeURIComponent(watch.runId)}/events`);
+  stream = { ...watch, source };
+
+  const deliver = (event) => {
+    if (!watching(watch)) {
+      closeStream();
+      return;
+    }
+    pushed.set(watch.runId, JSON.parse(event.data));
+    refresh();
+  };
+  source.addEventListener("run", deliver);
+  // Closed here and not left to the server: a stream the server ends is one
+  // `EventSource` reconnects to, and a finished run would be asked again for
+  // as long as the tab stayed open.
+  source.addEventListener("end", (event) => {
+    closeStream();
+    deliver(event);
+  });
+  // Any failure hands the run to the timer. A refused id, a restart, a proxy
+  // that will not stream — the timer path already knows what to do about each
+  // of them, and says so on the screen; a stream retrying silently would not.
+  source.addEventListener("error", () => {
+    closeStream();
+    unstreamable.add(watch.runId);
+    if (watching(watch)) window.setTimeout(() => watching(watch) && refresh(), watch.intervalMs);
+  });
+}
+
+function closeStream() {
+  if (stream === null) return;
+  stream.source.close();
+  stream = null;
+}
+
+/* Leaving the screen closes its stream. A timer left behind costs one request
+ * that finds nothing to do; a stream left behind holds a connection until the
+ * run next changes, which for a run waiting on a curator may be never. After
+ * the router's own listener, which is what moves `state` to the new screen. */
+window.addEventListener("hashchange", () => {
+  window.setTimeout(() => {
+    if (stream !== null && !watching(stream)) closeStream();
+  }, 0);
+});
@@ -30,7 +30,7 @@
  * rather than about the works, and lives on the Theme screen).
  */
 
-import { api, fetchAllWorks } from "../core/api.js";
+import { api, fetchAllWorks, thumbnailSrcset } from "../core/api.js";
 import { absentImage, fitBadge, shortfallNote, sourceBadge, statusBadge } from "../core/badges.js";
 import { el, guard, render } from "../core/render.js";
 import { go } from "../core/router.js";
@@ -187,8 +187,14 @@ function cardImage(work) {
   if (!work.image.available) {
     return el("div", { class: "card-image" }, [absentImage(work.image.note)]);
   }
+  const path = `/api/works/${encodeURIComponent(work.artwork_id)}/thumbnail`;
   const image = el("img", {
-    src: `/api/works/${encodeURIComponent(work.artwork_id)}/thumbnail`,
+    src: path,
+    srcset: thumbnailSrcset(path),
+    // The grid's column at its widest, or the viewport when the grid is one
+    // column. Generous rather than exact: one size too large costs bytes, one
+    // too small costs a blurred card.
+    sizes: "(max-width: 40rem) 100vw, 20rem",
     // Empty on purpose. The button around it is already named "Open <title>",
     // and the tile's own text carries artist, date and medium — describing the
     // picture here as well would make every tile announce its title twice.
@@ -18,7 +18,7 @@
 import { api } from "../core/api.js";
 import { confirmAct } from "../core/confirm.js";
 import { agree, counted } from "../core/counting.js";
-import { claimPoll, pollIsCurrent, schedulePollUnlessDone } from "../core/poll.js";
+import { claimPoll, pollIsCurrent, readRun, schedulePollUnlessDone } from "../core/poll.js";
 import { el, guard, render } from "../core/render.js";
 import { backLink, go } from "../core/router.js";
 import { state } from "../core/state.js";
@@ -54,13 +54,14 @@ const SPEAKER = { curator: "You", system: "Curation" };
  * What counts as stopped is this screen's too, and it is not the run view's:
  * there is nothing to wait for until a run is committed, so no committed run is
  * as finished as a terminal one. */
-function schedulePoll(conversationId, generation, { done }) {
+function schedulePoll(conversationId, generation, { done, runId }) {
   schedulePollUnlessDone({
     view: "conversation",
     detailId: conversationId,
     generation,
     intervalMs: CONVERSATION_POLL_MS,
     done,
+    runId,
   });
 }
 
@@ -116,7 +117,7 @@ async function paint(view, { conversationId, generation, pollGeneration }) {
   let runProblem = null;
   if (view.committed_run_id) {
     try {
-      run = await api(`/api/runs/${encodeURIComponent(view.committed_run_id)}`);
+      run = await readRun(view.committed_run_id);
     } catch (failure) {
       // Said rather than swallowed: a commit card that silently stopped showing
       // progress looks exactly like a search that is not running. Named, and
@@ -165,7 +166,7 @@ async function paint(view, { conversationId, generation, pollGeneration }) {
 
   const body = JSON.stringify({ view, run, runProblem, estimate });
   if (state.painted !== null && state.painted.conversationId === conversationId && state.painted.body === body) {
-    schedulePoll(conversationId, pollGeneration, { done });
+    schedulePoll(conversationId, pollGeneration, { done, runId: view.committed_run_id || null });
     return;
   }
 
@@ -176,10 +177,7 @@ async function paint(view, { conversationId, generation, pollGeneration }) {
     text: "Say it",
     onclick: () =>
       guard(async () => {
-        const next = await api(`/api/conversations/${encodeURIComponent(conversationId)}/turns`, {
-          method: "POST",
-          body: JSON.stringify({ text: said.value }),
-        });
+        const next = await speak(conversationId, { text: said.value });
         await repaint(next, { conversationId, generation });
       }),
   });
@@ -227,7 +225,7 @@ async function paint(view, { conversationId, generation, pollGeneration }) {
   );
 
   state.painted = { conversationId, body };
-  schedulePoll(conversationId, pollGeneration, { done });
+  schedulePoll(conversationId, pollGeneration, { done, runId: view.committed_run_id || null });
 }
 
 /* Destroy the thread, having said what that costs in the terms it costs it.
@@ -272,9 +270,110 @@ async function repaint(view, { conversationId, generation }) {
   await paint(view, { conversationId, generation, pollGeneration: claimPoll() });
 }
 
+/* Ask, and show the answer's words as they are written.
+ *
+ * The streaming route sends the reply's text in pieces and then the whole
+ * thread, and the whole thread is what gets painted — the pieces only fill a
+ * provisional turn at the foot of the transcript, so the curator reads along
+ * instead of watching a button for the seconds a reply takes to write.
+ *
+ * Anything short of a stream is answered by the plain route instead. A refusal
+ * from the stream route was made before anything was recorded, so asking the
+ * plain route repeats the refusal in the words `api` already gives it; a stream
+ * that broke off after the question was written is followed by reading the
+ * thread, because the answer is still being finished and recorded server-side
+ * and asking again would pay for a second one. An `error` event is the server
+ * saying the answer failed after the stream opened; it ends the stream without
+ * a turn, so it is answered the same way — by reading what the thread kept. */
+async function speak(conversationId, body) {
+  const path = `/api/conversations/${encodeURIComponent(conversationId)}`;
+  const response = await fetch(`${path}/turns/stream`, {
+    method: "POST",
+    headers: { "content-type": "application/json", accept: "text/event-stream" },
+    body: JSON.stringify(body),
+  });
+  if (!response.ok || !response.body) {
+    return api(`${path}/turns`, { method: "POST", body: JSON.stringify(body) });
+  }
+  const writing = provisionalTurns(body.text);
+  let view = null;
+  try {
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffered = "";
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffered += value;
+      let end;
+      while ((end = buffered.indexOf("\n\n")) !== -1) {
+        const event = sseEvent(buffered.slice(0, end));
+        buffered = buffered.slice(end + 2);
+        if (event.name === "text") writing.append(JSON.parse(event.data).text);
+        else if (event.name === "turn") view = JSON.parse(event.data);
+      }
+    }
+  } catch {
+    view = null;
+  }
+  return view || api(path);
+}
+
+/* One server-sent event's name and data. Comment lines — the keep-alive — have
+ * neither, and a multi-line `data` is rejoined with the newlines it was split
+ * on, as the format says. */
+function sseEvent(block) {
+  let name = "message";
+  const data = [];
+  for (const line of block.split("\n")) {
+    if (line.startsWith("event:")) name = line.slice(6).trim();
+    else if (line.startsWith("data:")) data.push(line.slice(5).replace(/^ /, ""));
+  }
+  return { name, data: data.join("\n") };
+}
+
+/* The question and an answer being written, put under the transcript until the
+ * real turns replace them on the next paint.
+ *
+ * `aria-busy` rather than a live region: a reader announcing every few words
+ * of a sentence still being written is noise, and the finished turn is painted
+ * in a moment anyway. */
+function provisionalTurns(asked) {
+  const host = document.getElementById("thread");
+  const answer = el("p", { class: "muted", text: "Thinking…" });
+  let started = false;
+  if (host) {
+    if (asked && asked.trim()) {
+      host.append(
+        el("div", { class: "turn", "data-role": "curator" }, [
+          el("p", { class: "turn-speaker", text: SPEAKER.curator }),
+          el("p", { text: asked }),
+        ]),
+      );
+    }
+    host.append(
+      el("div", { class: "turn", "data-role": "system", "aria-busy": true }, [
+        el("p", { class: "turn-speaker", text: SPEAKER.system }),
+        answer,
+      ]),
+    );
+  }
+  return {
+    append(text) {
+      if (!started) {
+        answer.textContent = "";
+        answer.className = "";
+        started = true;
+      }
+      answer.textContent += text;
+    },
+  };
+}
+
 function thread(view) {
   if (!view.turns.length) {
-    return el("div", { class: "panel" }, [
+    // `#thread` even while empty, so the first question has somewhere to be
+    // shown being answered.
+    return el("div", { class: "panel", id: "thread" }, [
       el("p", { class: "muted", text: "Nothing said yet. Describe the wall, the room, or the mood you are after." }),
     ]);
   }
@@ -460,10 +559,7 @@ function unanswered(view, { conversationId, generation }) {
             // keeps pressing this twice from buying two answers: once a turn has
             // been answered there is nothing outstanding, and the server says so
             // instead of spending again.
-            const next = await api(`/api/conversations/${encodeURIComponent(conversationId)}/turns`, {
-              method: "POST",
-              body: JSON.stringify({}),
-            });
+            const next = await speak(conversationId, {});
             await repaint(next, { conversationId, generation });
           }),
       }),
@@ -126,6 +126,137 @@ function heartbeatPanels(health) {
   return health.walls.map(heartbeatPanel);
 }
 
+/* What the catalogue's SQL has cost, or that nobody asked.
+ *
+ * **Off is said as off.** A null reading means the deployment did not turn
+ * profiling on, and an empty table in its place would read as "nothing has been
+ * slow" — a claim this screen would be making about statements it never timed.
+ *
+ * Only the costliest shapes are listed, by total time: the statement worth
+ * looking at is the one that adds up, and the full table is on the tool surface
+ * for whoever wants every row. */
+const STATEMENTS_SHOWN = 10;
+
+function statementsPanel(profile) {
+  if (!profile) {
+    return el("div", { class: "panel" }, [
+      el("h3", { text: "The catalogue's statements" }),
+      el("p", {
+        class: "muted",
+        text: "Statement profiling is off. Set STORE_PROFILING=true and restart to time every statement the catalogue runs.",
+      }),
+    ]);
+  }
+  const ms = (value) => `${value.toFixed(1)} ms`;
+  return el("div", { class: "panel" }, [
+    el("h3", { text: "The catalogue's statements" }),
+    el("p", {
+      class: "muted",
+      text: `Since ${profile.since}, costliest first. A statement over ${profile.slow_query_ms} ms is counted as slow and its plan kept.`,
+    }),
+    profile.statements.length === 0 ? el("p", { class: "note", text: "No statement has run yet." }) : null,
+    ...profile.statements.slice(0, STATEMENTS_SHOWN).map((statement) =>
+      el("div", { class: "statement" }, [
+        el("h4", { text: statement.shape }),
+        facts([
+          ["Calls", statement.calls],
+          ["Executing", `${ms(statement.total_ms)} in all, ${ms(statement.mean_ms)} on average, ${ms(statement.max_ms)} at worst`],
+          // Apart from executing, because the fix is different: this is time
+          // spent queued behind somebody else's transaction.
+          ["Waiting for the lock", ms(statement.lock_wait_ms)],
+          ["Rows", statement.rows],
+          ["Slow calls", statement.slow || null],
+        ]),
+        statement.plan ? el("pre", { text: statement.plan }) : null,
+      ]),
+    ),
+  ]);
+}
+
+/* The cache directories under ART_ROOT, each against its byte budget.
+ *
+ * As of the governor's last pass rather than now, and the screen says when that
+ * was: measuring a directory walks it, which a page load should not cost.
+ *
+ * **Held bytes are stated beside the total**, because a cache over its budget
+ * is either a governor that has not caught up or one that is not allowed to —
+ * a fetch running against its tiles, previews still under review — and only
+ * the second is where it should be. */
+function storagePanel(storage) {
+  if (!storage) return null;
+  const mib = (bytes) => `${(bytes / (1024 * 1024)).toFixed(1)} MiB`;
+  return el("div", { class: "panel" }, [
+    el("h3", { text: "The cache directories" }),
+    el("p", {
+      class: "muted",
+      text: `Each held to its budget, least recently used first. Evictions counted since ${storage.since}.`,
+    }),
+    ...storage.caches.map((cache) =>
+      el("div", { class: "statement" }, [
+        el("h4", { text: cache.name }),
+        cache.used_bytes === null
+          ? el("p", { class: "note", text: "Not measured yet." })
+          : facts([
+              ["In use", `${mib(cache.used_bytes)} in ${cache.entries} entries`],
+              ["Budget", cache.ceiling_bytes ? mib(cache.ceiling_bytes) : "none — measured, never evicted from"],
+              ["Held in place", cache.held_bytes ? mib(cache.held_bytes) : null],
+              ["Evicted", cache.evicted ? `${cache.evicted} entries, ${mib(cache.evicted_bytes)}` : null],
+              ["Could not evict", cache.failed || null],
+              ["Measured", cache.measured_at],
+            ]),
+      ]),
+    ),
+  ]);
+}
+
+/* The held originals, and what holding each distinct image once has saved.
+ *
+ * Counted off the catalogue's rows rather than the disk, so a sync that copied
+ * shared images once per work does not show here: the saving is the one this
+ * tree's layout makes, not a measurement of the card. */
+function originalsPanel(originals) {
+  if (!originals) return null;
+  const mib = (bytes) => `${(bytes / (1024 * 1024)).toFixed(1)} MiB`;
+  return el("div", { class: "panel" }, [
+    el("h3", { text: "The originals" }),
+    facts([
+      ["Held", `${originals.originals} works, ${mib(originals.byte_size)}`],
+      ["Distinct images", `${originals.images}, ${mib(originals.image_bytes)} counted once each`],
+      ["Shared between works", originals.deduplicated_bytes ? mib(originals.deduplicated_bytes) : null],
+    ]),
+  ]);
+}
+
+/* Every host the plane has asked, and whether it is asking it now.
+ *
+ * A host is listed once something has asked it, and not before: nothing here
+ * probes, so an absent host is one nothing has needed since the process
+ * started. **The state is the guard's, not a verdict** — `open` says requests
+ * are being refused without being sent, and until when, and the last failure
+ * beside it says why. */
+function providersPanel(providers) {
+  if (!providers || !providers.hosts.length) return null;
+  return el("div", { class: "panel" }, [
+    el("h3", { text: "The hosts asked" }),
+    el("p", {
+      class: "muted",
+      text: `Paced and broken per host, across every run and acquisition. Counted since ${providers.since}.`,
+    }),
+    ...providers.hosts.map((host) =>
+      el("div", { class: "statement" }, [
+        el("h4", { text: host.host }),
+        facts([
+          ["State", host.open_until ? `${host.state} until ${host.open_until}` : host.state],
+          ["Failures in a row", host.consecutive_failures || null],
+          ["Last failure", host.last_failure],
+          ["Sent", `${host.admitted} requests, ${host.waited_seconds.toFixed(1)}s spent waiting a turn`],
+          ["Refused unsent", host.refused || null],
+        ]),
+      ]),
+    ),
+  ]);
+}
+
 export async function viewHealth(generation) {
   const health = await api("/api/health");
   const box = health.artwork_box;
@@ -175,5 +306,9 @@ export async function viewHealth(generation) {
         ["Resolution floor", `${box.floor_inches}″ on the long edge`],
       ]),
     ]),
+    originalsPanel(health.originals),
+    storagePanel(health.storage),
+    providersPanel(health.providers),
+    statementsPanel(health.statements),
   );
 }
@@ -7,7 +7,7 @@
 import { api } from "../core/api.js";
 import { facts, reasonBadge, resolutionBadge, table } from "../core/badges.js";
 import { agree, agreePartitive, counted } from "../core/counting.js";
-import { claimPoll, pollIsCurrent, schedulePollUnlessDone } from "../core/poll.js";
+import { claimPoll, pollIsCurrent, readRun, schedulePollUnlessDone } from "../core/poll.js";
 import { el, guard, render } from "../core/render.js";
 import { backLink, go, refresh } from "../core/router.js";
 import { state } from "../core/state.js";
@@ -102,8 +102,11 @@ export function runSentence(view) {
 }
 
 /* Slow enough not to hammer a Pi, fast enough that a curator watching a run does
- * not wonder whether the page is live. The server answers immediately rather
- * than holding the request open, so this interval is the whole of the latency. */
+ * not wonder whether the page is live. **The fallback now, not the mechanism**:
+ * a run is streamed to the page as it changes (`core/poll.js`), and this is the
+ * pace of the polling that takes over when a stream cannot be had. The server
+ * answers a poll immediately rather than holding it open, so when it applies
+ * this interval is the whole of the latency. */
 export const RUN_POLL_MS = 2000;
 
 /* How many consecutive failures end the watch, and why a count rather than a
@@ -154,7 +157,7 @@ function noteWatchSuccess(runId) {
  * fourth call site that forgot the argument would get the silent failure this
  * whole chain exists to prevent, and would get it looking correct. */
 function scheduleRunPoll(runId, generation, { done }) {
-  schedulePollUnlessDone({ view: "run", detailId: runId, generation, intervalMs: RUN_POLL_MS, done });
+  schedulePollUnlessDone({ view: "run", detailId: runId, generation, intervalMs: RUN_POLL_MS, done, runId });
 }
 
 export async function viewRun(runId, generation) {
@@ -166,7 +169,7 @@ export async function viewRun(runId, generation) {
   const pollGeneration = claimPoll();
   let view;
   try {
-    view = await api(`/api/runs/${encodeURIComponent(runId)}`);
+    view = await readRun(runId);
   } catch (failure) {
     // One blip must not end the watch. Without re-arming, the throw leaves the
     // last paint on screen looking current, `guard` writes a message naming a
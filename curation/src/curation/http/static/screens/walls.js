@@ -41,7 +41,7 @@
  * decision on it. This screen has a decision on it.
  */
 
-import { api } from "../core/api.js";
+import { api, thumbnailSrcset } from "../core/api.js";
 import { absentImage, facts, table } from "../core/badges.js";
 import { hangTheme } from "../core/hanging.js";
 import { el, guard, render } from "../core/render.js";
@@ -442,8 +442,11 @@ function manifestPanels(manifest) {
  * the picture would be announced as "Open Nighthawks" and nothing about what it
  * is. The title below is the control instead. */
 function hungWork(entry) {
+  const path = `/api/works/${encodeURIComponent(entry.artwork_id)}/thumbnail`;
   const image = el("img", {
-    src: `/api/works/${encodeURIComponent(entry.artwork_id)}/thumbnail`,
+    src: path,
+    srcset: thumbnailSrcset(path),
+    sizes: "(max-width: 40rem) 100vw, 24rem",
     alt: entry.artist ? `${entry.title}, ${entry.artist}` : entry.title,
     loading: "lazy",
   });
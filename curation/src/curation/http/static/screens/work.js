@@ -22,7 +22,7 @@
  * less carefully.
  */
 
-import { api } from "../core/api.js";
+import { api, thumbnailSrcset } from "../core/api.js";
 import { facts, fitBadge, sourceBadge, statusBadge, table } from "../core/badges.js";
 import { confirmAct } from "../core/confirm.js";
 import { el, guard, render } from "../core/render.js";
@@ -108,6 +108,9 @@ function paint(detail, generation, focusAction = false) {
     ? el("img", {
         class: "detail-image",
         src: `${workPath(work.artwork_id)}/thumbnail`,
+        srcset: thumbnailSrcset(`${workPath(work.artwork_id)}/thumbnail`),
+        // One work, shown large: the panel's width, which is most of the page.
+        sizes: "(max-width: 60rem) 100vw, 60rem",
         alt: work.artist ? `${work.title}, by ${work.artist.name}` : work.title,
       })
     : el("p", { class: "note", text: work.image.note || "No image held." });
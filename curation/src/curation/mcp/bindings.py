@@ -21,10 +21,12 @@ what the shared service layer exists to avoid.
 import logging
 from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime
+from decimal import Decimal
 from typing import Any, Final
 
 from curation.acquisition.dezoomify import DezoomifyUnavailable
 from curation.acquisition.preparation import PreparationResult
+from curation.acquisition.queue import AcquisitionJob, JobState
 from curation.acquisition.service import AcquisitionOutcome, AcquisitionResult
 from curation.acquisition.space import NotEnoughSpace
 from curation.acquisition.tiles import TileTargetUnavailable
@@ -216,6 +218,35 @@ def _retry_acquisition(services: Services, arguments: Mapping[str, Any]) -> dict
     )
 
 
+def _queue_acquisitions(services: Services, arguments: Mapping[str, Any]) -> dict[str, Any]:
+    batch = services.acquisitions.enqueue(arguments["artwork_ids"], priority=arguments.get("priority", 0))
+    return ok(
+        batch_id=batch.batch_id,
+        jobs=[_acquisition_job_fields(job) for job in batch.jobs],
+        count=len(batch.jobs),
+        notice=(
+            "Queued; the fetches run behind this answer. Poll action='acquisition_status' with this batch_id to "
+            "watch them, and art_catalogue(action='sources') for what each recorded."
+        ),
+    )
+
+
+def _acquisition_status(services: Services, arguments: Mapping[str, Any]) -> dict[str, Any]:
+    status = services.acquisitions.status(batch_id=arguments.get("batch_id"))
+    return ok(
+        jobs=[_acquisition_job_fields(job) for job in status.jobs],
+        count=len(status.jobs),
+        queued=status.queued,
+        running=status.running,
+        reserved_bytes=status.reserved_bytes,
+    )
+
+
+def _cancel_acquisitions(services: Services, arguments: Mapping[str, Any]) -> dict[str, Any]:
+    jobs = services.acquisitions.cancel(arguments.get("job_id"), batch_id=arguments.get("batch_id"))
+    return ok(jobs=[_acquisition_job_fields(job) for job in jobs], count=len(jobs))
+
+
 def _set_mat_color(services: Services, arguments: Mapping[str, Any]) -> dict[str, Any]:
     """Set a mat colour, or ask the model for one when none is given.
 
@@ -286,6 +317,39 @@ def _regenerate(services: Services, arguments: Mapping[str, Any]) -> dict[str, A
     )
 
 
+def _prepare_batch(services: Services, arguments: Mapping[str, Any]) -> dict[str, Any]:
+    """`regenerate` for every work a queued batch acquired, through `prepare_many`.
+
+    The first `regenerate` after an acquisition is the one that pays for a mat,
+    so a batch of forty acquired works was forty vision calls made one after
+    another by a caller looping over them. Here they are asked several at a
+    time, and only the composing is done one work after the next.
+    """
+    batch_id = arguments["batch_id"]
+    jobs = services.acquisitions.status(batch_id=batch_id).jobs
+    results = services.preparation.prepare_many(services.acquisitions.held(batch_id), force=bool(arguments.get("force")))
+    return ok(
+        batch_id=batch_id,
+        works=[
+            {
+                "artwork_id": result.artwork_id,
+                "outcome": result.outcome.value,
+                "detail": result.detail,
+                "relative_path": result.relative_path,
+                "hex_rgb": result.mat_hex,
+                "method": result.mat_method,
+                "cost_usd": str(result.cost_usd),
+                "notice": _regenerate_notice(result),
+            }
+            for result in results
+        ],
+        count=len(results),
+        still_fetching=sum(job.state in (JobState.QUEUED, JobState.RUNNING) for job in jobs),
+        # Summed exactly, for the reason `_set_mat_color` gives for a string.
+        cost_usd=str(sum((result.cost_usd for result in results), Decimal(0))),
+    )
+
+
 def _regenerate_notice(result: PreparationResult) -> str | None:
     """Said out loud when the work is on the wall smaller than the floor allows.
 
@@ -717,6 +781,42 @@ def _wall_status(services: Services, arguments: Mapping[str, Any]) -> dict[str,
     )
 
 
+def _statements(services: Services, arguments: Mapping[str, Any]) -> dict[str, Any]:
+    """What the catalogue's SQL has cost, in the field names `GET /api/health` uses.
+
+    Read through the health service rather than from the profiler directly, so
+    this and the browser panel report the same instant's figures by the same
+    route. Off is stated, not emptied: a model told "no statements" would
+    reasonably conclude none were slow.
+    """
+    profile = services.health.observe().statements
+    if profile is None:
+        return ok(
+            profiling=False,
+            observation="Statement profiling is off on this deployment; STORE_PROFILING turns it on.",
+        )
+    return ok(
+        profiling=True,
+        since=_moment(profile.since),
+        slow_query_ms=profile.slow_query_ms,
+        statements=[
+            {
+                "shape": statement.shape,
+                "calls": statement.calls,
+                "total_ms": statement.total_ms,
+                "mean_ms": statement.mean_ms,
+                "max_ms": statement.max_ms,
+                "lock_wait_ms": statement.lock_wait_ms,
+                "rows": statement.rows,
+                "slow": statement.slow,
+                "plan": statement.plan,
+            }
+            for statement in profile.statements
+        ],
+        count=len(profile.statements),
+    )
+
+
 def _sync(services: Services, arguments: Mapping[str, Any]) -> dict[str, Any]:
     return _built(services.display.sync(arguments["wall_id"], arguments.get("theme_id")))
 
@@ -860,8 +960,12 @@ BINDINGS: Final[Mapping[tuple[str, str], Binding]] = {
     ("art_catalogue", "archive"): _archive_artwork,
     ("art_catalogue", "restore"): _restore_artwork,
     ("art_catalogue", "retry_acquisition"): _retry_acquisition,
+    ("art_catalogue", "queue_acquisitions"): _queue_acquisitions,
+    ("art_catalogue", "acquisition_status"): _acquisition_status,
+    ("art_catalogue", "cancel_acquisitions"): _cancel_acquisitions,
     ("art_catalogue", "set_mat_color"): _set_mat_color,
     ("art_catalogue", "regenerate"): _regenerate,
+    ("art_catalogue", "prepare_batch"): _prepare_batch,
     ("art_theme", "list"): _list_themes,
     ("art_theme", "get"): _get_theme,
     ("art_theme", "create"): _create_theme,
@@ -875,6 +979,7 @@ BINDINGS: Final[Mapping[tuple[str, str], Binding]] = {
     ("art_display", "walls"): _list_walls,
     ("art_display", "add_wall"): _add_wall,
     ("art_display", "status"): _wall_status,
+    ("art_display", "statements"): _statements,
     ("art_display", "sync"): _sync,
     ("art_display", "show_now"): _show_now,
     ("art_display", "next"): _next,
@@ -1072,6 +1177,34 @@ def _directive_fields(directive: Directive) -> dict[str, Any]:
     }
 
 
+def _acquisition_job_fields(job: AcquisitionJob) -> dict[str, Any]:
+    """One queued acquisition as a caller sees it.
+
+    `state` says where the job got to and `outcome` how its fetch went, kept
+    apart for the reason a run's terminal state is never collapsed into a flag:
+    a fetch that finished `failed` is the source's problem, and a job `refused`
+    is this deployment's.
+    """
+    return {
+        "job_id": job.id,
+        "batch_id": job.batch_id,
+        "artwork_id": job.artwork_id,
+        "source_id": job.source_id,
+        "method": str(job.method),
+        "priority": job.priority,
+        "state": str(job.state),
+        "expected_bytes": job.expected_bytes,
+        "outcome": None if job.outcome is None else job.outcome.value,
+        "detail": job.detail,
+        "enqueued_at": _moment(job.enqueued_at),
+        "started_at": _moment(job.started_at),
+        "finished_at": _moment(job.finished_at),
+        "tiles_fetched": None if job.progress is None else job.progress.tiles_fetched,
+        "tiles_refused": None if job.progress is None else job.progress.tiles_refused,
+        "tiles_expected": None if job.progress is None else job.progress.tiles_expected,
+    }
+
+
 def _run_fields(run: DiscoveryRun) -> dict[str, Any]:
     """One run as a caller sees it.
 
@@ -20,12 +20,12 @@ suggestions; enumerating the whole valid set is more useful to a model than one
 guess, and it cannot mislead.
 """
 
-import json
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any, Final
 
 import mcp.types as types
+from pydantic import TypeAdapter
 
 #: Where a binding leaves the pictures its result carries. **Private, and
 #: stripped before anything is serialised** — base64 image data must reach the
@@ -40,6 +40,18 @@ import mcp.types as types
 #: knows the name.
 IMAGE_BLOCKS: Final[str] = "_image_blocks"
 
+#: The encoder the text block is written with: pydantic-core's, which is the one
+#: the HTTP surface already writes its listings with. Built once, because it
+#: compiles a serialiser for the type.
+#:
+#: **Not `json.dumps`, for two reasons, and the second is the one a model
+#: notices.** It encodes a hundred-row listing in about half the time. And it
+#: writes non-ASCII as itself where `json.dumps` escapes it, so "Dürer" reaches
+#: the model as "Dürer" rather than as `D\u00fcrer` — which a model reads less
+#: reliably and pays more tokens for, in a catalogue whose artists' names are
+#: full of it. The values decoded from either are identical.
+_PAYLOAD: Final[TypeAdapter[dict[str, Any]]] = TypeAdapter(dict[str, Any])
+
 
 @dataclass(frozen=True, slots=True)
 class ImageBlock:
@@ -133,7 +145,7 @@ def to_call_tool_result(payload: Mapping[str, Any]) -> types.CallToolResult:
     images: Sequence[ImageBlock] = body.pop(IMAGE_BLOCKS, ())
     return types.CallToolResult(
         content=[
-            types.TextContent(type="text", text=json.dumps(body, indent=2, default=str)),
+            types.TextContent(type="text", text=_PAYLOAD.dump_json(body, indent=2, fallback=str).decode()),
             *(types.ImageContent(type="image", data=image.data, mimeType=image.media_type) for image in images),
         ],
         structuredContent=body,
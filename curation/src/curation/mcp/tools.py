@@ -26,6 +26,7 @@ service method answers it, and the service method does the work.
 
 from typing import Final
 
+from curation.acquisition.queue import MAX_ACQUISITION_BATCH
 from curation.mcp.registry import Action, Param, ToolRecord
 from curation.persistence.discovery_records import AffinityDerivation, AffinitySentiment, RunKind, RunStatus
 from curation.persistence.records import ArtworkStatus, VocabularyKind
@@ -104,6 +105,16 @@ _SOURCE_ID = Param(
     description="Which source to fetch from, as returned by action='sources'. Omit to use the work's primary source.",
 )
 
+#: One description for `batch_id`, for the reason `_RUN_ID_DESCRIPTION` gives: it
+#: narrows a status read and names what a cancel withdraws, and only the first
+#: description of a flattened parameter survives.
+_BATCH_ID_DESCRIPTION = "An acquisition batch's id, as returned by action='queue_acquisitions'."
+
+_BATCH_ID = Param(name="batch_id", type="string", description=_BATCH_ID_DESCRIPTION)
+
+#: The same parameter where the action means nothing without it.
+_REQUIRED_BATCH_ID = Param(name="batch_id", type="string", description=_BATCH_ID_DESCRIPTION, required=True)
+
 #: Optional, and its absence is what asks the model. Stated in the description
 #: because the parameter's presence changes what the action *costs*, and a caller
 #: reading only the schema would have no way to know that omitting it spends
@@ -128,15 +139,16 @@ ART_CATALOGUE: Final = ToolRecord(
     name="art_catalogue",
     title="Art catalogue",
     summary=(
-        "Read and manage the works already accepted into the collection. Two actions reach outside the machine: "
-        "retry_acquisition fetches from a museum, and set_mat_color asks a vision model when given no colour."
+        "Read and manage the works already accepted into the collection. Three actions reach outside the machine: "
+        "retry_acquisition and queue_acquisitions fetch from museums, and set_mat_color asks a vision model when "
+        "given no colour."
     ),
     read_only=False,
     destructive=False,
     #: **True, and it was wrong before.** This is published to clients as
     #: `openWorldHint`, which is how a client decides whether a call warrants
-    #: confirmation. Two actions here reach the internet — `retry_acquisition`
-    #: fetches a museum URL, and `set_mat_color` without a colour calls a vision
+    #: confirmation. Three actions here reach the internet — `retry_acquisition`
+    #: and `queue_acquisitions` fetch museum URLs, and `set_mat_color` without a colour calls a vision
     #: model — so declaring a closed world understated both to every client that
     #: reads the hint. The flag is per *tool*, not per action, so a tool holding
     #: one open-world action is an open-world tool; the alternative is splitting
@@ -205,6 +217,64 @@ ART_CATALOGUE: Final = ToolRecord(
                 "comes back with missing tiles is refused outright when the work already holds a complete image.",
             ),
         ),
+        Action(
+            name="queue_acquisitions",
+            description="Queue many works for acquisition and return at once; the fetches run behind the handle.",
+            example="art_catalogue(action='queue_acquisitions', artwork_ids=['<an artwork_id>', '<another>'], priority=1)",
+            params=(
+                Param(
+                    name="artwork_ids",
+                    type="array",
+                    items="string",
+                    description=f"The works to acquire, up to {MAX_ACQUISITION_BATCH}, each from its primary source.",
+                    required=True,
+                ),
+                Param(
+                    name="priority",
+                    type="integer",
+                    description="Higher runs sooner among works still waiting. Defaults to 0.",
+                ),
+            ),
+            tips=(
+                "Returns a batch_id at once. Poll action='acquisition_status' with it to watch the batch.",
+                "Every work is checked before any is queued, so a batch naming a work with no source is refused whole.",
+                "A work already waiting or being fetched is not queued twice; its existing job is returned.",
+                "Tiled fetches run one at a time by default, because museums throttle them; direct fetches run beside.",
+                "The queue lives in memory: a restart forgets works still waiting, and queueing them again is safe.",
+            ),
+        ),
+        Action(
+            name="acquisition_status",
+            description="Report the acquisition queue, or one batch's jobs, and how each ended.",
+            example="art_catalogue(action='acquisition_status', batch_id='<a batch_id from action=queue_acquisitions>')",
+            params=(_BATCH_ID,),
+            tips=(
+                "A job's state is queued, running, finished, refused or cancelled. A finished job's outcome is how the "
+                "fetch went — 'partial' is an image with gaps, not an error.",
+                "A refused job met a condition no source is to blame for, such as a full disk; the jobs behind it "
+                "that would meet it too are cancelled and say why.",
+                "A running tiled job reports tiles_fetched and tiles_refused as it goes; tiles_expected stays null "
+                "until the fetcher knows the grid. A server refusing nearly every tile ends the fetch early as "
+                "'failed', and the tiles it did send are kept for the retry.",
+            ),
+        ),
+        Action(
+            name="cancel_acquisitions",
+            description="Withdraw a waiting acquisition, or every waiting job of a batch.",
+            example="art_catalogue(action='cancel_acquisitions', batch_id='<a batch_id from action=queue_acquisitions>')",
+            params=(
+                Param(
+                    name="job_id",
+                    type="string",
+                    description="One job's id, as returned by action='queue_acquisitions'. Give this or batch_id.",
+                ),
+                _BATCH_ID,
+            ),
+            tips=(
+                "A fetch already running is not interrupted: it finishes and its result is recorded.",
+                "Cancelling a batch answers with every job in it, so what is still running is visible.",
+            ),
+        ),
         Action(
             name="set_mat_color",
             description="Set the mat colour a work is shown against, or ask the vision model to choose one again.",
@@ -234,6 +304,21 @@ ART_CATALOGUE: Final = ToolRecord(
                 "Use force=true after changing the panel geometry or clearing the rendered tree.",
                 "A work whose master image is missing from disk is refused rather than rendered blank; "
                 "action='retry_acquisition' fetches it again.",
+                "For every work a queued batch fetched, action='prepare_batch' does this once for the lot.",
+            ),
+        ),
+        Action(
+            name="prepare_batch",
+            description="Regenerate every work an acquisition batch left holding an image, choosing the mats they lack together.",
+            example="art_catalogue(action='prepare_batch', batch_id='<a batch_id from action=queue_acquisitions>')",
+            params=(_REQUIRED_BATCH_ID, _FORCE),
+            tips=(
+                "What action='regenerate' does for one work, for the batch: the works without a mat have it chosen by "
+                "the vision model several at a time, at a fraction of a cent each, before any canvas is composed.",
+                "Works still waiting or being fetched are counted in still_fetching and left alone; call again once "
+                "action='acquisition_status' shows the batch settled.",
+                "A work whose fetch failed is not prepared. Every work that is, is checked before anything is spent, "
+                "so a master missing from disk refuses the call rather than leaving it paid for and half done.",
             ),
         ),
     ),
@@ -848,6 +933,19 @@ ART_DISPLAY: Final = ToolRecord(
                 "one room could be given while another was dark.",
             ),
         ),
+        Action(
+            name="statements",
+            description="Report what the catalogue's SQL has cost since startup, one row per statement shape.",
+            example="art_display(action='statements')",
+            tips=(
+                "Only answers with figures when the deployment set STORE_PROFILING; otherwise it says "
+                "profiling is off rather than reporting an empty table.",
+                "Rows are costliest first by total execution time. Time spent waiting for the catalogue's "
+                "lock is reported apart from time spent executing — a statement that waited is queued "
+                "behind another transaction, not in need of an index.",
+                "A shape that has been slow carries SQLite's query plan, captured the first time it was.",
+            ),
+        ),
         Action(
             name="sync",
             description="Rebuild the theme manifest so a named wall converges on what is hanging there.",
@@ -100,6 +100,16 @@ class TableAdapter:
         """
         return self._store.reading()
 
+    def generation(self) -> int:
+        """A number that moves whenever the file's rows may have.
+
+        Delegated like the two above, and it is the file's number rather than
+        this adapter's: a commit made through either adapter moves it for both,
+        which is right because an answer read through one may join rows the
+        other writes.
+        """
+        return self._store.generation()
+
     def close(self) -> None:
         """Release the file. Every adapter over the same file is closed with it.
 
@@ -126,6 +136,19 @@ class TableAdapter:
             log.warning("Refused to store %s: %s", subject, exc.reason)
             raise StorageError(f"Could not store {subject}: {exc.reason}", reason=exc.reason) from exc
 
+    def _add_many(self, table: str, rows: Sequence[Mapping[str, Any]], *, subject: str, key: tuple[str, ...] = BY_ID) -> None:
+        """Insert several records as one write, refusing all of them if any is already there.
+
+        `_add` for a batch: the same policy and the same wording, with `subject`
+        naming the batch ("one of 4000 artworks") because the driver does not say
+        which row it refused. Nothing is stored unless everything is.
+        """
+        try:
+            self._store.upsert_many(table, rows, pk=key, on_conflict="raise")
+        except StorageError as exc:
+            log.warning("Refused to store %s: %s", subject, exc.reason)
+            raise StorageError(f"Could not store {subject}: {exc.reason}", reason=exc.reason) from exc
+
     def _update(self, table: str, key: tuple[str, ...], row: Mapping[str, Any], *, subject: str) -> None:
         """Overwrite a record that is already there, refusing to create one that is not.
 
@@ -145,6 +168,26 @@ class TableAdapter:
                 log.warning("Refused to update %s: %s", subject, exc.reason)
                 raise StorageError(f"Could not update {subject}: {exc.reason}", reason=exc.reason) from exc
 
+    def _update_many(self, table: str, key: tuple[str, ...], rows: Sequence[Mapping[str, Any]], *, subject: str) -> None:
+        """Overwrite several records that are all already there, as one write.
+
+        `_update` for a batch. Every record is checked inside the same
+        transaction as the write, and one that is not stored refuses the batch
+        before anything is written — a batch that created the one row it could
+        not find would be the typo'd-id problem `_update` exists to prevent.
+        """
+        with self._store.transaction():
+            for row in rows:
+                if self._store.fetch_one(table, {column: row[column] for column in key}) is None:
+                    reason = "it is not stored."
+                    log.warning("Refused to update %s: %s", subject, reason)
+                    raise StorageError(f"Could not update {subject}: {reason}", reason=reason)
+            try:
+                self._store.upsert_many(table, rows, pk=key, on_conflict="update")
+            except StorageError as exc:
+                log.warning("Refused to update %s: %s", subject, exc.reason)
+                raise StorageError(f"Could not update {subject}: {exc.reason}", reason=exc.reason) from exc
+
     def _delete(self, table: str, pk: Mapping[str, Any]) -> None:
         """Remove a record, saying nothing about whether it was there.
 
@@ -33,6 +33,7 @@ from curation.persistence.records import (
     Directive,
     MatColor,
     Original,
+    OriginalsFootprint,
     Rendition,
     Source,
     Theme,
@@ -127,6 +128,22 @@ class CatalogueStore(Protocol):
         """
         ...
 
+    def generation(self) -> int:
+        """A number that moves whenever the catalogue may have changed, and never goes back.
+
+        What lets a surface that already holds an answer ask whether it is still
+        the answer without recomputing it. Equal numbers mean no commit landed
+        between the two asks; unequal ones mean one may have, and not
+        necessarily to anything a given answer reads.
+
+        It counts commits, so it sees the rows and nothing else. An answer that
+        also reads the tree — whether a recorded render is still on disk — is
+        only as fresh as the last commit when a file changes behind the plane's
+        back; every file this plane writes or removes is recorded by a commit
+        of its own.
+        """
+        ...
+
     def close(self) -> None:
         """Release the underlying resources."""
         ...
@@ -137,6 +154,10 @@ class CatalogueStore(Protocol):
         """Persist an artist. Raises if the id is already present."""
         ...
 
+    def add_artist_many(self, artists: Sequence[Artist]) -> None:
+        """Persist several artists as one write. Raises, storing none, if any id is already present."""
+        ...
+
     def get_artist(self, artist_id: str) -> Artist | None:
         """Return the artist, or None if no such id is stored."""
         ...
@@ -161,6 +182,10 @@ class CatalogueStore(Protocol):
         """Persist a work. Raises if the id is already present."""
         ...
 
+    def add_artwork_many(self, artworks: Sequence[Artwork]) -> None:
+        """Persist several works as one write. Raises, storing none, if any id is already present."""
+        ...
+
     def get_artwork(self, artwork_id: str) -> Artwork | None:
         """Return the work, or None if no such id is stored."""
         ...
@@ -211,6 +236,11 @@ class CatalogueStore(Protocol):
         same object for every kind the curator has not filtered on. Counting those
         together is one statement instead of five, which is what keeps the
         collection's default screen from paying for six near-identical scans.
+
+        **A query narrowed by nothing but its status is answered from a summary**
+        an implementation keeps in step with every facet and status write, and
+        anything narrower is counted live. The two must give the same number for
+        the same query; which one answered is not the caller's business.
         """
         ...
 
@@ -220,6 +250,10 @@ class CatalogueStore(Protocol):
         """Persist a source. Raises if the id is already present."""
         ...
 
+    def add_source_many(self, sources: Sequence[Source]) -> None:
+        """Persist several sources as one write. Raises, storing none, if any id is already present."""
+        ...
+
     def get_source(self, source_id: str) -> Source | None:
         """Return the source, or None if no such id is stored."""
         ...
@@ -246,6 +280,14 @@ class CatalogueStore(Protocol):
         """Overwrite a stored master image with this one. Raises if the id is absent."""
         ...
 
+    def find_held_original(self, url: str, *, other_than: str) -> Original | None:
+        """Return another work's original fetched from a source at `url` and not recorded as partial, or None."""
+        ...
+
+    def measure_originals(self) -> OriginalsFootprint:
+        """Count every held original, and the distinct images among them by content hash."""
+        ...
+
     # -- renditions -----------------------------------------------------------
 
     def add_rendition(self, rendition: Rendition) -> None:
@@ -310,6 +352,10 @@ class CatalogueStore(Protocol):
         """Overwrite a stored entry with this one. Raises if it is absent."""
         ...
 
+    def update_membership_many(self, memberships: Sequence[ThemeMembership]) -> None:
+        """Overwrite several stored entries as one write. Raises, changing none, if any is absent."""
+        ...
+
     def remove_membership(self, theme_id: str, artwork_id: str) -> None:
         """Take a work out of a theme. Removing an absent entry is not an error."""
         ...
@@ -11,7 +11,7 @@ values, no state-machine opinion. Every rule about what a valid run or candidate
 looks like belongs to the service layer, which is the only caller.
 """
 
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from contextlib import AbstractContextManager
 from datetime import datetime
 from typing import Protocol
@@ -29,6 +29,7 @@ from curation.persistence.discovery_records import (
     RunKind,
     RunStatus,
     SpendRecord,
+    Verdict,
 )
 from curation.persistence.records import VocabularyKind
 
@@ -76,6 +77,10 @@ class DiscoveryStore(Protocol):
         """Persist a proposed work. Raises if the id is already present."""
         ...
 
+    def add_candidate_work_many(self, works: Sequence[CandidateWork]) -> None:
+        """Persist several proposed works as one write. Raises, storing none, if any id is already present."""
+        ...
+
     def get_candidate_work(self, candidate_work_id: str) -> CandidateWork | None:
         """Return the proposed work, or None if no such id is stored."""
         ...
@@ -102,6 +107,10 @@ class DiscoveryStore(Protocol):
         """Persist an image instance. Raises if the id is already present."""
         ...
 
+    def add_candidate_image_many(self, images: Sequence[CandidateImage]) -> None:
+        """Persist several image instances as one write. Raises, storing none, if any id is already present."""
+        ...
+
     def get_candidate_image(self, candidate_image_id: str) -> CandidateImage | None:
         """Return the instance, or None if no such id is stored."""
         ...
@@ -120,6 +129,28 @@ class DiscoveryStore(Protocol):
         """
         ...
 
+    def list_reclaimable_previews(self, *, decided: Collection[Verdict], after: str, limit: int) -> Sequence[CandidateImage]:
+        """Return every instance naming a preview that only `decided` works reference.
+
+        At most `limit` distinct paths, each strictly after `after` and in path
+        order, with all of each path's instances — ordered by path, then id. A
+        path any other work still names is absent entirely, and a row whose
+        `preview_path` is null is never returned. The empty string starts from
+        the beginning; the last path of one batch is where the next one starts.
+
+        Which verdicts count as decided is the caller's to say, because it is a
+        state-machine rule and this contract holds none.
+        """
+        ...
+
+    def count_retained_previews(self, *, decided: Collection[Verdict]) -> int:
+        """Return how many distinct preview paths a work outside `decided` still names."""
+        ...
+
+    def list_named_previews(self, paths: Collection[str]) -> Collection[str]:
+        """Return those of `paths` that at least one instance names, whatever its work's verdict."""
+        ...
+
     # -- conversations --------------------------------------------------------
 
     def add_conversation(self, conversation: Conversation) -> None:
@@ -241,3 +272,17 @@ class DiscoveryStore(Protocol):
         resolve run while any run covering it is still live.
         """
         ...
+
+    # -- upkeep ---------------------------------------------------------------
+
+    def dedup_rules_applied(self) -> str | None:
+        """Return the dedup rules version stored rows were last re-cleaned under, or None if never."""
+        ...
+
+    def record_dedup_rules_applied(self, version: str) -> None:
+        """Record that every stored row has been re-cleaned under `version`.
+
+        A write like the others here: inside `transaction()` it commits with the
+        re-clean it records, so the file can never claim a walk that rolled back.
+        """
+        ...
@@ -74,19 +74,28 @@ than usually-safe. Queries are sub-millisecond point lookups against a
 household-sized catalogue, so serialising them costs nothing worth measuring — and
 a transaction holds the lock for its whole body, which is what lets the one
 connection carry a multi-statement group without another thread writing into the
-middle of it.
+middle of it. Whether that stays true as the catalogue grows is a measurement
+rather than an argument: handed a `StatementProfiler`, the store reports each
+statement's wait for the lock apart from its own running time.
 """
 
+import hashlib
+import inspect
+import json
 import logging
 import sqlite3
+import sys
 import threading
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Final, Literal, get_args
 
 from curation.persistence.errors import StorageError, StoreMisuseError
+from curation.persistence.profiler import StatementProfiler
 
 log = logging.getLogger(__name__)
 
@@ -105,6 +114,27 @@ _POLICIES: Final[frozenset[str]] = frozenset(get_args(ConflictPolicy))
 #: whole reason to exist is not having any. `migrations.py` writes them.
 type Migration = Callable[[sqlite3.Connection], None]
 
+#: Where the store keeps facts about the file rather than rows of any domain:
+#: the stamp of the last full open, and whatever an adapter asks it to remember
+#: through `read_meta`/`write_meta`. Created by the store itself rather than by
+#: an adapter's schema, and not addressable by the table-and-row methods — no
+#: caller's typo can reach it, and nothing in it is a record.
+_META_TABLE: Final[str] = "store_meta"
+
+_META_DDL: Final[str] = f'CREATE TABLE IF NOT EXISTS "{_META_TABLE}" (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+
+_META_UPSERT: Final[str] = (
+    f'INSERT INTO "{_META_TABLE}" (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value'
+)
+
+#: The meta key holding what the last full open established about the file.
+_OPENED_UNDER: Final[str] = "store.opened_under"
+
+#: Part of every fingerprint. Raise it when what a full open *does* changes in a
+#: way neither the schema text nor a migration's source would show — a new kind
+#: of widening, say — so that every file is opened the long way once more.
+_OPEN_REVISION: Final[int] = 1
+
 
 @dataclass(frozen=True, slots=True)
 class _TableInfo:
@@ -167,6 +197,38 @@ def _describe(connection: sqlite3.Connection) -> dict[str, dict[str, sqlite3.Row
     return described
 
 
+def _migration_source(migration: Migration) -> str:
+    """What a migration is, for the purpose of noticing that it changed.
+
+    The source of the module that defines it, not its name: a migration edited in
+    place keeps its name, and the helpers it calls live beside it. A `partial`'s
+    bound arguments are deliberately not part of it — the one in use binds a wall
+    name that only applies to a file with no wall, which a file already opened
+    under this migration never is.
+    """
+    target: Any = migration
+    while isinstance(target, partial):
+        target = target.func
+    module = sys.modules.get(getattr(target, "__module__", ""))
+    try:
+        return inspect.getsource(module) if module is not None else repr(target)
+    except OSError:
+        return f"{target.__module__}.{target.__qualname__}"
+
+
+def _fingerprint(schema: str, migrations: Sequence[Migration]) -> str:
+    """A digest of everything a full open would apply to a file.
+
+    The SQLite library's version is in it because what a migration can do
+    depends on it (`DROP COLUMN` is 3.35's), so a file moved to a newer library
+    is opened the long way once rather than trusted to have had everything done.
+    """
+    digest = hashlib.sha256(f"{_OPEN_REVISION}\n{sqlite3.sqlite_version}\n{schema}".encode())
+    for migration in migrations:
+        digest.update(_migration_source(migration).encode())
+    return digest.hexdigest()
+
+
 def _column_declaration(column: sqlite3.Row) -> str:
     """Rebuild one column's DDL from what `PRAGMA table_info` reports of it.
 
@@ -188,19 +250,50 @@ def _column_declaration(column: sqlite3.Row) -> str:
 class SqliteDurableStore:
     """One SQLite file, addressed as tables of rows."""
 
-    def __init__(self, path: Path | str, schema: str, migrations: Sequence[Migration] = ()) -> None:
+    def __init__(
+        self,
+        path: Path | str,
+        schema: str,
+        migrations: Sequence[Migration] = (),
+        *,
+        profiler: StatementProfiler | None = None,
+    ) -> None:
+        #: Where each statement's cost is reported, when a deployment has asked.
+        #: None is the default and costs nothing: no clock is read on the path
+        #: that is not profiling. The schema work below is never profiled — it
+        #: runs once, before anything could be waiting on the lock.
+        self._profiler = profiler
         # Reentrant because `transaction()` holds it across a body that calls
         # back into the store's own methods, each of which takes it again.
         self._lock = threading.RLock()
         #: How many `transaction()` blocks are open. Non-zero means a write must
         #: leave committing to the outermost one.
         self._depth = 0
+        #: How many commits this store has published, plus one for each time the
+        #: file was seen to have been committed to by another connection. Only
+        #: ever grows; see `generation`.
+        self._generation = 0
+        #: The file's `data_version` when `generation` last looked. None until it
+        #: first has, which counts as a change: an extra count costs a reader one
+        #: full answer, and a missed one would cost it a stale one.
+        self._data_version: int | None = None
+        #: Every insert statement composed so far, keyed by what composed it.
+        #: The schema is fixed once the file is open, so a statement validated
+        #: once is valid for the life of the store — and a seed writing four
+        #: thousand rows would otherwise check the same columns against the same
+        #: schema four thousand times to build the same string.
+        self._inserts: dict[tuple[str, tuple[str, ...], tuple[str, ...], str], str] = {}
         self._connection = sqlite3.connect(str(path), check_same_thread=False)
         self._connection.row_factory = sqlite3.Row
         with self._lock:
             # Foreign keys are off by default in SQLite, which would let a row
             # keep pointing at a parent that was never written.
             self._connection.execute("PRAGMA foreign_keys = ON")
+            fingerprint = _fingerprint(schema, migrations)
+            known = self._opened_before(fingerprint)
+            if known is not None:
+                self._columns = known
+                return
             # **Widened before the script runs, not after, and the order is the
             # whole point.** The script declares indexes as well as tables, and an
             # index may name a column that only widening adds to a file older than
@@ -210,6 +303,7 @@ class SqliteDurableStore:
             # existing table to widen.
             self._widen_existing_tables(schema)
             self._connection.executescript(schema)
+            self._connection.execute(_META_DDL)
             self._connection.commit()
             # After the schema, because a migration carries rows into tables the
             # schema has just created; before `_read_schema`, because one may
@@ -219,6 +313,7 @@ class SqliteDurableStore:
                 migration(self._connection)
             self._connection.commit()
             self._columns = self._read_schema()
+            self._stamp(fingerprint)
 
     # -- atomicity ------------------------------------------------------------
 
@@ -241,7 +336,7 @@ class SqliteDurableStore:
         Nesting joins the outer group, so a service operation assembled from
         other service operations still commits exactly once.
         """
-        with self._lock:
+        with self._holding():
             if self._depth:
                 self._depth += 1
                 try:
@@ -261,7 +356,7 @@ class SqliteDurableStore:
                 self._connection.rollback()
                 raise
             else:
-                self._connection.commit()
+                self._commit()
             finally:
                 self._depth = 0
 
@@ -270,9 +365,10 @@ class SqliteDurableStore:
     def fetch_one(self, table: str, pk: Mapping[str, Any]) -> dict[str, Any] | None:
         """Return the row whose primary key equals `pk`, or None on a miss."""
         where, values = self._equality(table, pk, as_key=True)
-        with self._lock:
-            row = self._connection.execute(f'SELECT * FROM "{table}" WHERE {where}', values).fetchone()
-        return None if row is None else dict(row)
+        with self._holding():
+            rows = self._fetch(f'SELECT * FROM "{table}" WHERE {where}', values)
+        # The whole key was required above, so this is at most one row.
+        return dict(rows[0]) if rows else None
 
     def upsert(
         self,
@@ -289,22 +385,54 @@ class SqliteDurableStore:
         there, or `update` meeting one in a table whose columns are all key, where
         there is nothing an update could change.
         """
-        if on_conflict not in _POLICIES:
-            raise StoreMisuseError(f"Unknown conflict policy {on_conflict!r}; expected one of {', '.join(sorted(_POLICIES))}.")
-        columns = self._validate(table, row.keys())
-        self._validate(table, pk)
-        placeholders = ", ".join("?" for _ in columns)
-        quoted = ", ".join(f'"{column}"' for column in columns)
-        statement = f'INSERT INTO "{table}" ({quoted}) VALUES ({placeholders})'
-        if on_conflict != "raise":
-            # Only a conflict clause names the key. A target that is not the
-            # table's real key resolves nothing, so `update` would quietly start
-            # inserting duplicates instead of updating; a plain insert reaches no
-            # key at all and needs no such promise.
-            self._require_whole_key(table, pk)
-            statement += self._conflict_clause(columns, pk, on_conflict)
+        columns = tuple(row.keys())
+        statement = self._insert(table, columns, tuple(pk), on_conflict)
         return self._write(statement, tuple(row[column] for column in columns), table=table)
 
+    def upsert_many(
+        self,
+        table: str,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        pk: Sequence[str],
+        on_conflict: ConflictPolicy = "update",
+    ) -> int:
+        """Write every row in `rows` with one statement, resolving each key per `on_conflict`.
+
+        `upsert` for a batch, and the same in every respect a caller can see:
+        the same validation, the same refusal wording, the same count of rows
+        affected — summed. What differs is the cost. The statement is composed
+        once and handed to the driver's `executemany`, which prepares it once
+        and binds each row in turn, and outside a transaction the batch commits
+        once rather than once per row. The commit is most of what a row written
+        alone costs.
+
+        **One refusal refuses the batch.** A row the store will not take rolls
+        back every row written before it in the same call, exactly as a
+        `transaction()` would, so a caller is never left with the first half of
+        a list and an error about the second. Inside a transaction that decision
+        belongs to the outermost block, as it does for a single write.
+
+        **Every row names the same columns.** One statement binds every row, so
+        a row carrying a column the first does not — or lacking one it has — is
+        refused rather than written with a column silently dropped or nulled. An
+        empty batch writes nothing and touches nothing.
+        """
+        batch = list(rows)
+        if not batch:
+            return 0
+        columns = tuple(batch[0].keys())
+        statement = self._insert(table, columns, tuple(pk), on_conflict)
+        values: list[tuple[Any, ...]] = []
+        for row in batch:
+            if len(row) != len(columns) or not all(column in row for column in columns):
+                raise StoreMisuseError(
+                    f"Every row written to {table!r} in one batch must name the same columns; "
+                    f"expected {', '.join(repr(column) for column in columns)}."
+                )
+            values.append(tuple(row[column] for column in columns))
+        return self._write(statement, values, table=table, many=True)
+
     def delete(self, table: str, pk: Mapping[str, Any]) -> None:
         """Delete the row whose primary key equals `pk`. A missing row is not an error."""
         where, values = self._equality(table, pk, as_key=True)
@@ -318,8 +446,8 @@ class SqliteDurableStore:
         """
         where, values = self._equality(table, filters or {}, as_key=False)
         clause = "" if not where else f" WHERE {where}"
-        with self._lock:
-            rows = self._connection.execute(f'SELECT * FROM "{table}"{clause}', values).fetchall()
+        with self._holding():
+            rows = self._fetch(f'SELECT * FROM "{table}"{clause}', values)
         return [dict(row) for row in rows]
 
     # -- outside the matched contract -----------------------------------------
@@ -353,11 +481,9 @@ class SqliteDurableStore:
             window, page_values = " LIMIT -1 OFFSET ?", (*values, offset)
         else:
             window, page_values = " LIMIT ? OFFSET ?", (*values, limit, offset)
-        with self._lock:
-            total = self._connection.execute(f'SELECT COUNT(*) FROM "{table}"{clause}', values).fetchone()[0]
-            rows = self._connection.execute(
-                f'SELECT * FROM "{table}"{clause} ORDER BY {ordering}{window}', page_values
-            ).fetchall()
+        with self._holding():
+            total = self._fetch(f'SELECT COUNT(*) FROM "{table}"{clause}', values)[0][0]
+            rows = self._fetch(f'SELECT * FROM "{table}"{clause} ORDER BY {ordering}{window}', page_values)
         return [dict(row) for row in rows], total
 
     @contextmanager
@@ -381,7 +507,7 @@ class SqliteDurableStore:
         second process. There is no second process by design — `catalogue.sqlite`
         has one writer and it is this plane.
         """
-        with self._lock:
+        with self._holding():
             yield
 
     def select_rows(self, statement: str, values: Sequence[Any] = ()) -> list[dict[str, Any]]:
@@ -411,10 +537,65 @@ class SqliteDurableStore:
         through it would leave an implicit transaction open for the next commit to
         publish. `SELECT` only.
         """
-        with self._lock:
-            rows = self._connection.execute(statement, tuple(values)).fetchall()
+        with self._holding():
+            rows = self._fetch(statement, tuple(values))
         return [dict(row) for row in rows]
 
+    def read_meta(self, key: str) -> str | None:
+        """What the store was asked to remember under `key`, or None.
+
+        For facts about the file rather than rows of any domain — which version
+        of a rule the rows were last brought up to, say — so that an adapter need
+        not declare a one-row table for each. Keys are the caller's; namespacing
+        them by who writes them keeps two callers from sharing one by accident.
+        """
+        with self._holding():
+            rows = self._fetch(f'SELECT value FROM "{_META_TABLE}" WHERE key = ?', (key,))
+        return None if not rows else str(rows[0]["value"])
+
+    def write_meta(self, key: str, value: str) -> None:
+        """Remember `value` under `key`, replacing what was there.
+
+        A write like any other: inside `transaction()` it commits or rolls back
+        with the rest, which is what lets a caller record "done" in the same
+        commit as the work it is recording.
+        """
+        self._write(_META_UPSERT, (key, value), table=_META_TABLE)
+
+    # -- change tracking ------------------------------------------------------
+
+    def generation(self) -> int:
+        """A number that moves whenever the file's rows may have, and never goes back.
+
+        For a reader that wants to know whether an answer it already holds is
+        still the answer, without computing the answer again to find out. Two
+        calls that return the same number bracket no commit; two that differ may
+        bracket a commit that changed nothing a given reader looks at, which is
+        the safe direction to be wrong in.
+
+        **Counted at commit, not at write.** A write inside `transaction()` is
+        not visible to anyone until the outermost block publishes it, and one
+        that is rolled back never is — so it is the commit that counts, and a
+        transaction of many writes counts once. A commit with nothing pending
+        counts nothing.
+
+        **Another connection's commits count too**, read off `PRAGMA
+        data_version`, which SQLite moves only for changes this connection did
+        not make. There is no second writer by design, but a maintenance script
+        run against the live file is exactly the case where a reader trusting
+        the number would otherwise keep serving what it saw before.
+
+        Per store and per process: it starts at zero on every open, so a caller
+        that hands it out across restarts must say which life of the store it
+        came from.
+        """
+        with self._holding():
+            ((seen,),) = self._fetch("PRAGMA data_version", ())
+            if seen != self._data_version:
+                self._data_version = seen
+                self._generation += 1
+            return self._generation
+
     def close(self) -> None:
         """Release the underlying resources."""
         with self._lock:
@@ -422,6 +603,129 @@ class SqliteDurableStore:
 
     # -- internals ------------------------------------------------------------
 
+    @contextmanager
+    def _holding(self) -> Iterator[None]:
+        """Take the store's lock, telling the profiler how long that took.
+
+        Every statement runs under this rather than under `self._lock` directly,
+        so that the time a statement spent queued behind another thread's
+        transaction is reported apart from the time it spent running. Unprofiled,
+        it is the lock and nothing else.
+        """
+        if self._profiler is None:
+            with self._lock:
+                yield
+            return
+        asked = perf_counter()
+        with self._lock:
+            self._profiler.waited(perf_counter() - asked)
+            yield
+
+    def _commit(self) -> None:
+        """Publish the open transaction, counting it if it held a write. Called with the lock held.
+
+        `in_transaction` is read first because it is what says whether there is
+        anything to publish: `sqlite3` opens a transaction implicitly before a
+        write and never before a read, so a `transaction()` block that only read
+        commits nothing and should move no reader's `generation`.
+        """
+        pending = self._connection.in_transaction
+        self._connection.commit()
+        if pending:
+            self._generation += 1
+
+    def _fetch(self, statement: str, values: Sequence[Any]) -> list[sqlite3.Row]:
+        """Run one read and return every row it produced. Called with the lock held."""
+        if self._profiler is None:
+            return self._connection.execute(statement, values).fetchall()
+        started = perf_counter()
+        rows = self._connection.execute(statement, values).fetchall()
+        self._profiler.record(self._connection, statement, values, seconds=perf_counter() - started, rows=len(rows))
+        return rows
+
+    def _change(self, statement: str, values: Sequence[Any]) -> int:
+        """Run one write and return how many rows it changed. Called with the lock held."""
+        if self._profiler is None:
+            return int(self._connection.execute(statement, values).rowcount)
+        started = perf_counter()
+        changed = int(self._connection.execute(statement, values).rowcount)
+        self._profiler.record(self._connection, statement, values, seconds=perf_counter() - started, rows=changed)
+        return changed
+
+    def _change_many(self, statement: str, rows: Sequence[Sequence[Any]]) -> int:
+        """Run one write once per row and return how many rows it changed in all.
+
+        Called with the lock held. Profiled as one call of its shape, because it
+        is one statement prepared once; a slow batch is explained against its
+        first row's values, which share every other row's plan.
+        """
+        if self._profiler is None:
+            return int(self._connection.executemany(statement, rows).rowcount)
+        started = perf_counter()
+        changed = int(self._connection.executemany(statement, rows).rowcount)
+        self._profiler.record(self._connection, statement, rows[0], seconds=perf_counter() - started, rows=changed)
+        return changed
+
+    def _opened_before(self, fingerprint: str) -> dict[str, _TableInfo] | None:
+        """The file's tables, if it is exactly as the last full open left it.
+
+        **Opening is the same work every time on a file nothing has changed**:
+        the declared schema parsed into a scratch database and compared with the
+        file, the script run, every migration asked whether it has anything to
+        do, and a `PRAGMA` per table read back. Every answer is "nothing" on a
+        file this same code opened last time, and there are two processes that
+        open it and both pay. So a full open ends by recording what it was done
+        under and what it found, and this is one read asking whether both still
+        hold.
+
+        **Two things must match, and the second is SQLite's rather than this
+        module's.** The fingerprint says the schema and migrations are the ones
+        applied last time. `schema_version` — which SQLite itself advances on
+        every change to the file's schema, by anybody — says nothing has altered
+        the file's shape since: not an older build of this code re-adding a table
+        it remembers, not a hand-run `ALTER TABLE`, not a restored copy. Either
+        disagreeing means the long way, which is always safe.
+
+        **What this trusts, and it is stated rather than assumed:** that a
+        migration which found nothing to do on a file would find nothing again
+        while the file's shape and the migration are both unchanged. Every
+        migration in `migrations.py` is guarded by tables and columns, or by rows
+        nothing in the product deletes.
+        """
+        try:
+            row = self._connection.execute(
+                f'SELECT value, (SELECT schema_version FROM pragma_schema_version) AS version FROM "{_META_TABLE}" WHERE key = ?',
+                (_OPENED_UNDER,),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # A file from before the stamp existed, or a new one.
+            return None
+        if row is None:
+            return None
+        stamp = json.loads(row["value"])
+        if stamp["fingerprint"] != fingerprint or stamp["schema_version"] != row["version"]:
+            return None
+        return {
+            table: _TableInfo(columns=frozenset(info["columns"]), key=tuple(info["key"]))
+            for table, info in stamp["tables"].items()
+        }
+
+    def _stamp(self, fingerprint: str) -> None:
+        """Record what this full open established, for `_opened_before` to check next time.
+
+        Read after every schema change this open made — the meta table's own
+        creation included — so the version recorded is the one the next open
+        will find.
+        """
+        (version,) = self._connection.execute("PRAGMA schema_version").fetchone()
+        stamp = {
+            "fingerprint": fingerprint,
+            "schema_version": version,
+            "tables": {table: {"columns": sorted(info.columns), "key": list(info.key)} for table, info in self._columns.items()},
+        }
+        self._connection.execute(_META_UPSERT, (_OPENED_UNDER, json.dumps(stamp, sort_keys=True)))
+        self._connection.commit()
+
     def _widen_existing_tables(self, schema: str) -> None:
         """Add columns the declared schema has and the file on disk does not.
 
@@ -502,7 +806,9 @@ class SqliteDurableStore:
         file is the authority, and a file opened from disk carries a schema this
         process never wrote.
         """
-        tables = self._connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+        tables = self._connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name != ?", (_META_TABLE,)
+        ).fetchall()
         schema: dict[str, _TableInfo] = {}
         for table in tables:
             info = self._connection.execute(f'PRAGMA table_info("{table["name"]}")').fetchall()
@@ -604,17 +910,48 @@ class SqliteDurableStore:
             return f" ON CONFLICT ({target}) DO NOTHING"
         return f" ON CONFLICT ({target}) DO UPDATE SET {', '.join(assignments)}"
 
-    def _write(self, statement: str, values: tuple[Any, ...], *, table: str) -> int:
+    def _insert(self, table: str, columns: tuple[str, ...], pk: tuple[str, ...], on_conflict: ConflictPolicy) -> str:
+        """The insert statement for these columns and this policy, composed once.
+
+        Validation happens on the first request for a shape and never again: an
+        identifier that passed against this file's schema passes every time, and
+        a shape that failed raised before anything was remembered.
+        """
+        cache = (table, columns, pk, on_conflict)
+        statement = self._inserts.get(cache)
+        if statement is not None:
+            return statement
+        if on_conflict not in _POLICIES:
+            raise StoreMisuseError(f"Unknown conflict policy {on_conflict!r}; expected one of {', '.join(sorted(_POLICIES))}.")
+        self._validate(table, columns)
+        self._validate(table, pk)
+        placeholders = ", ".join("?" for _ in columns)
+        quoted = ", ".join(f'"{column}"' for column in columns)
+        statement = f'INSERT INTO "{table}" ({quoted}) VALUES ({placeholders})'
+        if on_conflict != "raise":
+            # Only a conflict clause names the key. A target that is not the
+            # table's real key resolves nothing, so `update` would quietly start
+            # inserting duplicates instead of updating; a plain insert reaches no
+            # key at all and needs no such promise.
+            self._require_whole_key(table, pk)
+            statement += self._conflict_clause(columns, pk, on_conflict)
+        self._inserts[cache] = statement
+        return statement
+
+    def _write(self, statement: str, values: Sequence[Any], *, table: str, many: bool = False) -> int:
         """Run one statement, committing it unless a transaction owns that decision.
 
         Inside `transaction()` the commit and the rollback both belong to the
         outermost block — committing here would publish half of a rule that spans
         rows, and rolling back here would discard writes the caller made before
         this one and still believes in.
+
+        `many` binds `values` as a list of rows rather than as one row's values,
+        and the rule above is unchanged by it: a batch is one write.
         """
-        with self._lock:
+        with self._holding():
             try:
-                rowcount = int(self._connection.execute(statement, values).rowcount)
+                rowcount = self._change_many(statement, values) if many else self._change(statement, values)
             except sqlite3.IntegrityError as exc:
                 if not self._depth:
                     # A failed statement writes nothing, but sqlite3 has already
@@ -632,5 +969,5 @@ class SqliteDurableStore:
                 log.warning("Refused a write to %s: %s", table, exc)
                 raise StorageError(reason, reason=reason) from exc
             if not self._depth:
-                self._connection.commit()
+                self._commit()
             return rowcount
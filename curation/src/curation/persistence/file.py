@@ -16,12 +16,18 @@ from functools import partial
 from pathlib import Path
 
 from curation.persistence.durable import SqliteDurableStore
-from curation.persistence.migrations import DEFAULT_WALL_NAME, establish_the_wall
+from curation.persistence.migrations import DEFAULT_WALL_NAME, establish_the_wall, recount_the_facets
+from curation.persistence.profiler import StatementProfiler
 from curation.persistence.sqlite import CATALOGUE_SCHEMA
 from curation.persistence.sqlite_discovery import DISCOVERY_SCHEMA
 
 
-def open_catalogue_file(path: Path | str, *, wall_name: str = DEFAULT_WALL_NAME) -> SqliteDurableStore:
+def open_catalogue_file(
+    path: Path | str,
+    *,
+    wall_name: str = DEFAULT_WALL_NAME,
+    profiler: StatementProfiler | None = None,
+) -> SqliteDurableStore:
     """Open the catalogue file, creating whatever tables it does not yet have.
 
     The caller owns closing it. Both adapters are views over the returned store
@@ -33,9 +39,13 @@ def open_catalogue_file(path: Path | str, *, wall_name: str = DEFAULT_WALL_NAME)
     shape. A wall that exists keeps the name it has, because by then the name is
     the curator's rather than the deployment's; nothing here renames one. The
     default is what a deployment that has said nothing gets.
+
+    `profiler` is where each statement's cost is reported, when the deployment
+    has asked for that; see `profiler.py`.
     """
     return SqliteDurableStore(
         path,
         CATALOGUE_SCHEMA + DISCOVERY_SCHEMA,
-        migrations=(partial(establish_the_wall, wall_name=wall_name),),
+        migrations=(partial(establish_the_wall, wall_name=wall_name), recount_the_facets),
+        profiler=profiler,
     )
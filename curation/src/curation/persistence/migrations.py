@@ -7,7 +7,8 @@ that is replaced by a differently-keyed one, rows that have to be carried from
 the first to the second — has to be written down, and this is where it is
 written.
 
-**A migration here is idempotent and safe to interrupt.** It runs on every open,
+**A migration here is idempotent and safe to interrupt.** It runs on every open
+that is not skipped as unchanged (see `SqliteDurableStore._opened_before`),
 against a file that may already have had it applied, may have had half of it
 applied, or may never have seen it; every step is guarded by what the file
 actually holds rather than by a version number the file would have to be trusted
@@ -93,6 +94,28 @@ def establish_the_wall(connection: sqlite3.Connection, *, wall_name: str) -> Non
     _drop_what_the_wall_replaced(connection)
 
 
+def recount_the_facets(connection: sqlite3.Connection) -> None:
+    """Rebuild `facet_counts` from the facets and statuses the file actually holds.
+
+    The summary is kept by triggers from the moment they exist, which leaves two
+    files it cannot be right about: one written before the table did, which has
+    facets and no counts, and one restored from a copy taken by hand mid-write.
+    Recounting answers both without telling them apart — it is one `GROUP BY`
+    over the facet table, a few milliseconds at twenty thousand works, and it
+    runs only when the file is opened the long way rather than on every start.
+
+    One transaction, so an interrupted recount leaves the previous table rather
+    than an empty one.
+    """
+    connection.execute("DELETE FROM facet_counts")
+    connection.execute(
+        "INSERT INTO facet_counts (status, kind, value, tally) "
+        "SELECT a.status, f.kind, f.value, COUNT(*) FROM work_facets f JOIN artworks a ON a.id = f.artwork_id "
+        "GROUP BY a.status, f.kind, f.value"
+    )
+    connection.commit()
+
+
 def _walls(connection: sqlite3.Connection) -> int:
     return int(connection.execute("SELECT COUNT(*) FROM walls").fetchone()[0])
 
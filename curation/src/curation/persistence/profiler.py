@@ -0,0 +1,226 @@
+"""What the durable store's SQL costs, statement by statement, when someone asks.
+
+Every read and write the catalogue makes goes through one `SqliteDurableStore`
+under one lock, and until this module the only figures for what any of it cost
+came from running `tools/search_latency.py` by hand against a synthetic corpus.
+That answers "is search fast enough" and nothing else: it cannot say which of the
+per-row `fetch_one` calls a screen makes is the one that adds up, nor whether a
+slow answer was slow in SQLite or slow waiting for the lock behind somebody
+else's transaction.
+
+**Opt-in, and off by default.** A deployment turns it on with `STORE_PROFILING`;
+an unprofiled store takes no timestamps at all, so the instrumentation costs
+nothing on the path that is not asking. On, it costs two clock reads and a
+dictionary update per statement, which is noise beside the statement.
+
+**Timings are kept per statement *shape*, not per statement.** Every value a
+caller supplies is a bound parameter, so the text of a statement is already its
+shape — except an `IN (?, ?, ?)` list, whose length varies with the question and
+would otherwise mint a new entry per length. Those lists are collapsed, which is
+what keeps the table bounded by the number of statements this package writes
+rather than by the number of questions anyone asks.
+
+**Waiting and working are reported apart**, because they have different fixes.
+Time spent acquiring the store's lock is another thread's transaction; time spent
+executing is this statement's own plan. A figure that summed them would send
+whoever read it to add an index to a query that was merely queued.
+
+**A slow statement is explained, not just counted.** One over the threshold has
+its `EXPLAIN QUERY PLAN` read back on the same connection — under the lock the
+statement already held, so the plan is the one SQLite used against the file as it
+then stood — and is journalled as `store.slow_query`. The plan is captured once
+per shape and reused: a statement that is slow every time is slow for the same
+reason every time, and asking SQLite again would make each slow call slower.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Final
+
+log = logging.getLogger(__name__)
+
+#: What counts as slow when a deployment has not said. A point lookup on this
+#: catalogue answers in well under a millisecond and the whole `GET /api/works`
+#: answer was measured at single-digit milliseconds against the thousands-scale
+#: corpus, so a statement taking a hundred has something wrong with its plan.
+DEFAULT_SLOW_QUERY_MS: Final[int] = 100
+
+#: A run of two or more placeholders separated by commas — the body of an `IN`
+#: list or a `VALUES` tuple — collapsed so the shape does not depend on its length.
+_PLACEHOLDER_RUN: Final[re.Pattern[str]] = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with its whitespace normalised and its placeholder lists collapsed.
+
+    Whitespace because the adapters compose statements from f-string fragments,
+    and two spellings of one statement are one shape.
+    """
+    return _PLACEHOLDER_RUN.sub("?, …", " ".join(statement.split()))
+
+
+@dataclass(frozen=True, slots=True)
+class StatementProfile:
+    """What one statement shape has cost since profiling began."""
+
+    shape: str
+    calls: int
+    #: Time spent executing, summed across calls. Excludes waiting for the lock.
+    total_ms: float
+    max_ms: float
+    #: Time spent acquiring the store's lock before these calls could run. A
+    #: transaction's wait is charged to the first statement inside it, which is
+    #: the one that was held up.
+    lock_wait_ms: float
+    #: Rows returned by a read, or changed by a write, summed across calls.
+    rows: int
+    #: How many calls crossed the slow threshold.
+    slow: int
+    #: SQLite's plan for the shape, captured the first time a call was slow.
+    #: None while no call has been.
+    plan: str | None
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class StoreProfile:
+    """Every shape's figures, read at one instant."""
+
+    #: When these figures started accumulating — the process start, in practice.
+    since: datetime
+    slow_query_ms: float
+    #: Costliest first, by total execution time: the shape worth looking at is
+    #: the one that adds up, which is rarely the one with the worst single call.
+    statements: Sequence[StatementProfile]
+
+
+@dataclass(slots=True)
+class _Tally:
+    """The running figures for one shape. Mutable; never leaves this module."""
+
+    calls: int = 0
+    seconds: float = 0.0
+    worst: float = 0.0
+    waited: float = 0.0
+    rows: int = 0
+    slow: int = 0
+    plan: str | None = None
+
+
+class StatementProfiler:
+    """Accumulate per-shape statement timings for one store.
+
+    Fed by `SqliteDurableStore`, which calls `waited` when it acquires its lock
+    and `record` after each statement. Read by whoever wants the figures, from
+    any thread.
+    """
+
+    def __init__(self, *, slow_query_ms: float = DEFAULT_SLOW_QUERY_MS) -> None:
+        self._slow_seconds = slow_query_ms / 1000
+        self._slow_query_ms = slow_query_ms
+        self._since = datetime.now(UTC)
+        self._tallies: dict[str, _Tally] = {}
+        #: Lock wait not yet charged to a statement. Only ever touched by the
+        #: thread holding the store's lock, which is what makes a plain attribute
+        #: safe here — but `snapshot` reads the tallies from any thread, so those
+        #: have a lock of their own.
+        self._unclaimed_wait = 0.0
+        self._guard = threading.Lock()
+
+    def waited(self, seconds: float) -> None:
+        """Note time spent acquiring the store's lock. Called with that lock held."""
+        self._unclaimed_wait += seconds
+
+    def record(
+        self,
+        connection: sqlite3.Connection,
+        statement: str,
+        values: Sequence[Any],
+        *,
+        seconds: float,
+        rows: int,
+    ) -> None:
+        """Charge one executed statement to its shape. Called with the store's lock held.
+
+        The connection is passed so a slow statement can be explained on the
+        connection it ran on, before anything else writes to the file.
+        """
+        shape = statement_shape(statement)
+        waited, self._unclaimed_wait = self._unclaimed_wait, 0.0
+        slow = seconds >= self._slow_seconds
+        with self._guard:
+            tally = self._tallies.setdefault(shape, _Tally())
+            tally.calls += 1
+            tally.seconds += seconds
+            tally.worst = max(tally.worst, seconds)
+            tally.waited += waited
+            tally.rows += rows
+            tally.slow += slow
+            explain = slow and tally.plan is None
+        if not slow:
+            return
+        plan = _explain(connection, statement, values) if explain else tally.plan
+        if explain:
+            with self._guard:
+                tally.plan = plan
+        log.warning(
+            "a catalogue statement took %.1fms",
+            seconds * 1000,
+            extra={
+                "event": "store.slow_query",
+                "shape": shape,
+                "duration_ms": round(seconds * 1000, 3),
+                "lock_wait_ms": round(waited * 1000, 3),
+                "rows": rows,
+                "plan": plan,
+            },
+        )
+
+    def snapshot(self) -> StoreProfile:
+        """Every shape's figures as they stand now."""
+        with self._guard:
+            statements = [
+                StatementProfile(
+                    shape=shape,
+                    calls=tally.calls,
+                    total_ms=tally.seconds * 1000,
+                    max_ms=tally.worst * 1000,
+                    lock_wait_ms=tally.waited * 1000,
+                    rows=tally.rows,
+                    slow=tally.slow,
+                    plan=tally.plan,
+                )
+                for shape, tally in self._tallies.items()
+            ]
+        statements.sort(key=lambda profile: (-profile.total_ms, profile.shape))
+        return StoreProfile(since=self._since, slow_query_ms=self._slow_query_ms, statements=statements)
+
+
+def _explain(connection: sqlite3.Connection, statement: str, values: Sequence[Any]) -> str:
+    """SQLite's plan for `statement`, one step per line, indented by depth.
+
+    A failure to explain is reported in the plan's place rather than raised: the
+    statement it describes has already succeeded, and the caller is owed its
+    result rather than an error about the instrumentation.
+    """
+    try:
+        steps = connection.execute(f"EXPLAIN QUERY PLAN {statement}", tuple(values)).fetchall()
+    except sqlite3.Error as exc:
+        return f"(the plan could not be read: {exc})"
+    depth: dict[int, int] = {}
+    lines: list[str] = []
+    for step in steps:
+        # Columns are (id, parent, notused, detail); a step's depth is one more
+        # than its parent's, and the root's parent is 0.
+        node, parent, detail = step[0], step[1], step[3]
+        depth[node] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node] + detail)
+    return "\n".join(lines)
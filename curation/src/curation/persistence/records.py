@@ -327,6 +327,26 @@ class Original:
     fetch_status: FetchStatus | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class OriginalsFootprint:
+    """How many bytes the catalogue's originals name, and how many distinct images they are.
+
+    Counted by `content_hash`, so two works holding the same museum image are
+    one image here however many files they were once written as.
+    """
+
+    originals: int
+    images: int
+    byte_size: int
+    #: The bytes of each distinct image, counted once.
+    image_bytes: int
+
+    @property
+    def deduplicated_bytes(self) -> int:
+        """What holding each distinct image once saves over a file per work."""
+        return self.byte_size - self.image_bytes
+
+
 @dataclass(frozen=True, slots=True)
 class Rendition:
     """A derived output, regenerated rather than transported.
@@ -45,6 +45,7 @@ from curation.persistence.records import (
     MatColor,
     MatMethod,
     Original,
+    OriginalsFootprint,
     Rendition,
     RenditionKind,
     RightsStatus,
@@ -144,6 +145,73 @@ CREATE INDEX IF NOT EXISTS work_facets_by_value ON work_facets(kind, value);
 
 CREATE INDEX IF NOT EXISTS work_facets_by_artwork ON work_facets(artwork_id);
 
+-- How many works of each status carry each facet value: the collection's first
+-- screen, and every count taken over the whole catalogue or one status of it,
+-- read as a lookup rather than a `GROUP BY` over every facet row. A count that
+-- anything else narrows — a search term, another facet — is still taken live
+-- from `work_facets`, because no summary keyed by value can answer "of the works
+-- that also match this".
+--
+-- **Maintained by the triggers below and by nothing else**, so that no write
+-- path can forget it: they fire inside the statement that changed the facet or
+-- the status, so the summary commits or rolls back with it and a read under the
+-- store's lock sees both or neither. That is what keeps the listing's counts in
+-- agreement with its grid. A row whose tally reaches zero is deleted, so a value
+-- held here is a value some work of that status carries — which is what the
+-- vocabulary is read as.
+--
+-- `value` carries the same NOCASE collation as `work_facets.value`, for the same
+-- reason: "Baroque" and "baroque" are one value and one row. `migrations.py`
+-- recounts the whole table from `work_facets` whenever the file is opened the
+-- long way, which is how a file from before this table gains its rows. A trigger
+-- is created only where it is missing, like a table, so changing one's body
+-- below is a migration to write rather than an edit that reaches old files.
+CREATE TABLE IF NOT EXISTS facet_counts (
+    status  TEXT NOT NULL,
+    kind    TEXT NOT NULL,
+    value   TEXT NOT NULL COLLATE NOCASE,
+    tally   INTEGER NOT NULL,
+    PRIMARY KEY (status, kind, value)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS facet_counts_on_add AFTER INSERT ON work_facets BEGIN
+    INSERT INTO facet_counts (status, kind, value, tally)
+    SELECT a.status, NEW.kind, NEW.value, 1 FROM artworks a WHERE a.id = NEW.artwork_id
+    ON CONFLICT (status, kind, value) DO UPDATE SET tally = tally + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS facet_counts_on_remove AFTER DELETE ON work_facets BEGIN
+    UPDATE facet_counts SET tally = tally - 1
+    WHERE status = (SELECT a.status FROM artworks a WHERE a.id = OLD.artwork_id) AND kind = OLD.kind AND value = OLD.value;
+    DELETE FROM facet_counts WHERE kind = OLD.kind AND value = OLD.value AND tally <= 0;
+END;
+
+-- Nothing rewrites a facet in place today — a claim is removed and another
+-- recorded — but a summary kept by triggers is only as right as the write it
+-- did not cover, so the third way a row can change is covered too.
+CREATE TRIGGER IF NOT EXISTS facet_counts_on_change AFTER UPDATE OF artwork_id, kind, value ON work_facets BEGIN
+    UPDATE facet_counts SET tally = tally - 1
+    WHERE status = (SELECT a.status FROM artworks a WHERE a.id = OLD.artwork_id) AND kind = OLD.kind AND value = OLD.value;
+    DELETE FROM facet_counts WHERE kind = OLD.kind AND value = OLD.value AND tally <= 0;
+    INSERT INTO facet_counts (status, kind, value, tally)
+    SELECT a.status, NEW.kind, NEW.value, 1 FROM artworks a WHERE a.id = NEW.artwork_id
+    ON CONFLICT (status, kind, value) DO UPDATE SET tally = tally + 1;
+END;
+
+-- Archiving or restoring a work moves every one of its facets from one status's
+-- counts to the other's. `WHEN` because an update rewrites `status` whether or
+-- not it changed, and moving a work's facets onto the status they are already
+-- counted under is two writes per facet for nothing.
+CREATE TRIGGER IF NOT EXISTS facet_counts_on_status AFTER UPDATE OF status ON artworks
+WHEN OLD.status IS NOT NEW.status BEGIN
+    UPDATE facet_counts SET tally = tally - 1
+    WHERE status = OLD.status AND (kind, value) IN (SELECT f.kind, f.value FROM work_facets f WHERE f.artwork_id = NEW.id);
+    DELETE FROM facet_counts WHERE status = OLD.status AND tally <= 0;
+    INSERT INTO facet_counts (status, kind, value, tally)
+    SELECT NEW.status, f.kind, f.value, 1 FROM work_facets f WHERE f.artwork_id = NEW.id
+    ON CONFLICT (status, kind, value) DO UPDATE SET tally = tally + 1;
+END;
+
 -- `rotation_interval_seconds` and `shuffle` are nullable because null means
 -- "inherit the global default" rather than "unset": a theme that has never
 -- expressed a pace is a normal theme, not an incomplete one.
@@ -199,6 +267,9 @@ CREATE TABLE IF NOT EXISTS sources (
 
 CREATE INDEX IF NOT EXISTS sources_by_artwork ON sources(artwork_id);
 
+-- Which held image a URL has already produced, asked before fetching it again.
+CREATE INDEX IF NOT EXISTS sources_by_url ON sources(url);
+
 -- Which source produced the held original is a single fact about the work.
 CREATE UNIQUE INDEX IF NOT EXISTS sources_one_primary ON sources(artwork_id) WHERE is_primary = 1;
 
@@ -220,6 +291,9 @@ CREATE TABLE IF NOT EXISTS originals (
     fetch_status   TEXT
 );
 
+-- The same image held by more than one work is one image, found by its hash.
+CREATE INDEX IF NOT EXISTS originals_by_content_hash ON originals(content_hash);
+
 CREATE TABLE IF NOT EXISTS renditions (
     id                   TEXT PRIMARY KEY,
     artwork_id           TEXT NOT NULL REFERENCES artworks(id),
@@ -454,6 +528,25 @@ def _matching(query: WorkQuery) -> _Restriction:
     )
 
 
+def _summarised(query: WorkQuery) -> bool:
+    """True when `facet_counts` answers `query`'s counts on its own.
+
+    The summary is keyed by status, kind and value, so it can say how many works
+    of a status carry a value and nothing narrower: a search term or a chosen
+    facet asks "of the works that also match this", which only the facet table
+    joined to the works can answer. The case it does answer is the one met most —
+    the collection's first screen, its archive tab, and every page after either.
+    """
+    return not query.terms and not any(query.facets.values())
+
+
+def _by_status(status: ArtworkStatus | None) -> _Restriction:
+    """The clause restricting `facet_counts c` to one status, or to none."""
+    if status is None:
+        return _Restriction(where="1", values=(), reads_the_artist=False)
+    return _Restriction(where="c.status = ?", values=(str(status),), reads_the_artist=False)
+
+
 class SqliteCatalogue(TableAdapter):
     """The catalogue's own tables, mapped to its records."""
 
@@ -462,6 +555,9 @@ class SqliteCatalogue(TableAdapter):
     def add_artist(self, artist: Artist) -> None:
         self._add("artists", _artist_row(artist), subject=f"artist {artist.id!r}")
 
+    def add_artist_many(self, artists: Sequence[Artist]) -> None:
+        self._add_many("artists", [_artist_row(artist) for artist in artists], subject=f"one of {len(artists)} artists")
+
     def get_artist(self, artist_id: str) -> Artist | None:
         return self._get("artists", {"id": artist_id}, _artist)
 
@@ -476,6 +572,9 @@ class SqliteCatalogue(TableAdapter):
     def add_artwork(self, artwork: Artwork) -> None:
         self._add("artworks", _artwork_row(artwork), subject=f"artwork {artwork.id!r}")
 
+    def add_artwork_many(self, artworks: Sequence[Artwork]) -> None:
+        self._add_many("artworks", [_artwork_row(artwork) for artwork in artworks], subject=f"one of {len(artworks)} artworks")
+
     def get_artwork(self, artwork_id: str) -> Artwork | None:
         return self._get("artworks", {"id": artwork_id}, _artwork)
 
@@ -521,12 +620,14 @@ class SqliteCatalogue(TableAdapter):
         return [_facet(row) for row in rows if _known_kind(row["kind"]) is not None]
 
     def facet_vocabulary(self, *, status: ArtworkStatus | None) -> Mapping[VocabularyKind, Sequence[str]]:
-        selects = _matching(WorkQuery(status=status))
+        # From the summary, which holds a row exactly where some work of that
+        # status carries the value — the same set the facet table grouped by
+        # status would give, without reading every facet to find it.
+        by_status = _by_status(status)
         rows = self._store.select_rows(
-            f"SELECT f.kind AS kind, f.value AS value FROM work_facets f "
-            f"WHERE 1{selects.over_works(column='f.artwork_id')} "
-            f"GROUP BY f.kind, f.value ORDER BY f.kind, f.value COLLATE NOCASE",
-            selects.values,
+            f"SELECT c.kind AS kind, c.value AS value FROM facet_counts c WHERE {by_status.where} "
+            f"GROUP BY c.kind, c.value ORDER BY c.kind, c.value COLLATE NOCASE",
+            by_status.values,
         )
         vocabulary: dict[VocabularyKind, list[str]] = {}
         for row in rows:
@@ -542,17 +643,27 @@ class SqliteCatalogue(TableAdapter):
     def count_facet_values(self, kinds: Sequence[VocabularyKind], query: WorkQuery) -> Mapping[VocabularyKind, Mapping[str, int]]:
         if not kinds:
             return {}
-        selects = _matching(query)
         placeholders = ", ".join("?" for _ in kinds)
-        rows = self._store.select_rows(
-            # `COUNT(*)` and not `COUNT(DISTINCT ...)`: `work_facets_once_per_work`
-            # makes a second row for the same work and value impossible, so the
-            # two are the same number and the cheaper one says so.
-            f"SELECT f.kind AS kind, f.value AS value, COUNT(*) AS tally FROM work_facets f "
-            f"WHERE f.kind IN ({placeholders}){selects.over_works(column='f.artwork_id')} "
-            f"GROUP BY f.kind, f.value",
-            (*(str(kind) for kind in kinds), *selects.values),
-        )
+        if _summarised(query):
+            by_status = _by_status(query.status)
+            rows = self._store.select_rows(
+                # Summed because with no status chosen one value is a row per
+                # status, and the count is the works of either.
+                f"SELECT c.kind AS kind, c.value AS value, SUM(c.tally) AS tally FROM facet_counts c "
+                f"WHERE c.kind IN ({placeholders}) AND {by_status.where} GROUP BY c.kind, c.value",
+                (*(str(kind) for kind in kinds), *by_status.values),
+            )
+        else:
+            selects = _matching(query)
+            rows = self._store.select_rows(
+                # `COUNT(*)` and not `COUNT(DISTINCT ...)`: `work_facets_once_per_work`
+                # makes a second row for the same work and value impossible, so the
+                # two are the same number and the cheaper one says so.
+                f"SELECT f.kind AS kind, f.value AS value, COUNT(*) AS tally FROM work_facets f "
+                f"WHERE f.kind IN ({placeholders}){selects.over_works(column='f.artwork_id')} "
+                f"GROUP BY f.kind, f.value",
+                (*(str(kind) for kind in kinds), *selects.values),
+            )
         counted: dict[VocabularyKind, dict[str, int]] = {kind: {} for kind in kinds}
         for row in rows:
             kind = _known_kind(row["kind"])
@@ -565,6 +676,9 @@ class SqliteCatalogue(TableAdapter):
     def add_source(self, source: Source) -> None:
         self._add("sources", _source_row(source), subject=f"source {source.id!r}")
 
+    def add_source_many(self, sources: Sequence[Source]) -> None:
+        self._add_many("sources", [_source_row(source) for source in sources], subject=f"one of {len(sources)} sources")
+
     def get_source(self, source_id: str) -> Source | None:
         return self._get("sources", {"id": source_id}, _source)
 
@@ -588,6 +702,32 @@ class SqliteCatalogue(TableAdapter):
     def update_original(self, original: Original) -> None:
         self._update("originals", BY_ID, _original_row(original), subject=f"original for artwork {original.artwork_id!r}")
 
+    def find_held_original(self, url: str, *, other_than: str) -> Original | None:
+        # Partial is excluded rather than ranked: a gappy image is not one to
+        # hand another work instead of fetching, and unrecorded reads as
+        # complete here as it does everywhere else.
+        rows = self._store.select_rows(
+            "SELECT o.* FROM originals o JOIN sources s ON s.id = o.source_id "
+            "WHERE s.url = ? AND o.artwork_id != ? AND (o.fetch_status IS NULL OR o.fetch_status != ?) "
+            "ORDER BY o.id LIMIT 1",
+            (url, other_than, FetchStatus.PARTIAL_TILES.value),
+        )
+        return _original(rows[0]) if rows else None
+
+    def measure_originals(self) -> OriginalsFootprint:
+        row = self._store.select_rows(
+            "SELECT COUNT(*) AS originals, COALESCE(SUM(byte_size), 0) AS byte_size, "
+            "(SELECT COUNT(*) FROM (SELECT 1 FROM originals GROUP BY content_hash)) AS images, "
+            "(SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(byte_size) AS size FROM originals GROUP BY content_hash)) "
+            "AS image_bytes FROM originals"
+        )[0]
+        return OriginalsFootprint(
+            originals=int(row["originals"]),
+            images=int(row["images"]),
+            byte_size=int(row["byte_size"]),
+            image_bytes=int(row["image_bytes"]),
+        )
+
     # -- renditions -----------------------------------------------------------
 
     def add_rendition(self, rendition: Rendition) -> None:
@@ -648,6 +788,14 @@ class SqliteCatalogue(TableAdapter):
             subject=f"artwork {membership.artwork_id!r} in theme {membership.theme_id!r}",
         )
 
+    def update_membership_many(self, memberships: Sequence[ThemeMembership]) -> None:
+        self._update_many(
+            "theme_memberships",
+            _MEMBERSHIP_KEY,
+            [_membership_row(membership) for membership in memberships],
+            subject=f"one of {len(memberships)} theme entries",
+        )
+
     def remove_membership(self, theme_id: str, artwork_id: str) -> None:
         self._store.delete("theme_memberships", {"theme_id": theme_id, "artwork_id": artwork_id})
 
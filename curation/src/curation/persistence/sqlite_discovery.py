@@ -25,7 +25,7 @@ names only the table.
 """
 
 import json
-from collections.abc import Mapping, Sequence
+from collections.abc import Collection, Mapping, Sequence
 from datetime import datetime
 from typing import Any, Final
 
@@ -143,6 +143,14 @@ CREATE TABLE IF NOT EXISTS candidate_images (
 
 CREATE INDEX IF NOT EXISTS candidate_images_by_work ON candidate_images(candidate_work_id);
 
+-- The preview sweep's question is asked by path, not by work: a preview file is
+-- named by its URL's digest, so two works can share one, and the unit of
+-- reclamation is the file. Partial, because most rows stop naming a path once
+-- their work is decided and swept, and an index over the ones that no longer
+-- do would grow with everything the sweep has already finished with.
+CREATE INDEX IF NOT EXISTS candidate_images_by_preview
+    ON candidate_images(preview_path) WHERE preview_path IS NOT NULL;
+
 -- Which instance a work is represented by is a single fact about the work.
 CREATE UNIQUE INDEX IF NOT EXISTS candidate_images_one_selected
     ON candidate_images(candidate_work_id) WHERE is_selected = 1;
@@ -289,10 +297,18 @@ _BY_OCCURRENCE: Final[tuple[OrderBy, ...]] = (OrderBy("occurred_at", descending=
 #: A join with no fields of its own; the key is the only stable order it has.
 _BY_COVERAGE: Final[tuple[OrderBy, ...]] = (OrderBy("resolve_run_id"), OrderBy("candidate_work_id"))
 
+#: Where the file remembers which title-cleaning rules its rows were last brought
+#: up to. Namespaced by this adapter, since the meta space is shared with the
+#: durable store's own bookkeeping.
+_DEDUP_RULES_KEY: Final[str] = "discovery.dedup_rules"
+
 #: Newest activity first: the thread a curator is looking for is the one they
 #: last said something in, which the day it began says nothing about.
 _BY_LAST_TURN: Final[tuple[OrderBy, ...]] = (OrderBy("last_turn_at", descending=True), OrderBy("id"))
 
+#: How many preview paths one `list_named_previews` statement asks about.
+_NAMED_PREVIEWS_PER_QUERY: Final[int] = 500
+
 #: The thread's own order. Ascending, because a transcript is read downwards.
 _BY_ORDINAL: Final[tuple[OrderBy, ...]] = (OrderBy("ordinal"),)
 
@@ -329,6 +345,11 @@ class SqliteDiscovery(TableAdapter):
     def add_candidate_work(self, work: CandidateWork) -> None:
         self._add("candidate_works", _candidate_work_row(work), subject=f"candidate work {work.id!r}")
 
+    def add_candidate_work_many(self, works: Sequence[CandidateWork]) -> None:
+        self._add_many(
+            "candidate_works", [_candidate_work_row(work) for work in works], subject=f"one of {len(works)} candidate works"
+        )
+
     def get_candidate_work(self, candidate_work_id: str) -> CandidateWork | None:
         return self._get("candidate_works", {"id": candidate_work_id}, _candidate_work)
 
@@ -346,6 +367,13 @@ class SqliteDiscovery(TableAdapter):
     def add_candidate_image(self, image: CandidateImage) -> None:
         self._add("candidate_images", _candidate_image_row(image), subject=f"candidate image {image.id!r}")
 
+    def add_candidate_image_many(self, images: Sequence[CandidateImage]) -> None:
+        self._add_many(
+            "candidate_images",
+            [_candidate_image_row(image) for image in images],
+            subject=f"one of {len(images)} candidate images",
+        )
+
     def get_candidate_image(self, candidate_image_id: str) -> CandidateImage | None:
         return self._get("candidate_images", {"id": candidate_image_id}, _candidate_image)
 
@@ -355,6 +383,51 @@ class SqliteDiscovery(TableAdapter):
     def list_candidate_images(self, candidate_work_id: str) -> Sequence[CandidateImage]:
         return self._list("candidate_images", {"candidate_work_id": candidate_work_id}, _BY_SELECTION, _candidate_image)
 
+    def list_reclaimable_previews(self, *, decided: Collection[Verdict], after: str, limit: int) -> Sequence[CandidateImage]:
+        placeholders = ", ".join("?" for _ in decided)
+        verdicts = tuple(str(verdict) for verdict in decided)
+        # The paths are chosen first and the rows fetched for them second, so
+        # `limit` bounds files rather than rows: a shared file is one unit of
+        # reclamation, and a batch that cut through one would hand the caller
+        # half its references. `> ?` against the partial index is a range seek,
+        # which is what makes the next batch start where this one stopped rather
+        # than from the beginning of the file.
+        rows = self._store.select_rows(
+            f"SELECT i.* FROM candidate_images i WHERE i.preview_path IN ("
+            f"SELECT p.preview_path FROM candidate_images p JOIN candidate_works w ON w.id = p.candidate_work_id "
+            f"WHERE p.preview_path IS NOT NULL AND p.preview_path > ? "
+            f"GROUP BY p.preview_path HAVING SUM(w.verdict NOT IN ({placeholders})) = 0 "
+            f"ORDER BY p.preview_path LIMIT ?"
+            f") ORDER BY i.preview_path, i.id",
+            (after, *verdicts, limit),
+        )
+        return [_candidate_image(row) for row in rows]
+
+    def count_retained_previews(self, *, decided: Collection[Verdict]) -> int:
+        placeholders = ", ".join("?" for _ in decided)
+        rows = self._store.select_rows(
+            f"SELECT COUNT(DISTINCT p.preview_path) AS retained FROM candidate_images p "
+            f"JOIN candidate_works w ON w.id = p.candidate_work_id "
+            f"WHERE p.preview_path IS NOT NULL AND w.verdict NOT IN ({placeholders})",
+            tuple(str(verdict) for verdict in decided),
+        )
+        return int(rows[0]["retained"])
+
+    def list_named_previews(self, paths: Collection[str]) -> Collection[str]:
+        wanted = sorted(set(paths))
+        named: set[str] = set()
+        # In slices, so a directory of thousands of files is never one statement
+        # with thousands of parameters; each slice is a seek per path on the
+        # partial index the sweep already uses.
+        for start in range(0, len(wanted), _NAMED_PREVIEWS_PER_QUERY):
+            chunk = wanted[start : start + _NAMED_PREVIEWS_PER_QUERY]
+            rows = self._store.select_rows(
+                f"SELECT DISTINCT preview_path FROM candidate_images WHERE preview_path IN ({', '.join('?' for _ in chunk)})",
+                tuple(chunk),
+            )
+            named.update(row["preview_path"] for row in rows)
+        return named
+
     # -- conversations --------------------------------------------------------
 
     def add_conversation(self, conversation: Conversation) -> None:
@@ -494,6 +567,14 @@ class SqliteDiscovery(TableAdapter):
     def list_coverage_by_work(self, candidate_work_id: str) -> Sequence[ResolveRunWork]:
         return self._list("resolve_run_works", {"candidate_work_id": candidate_work_id}, _BY_COVERAGE, _coverage)
 
+    # -- upkeep ---------------------------------------------------------------
+
+    def dedup_rules_applied(self) -> str | None:
+        return self._store.read_meta(_DEDUP_RULES_KEY)
+
+    def record_dedup_rules_applied(self, version: str) -> None:
+        self._store.write_meta(_DEDUP_RULES_KEY, version)
+
 
 # -- record to row ------------------------------------------------------------
 
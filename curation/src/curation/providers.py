@@ -0,0 +1,348 @@
+"""Every outbound request paced and broken per host, across the whole process.
+
+The museum's API is asked by two runs' phase two at once, by the preview cache
+and by every tiled acquisition's image-service lookup; OpenRouter by discovery,
+conversation and the mat engine; a museum's image host by every fetch of its
+works. Each of those holds its own client, and until this module none of them
+knew what the others were doing — two runs doubled the rate the museum saw, and
+a host that had gone down was rediscovered one full timeout at a time, by each
+caller in turn.
+
+**One guard per process, consulted by every client's transport, keyed by
+host.** Not by caller: what the far side limits and what goes down is the host,
+and two callers asking one host are one load on it. The guard is handed to each
+client as it is built and wraps that client's transport, so a request is paced
+and broken wherever it was issued from — a phase-two search, a preview, a tile.
+
+**Paced by a token bucket, and a request waits its turn rather than being
+refused.** A bucket refills at the host's rate up to its burst, and a request
+that finds it empty reserves the next token and sleeps until it is due. A run
+asking the museum forty questions takes as long as the museum asks it to, and
+none of them fails for having been asked quickly.
+
+**Broken by consecutive failures, and a broken host fails at once.** A
+transport error, a `5xx` or a `429` is a failure; any other answer, a `404`
+included, is the host answering. `_FAILURES_TO_OPEN` in a row open the host for
+`_OPEN_SECONDS`, during which every request to it raises `HostUnavailable`
+without being sent. That is an `httpx.TransportError`, so each client reports it
+exactly as it already reports a host it could not reach, in its own vocabulary
+and on its own path — nothing above a transport learns a new exception. When
+the pause is over one request is let through as a trial: its answer closes the
+host or opens it again.
+
+**`Retry-After` is obeyed rather than inferred.** A `429` or `503` that says
+when to come back opens the host until then, whatever the failure count — the
+host has said what it wants. The wait is capped at `_RETRY_AFTER_CEILING_SECONDS`,
+so a header naming next week cannot take a provider out of a process that would
+otherwise have recovered long before.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from typing import Final
+
+import httpx
+
+
+@dataclass(frozen=True, slots=True)
+class HostPolicy:
+    """How fast one host may be asked."""
+
+    #: The sustained rate, or None for a host this plane does not pace — one
+    #: whose own limits are per account and far above anything it sends.
+    requests_per_second: float | None
+    #: How many may go at once after a quiet spell before the rate applies.
+    burst: int = 1
+
+
+#: The museum's API publishes sixty requests a minute for an identified caller,
+#: and is the one host here with a rate anybody wrote down. OpenRouter's limits
+#: are per key and well above what a curation plane sends; it is broken when it
+#: fails, never paced.
+_POLICIES: Final[Mapping[str, HostPolicy]] = {
+    "api.artic.edu": HostPolicy(requests_per_second=1.0, burst=10),
+    "openrouter.ai": HostPolicy(requests_per_second=None),
+}
+
+#: Every other host: a museum's image service or a direct download. Generous
+#: enough that four tile requests in flight are never the ones waiting, and
+#: slow enough that two acquisitions against one museum are not a flood.
+DEFAULT_HOST_POLICY: Final[HostPolicy] = HostPolicy(requests_per_second=8.0, burst=16)
+
+#: Consecutive failures that open a host. Five rather than one, because a single
+#: dropped connection is ordinary and the next request usually succeeds.
+_FAILURES_TO_OPEN: Final[int] = 5
+
+#: How long a host opened by failures stays open before a trial request.
+_OPEN_SECONDS: Final[float] = 30.0
+
+#: The longest a `Retry-After` is obeyed for.
+_RETRY_AFTER_CEILING_SECONDS: Final[float] = 600.0
+
+#: The answers that count against a host, beside a transport error.
+_TOO_MANY_REQUESTS: Final[int] = 429
+_SERVICE_UNAVAILABLE: Final[int] = 503
+
+
+class HostState(StrEnum):
+    """Whether requests to a host are being sent."""
+
+    CLOSED = "closed"
+    #: Failing fast until the pause ends.
+    OPEN = "open"
+    #: The pause has ended and one request is finding out whether it is back.
+    TRIAL = "trial"
+
+
+class HostUnavailable(httpx.TransportError):
+    """A request refused without being sent, because its host is open."""
+
+
+@dataclass(frozen=True, slots=True)
+class HostReading:
+    """One host as the guard holds it now."""
+
+    host: str
+    state: HostState
+    consecutive_failures: int
+    #: When the next request will be let through, or None when the host is closed.
+    open_until: datetime | None
+    #: What the last failure was, kept after the host recovers so a panel can
+    #: say what happened while nobody was looking.
+    last_failure: str | None
+    #: Counted since the process started.
+    admitted: int
+    refused: int
+    #: How long admitted requests waited for their turn, in total.
+    waited_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class ProvidersReading:
+    """Every host the process has asked anything of, at one instant."""
+
+    since: datetime
+    hosts: Sequence[HostReading]
+
+
+@dataclass(slots=True)
+class _Host:
+    """One host's bucket and breaker. Mutable; never leaves this module."""
+
+    policy: HostPolicy
+    tokens: float
+    refilled_at: float
+    failures: int = 0
+    #: Monotonic time the host reopens at; zero when it is closed.
+    open_until: float = 0.0
+    #: Monotonic time the trial in flight is given up on, so a trial whose
+    #: answer never arrived cannot hold the host open for good.
+    trial_until: float = 0.0
+    last_failure: str | None = None
+    admitted: int = 0
+    refused: int = 0
+    waited: float = 0.0
+
+
+class ProviderGuard:
+    """The process's pacing and breakers, one of each per host."""
+
+    def __init__(
+        self,
+        *,
+        policies: Mapping[str, HostPolicy] = _POLICIES,
+        default: HostPolicy = DEFAULT_HOST_POLICY,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._policies = policies
+        self._default = default
+        self._clock = clock
+        self._sleep = sleep
+        self._since = datetime.now(UTC)
+        #: Guards every host's state, which transports on many threads — and
+        #: the health panel from a request — read and write.
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _Host] = {}
+
+    def admit(self, host: str) -> float:
+        """Let one request to `host` go, returning how long it must wait first.
+
+        Raises `HostUnavailable` when the host is open. The wait is reserved
+        here and served by the caller, so a request that sleeps holds no lock.
+        """
+        with self._lock:
+            state = self._host(host)
+            now = self._clock()
+            if state.open_until:
+                if now < state.open_until or now < state.trial_until:
+                    state.refused += 1
+                    raise HostUnavailable(_refusal(host, state, now))
+                state.trial_until = now + _OPEN_SECONDS
+            wait = _reserve(state, now)
+            state.admitted += 1
+            state.waited += wait
+            return wait
+
+    def record(self, host: str, *, status: int | None, retry_after: str | None = None, reason: str = "") -> None:
+        """What became of one admitted request: its status, or None when it never got one."""
+        failed = status is None or status >= 500 or status == _TOO_MANY_REQUESTS
+        with self._lock:
+            state = self._host(host)
+            now = self._clock()
+            if not failed:
+                state.failures = 0
+                state.open_until = state.trial_until = 0.0
+                return
+            state.failures += 1
+            state.last_failure = reason or f"HTTP {status}"
+            pause = _retry_after(retry_after) if status in (_TOO_MANY_REQUESTS, _SERVICE_UNAVAILABLE) else None
+            if pause is not None:
+                state.open_until = now + pause
+            elif state.failures >= _FAILURES_TO_OPEN or state.trial_until:
+                state.open_until = now + _OPEN_SECONDS
+            state.trial_until = 0.0
+
+    def reading(self) -> ProvidersReading:
+        """Every host as it stands. Reads nothing but memory, so a page load costs nothing."""
+        with self._lock:
+            now = self._clock()
+            wall = datetime.now(UTC)
+            return ProvidersReading(
+                since=self._since,
+                hosts=[_read(host, state, now=now, wall=wall) for host, state in sorted(self._hosts.items())],
+            )
+
+    def transport(self, inner: httpx.BaseTransport | None = None) -> httpx.BaseTransport:
+        """A transport that sends through `inner` only what this guard admits."""
+        return _GuardedTransport(self, inner or httpx.HTTPTransport())
+
+    def async_transport(self, inner: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncBaseTransport:
+        """The same, for an async client. Its waits are slept on the event loop."""
+        return _AsyncGuardedTransport(self, inner or httpx.AsyncHTTPTransport())
+
+    def wait(self, seconds: float) -> None:
+        """Serve a reserved wait on this thread."""
+        if seconds > 0:
+            self._sleep(seconds)
+
+    def _host(self, host: str) -> _Host:
+        state = self._hosts.get(host)
+        if state is None:
+            policy = self._policies.get(host, self._default)
+            state = self._hosts[host] = _Host(policy=policy, tokens=float(policy.burst), refilled_at=self._clock())
+        return state
+
+
+class _GuardedTransport(httpx.BaseTransport):
+    def __init__(self, guard: ProviderGuard, inner: httpx.BaseTransport) -> None:
+        self._guard = guard
+        self._inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self._guard.wait(_admit(self._guard, request))
+        try:
+            response = self._inner.handle_request(request)
+        except httpx.TransportError as exc:
+            self._guard.record(host, status=None, reason=str(exc) or type(exc).__name__)
+            raise
+        self._guard.record(host, status=response.status_code, retry_after=response.headers.get("Retry-After"))
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class _AsyncGuardedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, guard: ProviderGuard, inner: httpx.AsyncBaseTransport) -> None:
+        self._guard = guard
+        self._inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        wait = _admit(self._guard, request)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        try:
+            response = await self._inner.handle_async_request(request)
+        except httpx.TransportError as exc:
+            self._guard.record(host, status=None, reason=str(exc) or type(exc).__name__)
+            raise
+        self._guard.record(host, status=response.status_code, retry_after=response.headers.get("Retry-After"))
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def _admit(guard: ProviderGuard, request: httpx.Request) -> float:
+    """`admit`, with the refusal carrying the request it refused, as httpx's own errors do."""
+    try:
+        return guard.admit(request.url.host)
+    except HostUnavailable as exc:
+        exc.request = request
+        raise
+
+
+def _reserve(state: _Host, now: float) -> float:
+    """Take the next token, returning how long until it is due."""
+    rate = state.policy.requests_per_second
+    if rate is None:
+        return 0.0
+    state.tokens = min(float(state.policy.burst), state.tokens + (now - state.refilled_at) * rate)
+    state.refilled_at = now
+    state.tokens -= 1.0
+    # Negative tokens are requests already promised a later slot; this one
+    # queues behind them.
+    return 0.0 if state.tokens >= 0 else -state.tokens / rate
+
+
+def _retry_after(raw: str | None) -> float | None:
+    """The pause a `Retry-After` asks for, in seconds and capped, or None when it says nothing usable."""
+    if not raw:
+        return None
+    raw = raw.strip()
+    if raw.isdigit():
+        seconds = float(raw)
+    else:
+        try:
+            when = parsedate_to_datetime(raw)
+        except ValueError:
+            return None
+        # A date given as `-0000` parses naive; HTTP dates are GMT regardless.
+        seconds = (when.replace(tzinfo=when.tzinfo or UTC) - datetime.now(UTC)).total_seconds()
+    return min(max(seconds, 0.0), _RETRY_AFTER_CEILING_SECONDS)
+
+
+def _refusal(host: str, state: _Host, now: float) -> str:
+    if now < state.open_until:
+        remaining = f"for another {state.open_until - now:.0f}s"
+    else:
+        remaining = "until the trial request in flight is answered"
+    return f"{host} is failing ({state.last_failure}); not asked again {remaining}"
+
+
+def _read(host: str, state: _Host, *, now: float, wall: datetime) -> HostReading:
+    if not state.open_until:
+        status, until = HostState.CLOSED, None
+    elif now < state.open_until:
+        status, until = HostState.OPEN, wall + timedelta(seconds=state.open_until - now)
+    else:
+        status, until = HostState.TRIAL, wall
+    return HostReading(
+        host=host,
+        state=status,
+        consecutive_failures=state.failures,
+        open_until=until,
+        last_failure=state.last_failure,
+        admitted=state.admitted,
+        refused=state.refused,
+        waited_seconds=round(state.waited, 3),
+    )
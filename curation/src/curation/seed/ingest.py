@@ -29,7 +29,7 @@ from curation.persistence.records import MatMethod, RenditionKind, RightsStatus
 from curation.seed.images import read_image_facts
 from curation.seed.legacy import LegacyRecord, ParsedArtist
 from curation.seed.names import display_nationality_for, parts_for
-from curation.services.catalogue import MAX_LIST_LIMIT, CatalogueService
+from curation.services.catalogue import MAX_LIST_LIMIT, CatalogueService, NewArtist, NewWork
 
 log = logging.getLogger(__name__)
 
@@ -166,12 +166,14 @@ def seed_catalogue(records: Sequence[LegacyRecord], *, catalogue: CatalogueServi
     # creation — are not written a second time to say what they already say.
     _name_stored_artists(catalogue)
 
+    fresh = [record for record, _ in collapsed if record.url not in existing.urls]
+    _mint(fresh, catalogue=catalogue, artists=artists, existing=existing)
+    minted = {record.url for record in fresh}
+
     works: list[SeededWork] = []
     for record, notes in collapsed:
-        work_id = existing.urls.get(record.url)
-        created = work_id is None
-        if work_id is None:
-            work_id = _mint(record, catalogue=catalogue, artist=artists[record.artist.name], existing=existing)
+        work_id = existing.urls[record.url]
+        created = record.url in minted
         entry = [*notes, *_label_notes(record, artist=artists[record.artist.name])]
         entry.extend(_attach_images(record, work_id=work_id, catalogue=catalogue, art_root=art_root))
         _attach_mat(record, work_id=work_id, catalogue=catalogue)
@@ -328,51 +330,66 @@ def _merge_artists(records: Iterable[LegacyRecord]) -> dict[str, ParsedArtist]:
     return merged
 
 
-def _mint(record: LegacyRecord, *, catalogue: CatalogueService, artist: ParsedArtist, existing: _Existing) -> str:
-    """Create the work, its artist if it is new, and the source it came from."""
-    artist_id = existing.artists.get(artist.name)
-    if artist_id is None:
-        # `(None, None)` for a name the table does not carry, which is the same
-        # thing it says about a record that is not a person. The difference
-        # between "nobody has said" and "there is nothing to say" is reported to
-        # the curator by `_label_notes`; to the row itself they are one state,
-        # because the label does the same thing with both.
-        family, given = parts_for(artist.name) or (None, None)
-        artist_id = catalogue.add_artist(
-            name=artist.name,
-            nationality=artist.nationality,
-            born=artist.born,
-            died=artist.died,
-            lifespan_text=artist.lifespan_text,
-            family_name=family,
-            given_name=given,
-            display_nationality=display_nationality_for(artist.name),
-        ).id
-        existing.artists[artist.name] = artist_id
-
-    work = catalogue.add_artwork(
-        title=record.title,
-        artist_id=artist_id,
-        date_created=record.date_created,
-        medium=record.medium,
-        dimensions=record.dimensions,
-        description=record.description,
+def _mint(
+    records: Sequence[LegacyRecord], *, catalogue: CatalogueService, artists: dict[str, ParsedArtist], existing: _Existing
+) -> None:
+    """Create every work not yet seeded, each artist that is new, and the source each work came from.
+
+    **In bulk, because this is the one write that grows with the index.** Every
+    row here is new by construction — `existing` has already said which records
+    were seeded before — so there is nothing to reconcile row by row, and the
+    catalogue takes the new artists as one write and the works with their sources
+    as another. Per record, this was a commit for the work and another for its
+    source; on a four-thousand-work index that was most of the run.
+    """
+    unheld = [artists[name] for name in dict.fromkeys(record.artist.name for record in records) if name not in existing.artists]
+    added = catalogue.add_artists([_new_artist(artist) for artist in unheld])
+    for parsed, artist in zip(unheld, added, strict=True):
+        existing.artists[parsed.name] = artist.id
+
+    works = catalogue.add_works(
+        [
+            NewWork(
+                title=record.title,
+                artist_id=existing.artists[record.artist.name],
+                date_created=record.date_created,
+                medium=record.medium,
+                dimensions=record.dimensions,
+                description=record.description,
+                url=record.url,
+                provider=record.provider,
+                source_class=record.source_class,
+                acquisition_method=record.acquisition_method,
+                # Seeding makes no rights judgement. The index records none, and
+                # reading one off the host would be inventing a legal conclusion
+                # from an address — so every seeded source says the rights are
+                # unknown, which is what is true of them.
+                rights_status=RightsStatus.UNKNOWN,
+            )
+            for record in records
+        ]
     )
-    catalogue.add_source(
-        artwork_id=work.id,
-        url=record.url,
-        provider=record.provider,
-        source_class=record.source_class,
-        acquisition_method=record.acquisition_method,
-        # Seeding makes no rights judgement. The index records none, and reading
-        # one off the host would be inventing a legal conclusion from an address —
-        # so every seeded source says the rights are unknown, which is what is
-        # true of them.
-        rights_status=RightsStatus.UNKNOWN,
-        is_primary=True,
+    for record, work in zip(records, works, strict=True):
+        existing.urls[record.url] = work.id
+
+
+def _new_artist(artist: ParsedArtist) -> NewArtist:
+    # `(None, None)` for a name the table does not carry, which is the same
+    # thing it says about a record that is not a person. The difference between
+    # "nobody has said" and "there is nothing to say" is reported to the curator
+    # by `_label_notes`; to the row itself they are one state, because the label
+    # does the same thing with both.
+    family, given = parts_for(artist.name) or (None, None)
+    return NewArtist(
+        name=artist.name,
+        nationality=artist.nationality,
+        born=artist.born,
+        died=artist.died,
+        lifespan_text=artist.lifespan_text,
+        family_name=family,
+        given_name=given,
+        display_nationality=display_nationality_for(artist.name),
     )
-    existing.urls[record.url] = work.id
-    return work.id
 
 
 def _label_notes(record: LegacyRecord, *, artist: ParsedArtist) -> list[SeedNoteEntry]:
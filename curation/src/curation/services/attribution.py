@@ -35,14 +35,29 @@ every unattributed work in the catalogue into one artist named nothing — the
 worst reachable merge, and reachable without any name resembling any other. An
 unattributed candidate takes no artist at all, which is what `artist_id`'s
 nullability is for.
+
+**Keyed once, not once per proposal.** Deriving every held artist's key on
+every acceptance made a batch of acceptances cost the artist table's size in
+derivations per work, twice over for a name that mints. `HeldArtists` is the
+table keyed once — an exact-key map for the match and two token maps for the
+near misses — and `AttributionIndex` keeps it until the catalogue or the rules
+could have moved it. The answers are the ones a scan gives, first row first;
+only the number of derivations changed.
 """
 
-from collections.abc import Sequence
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 
 from curation.discovery.dedup import artist_key, clean_name
 from curation.persistence.records import Artist
 
+#: One held artist as its key was derived from: the row and the name it had.
+#: A renamed artist is a different entry, so a rename can never answer with the
+#: key of the name it replaced.
+_Named = tuple[str, str]
+
 
 @dataclass(frozen=True, slots=True)
 class Attribution:
@@ -75,64 +90,142 @@ def resolve(proposed_artist: str | None, artists: Sequence[Artist]) -> Attributi
     `artists` is every artist the catalogue holds. Keys are derived here rather
     than stored beside the rows on purpose: a stored key is a copy of a
     derivation, and the copy goes stale silently the day the derivation is
-    refined — which the work-identity spike has already done once. Deriving on
-    read costs a scan of a table that grows by one row per newly-seen painter,
-    against a catalogue sized by what fits on one wall.
+    refined — which the work-identity spike has already done once. A caller
+    resolving more than one name keeps the derivation in an `AttributionIndex`
+    instead, which holds it only as long as the rules that made it.
+    """
+    return HeldArtists(artists).resolve(proposed_artist)
+
+
+class HeldArtists:
+    """Every artist the catalogue holds, keyed once and looked up by key and by token.
+
+    Three maps over one listing. `by_key` answers the match; the two token maps
+    answer `_near_misses`'s condition — a shared token that ends one name or the
+    other — as two lookups: artists with the proposal's last token anywhere in
+    their name, and artists whose last token is anywhere in the proposal's.
+    Positions rather than rows, so the near misses come back in listing order,
+    as the scan returned them.
     """
-    if proposed_artist is None:
-        return Attribution(matched=None, mint=None, near_misses=())
-    key = artist_key(proposed_artist)
-    if not key:
-        # Normalises to nothing — a decorative dash, punctuation, "n/a". This is
-        # the unattributed case and must never be treated as a lookup key.
-        return Attribution(matched=None, mint=None, near_misses=())
-    for artist in artists:
-        if artist_key(artist.name) == key:
-            return Attribution(matched=artist, mint=None, near_misses=())
-    return Attribution(
-        matched=None,
-        # The cleaned name rather than the raw text or the key: the key is
-        # lowercase and stripped of the accents a name is spelled with, and the
-        # raw text may carry the decoration `clean_name` exists to remove. What
-        # is stored is what a label renders.
-        mint=clean_name(proposed_artist),
-        near_misses=_near_misses(key, artists),
-    )
-
-
-def _near_misses(key: str, artists: Sequence[Artist]) -> Sequence[Artist]:
-    """Held artists that plausibly name the same painter as this key.
-
-    The test is a shared token that is somebody's *last* token — the position a
-    surname occupies in every form this product has seen. `jacob isaacksz van
-    ruisdael` and `jacob van ruisdael` share `ruisdael`, which ends both. `hans
-    holbein` and `hans memling` share only `hans`, which ends neither, so a
-    shared forename does not report every painter who has it.
-
-    **That one condition is the whole rule, and it is why nothing here filters
-    tokens by length or against a list of particles.** Both were written and both
-    were inert: a particle is never anybody's last token, so `van` shared between
-    `vincent van gogh` and `jacob van ruisdael` already fails the test, and
-    initials are not last either, so `j m w turner` needs no special case. A
-    minimum length is worse than inert — it discards exactly the surnames that
-    are short. `wu li` reduces to nothing under a three-character floor and would
-    silently never report against `zhang li`, which is the notice failing for
-    whole naming traditions while looking correct on every European name.
-
-    Reporting too little is the safe direction here and reporting too much is
-    merely noisy, because nothing downstream acts on this: it is a sentence in a
-    response, not an argument to a write.
+
+    __slots__ = ("_artists", "_by_key", "_by_last", "_by_token")
+
+    def __init__(self, artists: Sequence[Artist], keys: Mapping[_Named, str] | None = None) -> None:
+        self._artists = tuple(artists)
+        self._by_key: dict[str, Artist] = {}
+        by_token: defaultdict[str, list[int]] = defaultdict(list)
+        by_last: defaultdict[str, list[int]] = defaultdict(list)
+        for position, artist in enumerate(self._artists):
+            key = keys[(artist.id, artist.name)] if keys is not None else artist_key(artist.name)
+            # The first row holding a key answers for it, as the first row the
+            # scan reached did.
+            self._by_key.setdefault(key, artist)
+            tokens = key.split()
+            if not tokens:
+                continue
+            for token in set(tokens):
+                by_token[token].append(position)
+            by_last[tokens[-1]].append(position)
+        self._by_token = dict(by_token)
+        self._by_last = dict(by_last)
+
+    def resolve(self, proposed_artist: str | None) -> Attribution:
+        """`resolve`, against the artists this was built from."""
+        if proposed_artist is None:
+            return Attribution(matched=None, mint=None, near_misses=())
+        key = artist_key(proposed_artist)
+        if not key:
+            # Normalises to nothing — a decorative dash, punctuation, "n/a". This is
+            # the unattributed case and must never be treated as a lookup key.
+            return Attribution(matched=None, mint=None, near_misses=())
+        matched = self._by_key.get(key)
+        if matched is not None:
+            return Attribution(matched=matched, mint=None, near_misses=())
+        return Attribution(
+            matched=None,
+            # The cleaned name rather than the raw text or the key: the key is
+            # lowercase and stripped of the accents a name is spelled with, and the
+            # raw text may carry the decoration `clean_name` exists to remove. What
+            # is stored is what a label renders.
+            mint=clean_name(proposed_artist),
+            near_misses=self._near_misses(key),
+        )
+
+    def _near_misses(self, key: str) -> Sequence[Artist]:
+        """Held artists that plausibly name the same painter as this key.
+
+        The test is a shared token that is somebody's *last* token — the position a
+        surname occupies in every form this product has seen. `jacob isaacksz van
+        ruisdael` and `jacob van ruisdael` share `ruisdael`, which ends both. `hans
+        holbein` and `hans memling` share only `hans`, which ends neither, so a
+        shared forename does not report every painter who has it.
+
+        **That one condition is the whole rule, and it is why nothing here filters
+        tokens by length or against a list of particles.** Both were written and both
+        were inert: a particle is never anybody's last token, so `van` shared between
+        `vincent van gogh` and `jacob van ruisdael` already fails the test, and
+        initials are not last either, so `j m w turner` needs no special case. A
+        minimum length is worse than inert — it discards exactly the surnames that
+        are short. `wu li` reduces to nothing under a three-character floor and would
+        silently never report against `zhang li`, which is the notice failing for
+        whole naming traditions while looking correct on every European name.
+
+        Reporting too little is the safe direction here and reporting too much is
+        merely noisy, because nothing downstream acts on this: it is a sentence in a
+        response, not an argument to a write.
+        """
+        tokens = key.split()
+        if not tokens:
+            return ()
+        found = set(self._by_token.get(tokens[-1], ()))
+        for token in set(tokens):
+            found.update(self._by_last.get(token, ()))
+        return tuple(self._artists[position] for position in sorted(found))
+
+
+class AttributionIndex:
+    """The held artists, keyed, and kept until the catalogue or the rules move.
+
+    Stamped with the catalogue's generation and `dedup.RULES_VERSION`, and
+    rebuilt when either differs from the stamp. The generation is the whole
+    file's, so it moves for commits that touched no artist — every acceptance
+    moves it — and a rebuild is therefore kept cheap rather than rare: each key
+    is remembered against the row and name it was derived from, so a rebuild
+    re-lists the artists and derives keys only for rows it has not seen. A
+    change of rules forgets every key, because every key may now be wrong.
+
+    **Read the generation before the artists, and outside any write to them.**
+    The stamp vouches for the listing only if no commit could have landed
+    between the two, and a write earlier in the caller's own transaction is not
+    counted until it commits — so a caller that had already minted an artist in
+    the same transaction would be answered without it.
     """
-    tokens = key.split()
-    if not tokens:
-        return ()
-    last = tokens[-1]
-    found: list[Artist] = []
-    for artist in artists:
-        other = artist_key(artist.name).split()
-        if not other:
-            continue
-        shared = set(tokens) & set(other)
-        if last in shared or other[-1] in shared:
-            found.append(artist)
-    return tuple(found)
+
+    def __init__(self) -> None:
+        #: Guards the swap. Acceptances run on request threads, and two
+        #: rebuilding at once would each derive what the other is deriving.
+        self._lock = threading.Lock()
+        self._stamp: tuple[int, str] | None = None
+        self._held: HeldArtists | None = None
+        self._keys: dict[_Named, str] = {}
+
+    def held(self, *, generation: int, rules: str, artists: Callable[[], Sequence[Artist]]) -> HeldArtists:
+        """The index as of `generation` under `rules`, listing `artists` only if it must."""
+        stamp = (generation, rules)
+        with self._lock:
+            if self._held is not None and self._stamp == stamp:
+                return self._held
+            if self._stamp is None or self._stamp[1] != rules:
+                self._keys = {}
+            listed = artists()
+            keys: dict[_Named, str] = {}
+            for artist in listed:
+                named = (artist.id, artist.name)
+                known = self._keys.get(named)
+                keys[named] = artist_key(artist.name) if known is None else known
+            # Replaced rather than grown, so a deleted or renamed row's key is
+            # not carried for the life of the process.
+            self._keys = keys
+            self._held = HeldArtists(listed, keys)
+            self._stamp = stamp
+            return self._held
@@ -41,6 +41,7 @@ from curation.persistence.records import (
     MatColor,
     MatMethod,
     Original,
+    OriginalsFootprint,
     Rendition,
     RenditionKind,
     RightsStatus,
@@ -170,6 +171,45 @@ class RenditionView:
     stale: bool
 
 
+@dataclass(frozen=True, slots=True)
+class NewArtist:
+    """One artist for `CatalogueService.add_artists`, carrying what `add_artist` takes."""
+
+    name: str
+    nationality: str | None = None
+    born: int | None = None
+    died: int | None = None
+    lifespan_text: str | None = None
+    biography: str | None = None
+    family_name: str | None = None
+    given_name: str | None = None
+    display_nationality: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class NewWork:
+    """One work for `CatalogueService.add_works`, and the source it came from.
+
+    A work added in bulk always arrives from somewhere, so the source is part of
+    the request rather than a second call per work — that second call is most of
+    what adding a work one at a time costs. The source is recorded as primary,
+    since it is the only one the work has.
+    """
+
+    title: str
+    url: str
+    provider: str
+    source_class: SourceClass
+    acquisition_method: AcquisitionMethod
+    #: No default, for the reason `add_source` gives.
+    rights_status: RightsStatus
+    artist_id: str | None = None
+    date_created: str | None = None
+    medium: str | None = None
+    dimensions: str | None = None
+    description: str | None = None
+
+
 def _offered(options: Sequence[FacetOption]) -> Sequence[FacetOption]:
     """Order a kind's options and cut the tail, keeping every selected one.
 
@@ -194,6 +234,20 @@ class CatalogueService:
     def __init__(self, store: CatalogueStore) -> None:
         self._store = store
 
+    # -- reads: whether anything has changed ----------------------------------
+
+    def generation(self) -> int:
+        """A number that moves whenever the catalogue may have changed.
+
+        The whole file's, not only the accepted works': discovery's rows share
+        it, so a run that proposes a candidate moves it for a surface polling
+        the review grid as well as one polling the collection. Read it *before*
+        computing the answer it is to vouch for — a commit landing in between
+        then makes the pair look older than the answer, which costs the next ask
+        a full answer rather than leaving it with a stale one.
+        """
+        return self._store.generation()
+
     # -- reads: works ---------------------------------------------------------
 
     def list_artworks(
@@ -218,10 +272,11 @@ class CatalogueService:
         **The facet counts come back with the page rather than from a second
         route**, because they answer the same question the grid answers — what
         does this filter select? — and two routes would give a curator two answers
-        to it, which could differ by a write landing between the calls. The cost
-        is that they are recomputed on page 2 of a grid that did not change them;
-        that is accepted on a loopback service serving one household, and
-        `api-contract.md` records the measurement and the trigger for revisiting.
+        to it, which could differ by a write landing between the calls. On page 2
+        of an unnarrowed grid — or one narrowed only by status — the counts are
+        read from a summary the file keeps current rather than recomputed, so the
+        repetition costs a lookup; a search or a chosen facet is still counted
+        live. `api-contract.md` records the measurement.
         """
         resolved_status = self._parse_status(status)
         resolved_limit = DEFAULT_LIST_LIMIT if limit is None else limit
@@ -287,7 +342,10 @@ class CatalogueService:
         4,000-work corpus with `tools/search_latency.py`, this and the unnarrowed
         skip in `_Restriction.narrows` together took the whole listing's median
         from **57 ms to 6 ms** unfiltered and from **101 ms to 31 ms** with a
-        search term.
+        search term. The store now answers the status-only count and the
+        vocabulary from its facet summary, which is what holds the unfiltered
+        screen near 20 ms at 20,000 works where recounting cost 36 ms — and
+        487 ms on the accepted-only tab.
         """
         vocabulary = self._store.facet_vocabulary(status=query.status)
         # A kind with nothing chosen has nothing to drop, so `without` leaves the
@@ -334,6 +392,20 @@ class CatalogueService:
         self._require_artwork(artwork_id)
         return self._store.get_original(artwork_id)
 
+    def find_held_original(self, url: str, *, other_than: str) -> Original | None:
+        """An original some other work already holds from a source at `url`, or None.
+
+        Partial ones are never the answer: a gappy image is a reason to fetch
+        again, not one to hand to another work in place of fetching. The work
+        asking is never the answer either, because a work re-fetching its own
+        source is a curator asking for the museum's bytes again on purpose.
+        """
+        return self._store.find_held_original(url, other_than=other_than)
+
+    def measure_originals(self) -> OriginalsFootprint:
+        """How many bytes the held originals are, and how many of them are the same image twice."""
+        return self._store.measure_originals()
+
     def display_fit(self, artwork_id: str, *, box: ArtworkBox) -> FitAssessment:
         """Judge the work's held original against the space it would be rendered into."""
         original = self.get_original(artwork_id)
@@ -413,21 +485,34 @@ class CatalogueService:
         display_nationality: str | None = None,
     ) -> Artist:
         """Record an artist and return it with its minted identity."""
-        artist = Artist(
-            id=str(uuid.uuid4()),
-            name=require_text(name, field="name"),
-            nationality=nationality,
-            born=born,
-            died=died,
-            lifespan_text=lifespan_text,
-            biography=biography,
-            family_name=family_name,
-            given_name=given_name,
-            display_nationality=display_nationality,
+        artist = self._minted_artist(
+            NewArtist(
+                name=name,
+                nationality=nationality,
+                born=born,
+                died=died,
+                lifespan_text=lifespan_text,
+                biography=biography,
+                family_name=family_name,
+                given_name=given_name,
+                display_nationality=display_nationality,
+            )
         )
         store_write(self._store.add_artist, artist)
         return artist
 
+    def add_artists(self, artists: Sequence[NewArtist]) -> Sequence[Artist]:
+        """Record several artists as one write, returned in the order given.
+
+        Every one is checked before any is written, and the store takes them as
+        one statement — so a refusal leaves none of them behind, and a seed of
+        thousands pays for one commit rather than one per artist.
+        """
+        minted = [self._minted_artist(artist) for artist in artists]
+        if minted:
+            store_write(self._store.add_artist_many, minted)
+        return minted
+
     def label_facts_for(
         self,
         artist_id: str,
@@ -491,30 +576,69 @@ class CatalogueService:
         """
         if artist_id is not None and self._store.get_artist(artist_id) is None:
             raise ServiceError(f"No artist with id {artist_id!r} is in the catalogue.")
-        now = datetime.now(UTC)
-        artwork = Artwork(
-            id=str(uuid.uuid4()),
-            title=require_text(title, field="title"),
-            created_at=now,
-            status=ArtworkStatus.ACCEPTED,
+        artwork = self._minted_artwork(
+            title=title,
             artist_id=artist_id,
             date_created=date_created,
             medium=medium,
             dimensions=dimensions,
-            # Normalised on the way in, once, rather than by every renderer that
-            # ever reads it back out.
-            description=description_markup(description),
+            description=description,
             rights=rights,
-            accepted_at=now,
-            # Not passed through `description_markup`: that strips a holding
-            # institution's HTML paragraph down to text, and commentary is
-            # written for a wall label rather than fetched from anywhere, so
-            # there is no markup to take out of it.
             commentary=commentary,
+            now=datetime.now(UTC),
         )
         store_write(self._store.add_artwork, artwork)
         return artwork
 
+    def add_works(self, works: Sequence[NewWork]) -> Sequence[Artwork]:
+        """Record several works, each with its primary source, returned in the order given.
+
+        The same rules as `add_artwork` followed by `add_source`, checked for
+        every work before anything is written: each artist named must already be
+        held — looked up once however many works share it — and every field is
+        refused exactly as the single-work path refuses it. The works and their
+        sources are then written as two statements in one transaction, so either
+        all of them arrive or none do, and a work is never left without the
+        source that says where it came from.
+        """
+        for artist_id in dict.fromkeys(work.artist_id for work in works if work.artist_id is not None):
+            if self._store.get_artist(artist_id) is None:
+                raise ServiceError(f"No artist with id {artist_id!r} is in the catalogue.")
+        now = datetime.now(UTC)
+        artworks: list[Artwork] = []
+        sources: list[Source] = []
+        for work in works:
+            artwork = self._minted_artwork(
+                title=work.title,
+                artist_id=work.artist_id,
+                date_created=work.date_created,
+                medium=work.medium,
+                dimensions=work.dimensions,
+                description=work.description,
+                rights=None,
+                commentary=None,
+                now=now,
+            )
+            artworks.append(artwork)
+            sources.append(
+                self._minted_source(
+                    artwork_id=artwork.id,
+                    url=work.url,
+                    provider=work.provider,
+                    source_class=work.source_class,
+                    acquisition_method=work.acquisition_method,
+                    rights_status=work.rights_status,
+                    is_primary=True,
+                    confidence=None,
+                    selection_rationale=None,
+                )
+            )
+        if artworks:
+            with self._store.transaction():
+                store_write(self._store.add_artwork_many, artworks)
+                store_write(self._store.add_source_many, sources)
+        return artworks
+
     def archive_artwork(self, artwork_id: str) -> Artwork:
         """Take a work out of circulation, keeping its record and its mat history."""
         artwork = self._require_artwork(artwork_id)
@@ -662,14 +786,13 @@ class CatalogueService:
         always the one who decided it.
         """
         self._require_artwork(artwork_id)
-        source = Source(
-            id=str(uuid.uuid4()),
+        source = self._minted_source(
             artwork_id=artwork_id,
-            url=require_text(url, field="url"),
-            provider=require_text(provider, field="provider"),
-            source_class=require_member(source_class, enum=SourceClass, field="source_class"),
-            acquisition_method=require_member(acquisition_method, enum=AcquisitionMethod, field="acquisition_method"),
-            rights_status=require_member(rights_status, enum=RightsStatus, field="rights_status"),
+            url=url,
+            provider=provider,
+            source_class=source_class,
+            acquisition_method=acquisition_method,
+            rights_status=rights_status,
             is_primary=is_primary,
             confidence=confidence,
             selection_rationale=selection_rationale,
@@ -900,6 +1023,81 @@ class CatalogueService:
 
     # -- internals ------------------------------------------------------------
 
+    @staticmethod
+    def _minted_artist(artist: NewArtist) -> Artist:
+        return Artist(
+            id=str(uuid.uuid4()),
+            name=require_text(artist.name, field="name"),
+            nationality=artist.nationality,
+            born=artist.born,
+            died=artist.died,
+            lifespan_text=artist.lifespan_text,
+            biography=artist.biography,
+            family_name=artist.family_name,
+            given_name=artist.given_name,
+            display_nationality=artist.display_nationality,
+        )
+
+    @staticmethod
+    def _minted_artwork(
+        *,
+        title: str,
+        artist_id: str | None,
+        date_created: str | None,
+        medium: str | None,
+        dimensions: str | None,
+        description: str | None,
+        rights: str | None,
+        commentary: str | None,
+        now: datetime,
+    ) -> Artwork:
+        return Artwork(
+            id=str(uuid.uuid4()),
+            title=require_text(title, field="title"),
+            created_at=now,
+            status=ArtworkStatus.ACCEPTED,
+            artist_id=artist_id,
+            date_created=date_created,
+            medium=medium,
+            dimensions=dimensions,
+            # Normalised on the way in, once, rather than by every renderer that
+            # ever reads it back out.
+            description=description_markup(description),
+            rights=rights,
+            accepted_at=now,
+            # Not passed through `description_markup`: that strips a holding
+            # institution's HTML paragraph down to text, and commentary is
+            # written for a wall label rather than fetched from anywhere, so
+            # there is no markup to take out of it.
+            commentary=commentary,
+        )
+
+    @staticmethod
+    def _minted_source(
+        *,
+        artwork_id: str,
+        url: str,
+        provider: str,
+        source_class: SourceClass,
+        acquisition_method: AcquisitionMethod,
+        rights_status: RightsStatus,
+        is_primary: bool,
+        confidence: float | None,
+        selection_rationale: str | None,
+    ) -> Source:
+        return Source(
+            id=str(uuid.uuid4()),
+            artwork_id=artwork_id,
+            url=require_text(url, field="url"),
+            provider=require_text(provider, field="provider"),
+            source_class=require_member(source_class, enum=SourceClass, field="source_class"),
+            acquisition_method=require_member(acquisition_method, enum=AcquisitionMethod, field="acquisition_method"),
+            rights_status=require_member(rights_status, enum=RightsStatus, field="rights_status"),
+            is_primary=is_primary,
+            confidence=confidence,
+            selection_rationale=selection_rationale,
+        )
+
     def _demote_primary_sources(self, artwork_id: str) -> None:
         """Clear whichever source currently claims to have produced the original."""
         for other in self._store.list_sources(artwork_id):
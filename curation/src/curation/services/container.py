@@ -16,13 +16,14 @@ facts about the product rather than conveniences of one call site, which is why
 they are settled in one place instead of per constructor.
 """
 
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
 from curation.acquisition.direct import StreamOpener
 from curation.acquisition.mat import MatEngine
 from curation.acquisition.preparation import PreparationService, PreparationSettings
+from curation.acquisition.queue import AcquisitionQueue, AcquisitionQueueSettings
 from curation.acquisition.service import AcquisitionService, AcquisitionSettings
 from curation.acquisition.tiles import TileTargetResolver
 from curation.acquisition.transport import no_transport
@@ -37,7 +38,10 @@ from curation.acquisition.urls import Resolver
 # import graph while teaching a pattern on a premise that was never true. If a
 # real cycle ever appears, the fix is to move the constants, not to hide the edge.
 from curation.config import (
+    DEFAULT_ACQUISITION_DIRECT_WORKERS,
+    DEFAULT_ACQUISITION_TILED_WORKERS,
     DEFAULT_ACQUISITION_USER_AGENT,
+    DEFAULT_ACQUISITION_WORKERS,
     DEFAULT_MAT_IMAGE_MAX_EDGE,
     DEFAULT_MAX_IMAGE_BYTES,
     DEFAULT_MIN_FREE_BYTES,
@@ -46,8 +50,11 @@ from curation.config import (
     DEFAULT_TILE_TIMEOUT_SECONDS,
     DEFAULT_TV_PANEL_HEIGHT_PX,
     DEFAULT_TV_PANEL_WIDTH_PX,
+    MUSEUM_CACHE_DIRNAME,
     ORIGINALS_DIRNAME,
+    PREVIEWS_DIRNAME,
     READY_DIRNAME,
+    THUMBNAILS_DIRNAME,
     TILE_CACHE_DIRNAME,
 )
 from curation.discovery.browse import CollectionBrowse
@@ -55,9 +62,12 @@ from curation.discovery.conversation import NO_CONVERSATION_KEY, ConversationEng
 from curation.discovery.engine import DiscoveryEngine
 from curation.discovery.images import ImageSearch
 from curation.discovery.phase_two import PhaseTwoEngine
+from curation.discovery.response_cache import ResponseCache
 from curation.persistence.backup import BACKUP_RECEIPT_FILENAME
 from curation.persistence.catalogue import CatalogueStore
 from curation.persistence.discovery import DiscoveryStore
+from curation.persistence.profiler import StatementProfiler
+from curation.providers import ProviderGuard
 from curation.services.catalogue import CatalogueService
 from curation.services.conversation import ConversationService
 from curation.services.discovery import DiscoveryService
@@ -65,13 +75,15 @@ from curation.services.display import DisplayService, DisplaySettings
 from curation.services.display_fit import ArtworkBox
 from curation.services.errors import ServiceError
 from curation.services.health import HealthService
+from curation.services.imaging_pool import ImagingPool
 from curation.services.previews import PreviewCache, PreviewSettings
 from curation.services.review import ReviewService
 from curation.services.runner import DiscoveryRunner, DiscoverySettings
+from curation.services.storage import GovernedCache, StorageBudgets, StorageGovernor
 from curation.services.survey import SurveyService
 from curation.services.sweep import PreviewSweep
 from curation.services.taste import TasteService
-from curation.services.thumbnails import ThumbnailService, ThumbnailSettings
+from curation.services.thumbnails import ThumbnailService, ThumbnailSettings, ThumbnailWarmer
 
 
 @dataclass(frozen=True, slots=True)
@@ -82,6 +94,11 @@ class Services:
     discovery: DiscoveryService
     display: DisplayService
     thumbnails: ThumbnailService
+    #: Drawing thumbnails ahead of the grid, as originals and canvases land. Built
+    #: unconditionally and started only by the application that wants it, for the
+    #: reason the sweep is: a test that acquires must not be racing a thread it
+    #: never asked for. Unstarted, it ignores what it is handed.
+    warmer: ThumbnailWarmer
     #: Works composed the way a surface showing them to a human needs them. It is
     #: its own concern rather than a method on the catalogue because it spans
     #: three of them, and because both surfaces need the identical composition —
@@ -108,15 +125,25 @@ class Services:
     #: Reclaiming the previews of works the curator has decided. Built
     #: unconditionally, unlike the phase-2 pair it cleans up after: a deployment
     #: that never cached a preview has nothing to sweep, and the pass costs one
-    #: walk of a household's rows to find that out. An optional here would mean
+    #: indexed query to find that out. An optional here would mean
     #: a deployment could disable phase 2, keep the files it already wrote, and
     #: lose the only thing that reclaims them.
     sweep: PreviewSweep
+    #: Holding the derived caches under `ART_ROOT` to their budgets. Beside
+    #: `sweep` because it runs on the sweep's timer and after it; separate from
+    #: it because the sweep reclaims by verdict and this by age and size, and a
+    #: cache with no verdicts — thumbnails, tiles — has only this.
+    storage: StorageGovernor
     #: Acquiring the master image a work was accepted for. Held beside the
     #: catalogue rather than inside it because it is the one service that reaches
     #: outside the machine to do its job — a subprocess and an HTTP transport —
     #: and the record layer is deliberately free of both.
     acquisition: AcquisitionService
+    #: Acquiring many works behind a handle, a bounded number at a time. Beside
+    #: `acquisition` rather than inside it for the reason `runner` sits above
+    #: `discovery`: one fetch is synchronous and knows nothing of threads, and
+    #: everything about starting work behind a handle does.
+    acquisitions: AcquisitionQueue
     #: Turning a held original into a mat and a television canvas. Its own service
     #: rather than the tail of acquisition: a work is prepared repeatedly over its
     #: life — whenever the panel changes, the mat is re-chosen, or a rendition
@@ -152,6 +179,7 @@ class Services:
         collection: CollectionBrowse | None = None,
         previews: PreviewSettings | None = None,
         acquisition: AcquisitionSettings | None = None,
+        acquisition_queue: AcquisitionQueueSettings | None = None,
         open_stream: StreamOpener | None = None,
         tile_targets: Mapping[str, TileTargetResolver] | None = None,
         #: How a hostname becomes addresses for the fetch policy. Defaults to the
@@ -169,6 +197,29 @@ class Services:
         #: the curator's evidence that the product works would be the product
         #: fabricating it.
         conversation_engine: ConversationEngine | None = None,
+        #: The profiler the catalogue file was opened with, so the health panel
+        #: and the tool surface can read back what it has counted. None — the
+        #: default — when the deployment did not ask for one.
+        profiler: StatementProfiler | None = None,
+        #: Where every decode and encode runs. Defaults to the calling thread,
+        #: which is what a suite wants: no processes to start, and a failure
+        #: raised where the test can see it. The entry point passes workers.
+        imaging: ImagingPool | None = None,
+        #: Each cache directory's byte budget. Defaults to none at all — every
+        #: directory measured, nothing evicted — so a suite never loses a file
+        #: to a governor it did not configure. The entry point passes the
+        #: deployment's.
+        storage: StorageBudgets | None = None,
+        #: The museum's stored answers, which the provider and the collection
+        #: given above were built over. Passed here as well so a run can report
+        #: what it cost and the directory is held to its budget; None when the
+        #: clients keep nothing.
+        museum_cache: ResponseCache | None = None,
+        #: The process's per-host pacing and breakers, which the clients given
+        #: above were built over. Passed here as well so the in-process tile
+        #: fetcher sends through it and the health panel can show it; None when
+        #: nothing is guarded, which is every test that drives its own transport.
+        providers: ProviderGuard | None = None,
     ) -> Services:
         """Assemble the services over an already-open file.
 
@@ -182,9 +233,11 @@ class Services:
         plane runs phase 1 and stops, which is a coherent deployment — and the
         one every test that has no business reaching a museum uses.
         """
+        imaging = imaging or ImagingPool(workers=0)
         catalogue_service = CatalogueService(catalogue)
         display_service = DisplayService(catalogue, catalogue_service, display_settings)
-        thumbnail_service = ThumbnailService(catalogue_service, thumbnails)
+        thumbnail_service = ThumbnailService(catalogue_service, thumbnails, imaging=imaging)
+        warmer = ThumbnailWarmer(thumbnail_service)
         # The artwork box reaches discovery for one reason: automatic selection
         # must withhold an instance that would render below the floor, and the
         # floor is a size on the wall rather than a pixel count — so the rule
@@ -211,19 +264,62 @@ class Services:
             # without supplementing, and a run with no collection simply offers
             # nothing.
             collection=collection,
+            museum_cache=museum_cache,
+        )
+        acquisition = acquisition or _default_acquisition(thumbnails.art_root)
+        acquisition_service = AcquisitionService(
+            catalogue_service,
+            acquisition,
+            # Defaults to a transport that refuses rather than to a live one.
+            # A plane assembled without wiring one has a wiring mistake, and
+            # a real client here would let that mistake reach a museum from a
+            # test suite instead of failing where it was made.
+            open_stream=open_stream or no_transport,
+            # Only a provider whose recorded URL is an identity needs one, and
+            # the museum client is the thing that can answer — so by default
+            # this is exactly the configured image provider. A deployment with
+            # none configured therefore has no resolver either, and an artic
+            # fetch refuses by name rather than handing the tile fetcher a URL
+            # it cannot read: without credentials to ask the collection for an
+            # object's image service, there is genuinely no way to reach it.
+            #
+            # Overridable because resolving one object and searching a whole
+            # collection are separate capabilities that today's one provider
+            # happens to serve both of.
+            tile_targets=(
+                tile_targets
+                if tile_targets is not None
+                else ({} if image_search is None else {image_search.provider: image_search.tile_url})
+            ),
+            **({} if resolve is None else {"resolve": resolve}),
+            warm=warmer.enqueue,
+            imaging=imaging,
+            guard=providers,
+        )
+        storage_governor = _storage_governor(
+            storage or StorageBudgets(),
+            art_root=thumbnails.art_root,
+            tile_cache=acquisition.tile_cache_path,
+            previews=None if previews is None else previews.directory,
+            thumbnails=thumbnails.directory,
+            museum_cache=None if museum_cache is None else museum_cache.directory,
+            acquisition=acquisition_service,
+            runner=runner_service,
+            discovery=discovery_service,
         )
         return cls(
             catalogue=catalogue_service,
             discovery=discovery_service,
             display=display_service,
             thumbnails=thumbnail_service,
+            warmer=warmer,
             survey=SurveyService(catalogue_service, display_service, thumbnail_service, artwork_box),
             # `art_root` is read off the thumbnail settings rather than taken as
             # an argument of its own. It is the same deployment value — every
             # catalogue path is relative to it — and it is already required and
             # validated there. A third copy would be a third chance for the
             # copies to disagree, and nothing would notice which was right.
-            review=ReviewService(discovery_service, box=artwork_box, art_root=thumbnails.art_root),
+            review=ReviewService(discovery_service, box=artwork_box, art_root=thumbnails.art_root, imaging=imaging),
             # The receipt is located the same way, and for the same reason. It is
             # not a `DisplaySettings` field beside the art root the heartbeats are
             # named from: that settings object carries what the *walls'*
@@ -233,37 +329,22 @@ class Services:
                 display_service,
                 backup_receipt_path=thumbnails.art_root / BACKUP_RECEIPT_FILENAME,
                 box=artwork_box,
+                profiler=profiler,
+                imaging=imaging,
+                storage=storage_governor,
+                catalogue=catalogue_service,
+                providers=providers,
             ),
             runner=runner_service,
             # `art_root` off the thumbnail settings for the same reason `review`
             # takes it from there: it is one deployment value, already validated,
             # and a second copy is a second chance for the two to disagree.
             sweep=PreviewSweep(discovery_service, art_root=thumbnails.art_root),
-            acquisition=AcquisitionService(
-                catalogue_service,
-                acquisition or _default_acquisition(thumbnails.art_root),
-                # Defaults to a transport that refuses rather than to a live one.
-                # A plane assembled without wiring one has a wiring mistake, and
-                # a real client here would let that mistake reach a museum from a
-                # test suite instead of failing where it was made.
-                open_stream=open_stream or no_transport,
-                # Only a provider whose recorded URL is an identity needs one, and
-                # the museum client is the thing that can answer — so by default
-                # this is exactly the configured image provider. A deployment with
-                # none configured therefore has no resolver either, and an artic
-                # fetch refuses by name rather than handing the tile fetcher a URL
-                # it cannot read: without credentials to ask the collection for an
-                # object's image service, there is genuinely no way to reach it.
-                #
-                # Overridable because resolving one object and searching a whole
-                # collection are separate capabilities that today's one provider
-                # happens to serve both of.
-                tile_targets=(
-                    tile_targets
-                    if tile_targets is not None
-                    else ({} if image_search is None else {image_search.provider: image_search.tile_url})
-                ),
-                **({} if resolve is None else {"resolve": resolve}),
+            storage=storage_governor,
+            acquisition=acquisition_service,
+            acquisitions=AcquisitionQueue(
+                acquisition_service,
+                acquisition_queue or _default_acquisition_queue(),
             ),
             preparation=PreparationService(
                 catalogue_service,
@@ -272,8 +353,10 @@ class Services:
                 # dominant-colour mats. A real client here would let a wiring
                 # mistake spend money from a test suite rather than failing where
                 # it was made — the same reason `open_stream` defaults to refusing.
-                mat_engine or _default_mat_engine(),
+                mat_engine or _default_mat_engine(imaging),
                 preparation or _default_preparation(thumbnails.art_root, artwork_box),
+                warm=warmer.enqueue,
+                imaging=imaging,
             ),
             conversation=ConversationService(
                 discovery,
@@ -313,6 +396,51 @@ class Services:
         self.discovery.reconcile()
 
 
+def _storage_governor(
+    budgets: StorageBudgets,
+    *,
+    art_root: Path,
+    tile_cache: Path,
+    previews: Path | None,
+    thumbnails: Path,
+    museum_cache: Path | None,
+    acquisition: AcquisitionService,
+    runner: DiscoveryRunner,
+    discovery: DiscoveryService,
+) -> StorageGovernor:
+    """The governed caches, each with the rule for what in it must stay.
+
+    The rules are written here rather than in the governor because each is
+    another service's knowledge: which source is being fetched, whether a run is
+    writing previews, which previews an instance still names. The governor asks;
+    it is never told how to find out.
+    """
+
+    def fetched(entries: Sequence[Path]) -> Collection[Path]:
+        # A source's tiles are named by its id, and a fetch in flight reads and
+        # writes them.
+        running = acquisition.fetching()
+        return [entry for entry in entries if entry.name in running]
+
+    def named(entries: Sequence[Path]) -> Collection[Path]:
+        if runner.working():
+            # A run writes a preview before the row that names it, so while one
+            # is working an unnamed file may be about to be named.
+            return entries
+        relative = {str(entry.relative_to(art_root)): entry for entry in entries}
+        return [relative[path] for path in discovery.named_previews(list(relative))]
+
+    caches = [GovernedCache(TILE_CACHE_DIRNAME, tile_cache, budgets.tile_cache_bytes, by_directory=True, holds=fetched)]
+    if previews is not None:
+        caches.append(GovernedCache(PREVIEWS_DIRNAME, previews, budgets.previews_bytes, holds=named))
+    caches.append(GovernedCache(THUMBNAILS_DIRNAME, thumbnails, budgets.thumbnails_bytes))
+    if museum_cache is not None:
+        # Nothing held: an answer evicted mid-request is one the request has
+        # already read, and the next asks the museum again.
+        caches.append(GovernedCache(MUSEUM_CACHE_DIRNAME, museum_cache, budgets.museum_cache_bytes))
+    return StorageGovernor(caches)
+
+
 def _default_acquisition(art_root: Path) -> AcquisitionSettings:
     """Acquisition settings for a caller that expressed no preference.
 
@@ -333,7 +461,16 @@ def _default_acquisition(art_root: Path) -> AcquisitionSettings:
     )
 
 
-def _default_mat_engine() -> MatEngine:
+def _default_acquisition_queue() -> AcquisitionQueueSettings:
+    """The queue's shipped concurrency, for a plane bound without settings."""
+    return AcquisitionQueueSettings(
+        workers=DEFAULT_ACQUISITION_WORKERS,
+        tiled_workers=DEFAULT_ACQUISITION_TILED_WORKERS,
+        direct_workers=DEFAULT_ACQUISITION_DIRECT_WORKERS,
+    )
+
+
+def _default_mat_engine(imaging: ImagingPool) -> MatEngine:
     """A mat engine for a caller that wired no model client.
 
     **No client is a real deployment, not a stub.** A plane with no
@@ -341,7 +478,7 @@ def _default_mat_engine() -> MatEngine:
     acquired there get dominant-colour mats recorded as such. So the default is
     that deployment rather than something that would fail if used.
     """
-    return MatEngine(None, image_max_edge=DEFAULT_MAT_IMAGE_MAX_EDGE)
+    return MatEngine(None, image_max_edge=DEFAULT_MAT_IMAGE_MAX_EDGE, imaging=imaging)
 
 
 def _default_conversation_engine() -> ConversationEngine:
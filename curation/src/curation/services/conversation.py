@@ -29,7 +29,7 @@ only category intent-forming can produce.
 
 import logging
 import uuid
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
@@ -226,6 +226,16 @@ class ConversationView:
         return None
 
 
+@dataclass(frozen=True, slots=True)
+class AskedTurn:
+    """A question standing in its thread, not yet answered: what `ask` hands `answer`."""
+
+    #: The thread as it stood with the question in it — what the model is sent.
+    view: ConversationView
+    #: The curator's turn the answer is to, and what a failed answer's spend cites.
+    turn: ConversationTurn
+
+
 class ConversationService:
     """Threads, turns, and the one edge from intent-forming onto a run."""
 
@@ -279,7 +289,9 @@ class ConversationService:
         log.info("a conversation was started", extra={"event": "conversation.started", "conversation_id": conversation.id})
         return ConversationView(conversation=conversation, turns=())
 
-    def speak(self, conversation_id: str, text: str | None = None) -> ConversationView:
+    def speak(
+        self, conversation_id: str, text: str | None = None, *, on_text: Callable[[str], None] | None = None
+    ) -> ConversationView:
         """Ask something, or ask again for the answer to the last thing asked.
 
         **Retrying is asking for the answer, never re-sending the question**, and
@@ -295,6 +307,19 @@ class ConversationService:
         error would take the curator's question with it — the client would show a
         sentence and no thread — and the requirement is that a failed turn *stays*
         in the thread and is retryable.
+
+        `ask` and `answer` are the two halves, for a surface that streams: it
+        needs a refused question to be an ordinary refusal before the first piece
+        of the answer is sent, and cannot take it back afterwards.
+        """
+        return self.answer(self.ask(conversation_id, text), on_text=on_text)
+
+    def ask(self, conversation_id: str, text: str | None = None) -> AskedTurn:
+        """Put the question in the thread, or find the one standing unanswered.
+
+        Raises `ServiceError` for an unknown thread, a blank question, or a retry
+        with nothing to retry — everything `speak` refuses is refused here, and
+        nothing has been spent by then.
         """
         view = self.get(conversation_id)
         if text is None or not text.strip():
@@ -304,22 +329,33 @@ class ConversationService:
                     "There is nothing to retry: the last turn in this conversation was answered. "
                     "Send some text to ask something new."
                 )
-        else:
-            asking = self._append(view, role=TurnRole.CURATOR, text=require_text(text, field="text"))
-            view = self.get(conversation_id)
+            return AskedTurn(view=view, turn=asking)
+        asking = self._append(view, role=TurnRole.CURATOR, text=require_text(text, field="text"))
+        return AskedTurn(view=self.get(conversation_id), turn=asking)
 
+    def answer(self, asked: AskedTurn, *, on_text: Callable[[str], None] | None = None) -> ConversationView:
+        """Answer a turn `ask` put in the thread, and record what it cost.
+
+        `on_text` is given the reply's text piece by piece as it is generated.
+        What is recorded is the whole reply once it is in, so a curator who
+        watched it arrive and one who reloads afterwards read the same turn.
+        """
+        view = asked.view
+        conversation_id = view.conversation.id
         unavailable = self._engine.unavailable_reason
         if unavailable is not None:
             return _with_failure(view, unavailable)
         try:
-            reply = self._engine.answer([ThreadTurn(role=turn.turn.role, text=turn.turn.text) for turn in view.turns])
+            reply = self._engine.answer(
+                [ThreadTurn(role=turn.turn.role, text=turn.turn.text) for turn in view.turns], on_text=on_text
+            )
         except ConversationFailure as exc:
             # The spend still lands. A 2xx that could not be read was billed, and
             # a month total that omitted exactly the failures would under-report
             # by what they cost — the failure this ledger exists to prevent. The
             # curator's turn is what it attributes to, because that is the turn
             # that was paid for.
-            self._record(exc.spend, turn_id=asking.id)
+            self._record(exc.spend, turn_id=asked.turn.id)
             log.info(
                 "a conversation turn could not be answered",
                 extra={"event": "conversation.failed", "conversation_id": conversation_id, "detail": str(exc)},
@@ -26,13 +26,14 @@ core keeps this logic testable without an event loop.
 
 import logging
 import uuid
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 from contextlib import AbstractContextManager
 from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from decimal import Decimal
+from typing import Final
 
-from curation.discovery.dedup import clean_name, work_dedup_key
+from curation.discovery.dedup import RULES_VERSION, clean_name, work_dedup_key
 from curation.persistence.discovery import DiscoveryStore
 from curation.persistence.discovery_records import (
     CandidateImage,
@@ -59,6 +60,11 @@ from curation.services.store import store_write
 
 log = logging.getLogger(__name__)
 
+#: The verdicts after which nobody is judging a work, spelled out for the store
+#: queries that need them as values. Derived from `Verdict.is_terminal` rather
+#: than restated, so the sweep and the state machine cannot disagree about it.
+_DECIDED_VERDICTS: Final[frozenset[Verdict]] = frozenset(verdict for verdict in Verdict if verdict.is_terminal)
+
 
 @dataclass(frozen=True, slots=True)
 class VerdictOutcome:
@@ -146,6 +152,34 @@ class RunCost:
     total: Decimal
 
 
+@dataclass(frozen=True, slots=True)
+class Proposal:
+    """One work for `DiscoveryService.propose_works`, carrying what `propose_work` takes."""
+
+    proposed_title: str
+    rationale: str
+    work_dedup_key: str
+    proposed_artist: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FoundInstance:
+    """One instance for `DiscoveryService.record_images`, carrying what `record_image` takes."""
+
+    url: str
+    provider: str
+    source_class: SourceClass
+    acquisition_method: AcquisitionMethod
+    confidence: float
+    preview_url: str | None = None
+    preview_path: str | None = None
+    estimated_width: int | None = None
+    estimated_height: int | None = None
+    rights_status: RightsStatus | None = None
+    quality_score: float | None = None
+    selection_rationale: str | None = None
+
+
 class DiscoveryService:
     """Read and write the pre-acceptance pipeline."""
 
@@ -159,6 +193,10 @@ class DiscoveryService:
         #: Optional so a caller with no deployment geometry gets the ranking
         #: without a floor rather than a constructor it cannot satisfy.
         self._artwork_box = artwork_box
+        #: The held artists keyed once for every acceptance, rather than once
+        #: per acceptance: a batch accepted from the review grid resolves each
+        #: work's painter against the same table.
+        self._attribution = attribution.AttributionIndex()
 
     def transaction(self) -> AbstractContextManager[None]:
         """Apply a rule that spans several of this service's operations, atomically.
@@ -454,7 +492,12 @@ class DiscoveryService:
                     # deleting its rows: the join records what the run's scope
                     # was, and that stays true after the run has ended.
                     store_write(self._store.update_run, self._ended(run, RunStatus.INTERRUPTED))
-            self._reclean_proposed_titles()
+            # The run repair above is a scan of live states and costs nothing on
+            # a quiet file; the re-clean is a walk of every candidate row, and
+            # owes nothing unless the rules moved since it last ran.
+            if self._store.dedup_rules_applied() != RULES_VERSION:
+                self._reclean_proposed_titles()
+                store_write(self._store.record_dedup_rules_applied, RULES_VERSION)
 
     def _reclean_proposed_titles(self) -> None:
         """Re-clean every stored title, and re-key any the cleaning changed.
@@ -470,13 +513,18 @@ class DiscoveryService:
         Recomputing here rather than in a one-off script is what makes the
         obligation self-discharging: the derivation's own account of itself says
         that changing it against a populated catalogue owes a re-key, and a script
-        pays that debt once while this pays it every time. It is idempotent and
-        almost always a no-op, which is what makes it safe to run at every start.
-
-        The cost is one walk of a household's candidate rows, in the transaction
-        the run repair above already opened — so a start either applies both
-        repairs or neither, and a failure here is retried next start rather than
-        leaving the catalogue half-repaired with nothing recording which half.
+        pays that debt once while this pays it every time the rules change. It is
+        idempotent, so running it against rows already current is harmless.
+
+        **It runs once per version of the rules, not at every start.** The cost is
+        one walk of a household's candidate rows, and `reconcile` pays it only
+        when the file's record of which rules it was last walked under differs
+        from `RULES_VERSION` — a digest of `dedup.py` itself, so editing a rule is
+        all it takes to owe one more walk. The walk and the record of it share the
+        transaction the run repair already opened, so a start either applies
+        every repair and says so or applies none, and a failure here is retried
+        next start rather than leaving the catalogue half-repaired with nothing
+        recording which half.
 
         Deliberately not a verdict-preserving merge. Two rows whose keys converge
         stay two rows — suppression reads every row sharing a key and asks whether
@@ -588,7 +636,29 @@ class DiscoveryService:
         exists because the rule is "unless the curator explicitly reconsiders it"
         — a decision they are allowed to revisit, but never by accident.
         """
-        key = require_text(work_dedup_key, field="work_dedup_key")
+        (work,) = self.propose_works(
+            run_id=run_id,
+            works=[
+                Proposal(
+                    proposed_title=proposed_title,
+                    rationale=rationale,
+                    work_dedup_key=work_dedup_key,
+                    proposed_artist=proposed_artist,
+                )
+            ],
+            reconsider=reconsider,
+        )
+        return work
+
+    def propose_works(self, *, run_id: str, works: Sequence[Proposal], reconsider: bool = False) -> Sequence[CandidateWork]:
+        """Record every work phase 1 proposed as one write, returned in the order given.
+
+        `propose_work` for a whole work list, under the same rules: the run is
+        checked once, every work is checked for suppression, and one the curator
+        has declined refuses the batch — nothing is written unless everything can
+        be. A caller wanting the declined works skipped rather than refused, as
+        the runner does, filters them with `is_work_suppressed` first.
+        """
         with self._store.transaction():
             # Kind before status: a resolve run is never in `resolving_works`, so
             # the status refusal would reach it first and answer a question it did
@@ -599,21 +669,27 @@ class DiscoveryService:
                     "rather than proposing new ones."
                 )
             self._require_status(run_id, RunStatus.RESOLVING_WORKS, doing="propose works")
-            if not reconsider and self.is_work_suppressed(key):
-                raise ServiceError(
-                    f"{proposed_title!r} has already been proposed and rejected. "
-                    "Pass reconsider=True to propose it again deliberately."
+            proposed: list[CandidateWork] = []
+            for proposal in works:
+                key = require_text(proposal.work_dedup_key, field="work_dedup_key")
+                if not reconsider and self.is_work_suppressed(key):
+                    raise ServiceError(
+                        f"{proposal.proposed_title!r} has already been proposed and rejected. "
+                        "Pass reconsider=True to propose it again deliberately."
+                    )
+                proposed.append(
+                    CandidateWork(
+                        id=str(uuid.uuid4()),
+                        discovery_run_id=run_id,
+                        proposed_title=require_text(proposal.proposed_title, field="proposed_title"),
+                        rationale=require_text(proposal.rationale, field="rationale"),
+                        work_dedup_key=key,
+                        proposed_artist=proposal.proposed_artist,
+                    )
                 )
-            work = CandidateWork(
-                id=str(uuid.uuid4()),
-                discovery_run_id=run_id,
-                proposed_title=require_text(proposed_title, field="proposed_title"),
-                rationale=require_text(rationale, field="rationale"),
-                work_dedup_key=key,
-                proposed_artist=proposed_artist,
-            )
-            store_write(self._store.add_candidate_work, work)
-        return work
+            if proposed:
+                store_write(self._store.add_candidate_work_many, proposed)
+        return proposed
 
     def offer_work(
         self,
@@ -780,9 +856,42 @@ class DiscoveryService:
         provider re-offering the same URL is the normal case rather than the
         exotic one.
         """
+        recorded = self.record_images(
+            candidate_work_id,
+            [
+                FoundInstance(
+                    url=url,
+                    provider=provider,
+                    source_class=source_class,
+                    acquisition_method=acquisition_method,
+                    confidence=confidence,
+                    preview_url=preview_url,
+                    preview_path=preview_path,
+                    estimated_width=estimated_width,
+                    estimated_height=estimated_height,
+                    rights_status=rights_status,
+                    quality_score=quality_score,
+                    selection_rationale=selection_rationale,
+                )
+            ],
+        )
+        return recorded[0] if recorded else None
+
+    def record_images(self, candidate_work_id: str, instances: Sequence[FoundInstance]) -> Sequence[CandidateImage]:
+        """Record every instance one search found for a work, as one write.
+
+        `record_image` for a batch, and it answers each instance exactly as that
+        would have answered it recorded alone and in order: a URL already held —
+        before the batch, or earlier in it — returns the row already there; the
+        first instance that survives and is not below the floor becomes the
+        selection, unless the work already has one. The instances that are new
+        are then written as one statement.
+
+        Empty, with nothing written, when the curator has already decided the
+        work — the same decline `record_image` makes, for the same reason.
+        """
         with self._store.transaction():
             work = self.get_candidate_work(candidate_work_id)
-            found_at = require_text(url, field="url")
             if work.verdict.is_terminal:
                 # A decided work's images are no longer under review — the same
                 # ground `reject_image` refuses on. On an accepted work they
@@ -797,41 +906,56 @@ class DiscoveryService:
                     work.proposed_title,
                     extra={"event": "image.work_decided", "verdict": str(work.verdict)},
                 )
-                return None
-            held = self._store.list_candidate_images(work.id)
-            already = next((instance for instance in held if instance.url == found_at), None)
-            if already is not None:
-                log.info(
-                    "an instance of %r was offered again at a URL the work already holds; keeping the one on record",
-                    work.proposed_title,
-                    extra={"event": "image.already_held", "rejected": already.rejected_at is not None},
+                return ()
+            held = {instance.url: instance for instance in self._store.list_candidate_images(work.id)}
+            selected = any(instance.is_selected for instance in held.values())
+            recorded: list[CandidateImage] = []
+            added: list[CandidateImage] = []
+            for found in instances:
+                found_at = require_text(found.url, field="url")
+                already = held.get(found_at)
+                if already is not None:
+                    log.info(
+                        "an instance of %r was offered again at a URL the work already holds; keeping the one on record",
+                        work.proposed_title,
+                        extra={"event": "image.already_held", "rejected": already.rejected_at is not None},
+                    )
+                    recorded.append(already)
+                    continue
+                image = CandidateImage(
+                    id=str(uuid.uuid4()),
+                    candidate_work_id=work.id,
+                    url=found_at,
+                    provider=require_text(found.provider, field="provider"),
+                    source_class=require_member(found.source_class, enum=SourceClass, field="source_class"),
+                    acquisition_method=require_member(
+                        found.acquisition_method, enum=AcquisitionMethod, field="acquisition_method"
+                    ),
+                    confidence=found.confidence,
+                    is_selected=False,
+                    preview_url=found.preview_url,
+                    preview_path=None if found.preview_path is None else relative_path(found.preview_path, field="preview_path"),
+                    estimated_width=found.estimated_width,
+                    estimated_height=found.estimated_height,
+                    rights_status=(
+                        None
+                        if found.rights_status is None
+                        else require_member(found.rights_status, enum=RightsStatus, field="rights_status")
+                    ),
+                    quality_score=found.quality_score,
+                    selection_rationale=found.selection_rationale,
                 )
-                return already
-            image = CandidateImage(
-                id=str(uuid.uuid4()),
-                candidate_work_id=work.id,
-                url=found_at,
-                provider=require_text(provider, field="provider"),
-                source_class=require_member(source_class, enum=SourceClass, field="source_class"),
-                acquisition_method=require_member(acquisition_method, enum=AcquisitionMethod, field="acquisition_method"),
-                confidence=confidence,
-                is_selected=False,
-                preview_url=preview_url,
-                preview_path=None if preview_path is None else relative_path(preview_path, field="preview_path"),
-                estimated_width=estimated_width,
-                estimated_height=estimated_height,
-                rights_status=(
-                    None if rights_status is None else require_member(rights_status, enum=RightsStatus, field="rights_status")
-                ),
-                quality_score=quality_score,
-                selection_rationale=selection_rationale,
-            )
-            # Decided from the built row rather than from the arguments, so the
-            # floor is evaluated against exactly the dimensions being stored.
-            claimed = not any(other.is_selected for other in held) and not self._below_floor(image)
-            image = replace(image, is_selected=claimed)
-            store_write(self._store.add_candidate_image, image)
-        return image
+                # Decided from the built row rather than from the arguments, so the
+                # floor is evaluated against exactly the dimensions being stored.
+                claimed = not selected and not self._below_floor(image)
+                image = replace(image, is_selected=claimed)
+                selected = selected or claimed
+                held[found_at] = image
+                recorded.append(image)
+                added.append(image)
+            if added:
+                store_write(self._store.add_candidate_image_many, added)
+        return recorded
 
     def select_image(self, candidate_image_id: str, *, rationale: str | None = None) -> CandidateImage:
         """Make this instance the one that represents its work, and the only one.
@@ -881,6 +1005,34 @@ class DiscoveryService:
             store_write(self._store.update_candidate_image, forgotten)
         return forgotten
 
+    def reclaimable_previews(self, *, after: str = "", limit: int) -> Sequence[CandidateImage]:
+        """The instances naming previews only decided works still reference, a batch of paths at a time.
+
+        At most `limit` paths, each after `after` in path order, with every
+        instance naming each — which is everything `forget_preview` needs to
+        clear them, and nothing it would refuse. A path any work still under
+        review names is not offered at all, because the unit of reclamation is
+        the file and the file is still wanted.
+
+        One indexed question rather than a walk of every run, work and instance:
+        the catalogue only grows, and a sweep that cost a query per row was a
+        timer job whose price rose with every run a curator had ever started.
+        """
+        return self._store.list_reclaimable_previews(decided=_DECIDED_VERDICTS, after=after, limit=limit)
+
+    def count_retained_previews(self) -> int:
+        """How many preview paths a work still under review holds in place."""
+        return self._store.count_retained_previews(decided=_DECIDED_VERDICTS)
+
+    def named_previews(self, paths: Collection[str]) -> Collection[str]:
+        """Which of these preview paths any instance still names, decided or not.
+
+        For a caller reclaiming files by something other than verdict: a named
+        file is either still shown by review or is the sweep's to reclaim with
+        its rows, and in neither case is it anyone else's to delete.
+        """
+        return self._store.list_named_previews(paths)
+
     def reject_image(self, candidate_image_id: str) -> CandidateWork:
         """Turn down an instance and ask for a better one. The work stays wanted.
 
@@ -1159,7 +1311,10 @@ class DiscoveryService:
         # Resolved before the artwork is minted, because `add_artwork` refuses an
         # `artist_id` the catalogue does not hold — so the row has to exist first,
         # and both writes have to land inside the transaction this runs in.
-        attributed = attribution.resolve(work.proposed_artist, self._catalogue.list_artists())
+        held = self._attribution.held(
+            generation=self._catalogue.generation(), rules=RULES_VERSION, artists=self._catalogue.list_artists
+        )
+        attributed = held.resolve(work.proposed_artist)
         minted: Artist | None = None
         if attributed.mint is not None:
             minted = self._catalogue.add_artist(name=attributed.mint)
@@ -553,12 +553,20 @@ class DisplayService:
         than relying on the refusal to make the ambiguity moot. Callers hold this
         inside a transaction, which is what turns that refusal into a rollback
         rather than a half-renumbered order.
+
+        Every entry whose place changed is written in one batch: moving the last
+        of two hundred works to the front changes all two hundred positions, and
+        one statement bound two hundred times is far cheaper than two hundred
+        statements.
         """
+        moved: list[ThemeMembership] = []
         for place, entry in enumerate(order):
             if entry is new:
                 store_write(self._store.add_membership, replace(entry, position=place))
             elif entry.position != place:
-                store_write(self._store.update_membership, replace(entry, position=place))
+                moved.append(replace(entry, position=place))
+        if moved:
+            store_write(self._store.update_membership_many, moved)
 
     def remove_from_theme(self, *, theme_id: str, artwork_id: str) -> None:
         """Take a work out of a theme. The work itself is untouched."""
@@ -36,8 +36,14 @@ from pathlib import Path
 
 from curation.persistence import backup
 from curation.persistence.backup import BackupReading
+from curation.persistence.profiler import StatementProfiler, StoreProfile
+from curation.persistence.records import OriginalsFootprint
+from curation.providers import ProviderGuard, ProvidersReading
+from curation.services.catalogue import CatalogueService
 from curation.services.display import DisplayService, WallHeartbeat, describe_wall_status
 from curation.services.display_fit import ArtworkBox
+from curation.services.imaging_pool import ImagingPool, ImagingProfile
+from curation.services.storage import StorageGovernor, StorageReading
 
 
 @dataclass(frozen=True, slots=True)
@@ -60,6 +66,30 @@ class HealthReading:
     #: the grid, which reads as a catalogue problem rather than a configuration
     #: one.
     artwork_box: ArtworkBox
+    #: What the catalogue's SQL has cost since the process started, costliest
+    #: shape first. None when profiling is off, which is the default — and said
+    #: as None rather than as an empty table, because "nothing has been timed"
+    #: and "nothing has been slow" are different facts and only one is true.
+    statements: StoreProfile | None = None
+    #: The imaging pool's queue and what each kind of decode has cost. None only
+    #: for a service built without a pool; the plane always has one, and counts
+    #: even when it runs work inline.
+    imaging: ImagingProfile | None = None
+    #: How full each cache directory is against its budget, and what has been
+    #: evicted to keep it there. As of the governor's last pass rather than
+    #: now: measuring a directory is a walk of it, which a page load should
+    #: not cost. None only for a service built without a governor.
+    storage: StorageReading | None = None
+    #: What the held originals weigh, and what holding each distinct image once
+    #: saves over a file per work. Counted off the catalogue on every read — one
+    #: aggregate over a table of a few thousand rows — rather than off the disk,
+    #: so it says what the rows name and not what a sync has since made of it.
+    originals: OriginalsFootprint | None = None
+    #: Every host the process has asked, whether it is being asked now, and
+    #: what its last failure was. Read as held rather than probed: a host
+    #: nothing has asked since the process started is simply absent. None only
+    #: for a service built without a guard.
+    providers: ProvidersReading | None = None
 
     def describe(self) -> str:
         """One sentence across every wall, from the readings this panel holds.
@@ -75,7 +105,18 @@ class HealthReading:
 class HealthService:
     """Gather what the panel states. Decides nothing about any of it."""
 
-    def __init__(self, display: DisplayService, *, backup_receipt_path: Path, box: ArtworkBox) -> None:
+    def __init__(
+        self,
+        display: DisplayService,
+        *,
+        backup_receipt_path: Path,
+        box: ArtworkBox,
+        profiler: StatementProfiler | None = None,
+        imaging: ImagingPool | None = None,
+        storage: StorageGovernor | None = None,
+        catalogue: CatalogueService | None = None,
+        providers: ProviderGuard | None = None,
+    ) -> None:
         self._display = display
         #: Where the backup job records that it succeeded. Passed in rather than
         #: resolved here, for the reason every settings object in this layer
@@ -83,6 +124,13 @@ class HealthService:
         #: against two deployments and would make every caller share one.
         self._backup_receipt_path = backup_receipt_path
         self._box = box
+        #: The same profiler the catalogue file was opened with, or None when
+        #: the deployment did not ask for one.
+        self._profiler = profiler
+        self._imaging = imaging
+        self._storage = storage
+        self._catalogue = catalogue
+        self._providers = providers
 
     def observe(self) -> HealthReading:
         """Read every signal the panel shows, now.
@@ -96,4 +144,9 @@ class HealthService:
             walls=self._display.survey_wall_status(),
             backup=backup.read(self._backup_receipt_path),
             artwork_box=self._box,
+            statements=None if self._profiler is None else self._profiler.snapshot(),
+            imaging=None if self._imaging is None else self._imaging.profile(),
+            storage=None if self._storage is None else self._storage.reading(),
+            originals=None if self._catalogue is None else self._catalogue.measure_originals(),
+            providers=None if self._providers is None else self._providers.reading(),
         )
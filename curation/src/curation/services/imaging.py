@@ -1,7 +1,7 @@
-"""The one downscale this product does, so its two callers cannot drift apart.
+"""The one downscale this product does, so its callers cannot drift apart.
 
 Thumbnails and inline previews want the same twelve lines — open, decode at a
-reduced scale, respect EXIF rotation, flatten to RGB, resample, encode JPEG — and
+reduced scale, respect EXIF rotation, flatten to RGB, resample, encode — and
 differ only in the numbers they pass and what they do when it fails. Those
 differences are real and stay with the callers. The decode is not, and keeping two
 copies of it is how one acquires a fix the other does not: the copies had already
@@ -16,7 +16,7 @@ behaviour here would make the wrong one right somewhere.
 """
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
@@ -28,9 +28,10 @@ from curation.services.errors import ServiceError
 
 log = logging.getLogger(__name__)
 
-#: JPEG, always. Both callers produce something a client renders immediately
-#: rather than an archival copy, and the source is already whatever the museum
-#: served — re-encoding to a second format would cost a decision nobody needs.
+#: JPEG unless a caller names another. Everything here produces something a
+#: client renders immediately rather than an archival copy, and JPEG is the one
+#: format every client renders. A second format is the caller's decision to make
+#: and to pay for — the thumbnail ladder makes it, for WebP.
 _FORMAT: Final[str] = "JPEG"
 
 
@@ -59,18 +60,53 @@ def encode_downscaled(source: Path, *, max_edge: int, quality: int) -> EncodedFr
     mean to answer for.
     """
     with Image.open(source) as image:
-        # Decodes at a reduced DCT scale — up to eight times smaller per axis —
-        # so a 47-megapixel master never becomes a 47-megapixel bitmap in memory
-        # on its way to a few hundred pixels. A no-op for formats without it.
-        image.draft("RGB", (max_edge, max_edge))
-        upright = ImageOps.exif_transpose(image) or image
-        # CMYK and greyscale scans both appear in museum downloads, and neither
-        # saves as a JPEG every client renders the same way.
-        frame = upright.convert("RGB")
+        frame = _upright(image, max_edge)
         frame.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
-        buffer = BytesIO()
-        frame.save(buffer, format=_FORMAT, quality=quality, optimize=True)
-        width, height = frame.size
+        return _encoded(frame, _FORMAT, quality)
+
+
+def encode_ladder(source: Path, *, max_edges: Sequence[int], qualities: Mapping[str, int]) -> dict[int, dict[str, EncodedFrame]]:
+    """Decode `source` once and encode it at every edge in every format named.
+
+    `qualities` maps a Pillow format name to the quality it is saved at. The
+    answer is keyed by edge and then by format.
+
+    **One decode for the whole ladder**, which is the point of asking for it
+    this way: the decode is what costs on a gigapixel master, and three sizes in
+    two formats asked for separately would pay it six times. Each smaller size
+    is resampled from the one above it rather than from the source — an image
+    already at 960 px is a far cheaper input to 480 than the source was, and
+    LANCZOS between adjacent sizes loses nothing a grid can show.
+
+    Raises what `encode_downscaled` raises, on the same terms.
+    """
+    edges = sorted(set(max_edges), reverse=True)
+    ladder: dict[int, dict[str, EncodedFrame]] = {}
+    with Image.open(source) as image:
+        frame = _upright(image, edges[0])
+        for edge in edges:
+            frame.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+            ladder[edge] = {codec: _encoded(frame, codec, quality) for codec, quality in qualities.items()}
+    return ladder
+
+
+def _upright(image: Image.Image, max_edge: int) -> Image.Image:
+    """The image as a viewer sees it, in RGB, decoded no larger than it need be."""
+    # Decodes at a reduced DCT scale — up to eight times smaller per axis — so a
+    # 47-megapixel master never becomes a 47-megapixel bitmap in memory on its
+    # way to a few hundred pixels. A no-op for formats without it.
+    image.draft("RGB", (max_edge, max_edge))
+    upright = ImageOps.exif_transpose(image) or image
+    # CMYK and greyscale scans both appear in museum downloads, and neither saves
+    # as a JPEG every client renders the same way.
+    return upright.convert("RGB")
+
+
+def _encoded(frame: Image.Image, codec: str, quality: int) -> EncodedFrame:
+    buffer = BytesIO()
+    # `optimize` is JPEG's extra Huffman pass; WebP takes the keyword and ignores it.
+    frame.save(buffer, format=codec, quality=quality, optimize=True)
+    width, height = frame.size
     return EncodedFrame(data=buffer.getvalue(), width=width, height=height)
 
 
@@ -91,12 +127,28 @@ def measure(source: Path) -> tuple[int, int]:
     same terms as `encode_downscaled` above.
     """
     with Image.open(source) as image:
-        width, height = image.size
-        # `exif_transpose` would decode; the orientation tag alone answers the
-        # question, and values 5 through 8 are the four that transpose the axes.
-        orientation = image.getexif().get(0x0112)
-        if orientation in (5, 6, 7, 8):
-            width, height = height, width
+        return _displayed_size(image)
+
+
+def measure_head(head: bytes) -> tuple[int, int]:
+    """`measure`, from the first bytes of a file rather than the file.
+
+    For a caller that kept the start of a file as it was written and would
+    otherwise open it again only to read the header. A head that stops short of
+    the header raises as a truncated file does, and the caller falls back to
+    `measure`; it never answers with a size the whole file would not.
+    """
+    with Image.open(BytesIO(head)) as image:
+        return _displayed_size(image)
+
+
+def _displayed_size(image: Image.Image) -> tuple[int, int]:
+    width, height = image.size
+    # `exif_transpose` would decode; the orientation tag alone answers the
+    # question, and values 5 through 8 are the four that transpose the axes.
+    orientation = image.getexif().get(0x0112)
+    if orientation in (5, 6, 7, 8):
+        width, height = height, width
     return width, height
 
 
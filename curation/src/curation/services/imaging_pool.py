@@ -0,0 +1,401 @@
+"""Every decode and encode this plane does, on processes of their own.
+
+Pillow work used to run on whichever thread asked for it: a grid's thumbnail on
+an HTTP worker, a canvas on the runner, a mat colour on whatever called
+`prepare`, a master stitched from its tiles on the acquisition thread. A
+gigapixel master decoded there holds that thread — and the memory it decodes
+into — for as long as the decode takes, so one large acquisition
+could leave the surface unable to answer a poll, and one image engineered to
+exhaust memory could take the whole plane with it.
+
+**One pool for all of it, sized to the machine.** Each call site names what it
+is doing and hands the work here; the work runs on a worker process and the
+caller waits for the answer exactly as it waited for the decode before, so no
+caller's failure posture changes. What changes is where the cost lands: a decode
+no longer competes with the surface for the interpreter, and a queue of them
+waits its turn rather than fanning out across every request thread at once.
+
+**Each worker has ceilings, and breaching one is an answer rather than an
+outage.** A worker's address space is capped, so a decode that would have grown
+past it raises `MemoryError` in the worker instead of inviting the kernel to
+choose a victim — which on a Pi is as likely to be the server as the decode.
+Each task's CPU time is capped too, twice over. Past the first ceiling the task
+is interrupted, which reaches Python code at once and a codec only when it next
+returns to the interpreter; a few seconds past that the kernel kills the worker,
+which reaches a decode stuck inside Pillow's C as well. Because a hard ceiling
+once lowered cannot be raised again, each worker runs one task and is replaced.
+Both come back to the caller as `ImagingAborted`, which each caller answers the way it
+already answered an image that would not decode. A killed worker breaks the
+executor for every task in flight, so a task that had not started, or had not
+run long enough to have spent its own allowance, is given one more worker
+rather than blamed for another task's image. Pillow's own decompression-bomb
+refusal still happens first, in the worker, and still arrives by its own name;
+the ceilings are what contain the image that slips under it.
+
+**Off, the pool is the calling thread.** `workers=0` runs every task where it
+is asked, with the figures still kept and no ceiling applied — which is what a
+test suite wants, and what every service falls back to when it is built without
+a pool. Only the entry point asks for processes.
+
+**What it reports** is the queue and the cost per kind of work, read by the
+health panel: how many tasks are waiting or running, and for each kind how many
+ran, how long they waited for a worker, and how long they took once they had
+one. Waiting and working are apart for the reason the statement profiler keeps
+them apart — they have different fixes.
+"""
+
+import logging
+import math
+import os
+import resource
+import shutil
+import signal
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from multiprocessing import get_context
+from pathlib import Path
+from types import FrameType
+from typing import Final
+
+from curation import logs
+
+log = logging.getLogger(__name__)
+
+#: A worker's address-space ceiling when a deployment has not said. Generous
+#: beside what a legitimate task needs — the largest master this plane assembles
+#: is 8192 px square, some 200 MB decoded — and well inside a Pi's memory, so a
+#: worker that reaches it is one that was never going to finish.
+DEFAULT_IMAGING_MEMORY_MB: Final[int] = 2048
+
+#: A task's CPU ceiling when a deployment has not said. A canvas composed from a
+#: 47-megapixel master is the slowest thing here and takes seconds on a Pi; two
+#: minutes is a decode that is not making progress.
+DEFAULT_IMAGING_TASK_SECONDS: Final[int] = 120
+
+#: CPU seconds past a task's ceiling before the kernel kills its worker. Time
+#: enough for Python code to take the interruption and answer; a task still
+#: running at the end of it is inside C, where the interruption never lands.
+_KILL_GRACE_SECONDS: Final[int] = 3
+
+#: How workers are started. Not `fork`: the server forks from a process holding
+#: threads and an open SQLite connection, and a child inheriting a lock some other
+#: thread held at the instant of the fork waits on it forever. `forkserver` forks
+#: from a clean single-threaded process instead, and is what 3.14 defaults to.
+_START_METHOD: Final[str] = "forkserver"
+
+#: The CPU ceiling in force in this worker, for the message that reports it.
+#: Set once by the initializer; a worker process runs one task and exits.
+_task_seconds: int = DEFAULT_IMAGING_TASK_SECONDS
+
+
+class ImagingAborted(Exception):
+    """A task was stopped before it finished: a ceiling, or its worker dying.
+
+    Not a `ServiceError`: callers answer it in their own terms — a thumbnail
+    that is unavailable, a preview that does not travel, a fetch recorded as
+    failed — exactly as they answer an image that would not decode. The message
+    says which ceiling, and is written to be passed on.
+    """
+
+
+@dataclass(frozen=True, slots=True)
+class ImagingKindProfile:
+    """What one kind of imaging work has cost since the pool was built."""
+
+    kind: str
+    calls: int
+    #: Calls that raised, a ceiling included. Counted rather than excluded from
+    #: the timings: a decode that fails after ten seconds cost ten seconds.
+    failed: int
+    #: Time from being handed to the pool to a worker starting on it, summed.
+    wait_ms: float
+    #: Time a worker spent on it, summed.
+    run_ms: float
+    max_run_ms: float
+
+    @property
+    def mean_wait_ms(self) -> float:
+        return self.wait_ms / self.calls if self.calls else 0.0
+
+    @property
+    def mean_run_ms(self) -> float:
+        return self.run_ms / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class ImagingProfile:
+    """The pool's figures, read at one instant."""
+
+    since: datetime
+    #: Worker processes, or zero when work runs on the calling thread.
+    workers: int
+    #: Tasks handed to the pool and not yet answered, running ones included.
+    in_flight: int
+    #: Costliest first, by total time on a worker.
+    kinds: Sequence[ImagingKindProfile]
+
+    @property
+    def queued(self) -> int:
+        """Tasks waiting for a worker: what is in flight beyond one per worker."""
+        return max(0, self.in_flight - max(self.workers, 1))
+
+
+@dataclass(slots=True)
+class _Tally:
+    """The running figures for one kind. Mutable; never leaves this module."""
+
+    calls: int = 0
+    failed: int = 0
+    waited: float = 0.0
+    ran: float = 0.0
+    worst: float = 0.0
+
+
+class ImagingPool:
+    """Run imaging work on a bounded set of worker processes, and count what it costs."""
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        memory_mb: int = DEFAULT_IMAGING_MEMORY_MB,
+        task_seconds: int = DEFAULT_IMAGING_TASK_SECONDS,
+    ) -> None:
+        if workers < 0:
+            raise ValueError(f"An imaging pool needs zero or more workers, got {workers}.")
+        if memory_mb <= 0 or task_seconds <= 0:
+            raise ValueError(f"Imaging ceilings must be positive, got {memory_mb} MB and {task_seconds}s.")
+        self._workers = workers
+        self._memory_mb = memory_mb
+        self._task_seconds = task_seconds
+        self._since = datetime.now(UTC)
+        self._guard = threading.Lock()
+        self._tallies: dict[str, _Tally] = {}
+        self._in_flight = 0
+        #: Built on first use rather than here, so a plane that never decodes
+        #: never starts a process — and rebuilt when a worker dies, because a
+        #: `ProcessPoolExecutor` that has lost one refuses everything after.
+        self._executor: ProcessPoolExecutor | None = None
+        #: Where each task marks that a worker has started it. Made with the
+        #: first executor, and read only when one breaks — see `_on_a_worker`.
+        self._marks: Path | None = None
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def run[**P, T](self, kind: str, task: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run `task` on a worker and return what it returns, or raise what it raised.
+
+        `kind` names the work for the figures — `thumbnail`, `compose`, and so
+        on. `task` and its arguments cross a process boundary, so the task must
+        be a module-level function and its arguments picklable; a bound method
+        or a lambda is refused by the pickler before any worker sees it.
+        """
+        submitted = time.monotonic()
+        with self._guard:
+            self._in_flight += 1
+        # Charged as all running until the worker says otherwise. A task that
+        # raised in a worker took its own start time with it, so the whole span
+        # is the honest upper bound on what it cost.
+        started = submitted
+        failed = True
+        try:
+            if self._workers == 0:
+                started, finished, result = _timed(task, args, kwargs, limit=False)
+            else:
+                started, finished, result = self._on_a_worker(kind, task, args, kwargs)
+            failed = False
+        finally:
+            if failed:
+                finished = time.monotonic()
+            self._record(kind, waited=started - submitted, ran=finished - started, failed=failed)
+        return result
+
+    def _on_a_worker[T](self, kind: str, task: Callable[..., T], args: tuple, kwargs: dict) -> tuple[float, float, T]:
+        """Run one task on a worker, once more on fresh workers if it was a bystander.
+
+        A worker that dies — the kernel's OOM killer, its CPU ceiling reached
+        inside C, a segfault in a codec — breaks the whole executor, and every
+        task in flight on it is answered with the same `BrokenProcessPool`,
+        including a thumbnail still queued behind the image that did it. So the
+        executor is replaced and each task asks whether it could have been the
+        one that died: one no worker had started, or one started too recently
+        to have used its CPU allowance, was somebody else's casualty and runs
+        again. The rest are reported as stopped, and so is a bystander whose
+        second try breaks too.
+        """
+        for attempt in (1, 2):
+            executor, marks = self._executor_now()
+            mark = marks / uuid.uuid4().hex
+            try:
+                return executor.submit(_timed, task, args, kwargs, mark=mark).result()
+            except BrokenProcessPool as exc:
+                self._replace(executor)
+                if attempt == 2 or self._could_have_died_of_itself(mark):
+                    raise ImagingAborted(f"The imaging worker running this {kind} stopped unexpectedly.") from exc
+                log.info(
+                    "an imaging task was caught in another's broken worker and runs again",
+                    extra={"event": "imaging.task_retried", "kind": kind},
+                )
+            finally:
+                mark.unlink(missing_ok=True)
+        raise AssertionError("unreachable: the second attempt returns or raises")
+
+    def _could_have_died_of_itself(self, mark: Path) -> bool:
+        """Whether a task had been on a worker long enough to reach its own ceiling.
+
+        By wall time since a worker started it, which a task on one thread
+        cannot outpace in CPU time. Pessimistic the other way: a task that spent
+        its allowance waiting on a slow disk is counted a suspect and not run
+        again.
+        """
+        try:
+            started = mark.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - started >= self._task_seconds
+
+    def profile(self) -> ImagingProfile:
+        """Every kind's figures as they stand now."""
+        with self._guard:
+            kinds = [
+                ImagingKindProfile(
+                    kind=kind,
+                    calls=tally.calls,
+                    failed=tally.failed,
+                    wait_ms=tally.waited * 1000,
+                    run_ms=tally.ran * 1000,
+                    max_run_ms=tally.worst * 1000,
+                )
+                for kind, tally in self._tallies.items()
+            ]
+            in_flight = self._in_flight
+        kinds.sort(key=lambda profile: (-profile.run_ms, profile.kind))
+        return ImagingProfile(since=self._since, workers=self._workers, in_flight=in_flight, kinds=kinds)
+
+    def shutdown(self) -> None:
+        """Stop the workers, waiting for any task already running to finish."""
+        with self._guard:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if self._marks is not None:
+            shutil.rmtree(self._marks, ignore_errors=True)
+
+    def _executor_now(self) -> tuple[ProcessPoolExecutor, Path]:
+        with self._guard:
+            if self._marks is None:
+                self._marks = Path(tempfile.mkdtemp(prefix="imaging-marks-"))
+            if self._executor is None:
+                context = get_context(_START_METHOD)
+                # A worker per task costs a fork from the server, which is
+                # cheap, and Pillow's import, which is not — so the server
+                # imports it once and every worker inherits it.
+                context.set_forkserver_preload(["PIL.Image"])
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=context,
+                    # One task each: the kernel's ceiling on a task is lowered
+                    # for it and cannot be lifted for the next.
+                    max_tasks_per_child=1,
+                    initializer=_prepare_worker,
+                    initargs=(self._memory_mb, self._task_seconds, logging.getLogger().getEffectiveLevel()),
+                )
+            return self._executor, self._marks
+
+    def _replace(self, broken: ProcessPoolExecutor | None) -> None:
+        with self._guard:
+            if broken is None or self._executor is not broken:
+                # Every task that was in flight on a broken executor lands here;
+                # the first replaces it and the rest find it already gone.
+                return
+            self._executor = None
+        log.warning(
+            "an imaging worker died; the pool will start fresh workers for the next task",
+            extra={"event": "imaging.worker_lost"},
+        )
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _record(self, kind: str, *, waited: float, ran: float, failed: bool) -> None:
+        with self._guard:
+            self._in_flight -= 1
+            tally = self._tallies.setdefault(kind, _Tally())
+            tally.calls += 1
+            tally.failed += failed
+            tally.waited += waited
+            tally.ran += ran
+            tally.worst = max(tally.worst, ran)
+
+
+def default_workers() -> int:
+    """One worker per core but one, and never none.
+
+    The core left over is the server's: a decode queue that occupied every core
+    would be a surface slow to answer its own poll while it waited.
+    """
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _prepare_worker(memory_mb: int, task_seconds: int, log_level: int) -> None:
+    """Put a fresh worker under its ceilings and the plane's log shape."""
+    global _task_seconds
+    _task_seconds = task_seconds
+    # The plane's JSON lines rather than the interpreter's fallback, which would
+    # write a warning from `reading` to the journal as plain text.
+    logs.configure(level=log_level)
+    signal.signal(signal.SIGXCPU, _out_of_time)
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_mb * 1024 * 1024, hard))
+    except (ValueError, OSError) as exc:
+        # macOS accepts neither the limit nor a refusal of it consistently, and
+        # the development Mac is not where a bomb needs containing. The Pi is.
+        log.info(
+            "the imaging memory ceiling is not enforceable on this platform",
+            extra={"event": "imaging.no_memory_ceiling", "reason": str(exc)},
+        )
+
+
+def _timed[T](
+    task: Callable[..., T], args: tuple, kwargs: dict, *, limit: bool = True, mark: Path | None = None
+) -> tuple[float, float, T]:
+    """Run one task, returning when it started and finished beside its result.
+
+    In a worker, under a CPU ceiling counted from now, with `mark` touched first
+    so the pool can tell after a crash that this task had begun. `limit=False`
+    is the pool run inline, on a thread of the server, whose limits are not this
+    module's to set.
+    """
+    started = time.monotonic()
+    if mark is not None:
+        mark.touch()
+    if not limit:
+        result = task(*args, **kwargs)
+        return started, time.monotonic(), result
+    used = resource.getrusage(resource.RUSAGE_SELF)
+    # The limit is on the process's whole life, so the task's is set relative to
+    # what the worker used starting up. The soft limit sends SIGXCPU, which
+    # `_out_of_time` turns into an answer once the interpreter next runs; the
+    # hard one sends SIGKILL, which needs no interpreter, and `_on_a_worker`
+    # reports the worker it took. Lowered for good — the worker's one task.
+    soft = math.ceil(used.ru_utime + used.ru_stime) + _task_seconds
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, soft + _KILL_GRACE_SECONDS))
+    try:
+        result = task(*args, **kwargs)
+    except MemoryError:
+        # `from None`: the allocation that failed is not the caller's business,
+        # and the chained traceback would be pickled back for nothing.
+        raise ImagingAborted("The image needed more memory than an imaging worker is allowed.") from None
+    return started, time.monotonic(), result
+
+
+def _out_of_time(signum: int, frame: FrameType | None) -> None:
+    raise ImagingAborted(f"The image took more than {_task_seconds}s of processing, the most an imaging task is allowed.")
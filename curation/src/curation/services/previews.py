@@ -41,6 +41,7 @@ from PIL import Image, UnidentifiedImageError
 
 from curation.services.errors import ServiceError
 from curation.services.imaging import EncodedFrame, encode_downscaled
+from curation.services.imaging_pool import ImagingAborted, ImagingPool
 
 log = logging.getLogger(__name__)
 
@@ -287,7 +288,7 @@ class RenderedPreview:
     media_type: str
 
 
-def inline_preview(path: Path) -> InlinePreview | None:
+def inline_preview(path: Path, *, imaging: ImagingPool) -> InlinePreview | None:
     """Downscale a cached preview into something a tool result can carry.
 
     `None` means this instance travels without a picture, and it is never an
@@ -297,7 +298,7 @@ def inline_preview(path: Path) -> InlinePreview | None:
     source-side URL. Raising instead would lose a curator the other thirty-nine
     works over one museum's malformed JPEG.
     """
-    frame = _rendered(path, max_edge=INLINE_MAX_EDGE_PX, quality=INLINE_JPEG_QUALITY)
+    frame = _rendered(path, imaging=imaging, max_edge=INLINE_MAX_EDGE_PX, quality=INLINE_JPEG_QUALITY)
     if frame is None:
         return None
     return InlinePreview(
@@ -308,7 +309,7 @@ def inline_preview(path: Path) -> InlinePreview | None:
     )
 
 
-def browser_preview(path: Path) -> RenderedPreview | None:
+def browser_preview(path: Path, *, imaging: ImagingPool) -> RenderedPreview | None:
     """Downscale a cached preview into bytes a browser renders.
 
     Absence is reported the same way and for the same reason as above: a review
@@ -317,11 +318,11 @@ def browser_preview(path: Path) -> RenderedPreview | None:
     asks — the listing carries `preview_available` — so a `None` here is the
     narrow race where the file went away between the listing and the request.
     """
-    frame = _rendered(path, max_edge=BROWSER_MAX_EDGE_PX, quality=BROWSER_JPEG_QUALITY)
+    frame = _rendered(path, imaging=imaging, max_edge=BROWSER_MAX_EDGE_PX, quality=BROWSER_JPEG_QUALITY)
     return None if frame is None else RenderedPreview(data=frame.data, media_type=PREVIEW_MEDIA_TYPE)
 
 
-def _rendered(path: Path, *, max_edge: int, quality: int) -> EncodedFrame | None:
+def _rendered(path: Path, *, imaging: ImagingPool, max_edge: int, quality: int) -> EncodedFrame | None:
     """Re-encode a cached preview, reporting absence rather than raising.
 
     One decode for both callers. They differ in the box, the quality and what
@@ -340,12 +341,16 @@ def _rendered(path: Path, *, max_edge: int, quality: int) -> EncodedFrame | None
     is deliberately the only one of its kind.
     """
     try:
-        return encode_downscaled(path, max_edge=max_edge, quality=quality)
+        return imaging.run("preview", encode_downscaled, path, max_edge=max_edge, quality=quality)
     except Image.DecompressionBombError as exc:
         # Pillow's own guard against a decompression bomb. Caught by name rather
         # than swept up with the rest, because a file engineered to exhaust
         # memory is worth a different log line from one that is merely corrupt.
         return _no_inline(path, f"it is too large to open safely: {exc}")
+    except ImagingAborted as exc:
+        # The bomb that slipped under Pillow's guard, stopped by the worker's
+        # ceilings instead. The message says which.
+        return _no_inline(path, str(exc))
     except (OSError, UnidentifiedImageError, ValueError) as exc:
         # `OSError` and `UnidentifiedImageError` are the ordinary two — a
         # truncated download, a file that is not an image — and are what the
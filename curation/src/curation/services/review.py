@@ -33,6 +33,7 @@ from curation.services import selection
 from curation.services.discovery import DiscoveryService
 from curation.services.display_fit import ArtworkBox, FitAssessment, assess_display_fit
 from curation.services.errors import ServiceError
+from curation.services.imaging_pool import ImagingPool
 from curation.services.previews import InlinePreview, RenderedPreview, browser_preview, inline_preview
 
 #: The most one review listing will return, and **the bound is the pictures, not
@@ -300,7 +301,9 @@ class InstanceListing:
 class ReviewService:
     """Read proposed works the way a surface that shows them to a human needs them."""
 
-    def __init__(self, discovery: DiscoveryService, *, box: ArtworkBox, art_root: Path) -> None:
+    def __init__(
+        self, discovery: DiscoveryService, *, box: ArtworkBox, art_root: Path, imaging: ImagingPool | None = None
+    ) -> None:
         self._discovery = discovery
         #: The space a work is rendered into on this deployment. Required rather
         #: than optional: a review surface whose whole justification is showing
@@ -310,6 +313,8 @@ class ReviewService:
         self._box = box
         #: Where preview files live. Every catalogue path is relative to it.
         self._art_root = art_root
+        #: Where previews are re-encoded. The calling thread when none is given.
+        self._imaging = imaging or ImagingPool(workers=0)
 
     def list_works(self, run_id: str, *, limit: int | None = None, offset: int = 0, pictures: bool = True) -> CandidatePage:
         """A page of the works a run is responsible for, each with a picture.
@@ -433,7 +438,7 @@ class ReviewService:
         image = self._discovery.get_candidate_image(candidate_image_id)
         work = self._discovery.get_candidate_work(image.candidate_work_id)
         if image.preview_path is not None:
-            rendered = browser_preview(self._art_root / image.preview_path)
+            rendered = browser_preview(self._art_root / image.preview_path, imaging=self._imaging)
             if rendered is not None:
                 return rendered
         raise ServiceError(self._absent_preview_note(image, work))
@@ -499,7 +504,7 @@ class ReviewService:
     def _preview(self, image: CandidateImage, work: CandidateWork) -> tuple[InlinePreview | None, str | None]:
         """The picture this instance travels with, or why it travels without one."""
         if image.preview_path is not None:
-            rendered = inline_preview(self._art_root / image.preview_path)
+            rendered = inline_preview(self._art_root / image.preview_path, imaging=self._imaging)
             if rendered is not None:
                 return rendered, None
         return None, self._absent_preview_note(image, work)
@@ -65,6 +65,7 @@ from curation.discovery.engine import (
 )
 from curation.discovery.images import FoundImage, ImageQuery, ImageSearchFailure
 from curation.discovery.phase_two import JudgedImage, PhaseTwoEngine
+from curation.discovery.response_cache import ResponseCache
 from curation.logs import run_context
 from curation.persistence.discovery_records import (
     CandidateWork,
@@ -75,7 +76,7 @@ from curation.persistence.discovery_records import (
     RunStatus,
     WorkProvenance,
 )
-from curation.services.discovery import DiscoveryService
+from curation.services.discovery import DiscoveryService, FoundInstance, Proposal
 from curation.services.errors import ServiceError
 from curation.services.previews import PreviewCache
 
@@ -439,6 +440,7 @@ class DiscoveryRunner:
         images: PhaseTwoEngine | None = None,
         previews: PreviewCache | None = None,
         collection: CollectionBrowse | None = None,
+        museum_cache: ResponseCache | None = None,
         spawn: Callable[[Callable[[], None]], None] = _daemon_thread,
     ) -> None:
         self._discovery = discovery
@@ -450,6 +452,9 @@ class DiscoveryRunner:
         #: incoherent: there is nothing to supplement until the gate has refused
         #: something. A run with no collection simply offers nothing.
         self._collection = collection
+        #: Where the museum clients keep their answers, read only to say in a
+        #: run's closing line how many of its questions the museum was spared.
+        self._museum_cache = museum_cache
         #: Phase 2, and the cache its previews land in. Optional together: a
         #: deployment without an image provider runs phase 1 and stops, which is
         #: a coherent configuration and the one every phase-1 test uses. What is
@@ -470,6 +475,11 @@ class DiscoveryRunner:
         #: the news it was waiting for.
         self._changed = threading.Condition()
         self._generation = 0
+        #: Told after every wake `status` would get, for a watcher that waits
+        #: somewhere other than on the condition — an event stream waits on its
+        #: event loop, and a thread parked here for it would be the very cost
+        #: the stream exists to avoid. Guarded by the condition like the rest.
+        self._watchers: list[Callable[[], None]] = []
         #: Runs this process is actively working on, which is what `status`
         #: decides to hold on. Guarded by the same condition as the counter, so
         #: a waiter cannot read it between a run being registered and the wake
@@ -606,6 +616,37 @@ class DiscoveryRunner:
                     self._changed.wait(min(remaining, _RECHECK_SECONDS))
                 seen = self._generation
 
+    def working(self) -> bool:
+        """Whether this process is working on any run at all, right now.
+
+        For a caller that must not judge the previews directory while a run may
+        be writing into it: a preview lands on disk before the row naming it,
+        so mid-run a file can look like nobody's.
+        """
+        with self._changed:
+            return bool(self._in_flight)
+
+    def watch(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call `listener` whenever some run's state changes; return how to stop.
+
+        `run_status`'s wake without its thread. The listener is told that
+        *something* changed, not what: it runs on whichever thread made the
+        change, so it must only hand the news on — an event loop's
+        `call_soon_threadsafe` is the intended shape — and the reading is done
+        where the news lands. Not told about changes made by another process;
+        a watcher that cares re-reads on a timer of its own, as `run_status`
+        does every `_RECHECK_SECONDS`.
+        """
+        with self._changed:
+            self._watchers.append(listener)
+
+        def stop() -> None:
+            with self._changed:
+                if listener in self._watchers:
+                    self._watchers.remove(listener)
+
+        return stop
+
     # -- writes ---------------------------------------------------------------
 
     def start(self, *, intent_text: str, initiated_by: InitiatedBy) -> DiscoveryRun:
@@ -727,6 +768,7 @@ class DiscoveryRunner:
             with self._changed:
                 self._in_flight.discard(run_id)
             self._bump()
+            self._forget_museum_cache_if_ended(run_id)
 
     def _attempt_phase_one(self, run_id: str, intent_text: str) -> None:
         """Call the engine and turn whatever it did into a run state."""
@@ -849,8 +891,11 @@ class DiscoveryRunner:
         Both are logged rather than silently dropped: a run that proposed twelve
         works from an engine that named twenty is a run whose count needs an
         explanation.
+
+        What survives both is proposed in one write, so a thirty-work list is one
+        commit rather than thirty.
         """
-        proposed = 0
+        proposals: list[Proposal] = []
         suppressed = 0
         duplicates = 0
         seen: set[str] = set()
@@ -868,15 +913,12 @@ class DiscoveryRunner:
                     extra={"event": "work.suppressed", "work_title": work.title},
                 )
                 continue
-            self._discovery.propose_work(
-                run_id=run_id,
-                proposed_title=work.title,
-                rationale=work.rationale,
-                work_dedup_key=key,
-                proposed_artist=work.artist,
+            proposals.append(
+                Proposal(proposed_title=work.title, rationale=work.rationale, work_dedup_key=key, proposed_artist=work.artist)
             )
-            proposed += 1
-        return proposed, suppressed, duplicates
+        if proposals:
+            self._discovery.propose_works(run_id=run_id, works=proposals)
+        return len(proposals), suppressed, duplicates
 
     # -- phase 2 --------------------------------------------------------------
 
@@ -908,6 +950,7 @@ class DiscoveryRunner:
             with self._changed:
                 self._in_flight.discard(run_id)
             self._bump()
+            self._forget_museum_cache_if_ended(run_id)
 
     def _attempt_phase_two(self, run_id: str) -> None:
         """Resolve every pending work, then close the run.
@@ -960,6 +1003,12 @@ class DiscoveryRunner:
     def _resolve_pending(self, run_id: str, images: PhaseTwoEngine, previews: PreviewCache) -> None:
         """Ask the provider about each work this run is responsible for."""
         works = self._works_to_resolve(run_id)
+        # Every search the loop below will ask, told to the provider first so it
+        # can send them together; each work is still searched and judged on its
+        # own, and a work decided since this read is skipped as before.
+        images.prepare(
+            [ImageQuery(title=work.proposed_title, artist=work.proposed_artist) for work in works if not work.verdict.is_terminal]
+        )
         tally: Counter[WorkOutcome] = Counter()
         for work in works:
             # Re-read each time round rather than once before the loop: a curator
@@ -1175,8 +1224,7 @@ class DiscoveryRunner:
                 extra={"event": "phase_two.unreachable", "work_title": work.proposed_title},
             )
             return WorkOutcome.UNREACHABLE
-        for entry in resolution.instances:
-            self._record_instance(work, entry, previews)
+        self._discovery.record_images(work.id, [self._found_instance(entry, previews) for entry in resolution.instances])
         # The refusals travel on because they cannot be recovered from the store:
         # a result the search discarded never became a row, so which gate turned
         # it away is knowable only here, at the attempt that made the judgement.
@@ -1189,16 +1237,18 @@ class DiscoveryRunner:
             return WorkOutcome.VERDICT_STOOD
         return WorkOutcome.RESOLVED if outcome.resolution_status is ResolutionStatus.RESOLVED else WorkOutcome.UNRESOLVED
 
-    def _record_instance(self, work: CandidateWork, entry: JudgedImage, previews: PreviewCache) -> None:
-        """Write down one judged instance, caching its preview on the way in.
+    @staticmethod
+    def _found_instance(entry: JudgedImage, previews: PreviewCache) -> FoundInstance:
+        """One judged instance as the service records it, its preview cached on the way in.
 
         The preview is fetched before the row is written so the path is recorded
         with it rather than by a second update — a row written first and patched
-        after is a row that is briefly wrong, and on a crash permanently so.
+        after is a row that is briefly wrong, and on a crash permanently so. Every
+        instance of a work is fetched before any is written, so the work's rows
+        arrive as one write; `sweep.py` records what that does to its straddle.
         """
         found = entry.found
-        self._discovery.record_image(
-            candidate_work_id=work.id,
+        return FoundInstance(
             url=found.url,
             provider=found.provider,
             source_class=found.source_class,
@@ -1249,6 +1299,7 @@ class DiscoveryRunner:
             "phase 2 finished",
             extra={
                 "event": "run.completed",
+                "museum_cache": self._museum_cache_counts(run_id),
                 "works_resolved": tally[WorkOutcome.RESOLVED],
                 "works_unresolved": tally[WorkOutcome.UNRESOLVED],
                 "works_unreachable": unreachable,
@@ -1320,7 +1371,36 @@ class DiscoveryRunner:
             log.info("could not end the run; it had already ended: %s", exc, extra={"event": "run.already_ended"})
             return
         self._bump()
-        log.warning(reason, extra={"event": event})
+        log.warning(reason, extra={"event": event, "museum_cache": self._museum_cache_counts(run_id)})
+
+    def _museum_cache_counts(self, run_id: str) -> dict[str, object] | None:
+        """How this run's questions to the museum were answered, for its closing line.
+
+        Taken rather than read, so the cache forgets a run once it has been
+        reported. None without a cache, rather than zeros that would read as a
+        run that asked the museum nothing.
+        """
+        if self._museum_cache is None:
+            return None
+        return self._museum_cache.take(run_id).as_fields()
+
+    def _forget_museum_cache_if_ended(self, run_id: str) -> None:
+        """Drop what a worker counted after its run was ended underneath it.
+
+        A cancel reports the run's counts at once, but the worker learns of it
+        only at its next check, and a question asked in between is counted
+        against a run that will never report again. Left alone, every run
+        cancelled mid-phase would keep an entry for the life of the process.
+        """
+        if self._museum_cache is None:
+            return
+        try:
+            ended = self._discovery.get_run(run_id).status.is_terminal
+        except ServiceError:
+            # No run to report it in either.
+            ended = True
+        if ended:
+            self._museum_cache.take(run_id)
 
     def _transition(self, change: Callable[[str], DiscoveryRun], run_id: str, *, event: str) -> RunView:
         """Apply a curator's decision and wake anything holding on this run.
@@ -1333,8 +1413,13 @@ class DiscoveryRunner:
         """
         run = change(run_id)
         self._bump()
+        # A run the curator ended has no closing line from the worker, so this
+        # is where what it asked of the museum is reported — and forgotten.
+        fields: dict[str, object] = {"event": event, "status": str(run.status)}
+        if run.status.is_terminal:
+            fields["museum_cache"] = self._museum_cache_counts(run_id)
         with run_context(run_id):
-            log.info("run %s", run.status, extra={"event": event, "status": str(run.status)})
+            log.info("run %s", run.status, extra=fields)
         return self._view(run_id)
 
     def _bump(self) -> None:
@@ -1348,3 +1433,18 @@ class DiscoveryRunner:
         with self._changed:
             self._generation += 1
             self._changed.notify_all()
+            watchers = tuple(self._watchers)
+        # Outside the condition, so a listener that does more than it should
+        # cannot stall every other waker behind it.
+        for listener in watchers:
+            try:
+                listener()
+            except Exception:  # prawduct:allow prawduct/broad-except -- a watcher's fault must not end the run that told it
+                # A stream whose event loop has closed raises here rather than
+                # stopping its watch — and this is the runner's own thread, in
+                # the middle of a run. So the watcher is dropped: one that
+                # failed once would fail on every change after.
+                log.exception("a run watcher raised and was dropped", extra={"event": "run.watcher_dropped"})
+                with self._changed:
+                    if listener in self._watchers:
+                        self._watchers.remove(listener)
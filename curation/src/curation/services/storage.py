@@ -0,0 +1,339 @@
+"""Holding each derived cache under `ART_ROOT` to a byte budget, least recently used first.
+
+Four directories grow with nothing else bounding them. `tile-cache/` keeps a
+source's tiles after a partial fetch so a retry is cheap, and is reclaimed only
+when a later fetch of that source completes — which for a work nobody retries is
+never. `previews/` is reclaimed by the sweep only for works the curator has
+decided. `thumbs/` holds a ladder for every work ever drawn. `museum-cache/` keeps every
+answer the museum gave, for as long as it may be reused. The plane runs on an
+SD card whose exhaustion is the top operational risk, so each directory is given
+a budget and this pass holds it there.
+
+**What may be evicted is the directory's rule, not this module's.** A tile cache
+goes a source's whole directory at a time, and never one a fetch is running
+against. A preview goes only when no instance names it — a named one is either
+still shown by review or the sweep's to reclaim with its rows — and none at all
+while a discovery run is working, because a run writes the file before the row
+and a file mid-run can look like nobody's. A thumbnail may go whenever it is
+finished, because a missing one is drawn again on its next request. Each cache
+carries its rule as `holds`, and this module only ever asks it.
+
+**Recency is read off the filesystem rather than recorded.** An entry was last
+used at the later of its access and modification times. Linux mounts default to
+`relatime`, which updates the access time at most daily, and a day is the grain
+an eviction over caches this old needs. A `noatime` mount degrades to write
+order, oldest first, which is still the right end to start from for files
+written once and read many times. Recording each use would cost a metadata
+write per thumbnail served, on the device this exists to spare.
+
+**It runs on the sweep's timer, after the sweep.** The sweep reclaims by verdict
+and clears the rows with the files, so what is left for this to evict is only
+what remains over budget. **A cache held over budget by what it may not touch
+says so** — the bytes are reported as held on the health panel, and nothing is
+deleted anyway to make a number fit.
+
+**The hold is asked twice, and that narrows a race rather than closing it.**
+Once for the whole directory and again for each entry immediately before it is
+removed, so a fetch or a run that began during the pass is seen. A fetch that
+starts between that second answer and the removal finds its cached tiles gone
+and fetches them again; nothing is lost but the tiles' second download.
+"""
+
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Callable, Collection, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final
+
+log = logging.getLogger(__name__)
+
+#: The budgets a deployment starts with. Sized against the SD card rather than
+#: the collection: the tile cache has room for a few dozen partial masters, the
+#: previews for several runs under review, and the thumbnails for a few thousand
+#: works' ladders — past which the oldest are drawn again on request.
+DEFAULT_TILE_CACHE_BUDGET_BYTES: Final[int] = 2 * 1024 * 1024 * 1024
+DEFAULT_PREVIEWS_BUDGET_BYTES: Final[int] = 512 * 1024 * 1024
+DEFAULT_THUMBNAILS_BUDGET_BYTES: Final[int] = 2 * 1024 * 1024 * 1024
+#: The museum's stored answers are a few kilobytes each, so this holds tens of
+#: thousands of them — every search a deployment is likely to repeat.
+DEFAULT_MUSEUM_CACHE_BUDGET_BYTES: Final[int] = 64 * 1024 * 1024
+
+#: Files a writer has not finished with. Never evicted: a staging file is
+#: renamed into place or unlinked by its own writer, and removing it first turns
+#: a cached write into a failed one.
+_UNFINISHED_SUFFIXES: Final[tuple[str, ...]] = (".tmp", ".partial")
+
+#: Given a cache's entries, the ones that must stay where they are.
+Holds = Callable[[Sequence[Path]], Collection[Path]]
+
+
+def _nothing_held(_entries: Sequence[Path]) -> Collection[Path]:
+    return ()
+
+
+@dataclass(frozen=True, slots=True)
+class StorageBudgets:
+    """How many bytes each governed directory may hold.
+
+    Zero measures a directory and evicts nothing from it, which is the default
+    here so that a plane assembled without a deployment's budgets — a test's —
+    never deletes a file it did not ask to.
+    """
+
+    tile_cache_bytes: int = 0
+    previews_bytes: int = 0
+    thumbnails_bytes: int = 0
+    museum_cache_bytes: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class GovernedCache:
+    """One directory, its budget, and the rule for what in it must stay."""
+
+    #: What the health panel calls it: the directory's name under `ART_ROOT`.
+    name: str
+    directory: Path
+    ceiling_bytes: int
+    #: Whether an entry is a whole subdirectory rather than one file. The tile
+    #: cache's unit is a source, and half a source's tiles is a resume that
+    #: re-fetches the other half anyway.
+    by_directory: bool = False
+    holds: Holds = _nothing_held
+
+
+@dataclass(frozen=True, slots=True)
+class CacheUsage:
+    """One directory as the last pass found it, and what passes have evicted.
+
+    The measurements are `None` until a pass has run, because "not measured"
+    and "empty" are different facts and only one of them is true at startup.
+    """
+
+    name: str
+    directory: Path
+    #: Zero when the directory is measured and never evicted from.
+    ceiling_bytes: int
+    used_bytes: int | None
+    entries: int | None
+    #: Bytes the directory's rule kept in place. A cache over budget by no more
+    #: than this is exactly where it is allowed to be.
+    held_bytes: int | None
+    #: Counted since the process started, across every pass.
+    evicted: int
+    evicted_bytes: int
+    #: Entries a pass chose and could not remove. Left for the next pass.
+    failed: int
+    measured_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class StorageReading:
+    """Every governed directory, read at one instant."""
+
+    since: datetime
+    caches: Sequence[CacheUsage]
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    path: Path
+    size: int
+    last_used: float
+
+
+@dataclass(slots=True)
+class _Counts:
+    """The running figures for one cache. Mutable; never leaves this module."""
+
+    evicted: int = 0
+    evicted_bytes: int = 0
+    failed: int = 0
+    measured: CacheUsage | None = None
+
+
+class StorageGovernor:
+    """Measure each cache directory and evict from it down to its budget."""
+
+    def __init__(self, caches: Sequence[GovernedCache]) -> None:
+        self._caches = tuple(caches)
+        self._since = datetime.now(UTC)
+        #: Guards the counts, which a pass on the sweep thread writes while the
+        #: health panel reads them from a request.
+        self._lock = threading.Lock()
+        self._counts = {cache.name: _Counts() for cache in self._caches}
+
+    def reading(self) -> StorageReading:
+        """What the last pass found. Reads no directory, so a page load costs nothing."""
+        with self._lock:
+            return StorageReading(since=self._since, caches=[self._usage(cache) for cache in self._caches])
+
+    def run(self) -> StorageReading:
+        """One pass over every cache. Safe to call at any time, any number of times."""
+        for cache in self._caches:
+            self._govern(cache)
+        reading = self.reading()
+        # At INFO even when nothing was evicted, for the reason the sweep gives:
+        # a periodic job that logs only when it acts cannot be told from one
+        # that stopped.
+        log.info(
+            "governed the cache directories",
+            extra={
+                "event": "storage.governed",
+                "caches": {
+                    usage.name: {
+                        "used_bytes": usage.used_bytes,
+                        "ceiling_bytes": usage.ceiling_bytes,
+                        "held_bytes": usage.held_bytes,
+                        "evicted": usage.evicted,
+                    }
+                    for usage in reading.caches
+                },
+            },
+        )
+        return reading
+
+    def _govern(self, cache: GovernedCache) -> None:
+        entries = _entries(cache)
+        used = sum(entry.size for entry in entries)
+        held = _held(cache, [entry.path for entry in entries])
+        held_bytes = sum(entry.size for entry in entries if entry.path in held)
+        evicted = evicted_bytes = failed = 0
+        if cache.ceiling_bytes:
+            for entry in sorted((entry for entry in entries if entry.path not in held), key=lambda entry: entry.last_used):
+                if used <= cache.ceiling_bytes:
+                    break
+                if _held(cache, [entry.path]):
+                    # Began to be wanted during this pass — the second asking the
+                    # module docstring describes.
+                    held_bytes += entry.size
+                    continue
+                if not _remove(cache, entry.path):
+                    failed += 1
+                    continue
+                used -= entry.size
+                evicted += 1
+                evicted_bytes += entry.size
+        with self._lock:
+            counts = self._counts[cache.name]
+            counts.evicted += evicted
+            counts.evicted_bytes += evicted_bytes
+            counts.failed += failed
+            counts.measured = CacheUsage(
+                name=cache.name,
+                directory=cache.directory,
+                ceiling_bytes=cache.ceiling_bytes,
+                used_bytes=used,
+                entries=len(entries) - evicted,
+                held_bytes=held_bytes,
+                evicted=counts.evicted,
+                evicted_bytes=counts.evicted_bytes,
+                failed=counts.failed,
+                measured_at=datetime.now(UTC),
+            )
+
+    def _usage(self, cache: GovernedCache) -> CacheUsage:
+        counts = self._counts[cache.name]
+        if counts.measured is not None:
+            return counts.measured
+        return CacheUsage(
+            name=cache.name,
+            directory=cache.directory,
+            ceiling_bytes=cache.ceiling_bytes,
+            used_bytes=None,
+            entries=None,
+            held_bytes=None,
+            evicted=0,
+            evicted_bytes=0,
+            failed=0,
+            measured_at=None,
+        )
+
+
+def _held(cache: GovernedCache, paths: Sequence[Path]) -> set[Path]:
+    """What of `paths` must stay: the cache's own rule, and anything unfinished."""
+    if not paths:
+        return set()
+    return set(cache.holds(paths)) | {path for path in paths if path.name.endswith(_UNFINISHED_SUFFIXES)}
+
+
+def _entries(cache: GovernedCache) -> list[_Entry]:
+    """Every evictable unit in the directory, with its size and when it was last used.
+
+    Symbolic links are neither followed nor counted: nothing this plane writes
+    is one, and following one would measure — and could evict — a file outside
+    the directory being governed.
+    """
+    try:
+        children = list(os.scandir(cache.directory))
+    except FileNotFoundError:
+        return []
+    entries = []
+    for child in children:
+        if child.is_symlink():
+            continue
+        if child.is_dir():
+            if cache.by_directory:
+                entries.append(_measure_tree(Path(child.path)))
+            else:
+                entries.extend(_measure_files(Path(child.path)))
+        elif (entry := _measure_file(Path(child.path))) is not None:
+            entries.append(entry)
+    return entries
+
+
+def _measure_file(path: Path) -> _Entry | None:
+    try:
+        status = path.stat(follow_symlinks=False)
+    except OSError:
+        # Removed between the listing and here — by its own writer, or the
+        # sweep. Nothing to govern.
+        return None
+    return _Entry(path=path, size=status.st_size, last_used=max(status.st_atime, status.st_mtime))
+
+
+def _measure_files(directory: Path) -> list[_Entry]:
+    found = []
+    for root, _dirs, names in os.walk(directory):
+        for name in names:
+            candidate = Path(root) / name
+            if not candidate.is_symlink() and (entry := _measure_file(candidate)) is not None:
+                found.append(entry)
+    return found
+
+
+def _measure_tree(directory: Path) -> _Entry:
+    """A directory as one entry: all its bytes, used when its newest file was."""
+    files = _measure_files(directory)
+    try:
+        touched = directory.stat().st_mtime
+    except OSError:
+        touched = 0.0
+    return _Entry(
+        path=directory,
+        size=sum(entry.size for entry in files),
+        last_used=max((entry.last_used for entry in files), default=touched),
+    )
+
+
+def _remove(cache: GovernedCache, path: Path) -> bool:
+    """Evict one entry, reporting whether it went."""
+    try:
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink(missing_ok=True)
+    except OSError as exc:
+        # A read-only mount or a permissions problem. Left for the next pass:
+        # one entry that will not go must not stop the cache reaching budget
+        # through the others.
+        log.warning(
+            "a cache entry could not be evicted",
+            extra={"event": "storage.evict_failed", "cache": cache.name, "path": str(path), "reason": str(exc)},
+        )
+        return False
+    log.debug("evicted %s from %s", path.name, cache.name, extra={"event": "storage.evicted", "cache": cache.name})
+    return True
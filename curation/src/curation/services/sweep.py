@@ -25,17 +25,29 @@ then report the file as unreadable when in fact this process removed it. So the
 unit of deletion is the *path*, and a path survives while any work still under
 review references it.
 
-**The pass runs inside one store transaction, and what that closes is worth
+**One indexed question, asked a batch at a time.** The pass does not walk runs,
+works and instances — that was a query per row on a timer, against a store that
+only grows. It asks the discovery store for the paths every referencing work has
+finished with, in path order and a bounded batch of paths at a time, and carries
+on from the last path it was handed. A path the pass could not finish keeps its
+row, sorts before where the next batch starts, and is left to the next pass.
+
+**Each batch runs inside one store transaction, and what that closes is worth
 stating exactly, because it is not everything.** Reading the references and
 unlinking are two steps, and holding the store's lock across both stops a writer
 landing *between them* — `record_image` takes the same lock, so no row can appear
-against a path this pass has already judged reclaimable while the pass is running.
+against a path this batch has already judged reclaimable while it is deciding.
+The lock is released between batches so a resolve run's writes wait behind one
+batch rather than a whole pass; a row landing in that gap is judged by whichever
+batch reaches its path next, with the verdicts as they then stand.
 
 **What it does not close is the writer's own straddle, and that is recorded rather
 than claimed away.** `PreviewCache.store` returns a digest-named file it finds on
 disk without re-fetching, and it holds no lock while doing so; `record_image` takes
-the lock afterwards. So a resolve run can read "the file is there", have a whole
-sweep pass run and delete it, and then write a row naming it. That row is permanent,
+the lock afterwards — and a resolve run records a work's instances together, so
+the gap spans every preview of that work rather than one. So a resolve run can
+read "the file is there", have a sweep batch run and delete it, and then write a
+row naming it. That row is permanent,
 because `record_image` never rewrites `preview_path` for a URL its work already
 holds. Closing it means the row write verifying the file inside the lock it takes,
 which is a change to what the record layer depends on and is filed rather than
@@ -59,15 +71,17 @@ only ever helped someone decide.
 
 import logging
 import threading
-from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from itertools import groupby
 from pathlib import Path
+from time import perf_counter
 from typing import Final
 
 from curation.persistence.discovery_records import CandidateImage
 from curation.services.discovery import DiscoveryService
 from curation.services.errors import ServiceError
+from curation.services.storage import StorageGovernor
 
 log = logging.getLogger(__name__)
 
@@ -76,6 +90,11 @@ log = logging.getLogger(__name__)
 #: pass that is somehow wedged must not hold a restart open.
 _SHUTDOWN_JOIN_SECONDS: Final[float] = 5.0
 
+#: How many preview *paths* one batch of a pass considers. Bounds both the rows
+#: one query hands back and how long the store's lock is held before a waiting
+#: writer gets a turn; a household's backlog after a large run is a few batches.
+_SWEEP_BATCH_PATHS: Final[int] = 200
+
 #: What the sweep's thread is called, in `journalctl` and in a stack dump.
 #:
 #: A constant rather than a literal at the one place it is set, because the only
@@ -110,6 +129,10 @@ class SweepResult:
     #: so the next pass tries again rather than leaving a row claiming a picture
     #: that is not coming back.
     failed: int
+    #: Wall-clock time the pass took, in milliseconds. Reported so a sweep whose
+    #: cost creeps upward with the catalogue is visible in the journal before it
+    #: is visible as a plane that stalls behind it.
+    duration_ms: float
 
 
 class PreviewSweep:
@@ -131,38 +154,46 @@ class PreviewSweep:
         # returns and a plane that stopped sweeping look identical in the
         # journal — silence — and they are different faults with different fixes.
         log.debug("sweeping candidate previews", extra={"event": "preview.sweep_started"})
-        deleted = forgotten = reclaimed = retained = failed = 0
-        # The whole pass runs inside one transaction, so no row can appear
-        # against a path *while* the pass is deciding about it: `record_image`
-        # takes the same lock. That is what this closes, and it is not the whole
-        # race — a writer whose file check ran before the pass started can still
-        # write afterwards. The module docstring has the surviving interleaving.
-        #
-        # The cost is bounded by what is inside: a walk of a household's rows and
-        # a handful of unlinks, single-digit milliseconds, against a plane whose
-        # writers are a curator's own runs. Nothing slow is done in here — no
-        # fetch, no encode — and nothing may be added.
-        with self._discovery.transaction():
-            referenced, decided = self._references()
-            for path, images in sorted(referenced.items()):
-                if any(image.candidate_work_id not in decided for image in images):
-                    retained += 1
-                    continue
-                removed, freed = self._unlink(path)
-                if not removed:
-                    failed += 1
-                    continue
-                deleted += 1
-                reclaimed += freed
-                for image in images:
-                    if self._forget(image):
-                        forgotten += 1
+        started = perf_counter()
+        deleted = forgotten = reclaimed = failed = 0
+        after = ""
+        while True:
+            # Each batch is read and acted on inside one transaction, so no row
+            # can appear against a path *while* the batch is deciding about it:
+            # `record_image` takes the same lock. That is what this closes, and
+            # it is not the whole race — a writer whose file check ran before the
+            # batch started can still write afterwards. The module docstring has
+            # the surviving interleaving.
+            #
+            # Nothing slow is done in here — no fetch, no encode — and nothing may
+            # be added: the lock is the one every writer on the plane waits on.
+            with self._discovery.transaction():
+                batch = self._discovery.reclaimable_previews(after=after, limit=_SWEEP_BATCH_PATHS)
+                for path, images in _by_path(batch):
+                    removed, freed = self._unlink(path)
+                    if not removed:
+                        failed += 1
+                        continue
+                    deleted += 1
+                    reclaimed += freed
+                    forgotten += sum(self._forget(image) for image in images)
+            if not batch:
+                break
+            # Carried on from the last path handed back rather than re-asked from
+            # the start. A path this batch cleared no longer appears anyway; one
+            # it failed on still does, and starting over would retry it forever.
+            after = batch[-1].preview_path or after
+        # Counted once, after the deletions, so it reports what the pass left
+        # standing rather than what it found on the way in.
+        retained = self._discovery.count_retained_previews()
+        duration_ms = round((perf_counter() - started) * 1000, 1)
         result = SweepResult(
             deleted=deleted,
             forgotten=forgotten,
             bytes_reclaimed=reclaimed,
             retained=retained,
             failed=failed,
+            duration_ms=duration_ms,
         )
         # At INFO even when nothing was reclaimed. The interesting operational
         # question about a periodic job is whether it is running at all, and a
@@ -178,41 +209,11 @@ class PreviewSweep:
                 "bytes_reclaimed": reclaimed,
                 "retained": retained,
                 "failed": failed,
+                "duration_ms": duration_ms,
             },
         )
         return result
 
-    def _references(self) -> tuple[dict[str, list[CandidateImage]], set[str]]:
-        """Every cached preview on record, the instances pointing at it, and which
-        of their works the curator has finished with.
-
-        Walked through the service's own listings rather than a query of its own,
-        because the durable store's contract is equality filters and a
-        deterministic order — a join or a `WHERE preview_path IS NOT NULL` would
-        widen that contract for a job that runs on a timer over a household's
-        worth of rows.
-
-        Iterating runs reaches every work exactly once: a work belongs to the
-        discovery run that proposed it and keeps that id for life, so a resolve
-        run — which covers works through `ResolveRunWork` rather than owning them
-        — contributes an empty list rather than a second sighting.
-
-        The verdicts come back with the walk rather than being asked for again
-        per instance. The walk already holds each work, and re-reading it once
-        per image would be a query per preview to answer a question already in
-        hand — on the pass where nothing is reclaimable, which is most of them.
-        """
-        references: dict[str, list[CandidateImage]] = defaultdict(list)
-        decided: set[str] = set()
-        for run in self._discovery.list_runs():
-            for work in self._discovery.list_candidate_works(run.id):
-                if work.verdict.is_terminal:
-                    decided.add(work.id)
-                for image in self._discovery.list_candidate_images(work.id):
-                    if image.preview_path is not None:
-                        references[image.preview_path].append(image)
-        return references, decided
-
     def _forget(self, image: CandidateImage) -> bool:
         """Clear one row's `preview_path`, reporting whether it went.
 
@@ -263,12 +264,23 @@ class PreviewSweep:
         return True, freed
 
 
+def _by_path(images: Sequence[CandidateImage]) -> list[tuple[str, list[CandidateImage]]]:
+    """One batch's instances, gathered under the file they name.
+
+    The store hands them back ordered by path, so consecutive runs are whole
+    groups; a row with no path is never in a batch, and is skipped rather than
+    trusted if one ever were.
+    """
+    return [(path, list(group)) for path, group in groupby(images, key=lambda image: image.preview_path) if path is not None]
+
+
 def run_periodically(
     sweep: PreviewSweep,
     *,
     interval_seconds: float,
     stop: threading.Event,
     after_pass: Callable[[], None] = lambda: None,
+    governor: StorageGovernor | None = None,
 ) -> None:
     """Sweep once, then every `interval_seconds`, until `stop` is set.
 
@@ -281,6 +293,11 @@ def run_periodically(
     for the rest of an interval. `after_pass` is called once per completed pass,
     which is the seam a test uses to count passes and stop the loop without
     waiting out an interval.
+
+    **The storage governor runs on the same timer, after the sweep**, so that
+    what the sweep reclaims by verdict is gone before anything is evicted by
+    age. Each is guarded on its own: a sweep that fails must not leave the
+    caches unbounded, nor a failed eviction stop the sweep.
     """
     while True:
         try:
@@ -291,12 +308,24 @@ def run_periodically(
             # is silent: the disk fills weeks later with nothing connecting the
             # two events.
             log.exception("a preview sweep failed; the next one will try again", extra={"event": "preview.sweep_error"})
+        if governor is not None:
+            try:
+                governor.run()
+            except (
+                Exception
+            ):  # prawduct:allow prawduct/broad-except -- a background loop that dies stops bounding the caches forever
+                log.exception(
+                    "governing the cache directories failed; the next pass will try again",
+                    extra={"event": "storage.govern_error"},
+                )
         after_pass()
         if stop.wait(interval_seconds):
             return
 
 
-def start_sweeping(sweep: PreviewSweep, *, interval_seconds: float) -> Callable[[], None]:
+def start_sweeping(
+    sweep: PreviewSweep, *, interval_seconds: float, governor: StorageGovernor | None = None
+) -> Callable[[], None]:
     """Run the sweep on a daemon thread, returning the call that stops it.
 
     A daemon thread for the reason discovery's runs use one: work in flight when
@@ -307,7 +336,7 @@ def start_sweeping(sweep: PreviewSweep, *, interval_seconds: float) -> Callable[
     thread = threading.Thread(
         target=run_periodically,
         args=(sweep,),
-        kwargs={"interval_seconds": interval_seconds, "stop": stop},
+        kwargs={"interval_seconds": interval_seconds, "stop": stop, "governor": governor},
         name=SWEEP_THREAD_NAME,
         daemon=True,
     )
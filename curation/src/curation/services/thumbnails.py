@@ -26,34 +26,68 @@ a superseded acquisition in front of the curator, which is precisely what the
 staleness rule exists to prevent — and the master is used instead. Callers are
 told which, because a curator looking at a grid deserves to know whether they are
 seeing the composed presentation or the raw scan.
+
+**Three sizes in two encodings, drawn together and ahead of the grid.** A card
+offers the browser a `srcset` and lets it pick by the pixels it actually has, and
+WebP carries the same picture in well under JPEG's bytes for every client that
+says it reads it. All six files come from one decode, and whichever
+size goes stale regenerates the lot — the decode is the cost, not the encodes.
+`ThumbnailWarmer` draws them in the background the moment an original or a
+canvas lands, so the first view of a freshly accepted batch is served from disk
+rather than stalled on a decode per card; the on-request path below still
+answers for everything the warmer has not reached.
 """
 
 import logging
 import os
+import threading
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from time import perf_counter
 from typing import Final
 
 from PIL import Image, UnidentifiedImageError
 
 from curation.persistence.records import Rendition, RenditionKind, tv_renditions_newest_first
-from curation.services.catalogue import CatalogueService
+from curation.services.catalogue import CatalogueService, RenditionView
 from curation.services.errors import ServiceError
-from curation.services.imaging import encode_downscaled
+from curation.services.imaging import encode_ladder
+from curation.services.imaging_pool import ImagingAborted, ImagingPool
 
 log = logging.getLogger(__name__)
 
-#: The box a thumbnail is fitted into, in pixels. One size rather than a
-#: per-request parameter: a caller-chosen size makes the cache unbounded and the
-#: rendition rows meaningless, and this surface has exactly one grid.
+#: The box a thumbnail is fitted into when no width is asked for, in pixels.
+#: The grid's own size, and the one whose file keeps the name it had before there
+#: were others — so a cache and catalogue written then are still current now.
 THUMBNAIL_MAX_EDGE_PX: Final[int] = 480
 
+#: Every box a thumbnail is drawn at: the `srcset` a card offers. A fixed ladder
+#: rather than a per-request size, because a caller-chosen size makes the cache
+#: unbounded and the rendition rows meaningless. 240 is a phone's grid column,
+#: 480 the desktop grid, and 960 either of them on a display with twice the
+#: pixels — or the detail screen, which shows one work large.
+THUMBNAIL_EDGES_PX: Final[tuple[int, ...]] = (240, THUMBNAIL_MAX_EDGE_PX, 960)
+
 #: Quality for the re-encode. High enough that the grid is not visibly artefacted
 #: on a retina display, low enough that forty of them are a page.
 THUMBNAIL_JPEG_QUALITY: Final[int] = 82
 
+#: WebP's quality scale is not JPEG's, and 80 is the customary match for 82
+#: above. `tools/thumbnail_warmth.py` reports what it saves at each size.
+THUMBNAIL_WEBP_QUALITY: Final[int] = 80
+
+#: What the warming thread is called, in `journalctl` and in a stack dump — a
+#: constant for the reason `SWEEP_THREAD_NAME` is one.
+WARMER_THREAD_NAME: Final[str] = "thumbnail-warmer"
+
+#: How long a shutdown waits for a draw in flight. A ladder is one decode and six
+#: encodes, well under this on a Pi; a draw that outlasts it is not worth holding
+#: a restart open for, because the on-request path redraws whatever it left.
+_SHUTDOWN_JOIN_SECONDS: Final[float] = 5.0
+
 
 class ThumbnailUnavailable(ServiceError):
     """No thumbnail can be produced, and the message says what is missing.
@@ -172,9 +206,10 @@ def _drawn_from(thumbnail: Rendition, source: ThumbnailSource) -> bool:
 class ThumbnailService:
     """Produce and cache small copies of held works."""
 
-    def __init__(self, catalogue: CatalogueService, settings: ThumbnailSettings) -> None:
+    def __init__(self, catalogue: CatalogueService, settings: ThumbnailSettings, *, imaging: ImagingPool | None = None) -> None:
         self._catalogue = catalogue
         self._settings = settings
+        self._imaging = imaging or ImagingPool(workers=0)
 
     def source_for(self, artwork_id: str) -> ThumbnailSource:
         """The held image a thumbnail of this work would be made from.
@@ -213,22 +248,18 @@ class ThumbnailService:
             raise ThumbnailUnavailable(f"The master image is recorded at {original.relative_path} but no file is there.")
         return ThumbnailSource(kind="original", path=master, generated_at=None)
 
-    def thumbnail(self, artwork_id: str) -> Path:
-        """An absolute path to a current thumbnail, generating one if needed."""
+    def thumbnail(self, artwork_id: str, *, width: int | None = None, webp: bool = False) -> Path:
+        """An absolute path to a current thumbnail, generating one if needed.
+
+        `width` is the pixels the caller will show it at, and the answer is the
+        smallest size on the ladder that covers it — the largest when none does.
+        `webp` asks for that size's WebP encoding rather than its JPEG.
+        """
+        edge = thumbnail_edge(width)
         source = self.source_for(artwork_id)
-        cached = self._settings.directory / f"{artwork_id}.jpg"
-        # The id reaches this filename from a URL path segment. Nothing that is
-        # not a catalogue id gets this far — `source_for` refuses an unknown work
-        # first — but the guard is here rather than resting on that, because a
-        # traversal is only ever one refactor away from being written to disk and
-        # this check costs nothing.
-        if not cached.resolve().is_relative_to(self._settings.directory.resolve()):
-            raise ServiceError(f"Artwork id {artwork_id!r} does not name a file inside the thumbnail cache.")
+        cached = self._path(artwork_id, edge, webp=webp)
 
-        held = next(
-            (view for view in self._catalogue.list_renditions(artwork_id) if view.rendition.kind is RenditionKind.THUMBNAIL),
-            None,
-        )
+        held = self._held(artwork_id).get(edge)
         # All four conditions, because each one alone is satisfiable while the
         # cached file is wrong: a fresh row can point at a file someone deleted,
         # a present file can predate the master it claims to depict, and a
@@ -259,24 +290,101 @@ class ThumbnailService:
                 },
             )
 
-        self._write(source.path, cached)
-        # Recorded after the file exists, so a row can never promise an image
-        # that is not there. The reverse — a file with no row — costs one
-        # regeneration and nothing else.
-        self._catalogue.record_rendition(
-            artwork_id=artwork_id,
-            kind=RenditionKind.THUMBNAIL,
-            # The box requested, not the size produced: fitting preserves aspect
-            # so one edge comes out shorter, and recording that would give every
-            # work its own geometry and defeat the upsert this depends on.
-            target_width=THUMBNAIL_MAX_EDGE_PX,
-            target_height=THUMBNAIL_MAX_EDGE_PX,
-            path=str(cached.relative_to(self._settings.art_root)),
+        self._draw(artwork_id, source)
+        return cached
+
+    def warm(self, artwork_id: str) -> bool:
+        """Draw every size of this work's thumbnail that is not already current.
+
+        True when anything was drawn. The ladder is all or nothing — one size
+        missing or stale redraws the six files, because they share the decode
+        that is the whole cost — so a work the request path already drew is
+        answered from the rows without opening an image.
+        """
+        source = self.source_for(artwork_id)
+        held = self._held(artwork_id)
+        current = all(
+            edge in held
+            and not held[edge].stale
+            and _drawn_from(held[edge].rendition, source)
+            and self._path(artwork_id, edge, webp=False).is_file()
+            and self._path(artwork_id, edge, webp=True).is_file()
+            for edge in THUMBNAIL_EDGES_PX
         )
+        if current:
+            return False
+        self._draw(artwork_id, source)
+        return True
+
+    def _held(self, artwork_id: str) -> dict[int, RenditionView]:
+        """This work's thumbnail rows, by the edge each was drawn at."""
+        return {
+            view.rendition.target_width: view
+            for view in self._catalogue.list_renditions(artwork_id)
+            if view.rendition.kind is RenditionKind.THUMBNAIL
+        }
+
+    def _path(self, artwork_id: str, edge: int, *, webp: bool) -> Path:
+        """Where one size of one encoding lives.
+
+        The default size keeps the name the cache has always used; the others
+        carry their edge. The WebP is the JPEG's sibling by suffix, which is what
+        lets one rendition row answer for both — they are one drawing of one
+        image, made together, and go stale together.
+        """
+        stem = artwork_id if edge == THUMBNAIL_MAX_EDGE_PX else f"{artwork_id}-{edge}"
+        cached = self._settings.directory / f"{stem}.{'webp' if webp else 'jpg'}"
+        # The id reaches this filename from a URL path segment. Nothing that is
+        # not a catalogue id gets this far — `source_for` refuses an unknown work
+        # first — but the guard is here rather than resting on that, because a
+        # traversal is only ever one refactor away from being written to disk and
+        # this check costs nothing.
+        if not cached.resolve().is_relative_to(self._settings.directory.resolve()):
+            raise ServiceError(f"Artwork id {artwork_id!r} does not name a file inside the thumbnail cache.")
         return cached
 
-    def _write(self, source: Path, destination: Path) -> None:
-        """Downscale `source` into `destination`, atomically."""
+    def _draw(self, artwork_id: str, source: ThumbnailSource) -> None:
+        """Encode the whole ladder from `source`, write it, and record it."""
+        try:
+            ladder = self._imaging.run(
+                "thumbnail",
+                encode_ladder,
+                source.path,
+                max_edges=THUMBNAIL_EDGES_PX,
+                qualities={"JPEG": THUMBNAIL_JPEG_QUALITY, "WEBP": THUMBNAIL_WEBP_QUALITY},
+            )
+            for edge, encodings in ladder.items():
+                self._write(encodings["JPEG"].data, self._path(artwork_id, edge, webp=False))
+                self._write(encodings["WEBP"].data, self._path(artwork_id, edge, webp=True))
+        except Image.DecompressionBombError as exc:
+            raise ThumbnailUnavailable(f"The image at {source.path.name} is too large to open safely: {exc}") from exc
+        except ImagingAborted as exc:
+            raise ThumbnailUnavailable(f"The image at {source.path.name} could not be drawn: {exc}") from exc
+        except (OSError, UnidentifiedImageError, ValueError) as exc:
+            # `ValueError` is here for the same reason `inline_preview` carries
+            # it: Pillow raises it from `convert` for at least one mode (`La`).
+            # It was absent here while the sibling had it, which is exactly the
+            # drift that comes of keeping two copies of one decode.
+            raise ThumbnailUnavailable(f"The image at {source.path.name} could not be read: {exc}") from exc
+
+        for edge in ladder:
+            # Recorded after every file exists, so a row can never promise an
+            # image that is not there. The reverse — a file with no row — costs
+            # one regeneration and nothing else.
+            self._catalogue.record_rendition(
+                artwork_id=artwork_id,
+                kind=RenditionKind.THUMBNAIL,
+                # The box requested, not the size produced: fitting preserves
+                # aspect so one edge comes out shorter, and recording that would
+                # give every work its own geometry and defeat the upsert this
+                # depends on.
+                target_width=edge,
+                target_height=edge,
+                path=str(self._path(artwork_id, edge, webp=False).relative_to(self._settings.art_root)),
+            )
+
+    def _write(self, data: bytes, destination: Path) -> None:
+        """Put `data` at `destination`, atomically."""
         destination.parent.mkdir(parents=True, exist_ok=True)
         # A distinct name per attempt, so two requests for the same work racing
         # each other cannot write the same temp file: rename is atomic, but two
@@ -284,21 +392,118 @@ class ThumbnailService:
         staging = destination.with_name(f"{destination.name}.{uuid.uuid4().hex}.tmp")
         # **Cleanup in `finally`, not per handler.** The staging name is unique
         # per attempt, so anything this method fails to unlink is stranded for
-        # good and every retry strands another — and cleaning up only inside the
-        # handlers meant an exception neither of them named leaked a file as well
-        # as a 500. After a successful `os.replace` the name is already gone, so
-        # the unlink is a no-op on the happy path.
+        # good and every retry strands another. After a successful `os.replace`
+        # the name is already gone, so the unlink is a no-op on the happy path.
         try:
-            frame = encode_downscaled(source, max_edge=THUMBNAIL_MAX_EDGE_PX, quality=THUMBNAIL_JPEG_QUALITY)
-            staging.write_bytes(frame.data)
+            staging.write_bytes(data)
             os.replace(staging, destination)
-        except Image.DecompressionBombError as exc:
-            raise ThumbnailUnavailable(f"The image at {source.name} is too large to open safely: {exc}") from exc
-        except (OSError, UnidentifiedImageError, ValueError) as exc:
-            # `ValueError` is here for the same reason `inline_preview` carries
-            # it: Pillow raises it from `convert` for at least one mode (`La`).
-            # It was absent here while the sibling had it, which is exactly the
-            # drift that comes of keeping two copies of one decode.
-            raise ThumbnailUnavailable(f"The image at {source.name} could not be read: {exc}") from exc
         finally:
             staging.unlink(missing_ok=True)
+
+
+def thumbnail_edge(width: int | None) -> int:
+    """The size on the ladder that serves a picture shown `width` pixels wide.
+
+    The smallest that covers it, so a browser never upscales; the largest when
+    none does, because a bigger file than the ladder holds is not on offer.
+    """
+    if width is None:
+        return THUMBNAIL_MAX_EDGE_PX
+    if width < 1:
+        raise ServiceError(f"A thumbnail width must be a positive number of pixels, got {width}.")
+    return next((edge for edge in sorted(THUMBNAIL_EDGES_PX) if edge >= width), max(THUMBNAIL_EDGES_PX))
+
+
+class ThumbnailWarmer:
+    """Draw a work's thumbnails as soon as its image lands, on one background thread.
+
+    Acquisition and preparation each hand it the work whose held image just
+    changed; it draws the ladder before anyone opens the grid. **One thread**,
+    because a decode is CPU and memory on the smallest machine in the deployment,
+    and the grid's own requests need a core more than a batch needs finishing a
+    few seconds sooner. **A set rather than a queue**, so a work acquired and then
+    prepared before the thread reaches it is drawn once, from the canvas — which
+    is the picture that is current by then.
+
+    **Off until started, and a work handed to it then is not remembered.** A
+    plane that was not asked to warm — every test that acquires, and any
+    deployment that turns it off — still serves every thumbnail, from the
+    on-request path, exactly as before this existed. Remembering ids nobody will
+    drain would be a collection that only grows.
+    """
+
+    def __init__(self, thumbnails: ThumbnailService) -> None:
+        self._thumbnails = thumbnails
+        self._changed = threading.Condition()
+        #: Works waiting to be drawn, oldest first. A dict for its ordered keys.
+        self._pending: dict[str, None] = {}
+        self._running = False
+
+    def enqueue(self, artwork_id: str) -> None:
+        """Ask for this work's thumbnails to be drawn, if the warmer is running."""
+        with self._changed:
+            if not self._running:
+                return
+            self._pending[artwork_id] = None
+            self._changed.notify()
+
+    def start(self) -> Callable[[], None]:
+        """Start drawing on a daemon thread, returning the call that stops it.
+
+        A daemon thread for the reason the sweep's is one: a draw in flight when
+        the process stops leaves nothing the request path will not redo.
+        """
+        with self._changed:
+            if self._running:
+                raise ServiceError("The thumbnail warmer is already running.")
+            self._running = True
+        thread = threading.Thread(target=self._drain, name=WARMER_THREAD_NAME, daemon=True)
+        thread.start()
+
+        def halt() -> None:
+            with self._changed:
+                self._running = False
+                self._pending.clear()
+                self._changed.notify_all()
+            thread.join(timeout=_SHUTDOWN_JOIN_SECONDS)
+            if thread.is_alive():
+                log.warning(
+                    "the thumbnail warmer did not stop when asked and is still drawing",
+                    extra={"event": "thumbnail.warmer_wedged", "waited_seconds": _SHUTDOWN_JOIN_SECONDS},
+                )
+
+        return halt
+
+    def _drain(self) -> None:
+        while True:
+            with self._changed:
+                while self._running and not self._pending:
+                    self._changed.wait()
+                if not self._running:
+                    return
+                artwork_id = next(iter(self._pending))
+                del self._pending[artwork_id]
+            self._warm(artwork_id)
+
+    def _warm(self, artwork_id: str) -> None:
+        started = perf_counter()
+        try:
+            drawn = self._thumbnails.warm(artwork_id)
+        except ThumbnailUnavailable as exc:
+            # A normal state rather than a fault, for the reason the type gives:
+            # the card will say the same thing when the grid asks.
+            log.info("no thumbnails drawn for %s: %s", artwork_id, exc, extra={"event": "thumbnail.unwarmed"})
+            return
+        except Exception:  # prawduct:allow prawduct/broad-except -- one work's failure must not stop every later one
+            # The thread is the only one there is, so anything escaping here ends
+            # warming for the life of the process — silently, because the request
+            # path covers for it. Logged with its traceback and carried on.
+            log.exception("drawing thumbnails for %s failed", artwork_id, extra={"event": "thumbnail.warm_failed"})
+            return
+        if drawn:
+            log.info(
+                "drew thumbnails for %s in %.0fms",
+                artwork_id,
+                (perf_counter() - started) * 1000,
+                extra={"event": "thumbnail.warmed", "work_id": artwork_id},
+            )
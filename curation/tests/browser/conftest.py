@@ -49,7 +49,7 @@ import pathlib
 import pytest
 from PIL import Image
 
-from curation.http.models import ArtworkBoxOut, BackupOut, HealthOut, WallHeartbeatOut
+from curation.http.models import ArtworkBoxOut, BackupOut, HealthOut, StoreProfileOut, WallHeartbeatOut
 from curation.persistence.records import (
     AcquisitionMethod,
     FetchStatus,
@@ -129,7 +129,7 @@ def a_health_reading():
     observation is wrong.
     """
 
-    def _reading(*, walls=None, backup=None, description="Every wall has reported.", artwork_box=None):
+    def _reading(*, walls=None, backup=None, description="Every wall has reported.", artwork_box=None, statements=None):
         return HealthOut(
             walls=[WallHeartbeatOut(**wall) for wall in ([_a_wall()] if walls is None else walls)],
             description=description,
@@ -137,6 +137,9 @@ def a_health_reading():
             artwork_box=ArtworkBoxOut(
                 **(artwork_box or {"width": 3840, "height": 2160, "pixels_per_inch": 72.0, "floor_inches": 20.0})
             ),
+            # Off unless a test says otherwise, as it is on a deployment that has
+            # not set STORE_PROFILING.
+            statements=None if statements is None else StoreProfileOut(**statements),
         ).model_dump()
 
     return _reading
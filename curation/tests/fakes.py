@@ -15,8 +15,9 @@ that refuses.
 
 from __future__ import annotations
 
+import re
 import threading
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from decimal import Decimal
 
@@ -189,6 +190,7 @@ class FakeImageSearch:
     asked: list[str] = field(default_factory=list)
     fetched: list[str] = field(default_factory=list)
     resolved: list[str] = field(default_factory=list)
+    prepared: list[list[str]] = field(default_factory=list)
     preview_bytes: bytes | None = b"\xff\xd8\xff\xe0 jpeg"
 
     @property
@@ -208,6 +210,10 @@ class FakeImageSearch:
             raise ImageSearchFailure(f"could not reach the collection to resolve {url!r}")
         return f"https://www.artic.edu/iiif/2/{abs(hash(url)) % 100000}"
 
+    def prepare(self, queries: Sequence[ImageQuery]) -> None:
+        """Recorded and otherwise ignored: every answer here is already in memory."""
+        self.prepared.append([query.title for query in queries])
+
     def find_images(self, query: ImageQuery) -> Sequence[FoundImage]:
         self.asked.append(query.title)
         if self.unreachable or query.title in self.fails_for:
@@ -348,7 +354,9 @@ class FakeConversationEngine:
     #: is what the `conversation_tokens` row is asserted against, and a fixture
     #: priced at $1 would let an arithmetic error look right.
     cost_usd: Decimal = Decimal("0.00001896")
-    error: ConversationFailure | None = None
+    #: Raised by every turn. Usually a `ConversationFailure`; anything else is
+    #: a fault the service does not answer, which the stream route must.
+    error: Exception | None = None
     reason: str | None = None
     threads: list[Sequence[ThreadTurn]] = field(default_factory=list)
 
@@ -356,10 +364,14 @@ class FakeConversationEngine:
     def unavailable_reason(self) -> str | None:
         return self.reason
 
-    def answer(self, thread: Sequence[ThreadTurn]) -> ConversationReply:
+    def answer(self, thread: Sequence[ThreadTurn], *, on_text: Callable[[str], None] | None = None) -> ConversationReply:
         self.threads.append(tuple(thread))
         if self.error is not None:
             raise self.error
+        if on_text is not None:
+            # A word at a time, spaces kept, so the pieces join back into the reply.
+            for piece in re.findall(r"\S+\s*|\s+", self.reply):
+                on_text(piece)
         return ConversationReply(
             text=self.reply,
             spend=(
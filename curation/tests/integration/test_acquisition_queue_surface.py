@@ -0,0 +1,135 @@
+"""Queued acquisition over real HTTP and over the mounted tool surface.
+
+Against a real uvicorn server rather than an in-process transport, per this
+suite's standing rule: Starlette does not run a mounted sub-app's lifespan, so an
+in-process test would pass against an application whose every MCP request fails.
+
+The queue's policy is held in `tests/unit/test_acquisition_queue.py`. What is
+held here is that both surfaces reach it, hand back a batch that can be followed,
+and that a fetch run behind the handle records its outcome where `sources` reads
+it. This deployment wires no transport, so every fetch fails — which is the
+point: the failure is a recorded outcome, reached without the caller waiting.
+"""
+
+import json
+import time
+
+import httpx
+import pytest
+
+from curation.persistence.records import AcquisitionMethod, RightsStatus, SourceClass
+
+#: Long enough for a loaded machine to run one refused fetch.
+_PATIENCE_SECONDS = 10
+
+
+async def call(server_url: str, tool: str, **arguments) -> tuple[dict, bool]:
+    """One MCP tool call over the mounted surface, as an agent would make it."""
+    from mcp import ClientSession
+    from mcp.client.streamable_http import streamable_http_client
+
+    async with streamable_http_client(f"{server_url}/mcp") as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            result = await session.call_tool(tool, arguments)
+    return json.loads(result.content[0].text), bool(result.isError)
+
+
+@pytest.fixture
+def http(server_url):
+    with httpx.Client(base_url=server_url, timeout=30.0) as client:
+        yield client
+
+
+@pytest.fixture
+def direct_work(services):
+    """A work whose primary source is a plain URL, so no tile binary is involved."""
+    work = services.catalogue.add_artwork(title="Early Sunday Morning")
+    services.catalogue.add_source(
+        artwork_id=work.id,
+        url="https://gallery.example.com/early-sunday-morning.jpg",
+        provider="gallery_site",
+        source_class=SourceClass.CONTEMPORARY_WEB,
+        acquisition_method=AcquisitionMethod.DIRECT_HTTP,
+        rights_status=RightsStatus.UNKNOWN,
+        is_primary=True,
+    )
+    return work
+
+
+def _settled(http: httpx.Client, batch_id: str) -> list[dict]:
+    """The batch's jobs once none is waiting or running."""
+    deadline = time.monotonic() + _PATIENCE_SECONDS
+    while time.monotonic() < deadline:
+        jobs = http.get("/api/acquisitions", params={"batch_id": batch_id}).json()["jobs"]
+        if all(job["state"] not in ("queued", "running") for job in jobs):
+            return jobs
+        time.sleep(0.05)
+    pytest.fail(f"batch {batch_id} never settled")
+
+
+def test_a_queued_batch_is_fetched_behind_the_response_and_recorded(http, direct_work):
+    answer = http.post("/api/acquisitions", json={"artwork_ids": [direct_work.id], "priority": 2})
+
+    assert answer.status_code == 200
+    batch = answer.json()
+    assert batch["count"] == 1
+    assert batch["jobs"][0]["priority"] == 2
+    (job,) = _settled(http, batch["batch_id"])
+    assert (job["state"], job["outcome"]) == ("finished", "failed")
+    assert job["finished_at"] is not None
+    # A direct fetch is one body; only a tiled one counts tiles.
+    assert (job["tiles_fetched"], job["tiles_expected"]) == (None, None)
+
+
+def test_a_batch_naming_an_unknown_work_is_refused_with_the_surfaces_error_shape(http):
+    answer = http.post("/api/acquisitions", json={"artwork_ids": ["no-such-work"]})
+
+    assert answer.status_code == 400
+    assert "error" in answer.json()
+
+
+def test_cancelling_a_finished_job_says_there_is_nothing_to_cancel(http, direct_work):
+    batch = http.post("/api/acquisitions", json={"artwork_ids": [direct_work.id]}).json()
+    (job,) = _settled(http, batch["batch_id"])
+
+    answer = http.post(f"/api/acquisitions/{job['job_id']}/cancel")
+
+    assert answer.status_code == 400
+    assert "nothing to cancel" in answer.json()["error"]
+    assert http.post(f"/api/acquisitions/batches/{batch['batch_id']}/cancel").json()["jobs"][0]["state"] == "finished"
+
+
+async def test_the_tool_queues_a_batch_and_reports_it_by_batch_id(server_url, direct_work):
+    queued, errored = await call(server_url, "art_catalogue", action="queue_acquisitions", artwork_ids=[direct_work.id])
+
+    assert errored is False
+    assert queued["jobs"][0]["artwork_id"] == direct_work.id
+    with httpx.Client(base_url=server_url, timeout=30.0) as client:
+        _settled(client, queued["batch_id"])
+
+    status, errored = await call(server_url, "art_catalogue", action="acquisition_status", batch_id=queued["batch_id"])
+
+    assert errored is False
+    assert [job["state"] for job in status["jobs"]] == ["finished"]
+    assert (status["queued"], status["running"]) == (0, 0)
+    sources, _ = await call(server_url, "art_catalogue", action="sources", artwork_id=direct_work.id)
+    assert sources["sources"][0]["last_fetch_status"] == "failed"
+
+
+async def test_the_tool_refuses_a_cancel_naming_nothing(server_url):
+    payload, errored = await call(server_url, "art_catalogue", action="cancel_acquisitions")
+
+    assert errored is True
+    assert "job_id or a batch_id" in payload["error"]
+
+
+async def test_preparing_a_batch_whose_fetches_failed_prepares_nothing_and_spends_nothing(server_url, direct_work):
+    queued, _ = await call(server_url, "art_catalogue", action="queue_acquisitions", artwork_ids=[direct_work.id])
+    with httpx.Client(base_url=server_url, timeout=30.0) as client:
+        _settled(client, queued["batch_id"])
+
+    payload, errored = await call(server_url, "art_catalogue", action="prepare_batch", batch_id=queued["batch_id"])
+
+    assert errored is False
+    assert (payload["count"], payload["still_fetching"], payload["cost_usd"]) == (0, 0, "0")
@@ -16,8 +16,10 @@ phase 1 on the calling thread deliberately, but a handle that must come back
 while the work goes on behind it is not a claim a synchronous test can check.
 """
 
+import json
 import threading
 import time
+from collections.abc import Iterator
 from decimal import Decimal
 
 import httpx
@@ -372,6 +374,89 @@ class TestCommissioningARun:
         assert Decimal(spend["cost_usd"]) > 0
 
 
+def events(response: httpx.Response) -> Iterator[tuple[str, dict]]:
+    """The named events on an open stream, parsed the way `EventSource` would.
+
+    Comment lines — the stream's keep-alive — are skipped, as a browser skips
+    them. Every event this stream sends is a single `data:` line.
+    """
+    name = None
+    for line in response.iter_lines():
+        if line.startswith("event: "):
+            name = line.removeprefix("event: ")
+        elif line.startswith("data: "):
+            yield name, json.loads(line.removeprefix("data: "))
+
+
+class TestWatchingARunWithoutAsking:
+    """The run pushed to the browser as it changes, on a connection that holds no thread."""
+
+    def test_the_stream_opens_with_where_the_run_is(self, http, engine):
+        engine.gate = threading.Event()
+        try:
+            run_id = http.post("/api/runs", json={"intent": "Dutch still life"}).json()["run_id"]
+            with http.stream("GET", f"/api/runs/{run_id}/events") as response:
+                assert response.status_code == 200
+                assert response.headers["content-type"].startswith("text/event-stream")
+                name, view = next(events(response))
+        finally:
+            engine.gate.set()
+
+        assert name == "run"
+        assert view["run"]["status"] == RunStatus.RESOLVING_WORKS
+
+    def test_a_change_is_pushed_and_the_end_closes_the_stream(self, http, engine):
+        """Everything from a run in flight to its end, with no request in between but the cancel."""
+        engine.gate = threading.Event()
+        run_id = http.post("/api/runs", json={"intent": "Dutch still life"}).json()["run_id"]
+        seen: list[tuple[str, dict]] = []
+        opened = threading.Event()
+
+        def watch():
+            with (
+                httpx.Client(base_url=str(http.base_url), timeout=30.0) as own,
+                own.stream("GET", f"/api/runs/{run_id}/events") as response,
+            ):
+                for event in events(response):
+                    seen.append(event)
+                    opened.set()
+
+        watcher = threading.Thread(target=watch)
+        watcher.start()
+        # Released only once the stream has said where the run is, so every
+        # change after this one is one the stream has to push.
+        assert opened.wait(timeout=20), "the stream never opened"
+        engine.gate.set()
+        settled(http, run_id)
+        http.post(f"/api/runs/{run_id}/cancel")
+        watcher.join(timeout=20)
+
+        assert not watcher.is_alive(), "the stream stayed open after the run ended"
+        statuses = [view["run"]["status"] for _, view in seen]
+        assert statuses[0] == RunStatus.RESOLVING_WORKS
+        assert len(set(statuses)) > 1, "the run moved on and the stream never said so"
+        assert seen[-1][0] == "end"
+        assert seen[-1][1]["run"]["status"] == RunStatus.CANCELLED
+        assert [name for name, _ in seen].count("end") == 1
+
+    def test_a_run_that_has_already_ended_gets_its_end_and_nothing_else(self, http, engine):
+        run_id = http.post("/api/runs", json={"intent": "Surrealists"}).json()["run_id"]
+        settled(http, run_id)
+        http.post(f"/api/runs/{run_id}/cancel")
+
+        with http.stream("GET", f"/api/runs/{run_id}/events") as response:
+            received = list(events(response))
+
+        assert [name for name, _ in received] == ["end"]
+
+    def test_an_unknown_run_is_refused_before_any_stream_opens(self, http):
+        """An error on a stream that has already said 200 is one `EventSource` cannot read."""
+        response = http.get("/api/runs/no-such-run/events")
+
+        assert response.status_code == 400
+        assert "no-such-run" in response.json()["error"]
+
+
 class TestWhatTheRunBroughtBack:
     """A deployment wired for phase 2, so the tallies have something to count."""
 
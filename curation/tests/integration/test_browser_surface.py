@@ -179,6 +179,41 @@ class TestTheClientIsServed:
         for module in modules:
             assert http.get(f"/static/{module}").status_code == 200, module
 
+    def test_the_shell_names_the_bundle_and_is_revalidated(self, http):
+        """The shell is the one file a browser asks about again, so it is the one with a validator."""
+        response = http.get("/")
+        assert response.headers["cache-control"] == "no-cache"
+        assert re.search(r'src="/assets/app\.[0-9a-f]{10}\.js"', response.text)
+
+        again = http.get("/", headers={"If-None-Match": response.headers["etag"]})
+        assert again.status_code == 304
+        assert again.content == b""
+
+    def test_a_bundled_file_is_kept_forever_and_sent_compressed(self, http):
+        """The whole point of a content-hashed name: nothing about it can go stale.
+
+        Asked for with an explicit `Accept-Encoding` and read raw, because the
+        client decodes gzip transparently and would otherwise make the
+        compressed and the plain answer indistinguishable here.
+        """
+        script = re.search(r'src="(/assets/[^"]+)"', http.get("/").text).group(1)
+        with http.stream("GET", script, headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+        assert response.status_code == 200
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert "javascript" in response.headers["content-type"]
+        assert len(raw) < (STATIC_DIR / "app.js").stat().st_size
+
+        plain = http.get(script, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert re.search(r'from "\./core/router\.[0-9a-f]{10}\.js"', plain.text)
+
+    def test_a_name_from_another_deployment_is_not_found(self, http):
+        """Answering it with today's bytes under `immutable` would pin the wrong file for good."""
+        assert http.get("/assets/app.0000000000.js").status_code == 404
+
     def test_an_unknown_api_path_is_not_answered_with_the_shell(self, http):
         """A catch-all that returned HTML here would reach a client as unparseable JSON."""
         response = http.get("/api/nothing-here")
@@ -249,6 +284,26 @@ class TestThumbnails:
         response = http.get(f"/api/works/{artwork.id}/thumbnail")
         assert "no-cache" in response.headers["cache-control"]
 
+    def test_a_browser_that_reads_webp_is_sent_webp(self, http, hold):
+        artwork = hold("Automat")
+        response = http.get(f"/api/works/{artwork.id}/thumbnail", headers={"Accept": "image/avif,image/webp,*/*;q=0.8"})
+        assert response.headers["content-type"] == "image/webp"
+        assert response.content[8:12] == b"WEBP"
+        assert response.headers["vary"] == "Accept"
+
+    def test_a_wildcard_is_not_taken_as_reading_webp(self, http, hold):
+        """The browsers that send only `*/*` for an image include the ones that cannot decode it."""
+        artwork = hold("Automat")
+        response = http.get(f"/api/works/{artwork.id}/thumbnail", headers={"Accept": "*/*"})
+        assert response.headers["content-type"] == "image/jpeg"
+
+    def test_a_width_picks_the_size_a_srcset_asked_for(self, http, hold):
+        artwork = hold("Automat", width=4000, height=3000)
+        small = http.get(f"/api/works/{artwork.id}/thumbnail", params={"w": 240}).content
+        large = http.get(f"/api/works/{artwork.id}/thumbnail", params={"w": 960}).content
+        assert len(small) < len(large)
+        assert http.get(f"/api/works/{artwork.id}/thumbnail", params={"w": 0}).status_code == 422
+
     def test_a_work_with_no_image_refuses_with_the_reason_shown_on_its_card(self, http, seeded_service):
         empty = next(work for work in seeded_service.list_artworks().entries)
         response = http.get(f"/api/works/{empty.artwork.id}/thumbnail")
@@ -484,8 +539,39 @@ class TestHealth:
         # And the panel is three observations, not four. The check above would
         # pass for a balance carried under a name that dodges those four words.
         # `description` is the walls' own summary rather than a fourth signal —
-        # it states nothing the readings beside it do not.
-        assert set(http.get("/api/health").json()) == {"walls", "description", "backup", "artwork_box"}
+        # it states nothing the readings beside it do not. `statements` is not
+        # one either: it is the catalogue's own timings, null unless profiling
+        # was asked for, and it judges nothing. Nor is `imaging`, which is the
+        # decode queue's timings on the same terms, nor `storage`, which is how
+        # full the cache directories are — bytes on a card, not money — nor
+        # `originals`, which is what the held images weigh on the same terms,
+        # nor `providers`, which is whether each outbound host is being asked.
+        assert set(http.get("/api/health").json()) == {
+            "walls",
+            "description",
+            "backup",
+            "artwork_box",
+            "statements",
+            "imaging",
+            "storage",
+            "originals",
+            "providers",
+        }
+
+    def test_statement_timings_are_absent_rather_than_empty_when_profiling_is_off(self, http):
+        assert http.get("/api/health").json()["statements"] is None
+
+    def test_the_panel_says_what_drawing_a_thumbnail_cost(self, http, hold):
+        artwork = hold("Nighthawks")
+        http.get(f"/api/works/{artwork.id}/thumbnail")
+
+        imaging = http.get("/api/health").json()["imaging"]
+        # The suite's plane runs its decodes inline, and still counts them.
+        assert (imaging["workers"], imaging["in_flight"], imaging["queued"]) == (0, 0, 0)
+        (thumbnail,) = [kind for kind in imaging["kinds"] if kind["kind"] == "thumbnail"]
+        assert thumbnail["calls"] == 1
+        assert thumbnail["failed"] == 0
+        assert thumbnail["run_ms"] > 0
 
     def test_the_panel_shows_the_geometry_every_size_in_the_grid_is_judged_against(self, http):
         box = http.get("/api/health").json()["artwork_box"]
@@ -747,6 +833,66 @@ class TestThumbnailRevalidation:
         assert http.get(f"/api/works/{artwork.id}/thumbnail", headers={"If-None-Match": offered}).status_code == 304
 
 
+class TestListingRevalidation:
+    """The listings the screens poll, answered with a 304 between commits.
+
+    What matters is the direction of every failure: a 304 over a catalogue that
+    has changed shows a curator a grid that is not the catalogue, while a 200
+    that could have been a 304 costs the plane one recomputation.
+    """
+
+    @pytest.fixture
+    def listings(self, http, wall, run):
+        theme = http.post("/api/themes", json={"name": "Nocturnes"}).json()
+        return [
+            "/api/works?offset=0",
+            "/api/themes",
+            "/api/walls",
+            f"/api/runs/{run.id}/candidates?offset=0",
+            f"/api/manifest?wall_id={wall['wall_id']}&theme_id={theme['theme_id']}",
+        ]
+
+    def test_every_polled_listing_revalidates_to_an_empty_304(self, http, listings):
+        for path in listings:
+            first = http.get(path)
+            assert first.status_code == 200, path
+            assert first.headers["etag"].startswith('W/"'), path
+            assert first.headers["cache-control"] == "private, no-cache", path
+
+            again = http.get(path, headers={"If-None-Match": first.headers["etag"]})
+            assert again.status_code == 304, path
+            assert again.content == b"", path
+            assert again.headers["etag"] == first.headers["etag"], path
+
+    def test_a_commit_between_two_asks_gets_the_new_answer(self, http):
+        stale = http.get("/api/themes").headers["etag"]
+        http.post("/api/themes", json={"name": "Nocturnes"})
+
+        response = http.get("/api/themes", headers={"If-None-Match": stale})
+        assert response.status_code == 200, "the browser was told a list without the new theme is current"
+        assert [theme["theme"]["name"] for theme in response.json()["themes"]] == ["Nocturnes"]
+        assert response.headers["etag"] != stale
+
+    def test_a_discovery_commit_moves_the_collection_listings_too(self, http, propose):
+        """One file, one generation: a listing may join rows either half writes."""
+        stale = http.get("/api/works?offset=0").headers["etag"]
+        propose("The Son of Man")
+
+        assert http.get("/api/works?offset=0", headers={"If-None-Match": stale}).status_code == 200
+
+    def test_one_question_s_validator_does_not_answer_another(self, http):
+        etag = http.get("/api/works?offset=0").headers["etag"]
+
+        response = http.get("/api/works?offset=0&q=harbour", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+
+    def test_a_refusal_carries_no_validator(self, http):
+        """A tag on a refusal would let the next ask be told the refusal still stands."""
+        response = http.get("/api/runs/no-such-run/candidates")
+        assert response.status_code == 400
+        assert "etag" not in response.headers
+
+
 class TestWhatTheWallSummaryClaims:
     """All three branches of the one sentence both surfaces state.
 
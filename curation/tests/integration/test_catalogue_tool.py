@@ -109,8 +109,12 @@ async def test_help_works_without_arguments_and_without_the_catalogue(server_url
         "archive",
         "restore",
         "retry_acquisition",
+        "queue_acquisitions",
+        "acquisition_status",
+        "cancel_acquisitions",
         "set_mat_color",
         "regenerate",
+        "prepare_batch",
         "help",
     }
 
@@ -157,8 +161,12 @@ async def test_an_unknown_action_is_an_error_result_that_enumerates_the_valid_se
         "archive",
         "restore",
         "retry_acquisition",
+        "queue_acquisitions",
+        "acquisition_status",
+        "cancel_acquisitions",
         "set_mat_color",
         "regenerate",
+        "prepare_batch",
         "help",
     ]
     assert payload["example"] == "art_catalogue(action='help')"
@@ -12,6 +12,7 @@ conversation spent turns up in the month total. The rest pin the pieces it would
 be easy to break without failing either.
 """
 
+import json
 from datetime import UTC, datetime
 from decimal import Decimal
 
@@ -25,8 +26,6 @@ from curation.persistence.discovery_records import InitiatedBy, SpendCategory
 
 async def call(server_url: str, tool: str, **arguments) -> tuple[dict, bool]:
     """One MCP tool call over the mounted surface, as an agent would make it."""
-    import json
-
     from mcp import ClientSession
     from mcp.client.streamable_http import streamable_http_client
 
@@ -235,3 +234,63 @@ def test_an_unknown_conversation_is_refused_in_the_one_error_shape(server_url):
 
     assert response.status_code == 400
     assert "No conversation with id" in response.json()["error"]
+
+
+def streamed(server_url: str, conversation_id: str, text: str | None = None) -> tuple[int, list[tuple[str, str]]]:
+    """The stream route's status and its events, as `(name, data)` in the order they came."""
+    events: list[tuple[str, str]] = []
+    with httpx.stream(
+        "POST",
+        f"{server_url}/api/conversations/{conversation_id}/turns/stream",
+        json={} if text is None else {"text": text},
+        timeout=20,
+    ) as response:
+        if response.status_code != 200:
+            response.read()
+            return response.status_code, [("error", response.json()["error"])]
+        name = None
+        for line in response.iter_lines():
+            if line.startswith("event:"):
+                name = line.removeprefix("event:").strip()
+            elif line.startswith("data:"):
+                events.append((name, line.removeprefix("data:").strip()))
+    return 200, events
+
+
+def test_a_streamed_turn_sends_the_reply_in_pieces_and_then_the_thread(server_url, conversation_engine):
+    """The pieces join into the reply, and the last event is what `speak` would have answered."""
+    conversation_id = started(server_url)
+
+    status, events = streamed(server_url, conversation_id, "Something calm.")
+
+    assert status == 200
+    *pieces, (last, view) = events
+    assert {name for name, _ in pieces} == {"text"}
+    assert "".join(json.loads(data)["text"] for _, data in pieces) == conversation_engine.reply
+    assert last == "turn"
+    assert [turn["text"] for turn in json.loads(view)["turns"]] == ["Something calm.", conversation_engine.reply]
+    again = httpx.get(f"{server_url}/api/conversations/{conversation_id}", timeout=20).json()
+    assert again["turns"] == json.loads(view)["turns"]
+
+
+def test_a_streamed_question_that_is_refused_is_an_ordinary_400(server_url):
+    """Refused before the stream opens, so it is never an event on a stream that said 200."""
+    status, events = streamed(server_url, "not-a-conversation", "Something calm.")
+
+    assert status == 400
+    assert "No conversation with id" in events[0][1]
+
+
+def test_a_streamed_answer_that_raises_ends_in_an_error_event(server_url, conversation_engine):
+    """Past the 200 a status cannot say it, so the stream does, and the question is still in the thread."""
+    conversation_id = started(server_url)
+    conversation_engine.error = RuntimeError("a fault nothing answers")
+
+    status, events = streamed(server_url, conversation_id, "Something calm.")
+
+    assert status == 200
+    ((name, data),) = events
+    assert name == "error"
+    assert "could not be finished" in json.loads(data)["detail"]
+    again = httpx.get(f"{server_url}/api/conversations/{conversation_id}", timeout=20).json()
+    assert [turn["text"] for turn in again["turns"]] == ["Something calm."]
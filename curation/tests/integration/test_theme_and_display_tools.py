@@ -468,6 +468,15 @@ async def test_status_says_plainly_that_the_display_plane_has_never_reported(ser
     )
 
 
+async def test_statements_says_profiling_is_off_rather_than_that_nothing_was_slow(server_url):
+    payload, errored = await call(server_url, "art_display", action="statements")
+
+    assert errored is False
+    assert payload["profiling"] is False
+    assert "statements" not in payload
+    assert "STORE_PROFILING" in payload["observation"]
+
+
 async def test_sync_names_every_work_that_will_not_be_on_the_wall(server_url, wall):
     """The seeded works have no originals, so a sync puts none of them up.
 
@@ -0,0 +1,90 @@
+"""Holding each distinct original once, and linking every work's path to it."""
+
+import errno
+import os
+
+import pytest
+
+from curation.acquisition import blobs
+from curation.acquisition.blobs import BlobStore
+
+_HASH = "ab" + "0" * 62
+
+
+@pytest.fixture
+def store(tmp_path) -> BlobStore:
+    return BlobStore(tmp_path / "raw")
+
+
+def _staged(tmp_path, payload: bytes = b"image bytes"):
+    staged = tmp_path / "raw" / "w.jpg.partial"
+    staged.parent.mkdir(parents=True, exist_ok=True)
+    staged.write_bytes(payload)
+    return staged
+
+
+def test_a_promoted_image_is_held_once_and_named_by_the_work(store, tmp_path):
+    destination = tmp_path / "raw" / "w1.jpg"
+
+    placed = store.promote(_staged(tmp_path), content_hash=_HASH, destination=destination)
+
+    assert (placed.shared, placed.linked) == (False, True)
+    assert destination.samefile(store.path_for(_HASH))
+    assert store.path_for(_HASH).parent.name == "ab"
+
+
+def test_the_same_bytes_for_a_second_work_are_linked_and_the_staged_copy_discarded(store, tmp_path):
+    store.promote(_staged(tmp_path), content_hash=_HASH, destination=tmp_path / "raw" / "w1.jpg")
+    staged = _staged(tmp_path)
+
+    placed = store.promote(staged, content_hash=_HASH, destination=tmp_path / "raw" / "w2.jpg")
+
+    assert placed.shared
+    assert not staged.exists()
+    assert (tmp_path / "raw" / "w1.jpg").samefile(tmp_path / "raw" / "w2.jpg")
+
+
+def test_a_file_written_before_the_store_is_adopted_when_placed(store, tmp_path):
+    legacy = tmp_path / "raw" / "Nighthawks.jpg"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_bytes(b"image bytes")
+
+    store.place(legacy, content_hash=_HASH, destination=tmp_path / "raw" / "w2.jpg")
+
+    assert legacy.samefile(store.path_for(_HASH))
+    assert (tmp_path / "raw" / "w2.jpg").samefile(legacy)
+
+
+def test_a_blob_is_released_only_once_no_work_links_it(store, tmp_path):
+    destination = tmp_path / "raw" / "w1.jpg"
+    store.promote(_staged(tmp_path), content_hash=_HASH, destination=destination)
+
+    assert store.release(_HASH) is False
+    destination.unlink()
+    assert store.release(_HASH) is True
+    assert not store.path_for(_HASH).exists()
+
+
+def test_a_filesystem_that_cannot_link_holds_a_file_per_work(store, tmp_path, monkeypatch):
+    def refuse(_source, _destination):
+        raise OSError(errno.EPERM, "Operation not permitted")
+
+    monkeypatch.setattr(blobs.os, "link", refuse)
+    destination = tmp_path / "raw" / "w1.jpg"
+
+    placed = store.promote(_staged(tmp_path), content_hash=_HASH, destination=destination)
+
+    assert (placed.shared, placed.linked) == (False, False)
+    assert destination.read_bytes() == b"image bytes"
+    assert not store.path_for(_HASH).exists()
+
+
+def test_a_link_failing_for_another_reason_is_raised(store, tmp_path, monkeypatch):
+    def fail(_source, _destination):
+        raise OSError(errno.EIO, "Input/output error")
+
+    monkeypatch.setattr(blobs.os, "link", fail)
+
+    with pytest.raises(OSError, match="Input/output"):
+        store.promote(_staged(tmp_path), content_hash=_HASH, destination=tmp_path / "raw" / "w1.jpg")
+    assert os.listdir(tmp_path / "raw" / "by-hash" / "ab") == [f"{_HASH}.jpg"]
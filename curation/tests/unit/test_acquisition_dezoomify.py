@@ -9,13 +9,17 @@ have.
 
 import json
 import stat
+import time
 from pathlib import Path
 
 import pytest
 
 from curation.acquisition.dezoomify import (
+    REFUSAL_WINDOW,
     DezoomifyUnavailable,
+    RefusalWindow,
     TileOutcome,
+    TileProgress,
     reclaim_tile_cache,
     tile_fetch,
 )
@@ -125,13 +129,13 @@ class TestSecurityOfTheInvocation:
         import subprocess as sp
 
         seen = {}
-        real = sp.run
+        real = sp.Popen
 
         def capture(*args, **kwargs):
             seen.update(kwargs)
             return real(*args, **kwargs)
 
-        monkeypatch.setattr(sp, "run", capture)
+        monkeypatch.setattr(sp, "Popen", capture)
         _run(tmp_path, _fake_binary(tmp_path, SAVES_IMAGE))
 
         assert seen["stdin"] is sp.DEVNULL
@@ -277,6 +281,70 @@ class TestTheTileCache:
         reclaim_tile_cache(tmp_path / "never-existed")
 
 
+class TestWatchingARunningFetch:
+    """Progress read off the cache and stderr while the binary runs.
+
+    The fakes write tiles into the cache and warnings onto stderr at the pace a
+    slow museum would, because the thing under test is what is seen *before*
+    the binary exits.
+    """
+
+    def _tiles_then_image(self, tmp_path: Path, count: int, *, warnings: int = 0) -> Path:
+        cache = tmp_path / "tiles"
+        body = "".join(f'echo "[WARN ] Could not download tile {n}: 503" >&2\n' for n in range(warnings))
+        body += "".join(f'printf t > "{cache}/{n}.jpg"\nsleep 0.02\n' for n in range(count))
+        return _fake_binary(tmp_path, body + "sleep 0.6\n" + SAVES_IMAGE)
+
+    def test_tile_counts_are_reported_as_they_change(self, tmp_path):
+        seen = []
+
+        result = _run(tmp_path, self._tiles_then_image(tmp_path, 3), progress=seen.append)
+
+        assert result.outcome is TileOutcome.COMPLETE
+        assert seen, "a run longer than a poll reported nothing while it ran"
+        assert seen[-1] == TileProgress(tiles_fetched=3, tiles_refused=0)
+        assert [report.tiles_fetched for report in seen] == sorted(report.tiles_fetched for report in seen)
+
+    def test_a_server_refusing_every_tile_is_stopped_before_the_timeout(self, tmp_path):
+        body = "".join(f'echo "[WARN ] Could not download tile {n}: 403" >&2\n' for n in range(REFUSAL_WINDOW + 4))
+        script = _fake_binary(tmp_path, body + "sleep 30\n" + SAVES_IMAGE)
+        started = time.monotonic()
+
+        result = _run(tmp_path, script, timeout_seconds=60)
+
+        assert time.monotonic() - started < 10
+        assert result.outcome is TileOutcome.FAILED
+        assert f"refused {REFUSAL_WINDOW} of the last {REFUSAL_WINDOW} tiles" in result.detail
+        assert not (tmp_path / "out" / "work.partial.jpg").exists()
+
+    def test_a_few_refusals_in_a_healthy_walk_do_not_stop_it(self, tmp_path):
+        result = _run(tmp_path, self._tiles_then_image(tmp_path, REFUSAL_WINDOW, warnings=4))
+
+        assert result.outcome is TileOutcome.COMPLETE
+
+    def test_the_summary_line_is_not_counted_as_a_refused_tile(self, tmp_path):
+        seen = []
+        script = _fake_binary(
+            tmp_path, SAVES_IMAGE.replace("exit 0", 'echo "[WARN ] Only 1 tiles out of 2 could be downloaded." >&2\nexit 1')
+        )
+
+        _run(tmp_path, script, progress=seen.append)
+
+        assert all(report.tiles_refused == 0 for report in seen)
+
+
+def test_the_refusal_window_judges_only_a_full_window():
+    window = RefusalWindow(size=4, ratio=0.75)
+    window.record(refused=3)
+    assert not window.refusing, "three answers are not yet a window"
+
+    window.record(arrived=1)
+    assert window.refusing
+
+    window.record(arrived=2)
+    assert not window.refusing
+
+
 class TestDestination:
     def test_the_staged_name_keeps_the_real_suffix_last(self, tmp_path):
         # The binary picks its output encoder from the extension, so a staged path
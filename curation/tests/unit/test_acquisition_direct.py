@@ -5,7 +5,7 @@ from contextlib import contextmanager
 
 import pytest
 
-from curation.acquisition.direct import direct_fetch
+from curation.acquisition.direct import ServedBody, direct_fetch
 
 
 def _serves(*chunks: bytes, raises: Exception | None = None):
@@ -41,6 +41,10 @@ class TestTheHappyPath:
         assert result.byte_size == 6
         assert result.content_hash == hashlib.sha256(b"abcdef").hexdigest()
 
+    def test_the_head_of_the_file_is_kept_without_reading_it_back(self, tmp_path):
+        result = _run(tmp_path, _serves(b"abc", b"def"))
+        assert (result.witnessed.head, result.witnessed.reread_bytes) == (b"abcdef", 0)
+
     def test_the_parent_directory_is_created(self, tmp_path):
         result = _run(tmp_path, _serves(b"x"))
         assert result.path.parent.is_dir()
@@ -134,6 +138,106 @@ class TestRefetching:
         assert held.read_bytes() == b"the image the work is displaying"
 
 
+class _Rangeable:
+    """A server that serves ranges, and breaks off when told to.
+
+    `payload` is the file; each answer is the rest of it from where the fetch
+    asked to resume, cut short after `cut` bytes if `cut` is set.
+    """
+
+    def __init__(self, payload: bytes, *, validator: str | None = '"v1"') -> None:
+        self.payload = payload
+        self.validator = validator
+        self.cut: int | None = None
+        self.asked: list = []
+
+    @contextmanager
+    def __call__(self, _url: str, *, resume=None):
+        self.asked.append(resume)
+        offset = 0 if resume is None or resume.validator != self.validator else resume.offset
+        rest = self.payload[offset:]
+
+        def gen():
+            if self.cut is None:
+                yield rest
+                return
+            yield rest[: self.cut]
+            raise RuntimeError("read timed out")
+
+        yield ServedBody(gen(), offset=offset, validator=self.validator)
+
+
+class TestResuming:
+    PAYLOAD = bytes(range(256)) * 40
+
+    def test_an_interrupted_fetch_keeps_its_bytes_when_the_server_can_resume(self, tmp_path):
+        server = _Rangeable(self.PAYLOAD)
+        server.cut = 4000
+
+        result = _run(tmp_path, server)
+
+        assert not result.usable
+        assert "4000 bytes were kept" in result.detail
+        assert (tmp_path / "raw" / "work.jpg.partial").read_bytes() == self.PAYLOAD[:4000]
+
+    def test_the_next_attempt_asks_for_the_rest_and_hashes_the_whole(self, tmp_path, caplog):
+        server = _Rangeable(self.PAYLOAD)
+        server.cut = 4000
+        _run(tmp_path, server)
+        server.cut = None
+
+        with caplog.at_level("INFO", logger="curation.acquisition.direct"):
+            result = _run(tmp_path, server)
+
+        assert server.asked[-1].offset == 4000
+        assert result.path.read_bytes() == self.PAYLOAD
+        assert result.content_hash == hashlib.sha256(self.PAYLOAD).hexdigest()
+        (resumed,) = [record for record in caplog.records if getattr(record, "event", None) == "acquisition.direct_resumed"]
+        assert (resumed.resumed_bytes, resumed.fetched_bytes) == (4000, len(self.PAYLOAD) - 4000)
+        # The kept part is the only part read back, and the head still starts
+        # at the start of the file rather than where the resume did.
+        assert result.witnessed.reread_bytes == 4000
+        assert result.witnessed.head == self.PAYLOAD
+
+    def test_a_file_that_changed_meanwhile_is_fetched_again_from_the_start(self, tmp_path):
+        server = _Rangeable(self.PAYLOAD)
+        server.cut = 4000
+        _run(tmp_path, server)
+        server.cut, server.validator, server.payload = None, '"v2"', b"a different file"
+
+        result = _run(tmp_path, server)
+
+        assert result.path.read_bytes() == b"a different file"
+        assert result.content_hash == hashlib.sha256(b"a different file").hexdigest()
+
+    def test_nothing_is_kept_for_a_server_that_cannot_resume(self, tmp_path):
+        server = _Rangeable(self.PAYLOAD, validator=None)
+        server.cut = 4000
+
+        _run(tmp_path, server)
+
+        assert not (tmp_path / "raw" / "work.jpg.partial").exists()
+        server.cut = None
+        _run(tmp_path, server)
+        assert server.asked == [None, None]
+
+    def test_kept_bytes_are_not_resumed_into_a_different_url(self, tmp_path):
+        server = _Rangeable(self.PAYLOAD)
+        server.cut = 4000
+        _run(tmp_path, server)
+        server.cut = None
+
+        result = direct_fetch(
+            "https://gallery.example.com/another.jpg",
+            destination=tmp_path / "raw" / "work.jpg",
+            open_stream=server,
+            max_bytes=10_000_000,
+        )
+
+        assert server.asked[-1] is None
+        assert result.path.read_bytes() == self.PAYLOAD
+
+
 @pytest.mark.parametrize("chunks", [(b"a",), (b"a", b"b"), (b"a" * 1000,)])
 def test_the_hash_always_matches_the_file_on_disk(tmp_path, chunks):
     # The hash is computed while streaming rather than by re-reading, so this is
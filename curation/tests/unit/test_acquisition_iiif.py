@@ -0,0 +1,330 @@
+"""The in-process IIIF fetcher, against a real server on a loopback port.
+
+A stand-in rather than a fake client, because what is under test is the part a
+fake would skip: the URLs a tile grid turns into, a pooled client making them
+concurrently, and bytes off a socket stitched into a JPEG. The stand-in serves an
+`info.json` and tiles cut from one source picture, so a stitched result can be
+compared with the picture it should be.
+"""
+
+import hashlib
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote
+
+import pytest
+from PIL import Image
+
+from curation.acquisition.dezoomify import TileOutcome, TileProgress
+from curation.acquisition.iiif import IiifRefused, iiif_fetch, parse_info, plan_tiles
+from curation.acquisition.urls import UrlRefused, check_fetchable
+from curation.services.imaging_pool import ImagingAborted, ImagingPool
+
+WIDTH, HEIGHT, TILE = 300, 200, 128
+
+
+def _picture() -> Image.Image:
+    """Four flat quadrants, so a misplaced tile changes a colour someone can name."""
+    picture = Image.new("RGB", (WIDTH, HEIGHT), (200, 30, 30))
+    picture.paste((30, 200, 30), (WIDTH // 2, 0, WIDTH, HEIGHT // 2))
+    picture.paste((30, 30, 200), (0, HEIGHT // 2, WIDTH // 2, HEIGHT))
+    picture.paste((230, 230, 230), (WIDTH // 2, HEIGHT // 2, WIDTH, HEIGHT))
+    return picture
+
+
+class _Museum:
+    """A IIIF level-1 image service with a memory of what it was asked for."""
+
+    def __init__(self, *, version: int = 2, missing: frozenset[str] = frozenset(), identifier: str | None = None) -> None:
+        self.version = version
+        self.missing = missing
+        #: The `id` its `info.json` answers with, when that is not where it is.
+        self.identifier = identifier
+        self.requests: list[str] = []
+        self.picture = _picture()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.base = f"http://127.0.0.1:{self._server.server_port}/iiif/work"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def info(self) -> dict:
+        grid = [{"width": TILE, "height": TILE, "scaleFactors": [1, 2, 4]}]
+        if self.version == 3:
+            return {
+                "@context": "http://iiif.io/api/image/3/context.json",
+                "id": self.identifier or self.base,
+                "width": WIDTH,
+                "height": HEIGHT,
+                "tiles": grid,
+            }
+        return {
+            "@context": "http://iiif.io/api/image/2/context.json",
+            "@id": self.identifier or self.base,
+            "width": WIDTH,
+            "height": HEIGHT,
+            "tiles": grid,
+        }
+
+    def tile(self, region: str, size: str) -> bytes:
+        x, y, w, h = (int(part) for part in region.split(","))
+        width, _, height = size.partition(",")
+        crop = self.picture.crop((x, y, x + w, y + h))
+        out_width = int(width)
+        out_height = int(height) if height else round(h * out_width / w)
+        buffer = io.BytesIO()
+        crop.resize((out_width, out_height)).save(buffer, format="JPEG", quality=95)
+        return buffer.getvalue()
+
+    def _handler(self):
+        museum = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802 - the stdlib's name
+                path = unquote(self.path)
+                museum.requests.append(path)
+                rest = path.removeprefix("/iiif/work/")
+                if rest == path:
+                    self._send(404, b"no such image", "text/plain")
+                elif rest == "info.json":
+                    self._send(200, json.dumps(museum.info()).encode(), "application/json")
+                elif rest in museum.missing:
+                    self._send(404, b"no", "text/plain")
+                else:
+                    region, size, _rotation, _quality = rest.split("/")
+                    self._send(200, museum.tile(region, size), "image/jpeg")
+
+            def _send(self, status, body, kind):
+                self.send_response(status)
+                self.send_header("Content-Type", kind)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def museum():
+    serving = _Museum()
+    yield serving
+    serving.close()
+
+
+def _fetch(tmp_path: Path, url: str, **kwargs):
+    defaults = {
+        "destination": tmp_path / "out" / "work.jpg",
+        "tile_cache": tmp_path / "tiles",
+        "user_agent": "samsung-frame-art-loader/1.0 (probe)",
+        "max_width": 8192,
+        "max_height": 8192,
+        "timeout_seconds": 30,
+        "check": lambda address: address,
+    }
+    return iiif_fetch(url, **{**defaults, **kwargs})
+
+
+def _near(actual: tuple[int, ...], expected: tuple[int, ...]) -> bool:
+    """JPEG is lossy twice over here; a quadrant's colour is close, not equal."""
+    return all(abs(a - e) <= 12 for a, e in zip(actual, expected, strict=True))
+
+
+class TestReadingTheService:
+    def test_version_two_and_three_are_read_alike(self):
+        v2 = parse_info(_Museum.info(_Stub(2)), check=lambda address: address)
+        v3 = parse_info(_Museum.info(_Stub(3)), check=lambda address: address)
+
+        assert (v2.version, v3.version) == (2, 3)
+        assert (v2.width, v2.height, v2.tile_width, v2.scale_factors) == (WIDTH, HEIGHT, TILE, (1, 2, 4))
+        assert (v3.width, v3.height, v3.tile_width, v3.scale_factors) == (WIDTH, HEIGHT, TILE, (1, 2, 4))
+
+    def test_the_id_the_service_answers_with_goes_through_the_policy(self):
+        def refuse(address):
+            raise UrlRefused(f"refused {address}")
+
+        with pytest.raises(IiifRefused, match="refused https://museum"):
+            parse_info({"@id": "https://museum.example.com/iiif/1", "width": 10, "height": 10}, check=refuse)
+
+    def test_a_service_with_no_tile_grid_is_one_tile_scaled_by_halves(self):
+        service = parse_info({"@id": "https://museum.example.com/iiif/1", "width": 1000, "height": 600}, check=str)
+
+        plan = plan_tiles(service, max_width=300, max_height=300)
+
+        assert (plan.scale, plan.width, plan.height, plan.tile_count) == (4, 250, 150, 1)
+
+    def test_a_document_that_is_not_an_image_is_refused_by_name(self):
+        with pytest.raises(IiifRefused, match="width and height"):
+            parse_info({"@id": "https://museum.example.com/iiif/1"}, check=str)
+
+    def test_the_plan_takes_the_largest_scale_that_fits(self):
+        service = parse_info(_Museum.info(_Stub(2)), check=str)
+
+        assert plan_tiles(service, max_width=8192, max_height=8192).scale == 1
+        assert plan_tiles(service, max_width=150, max_height=150).scale == 2
+        # Nothing offered fits; the smallest the service has is better than none.
+        assert plan_tiles(service, max_width=10, max_height=10).scale == 4
+
+
+class _Stub:
+    """Enough of `_Museum` for `info()` without opening a socket."""
+
+    def __init__(self, version: int) -> None:
+        self.version = version
+        self.base = "https://museum.example.com/iiif/work"
+        self.identifier = None
+
+
+class TestFetching:
+    def test_every_tile_arriving_is_complete_and_the_picture_is_whole(self, tmp_path, museum):
+        result = _fetch(tmp_path, museum.base)
+
+        assert result.outcome is TileOutcome.COMPLETE
+        assert (result.tiles_fetched, result.tiles_expected) == (6, 6)
+        assert result.path == tmp_path / "out" / "work.partial.jpg"
+        with Image.open(result.path) as stitched:
+            assert stitched.size == (WIDTH, HEIGHT)
+            assert _near(stitched.getpixel((10, 10)), (200, 30, 30))
+            assert _near(stitched.getpixel((WIDTH - 10, 10)), (30, 200, 30))
+            assert _near(stitched.getpixel((10, HEIGHT - 10)), (30, 30, 200))
+            assert _near(stitched.getpixel((WIDTH - 10, HEIGHT - 10)), (230, 230, 230))
+
+    def test_the_stitched_file_is_witnessed_as_it_is_written(self, tmp_path, museum):
+        result = _fetch(tmp_path, museum.base)
+
+        written = result.path.read_bytes()
+        assert result.witnessed.content_hash == hashlib.sha256(written).hexdigest()
+        assert (result.witnessed.byte_size, result.byte_size) == (len(written), len(written))
+        assert written.startswith(result.witnessed.head)
+        assert result.witnessed.reread_bytes == 0
+
+    def test_the_bound_fetches_a_smaller_scale(self, tmp_path, museum):
+        result = _fetch(tmp_path, f"{museum.base}/info.json", max_width=150, max_height=150)
+
+        assert result.outcome is TileOutcome.COMPLETE
+        with Image.open(result.path) as stitched:
+            assert stitched.size == (150, 100)
+
+    def test_version_three_sizes_are_written_in_full(self, tmp_path):
+        museum = _Museum(version=3)
+        try:
+            result = _fetch(tmp_path, museum.base)
+        finally:
+            museum.close()
+
+        assert result.outcome is TileOutcome.COMPLETE
+        assert "/0,0,128,128/128,128/0/default.jpg" in {r.removeprefix("/iiif/work") for r in museum.requests}
+
+    def test_a_missing_tile_is_partial_with_the_gap_counted(self, tmp_path):
+        museum = _Museum(missing=frozenset({"256,128,44,72/44,/0/default.jpg"}))
+        try:
+            result = _fetch(tmp_path, museum.base)
+        finally:
+            museum.close()
+
+        assert result.outcome is TileOutcome.PARTIAL
+        assert result.usable
+        assert (result.tiles_fetched, result.tiles_expected) == (5, 6)
+        assert "5 of 6 tiles" in result.detail
+        with Image.open(result.path) as stitched:
+            # The gap is left black, as the binary leaves it.
+            assert _near(stitched.getpixel((WIDTH - 5, HEIGHT - 5)), (0, 0, 0))
+
+    @pytest.mark.parametrize("identifier", ["http://127.0.0.1/iiif/work", "http://10.0.0.7/iiif/work"])
+    def test_a_service_naming_a_private_address_for_its_tiles_fails_rather_than_raises(self, tmp_path, identifier):
+        """The real policy, not a stand-in: it raises `UrlRefused`, and the fetch must answer it."""
+        museum = _Museum(identifier=identifier)
+        try:
+            result = _fetch(
+                tmp_path, museum.base, check=lambda address: check_fetchable(address, resolve=lambda host: ["93.184.216.34"])
+            )
+        finally:
+            museum.close()
+
+        assert result.outcome is TileOutcome.FAILED
+        assert "may not be fetched" in result.detail
+        assert museum.requests == ["/iiif/work/info.json"]
+        assert not (tmp_path / "out" / "work.partial.jpg").exists()
+
+    def test_a_service_that_is_not_there_fails_and_leaves_nothing(self, tmp_path, museum):
+        result = _fetch(tmp_path, museum.base.replace("/work", "/elsewhere"))
+
+        assert result.outcome is TileOutcome.FAILED
+        assert not result.usable
+        assert "HTTP" in result.detail
+        assert not (tmp_path / "out" / "work.partial.jpg").exists()
+
+    def test_no_tile_arriving_fails_and_discards_the_staged_file(self, tmp_path):
+        every_tile = frozenset(
+            tile.url(plan.service).removeprefix(plan.service.id + "/") for plan in [_plan()] for tile in plan.tiles()
+        )
+        museum = _Museum(missing=every_tile)
+        try:
+            result = _fetch(tmp_path, museum.base)
+        finally:
+            museum.close()
+
+        assert result.outcome is TileOutcome.FAILED
+        assert result.tiles_fetched == 0
+        assert not (tmp_path / "out" / "work.partial.jpg").exists()
+
+    def test_a_cached_tile_is_not_fetched_again(self, tmp_path, museum):
+        _fetch(tmp_path, museum.base)
+        museum.requests.clear()
+
+        result = _fetch(tmp_path, museum.base)
+
+        assert result.outcome is TileOutcome.COMPLETE
+        assert museum.requests == ["/iiif/work/info.json"]
+
+    def test_each_tile_is_reported_against_the_grid_it_belongs_to(self, tmp_path, museum):
+        seen = []
+
+        _fetch(tmp_path, museum.base, progress=seen.append)
+
+        assert seen[0] == TileProgress(tiles_fetched=0, tiles_refused=0, tiles_expected=6)
+        assert seen[-1] == TileProgress(tiles_fetched=6, tiles_refused=0, tiles_expected=6)
+
+    def test_the_canvas_scratch_file_does_not_outlive_the_fetch(self, tmp_path, museum):
+        _fetch(tmp_path, museum.base)
+
+        assert sorted(path.name for path in (tmp_path / "tiles").iterdir() if not path.name.endswith(".jpg")) == []
+
+    def test_the_stitch_runs_on_an_imaging_worker_and_its_witness_comes_back(self, tmp_path, museum):
+        """The tiles are a stranger's JPEGs, so they are decoded where the ceilings are."""
+        imaging = ImagingPool(workers=1, memory_mb=512, task_seconds=30)
+        try:
+            result = _fetch(tmp_path, museum.base, imaging=imaging)
+            kinds = {kind.kind: kind for kind in imaging.profile().kinds}
+        finally:
+            imaging.shutdown()
+
+        assert result.outcome is TileOutcome.COMPLETE
+        assert result.witnessed.content_hash == hashlib.sha256(result.path.read_bytes()).hexdigest()
+        assert kinds["stitch"].calls == 1
+
+    def test_a_stitch_stopped_at_a_ceiling_fails_and_leaves_nothing(self, tmp_path, museum):
+        result = _fetch(tmp_path, museum.base, imaging=_Stopping())
+
+        assert result.outcome is TileOutcome.FAILED
+        assert "could not be assembled" in result.detail
+        assert "more memory" in result.detail
+        assert not (tmp_path / "out" / "work.partial.jpg").exists()
+
+
+class _Stopping:
+    """A pool whose every task breaches its ceiling."""
+
+    def run(self, kind, task, /, *args, **kwargs):
+        raise ImagingAborted("The image needed more memory than an imaging worker is allowed.")
+
+
+def _plan():
+    return plan_tiles(parse_info(_Museum.info(_Stub(2)), check=str), max_width=8192, max_height=8192)
@@ -0,0 +1,335 @@
+"""The acquisition queue: what runs, in what order, how many at once, and what stops.
+
+The acquisition service underneath is a stand-in that fetches nothing and
+answers when told to, because what is pinned here is the queue's own policy —
+lanes, priority, the disk, and which refusals stop the jobs behind them. What a
+fetch records is `test_acquisition_service`'s business and is not repeated.
+
+Most tests hand the queue a `spawn` that collects its workers instead of
+starting them, and then run them on the test's thread: everything is queued
+before anything is claimed, so the order is the queue's and not the scheduler's.
+The lane and disk tests need fetches genuinely in flight together, and use
+threads.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from curation.acquisition.dezoomify import DezoomifyUnavailable, TileProgress
+from curation.acquisition.queue import (
+    MAX_ACQUISITION_BATCH,
+    AcquisitionQueue,
+    AcquisitionQueueSettings,
+    JobState,
+)
+from curation.acquisition.service import AcquisitionOutcome
+from curation.acquisition.space import NotEnoughSpace
+from curation.persistence.records import AcquisitionMethod
+from curation.services.errors import ServiceError
+
+TILED = AcquisitionMethod.DEZOOMIFY
+DIRECT = AcquisitionMethod.DIRECT_HTTP
+
+#: Long enough for a loaded machine, short enough that a hang fails rather than stalls.
+_PATIENCE_SECONDS = 5
+
+
+class _Acquisitions:
+    """An acquisition service that fetches nothing, in the shape the queue calls."""
+
+    def __init__(self, methods: dict[str, AcquisitionMethod], *, gated: bool = False, room: bool = True) -> None:
+        self.methods = methods
+        self.gated = gated
+        self.room = room
+        self.raises: dict[str, Exception] = {}
+        self.outcomes: dict[str, AcquisitionOutcome] = {}
+        self.started: list[str] = []
+        self.release = {artwork_id: threading.Event() for artwork_id in methods}
+        self.reserved_bytes = 0
+        self.reports: dict[str, list[TileProgress]] = {}
+        self._changed = threading.Condition()
+
+    def source_for(self, artwork_id, *, source_id=None):
+        if artwork_id not in self.methods:
+            raise ServiceError(f"No artwork {artwork_id!r}.")
+        return SimpleNamespace(
+            id=f"source-{artwork_id}",
+            artwork_id=artwork_id,
+            provider="artic",
+            acquisition_method=self.methods[artwork_id],
+        )
+
+    def expected_bytes(self, source):
+        return 1000
+
+    def has_room(self, expected_bytes):
+        return self.room
+
+    def acquire(self, artwork_id, *, source_id=None, progress=None):
+        for report in self.reports.get(artwork_id, []):
+            progress(report)
+        with self._changed:
+            self.started.append(artwork_id)
+            self._changed.notify_all()
+        if artwork_id in self.raises:
+            raise self.raises[artwork_id]
+        if self.gated:
+            assert self.release[artwork_id].wait(_PATIENCE_SECONDS), f"{artwork_id} was never released"
+        return SimpleNamespace(outcome=self.outcomes.get(artwork_id, AcquisitionOutcome.ACQUIRED), detail="held")
+
+    def wait_for_starts(self, count: int) -> list[str]:
+        with self._changed:
+            assert self._changed.wait_for(lambda: len(self.started) >= count, _PATIENCE_SECONDS), self.started
+            return list(self.started)
+
+
+def _settings(workers: int = 1, *, tiled: int = 1, direct: int = 1) -> AcquisitionQueueSettings:
+    return AcquisitionQueueSettings(workers=workers, tiled_workers=tiled, direct_workers=direct)
+
+
+def _deferred():
+    """A `spawn` that keeps its workers for the test to run."""
+    workers: list = []
+    return workers, workers.append
+
+
+def _drain(workers: list) -> None:
+    while workers:
+        workers.pop(0)()
+
+
+def _states(queue: AcquisitionQueue) -> dict[str, JobState]:
+    return {job.artwork_id: job.state for job in queue.status().jobs}
+
+
+def _wait_until_idle(queue: AcquisitionQueue) -> None:
+    deadline = threading.Event()
+    for _ in range(_PATIENCE_SECONDS * 100):
+        status = queue.status()
+        if not status.queued and not status.running:
+            return
+        deadline.wait(0.01)
+    pytest.fail(f"the queue never went idle: {_states(queue)}")
+
+
+class TestQueueing:
+    def test_every_work_is_fetched_and_the_batch_returns_before_any_is(self):
+        acquisitions = _Acquisitions({"a": DIRECT, "b": DIRECT, "c": TILED})
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+
+        batch = queue.enqueue(["a", "b", "c"])
+
+        assert [job.state for job in batch.jobs] == [JobState.QUEUED] * 3
+        assert acquisitions.started == []
+        _drain(workers)
+        finished = queue.status(batch_id=batch.batch_id).jobs
+        assert [(job.state, job.outcome) for job in finished] == [(JobState.FINISHED, AcquisitionOutcome.ACQUIRED)] * 3
+        assert all(job.started_at is not None and job.finished_at is not None for job in finished)
+
+    def test_higher_priority_runs_first_and_ties_run_in_the_order_queued(self):
+        acquisitions = _Acquisitions({"early": DIRECT, "later": DIRECT, "urgent": DIRECT})
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+
+        queue.enqueue(["early", "later"])
+        queue.enqueue(["urgent"], priority=5)
+        _drain(workers)
+
+        assert acquisitions.started == ["urgent", "early", "later"]
+
+    def test_a_work_already_waiting_is_not_queued_twice_and_moves_up_if_asked_more_urgently(self):
+        acquisitions = _Acquisitions({"a": DIRECT, "b": DIRECT})
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+
+        first = queue.enqueue(["b", "a"])
+        again = queue.enqueue(["a", "a"], priority=3)
+
+        (job,) = again.jobs
+        assert job.id == first.jobs[1].id
+        assert job.priority == 3
+        _drain(workers)
+        assert acquisitions.started == ["a", "b"]
+
+    def test_a_batch_naming_a_work_with_no_source_is_refused_whole(self):
+        queue = AcquisitionQueue(_Acquisitions({"a": DIRECT}), _settings(), spawn=_deferred()[1])
+
+        with pytest.raises(ServiceError, match="'missing'"):
+            queue.enqueue(["a", "missing"])
+
+        assert queue.status().jobs == []
+
+    def test_an_empty_or_oversized_batch_is_refused(self):
+        queue = AcquisitionQueue(_Acquisitions({}), _settings(), spawn=_deferred()[1])
+
+        with pytest.raises(ServiceError, match="at least one"):
+            queue.enqueue([])
+        with pytest.raises(ServiceError, match=f"At most {MAX_ACQUISITION_BATCH}"):
+            queue.enqueue([f"w{n}" for n in range(MAX_ACQUISITION_BATCH + 1)])
+
+    def test_the_works_a_batch_left_holding_an_image_are_named_in_the_order_queued(self):
+        """What preparing the batch starts from: a failed fetch has nothing to compose, a kept one does."""
+        acquisitions = _Acquisitions({"a": DIRECT, "b": DIRECT, "c": TILED, "d": DIRECT})
+        acquisitions.outcomes = {"b": AcquisitionOutcome.FAILED, "c": AcquisitionOutcome.KEPT_HELD}
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+
+        batch = queue.enqueue(["d", "c", "b", "a"])
+
+        assert queue.held(batch.batch_id) == []
+        _drain(workers)
+        assert queue.held(batch.batch_id) == ["d", "c", "a"]
+
+    def test_settings_with_a_lane_of_nothing_are_refused(self):
+        with pytest.raises(ServiceError, match="tiled_workers"):
+            _settings(tiled=0)
+
+
+class TestConcurrency:
+    def test_each_method_is_held_to_its_own_lane_inside_the_total(self):
+        methods = {"t1": TILED, "t2": TILED, "d1": DIRECT, "d2": DIRECT, "d3": DIRECT}
+        acquisitions = _Acquisitions(methods, gated=True)
+        queue = AcquisitionQueue(acquisitions, _settings(3, tiled=1, direct=2))
+
+        queue.enqueue(list(methods))
+        started = acquisitions.wait_for_starts(3)
+
+        # The second tiled job is passed over, not waited on, so the direct
+        # jobs behind it fill the two direct places.
+        assert sorted(started) == ["d1", "d2", "t1"]
+        assert queue.status().running == 3
+        for release in acquisitions.release.values():
+            release.set()
+        _wait_until_idle(queue)
+        assert set(_states(queue).values()) == {JobState.FINISHED}
+
+    def test_a_running_job_shows_how_far_its_fetch_has_got_and_keeps_it_once_ended(self):
+        acquisitions = _Acquisitions({"t": TILED}, gated=True)
+        acquisitions.reports["t"] = [TileProgress(tiles_fetched=1, tiles_refused=0), TileProgress(12, 2)]
+        queue = AcquisitionQueue(acquisitions, _settings())
+
+        queue.enqueue(["t"])
+        acquisitions.wait_for_starts(1)
+
+        (running,) = queue.status().jobs
+        assert (running.state, running.progress) == (JobState.RUNNING, TileProgress(12, 2))
+        acquisitions.release["t"].set()
+        _wait_until_idle(queue)
+        (ended,) = queue.status().jobs
+        assert (ended.state, ended.progress) == (JobState.FINISHED, TileProgress(12, 2))
+
+    def test_a_job_the_disk_cannot_take_waits_for_the_fetches_in_flight(self):
+        acquisitions = _Acquisitions({"first": DIRECT, "second": DIRECT}, gated=True, room=False)
+        queue = AcquisitionQueue(acquisitions, _settings(2, direct=2))
+
+        queue.enqueue(["first", "second"])
+
+        # With nothing in flight the first starts anyway, so a real shortage is
+        # met and refused rather than waited on for ever.
+        assert acquisitions.wait_for_starts(1) == ["first"]
+        assert _states(queue)["second"] is JobState.QUEUED
+        acquisitions.release["first"].set()
+        acquisitions.release["second"].set()
+        assert acquisitions.wait_for_starts(2) == ["first", "second"]
+        _wait_until_idle(queue)
+
+
+class TestWhatStopsTheQueue:
+    def test_a_full_disk_cancels_every_job_behind_it_and_says_why(self):
+        acquisitions = _Acquisitions({"a": DIRECT, "b": TILED, "c": DIRECT})
+        acquisitions.raises["a"] = NotEnoughSpace("0.50 GiB free where 2.00 GiB is required.")
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+
+        queue.enqueue(["a", "b", "c"])
+        _drain(workers)
+
+        assert acquisitions.started == ["a"]
+        jobs = {job.artwork_id: job for job in queue.status().jobs}
+        assert jobs["a"].state is JobState.REFUSED
+        assert "0.50 GiB free" in jobs["a"].detail
+        assert {jobs["b"].state, jobs["c"].state} == {JobState.CANCELLED}
+        assert jobs["b"].detail.startswith("Not started")
+
+    def test_a_missing_tile_binary_cancels_only_the_tiled_jobs(self):
+        acquisitions = _Acquisitions({"t1": TILED, "t2": TILED, "d1": DIRECT})
+        acquisitions.raises["t1"] = DezoomifyUnavailable("dezoomify-rs is not on PATH.")
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+
+        queue.enqueue(["t1", "t2", "d1"])
+        _drain(workers)
+
+        assert _states(queue) == {"t1": JobState.REFUSED, "t2": JobState.CANCELLED, "d1": JobState.FINISHED}
+
+    def test_a_job_that_crashes_does_not_stop_the_ones_behind_it(self):
+        acquisitions = _Acquisitions({"a": DIRECT, "b": DIRECT})
+        acquisitions.raises["a"] = RuntimeError("unforeseen")
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+
+        queue.enqueue(["a", "b"])
+        _drain(workers)
+
+        assert _states(queue) == {"a": JobState.REFUSED, "b": JobState.FINISHED}
+        assert "RuntimeError" in queue.status().jobs[0].detail
+
+
+class TestCancelling:
+    def test_a_waiting_job_is_withdrawn_and_never_fetched(self):
+        acquisitions = _Acquisitions({"a": DIRECT, "b": DIRECT})
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+        batch = queue.enqueue(["a", "b"])
+
+        (cancelled,) = queue.cancel(batch.jobs[1].id)
+        _drain(workers)
+
+        assert cancelled.state is JobState.CANCELLED
+        assert acquisitions.started == ["a"]
+
+    def test_cancelling_a_batch_answers_with_every_job_in_it(self):
+        acquisitions = _Acquisitions({"a": DIRECT, "b": DIRECT})
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+        batch = queue.enqueue(["a", "b"])
+
+        answered = queue.cancel(batch_id=batch.batch_id)
+        _drain(workers)
+
+        assert [job.state for job in answered] == [JobState.CANCELLED, JobState.CANCELLED]
+        assert acquisitions.started == []
+
+    def test_a_job_that_has_ended_cannot_be_cancelled(self):
+        workers, spawn = _deferred()
+        queue = AcquisitionQueue(_Acquisitions({"a": DIRECT}), _settings(), spawn=spawn)
+        (job,) = queue.enqueue(["a"]).jobs
+        _drain(workers)
+
+        with pytest.raises(ServiceError, match="finished, so there is nothing to cancel"):
+            queue.cancel(job.id)
+
+    def test_an_unknown_id_says_the_queue_is_held_in_memory(self):
+        queue = AcquisitionQueue(_Acquisitions({}), _settings(), spawn=_deferred()[1])
+
+        with pytest.raises(ServiceError, match="held in memory"):
+            queue.cancel("no-such-job")
+        with pytest.raises(ServiceError, match="Name either"):
+            queue.cancel()
+
+    def test_shutting_down_withdraws_what_is_waiting_and_takes_no_more(self):
+        workers, spawn = _deferred()
+        acquisitions = _Acquisitions({"a": DIRECT})
+        queue = AcquisitionQueue(acquisitions, _settings(), spawn=spawn)
+        queue.enqueue(["a"])
+
+        queue.shutdown()
+        _drain(workers)
+
+        assert _states(queue) == {"a": JobState.CANCELLED}
+        assert acquisitions.started == []
+        with pytest.raises(ServiceError, match="stopped"):
+            queue.enqueue(["a"])
@@ -18,8 +18,9 @@ from curation.acquisition.service import (
     AcquisitionOutcome,
     AcquisitionService,
     AcquisitionSettings,
+    TileFetcher,
 )
-from curation.acquisition.space import NotEnoughSpace
+from curation.acquisition.space import NotEnoughSpace, SpaceLedger, check_free_space
 from curation.acquisition.tiles import TileTargetUnavailable
 from curation.persistence.records import (
     AcquisitionMethod,
@@ -166,6 +167,38 @@ class TestASuccessfulDirectFetch:
         original = service.get_original(work.id)
         assert original.content_hash == hashlib.sha256(payload).hexdigest()
 
+    def test_the_new_original_is_handed_on_for_its_thumbnails(self, service, acq_settings):
+        work, _ = _work_with_source(service)
+        warmed: list[str] = []
+        acquisition = AcquisitionService(
+            service,
+            acq_settings,
+            open_stream=_serves(_jpeg_bytes()),
+            resolve=_resolves_publicly,
+            tile_targets={},
+            warm=warmed.append,
+        )
+
+        acquisition.acquire(work.id)
+
+        assert warmed == [work.id]
+
+    def test_a_failed_fetch_hands_nothing_on(self, service, acq_settings):
+        work, _ = _work_with_source(service)
+        warmed: list[str] = []
+        acquisition = AcquisitionService(
+            service,
+            acq_settings,
+            open_stream=_serves(b"not an image"),
+            resolve=_resolves_publicly,
+            tile_targets={},
+            warm=warmed.append,
+        )
+
+        acquisition.acquire(work.id)
+
+        assert warmed == []
+
 
 class TestFailuresAreRecordedNotRaised:
     def test_a_refused_url_records_a_failed_fetch(self, service, acq_settings):
@@ -273,6 +306,60 @@ class TestTheFreeSpaceGuard:
         assert result.outcome is AcquisitionOutcome.ACQUIRED
 
 
+class TestReservingSpaceForFetchesInFlight:
+    """Several fetches at once, each counting what the others may still write.
+
+    Sized in GiB against the real disk's free space, so ordinary churn on the
+    filesystem while the test runs cannot move either answer.
+    """
+
+    _GIB = 1024**3
+
+    def test_a_second_fetch_that_fits_alone_is_refused_beside_the_first(self, tmp_path):
+        ledger = SpaceLedger()
+        floor = check_free_space(tmp_path, required_bytes=0).free_bytes - 3 * self._GIB
+
+        with ledger.reserve(tmp_path, floor_bytes=floor, expected_bytes=2 * self._GIB):
+            assert not ledger.fits(tmp_path, floor_bytes=floor, expected_bytes=2 * self._GIB)
+            with (
+                pytest.raises(NotEnoughSpace, match="reserved by fetches in flight"),
+                ledger.reserve(tmp_path, floor_bytes=floor, expected_bytes=2 * self._GIB),
+            ):
+                pass  # pragma: no cover - the reservation is refused before the block
+
+        assert ledger.reserved_bytes == 0
+        assert ledger.fits(tmp_path, floor_bytes=floor, expected_bytes=2 * self._GIB)
+
+    def test_a_reservation_is_released_when_the_fetch_raises(self, tmp_path):
+        ledger = SpaceLedger()
+
+        with pytest.raises(OSError), ledger.reserve(tmp_path, floor_bytes=1, expected_bytes=self._GIB):
+            assert ledger.reserved_bytes == self._GIB
+            raise OSError("the fetch broke")
+
+        assert ledger.reserved_bytes == 0
+
+    def test_the_service_expects_a_refetch_to_write_what_the_held_image_weighs(self, service, acq_settings):
+        work, source = _work_with_source(service)
+        acquisition = _acquisition(service, acq_settings, _serves(_jpeg_bytes()))
+        assert acquisition.expected_bytes(source) == acq_settings.max_image_bytes
+
+        held = acquisition.acquire(work.id)
+
+        assert acquisition.expected_bytes(acquisition.source_for(work.id)) == held.byte_size
+        assert acquisition.reserved_bytes == 0
+
+    def test_the_in_process_tile_fetcher_reserves_its_canvas_too(self, service, acq_settings):
+        from dataclasses import replace
+
+        _, source = _work_with_source(service, method=AcquisitionMethod.DEZOOMIFY, url="https://www.artic.edu/iiif/2/abc")
+        binary = _acquisition(service, acq_settings, _serves(b""))
+        native = _acquisition(service, replace(acq_settings, tile_fetcher=TileFetcher.IIIF), _serves(b""))
+
+        canvas = acq_settings.tile_max_pixels**2 * 4
+        assert native.expected_bytes(source) == binary.expected_bytes(source) + canvas
+
+
 class TestTheDeploymentFaultsReachTheJournal:
     """The three conditions acquisition raises for, journalled at the raise.
 
@@ -466,6 +553,56 @@ class TestTheApiMethodHasNoProducer:
         assert "api" in result.detail
 
 
+class TestPromotionReadsNothingBack:
+    """The hash and the header are learnt while the file is written, not after."""
+
+    @staticmethod
+    def _acquired(caplog):
+        (record,) = [r for r in caplog.records if getattr(r, "event", None) == "acquisition.acquired"]
+        return record
+
+    def test_a_direct_fetch_is_measured_without_opening_the_file(self, service, acq_settings, monkeypatch, caplog):
+        def reopened(_path):
+            raise AssertionError("the staged file was opened to measure it")
+
+        monkeypatch.setattr("curation.acquisition.service.measure", reopened)
+        work, _ = _work_with_source(service)
+        acquisition = _acquisition(service, acq_settings, _serves(_jpeg_bytes(300, 200)))
+
+        with caplog.at_level(logging.INFO, logger="curation.acquisition.service"):
+            result = acquisition.acquire(work.id)
+
+        assert result.outcome is AcquisitionOutcome.ACQUIRED
+        assert (result.width, result.height) == (300, 200)
+        acquired = self._acquired(caplog)
+        assert (acquired.reread_bytes, acquired.header_reread) == (0, False)
+
+    def test_a_head_short_of_the_header_is_measured_from_the_file(self, service, acq_settings, monkeypatch, caplog):
+        monkeypatch.setattr("curation.acquisition.witness.HEAD_BYTES", 16)
+        work, _ = _work_with_source(service)
+        acquisition = _acquisition(service, acq_settings, _serves(_jpeg_bytes(300, 200)))
+
+        with caplog.at_level(logging.INFO, logger="curation.acquisition.service"):
+            result = acquisition.acquire(work.id)
+
+        assert (result.width, result.height) == (300, 200)
+        assert self._acquired(caplog).header_reread is True
+
+    def test_a_file_the_binary_wrote_is_read_back_once(self, service, acq_settings, tmp_path, caplog):
+        from dataclasses import replace
+
+        payload = _jpeg_bytes(200, 150)
+        (tmp_path / "seed.jpg").write_bytes(payload)
+        binary = TestTiledAcquisition._binary(tmp_path, _copies_to_last_arg(tmp_path / "seed.jpg"))
+        work, _ = _work_with_source(service, method=AcquisitionMethod.DEZOOMIFY, url="https://www.artic.edu/iiif/2/abc/info.json")
+
+        with caplog.at_level(logging.INFO, logger="curation.acquisition.service"):
+            _acquisition(service, replace(acq_settings, tile_binary=binary), _serves(b"")).acquire(work.id)
+
+        acquired = self._acquired(caplog)
+        assert (acquired.reread_bytes, acquired.header_reread) == (len(payload), False)
+
+
 class TestTiledAcquisition:
     """Driven through a stand-in binary, for the reasons its own tests give."""
 
@@ -813,7 +950,7 @@ class TestARetryNeverLowersTheQualityOfWhatIsHeld:
         gappy = self._settings(acq_settings, tmp_path, "gappy.jpg", width=120, height=90, complete=False)
         _acquisition(service, gappy, _serves(b"")).acquire(work.id, source_id=source.id)
 
-        remaining = sorted(p.name for p in acq_settings.originals_path.glob("*"))
+        remaining = sorted(p.name for p in acq_settings.originals_path.glob("*") if p.is_file())
         assert remaining == [Path(held.relative_path).name], "the refused fetch was orphaned on disk"
 
     def test_the_refused_attempt_keeps_the_tiles_so_asking_again_is_still_cheap(self, service, acq_settings, tmp_path):
@@ -1120,3 +1257,111 @@ class TestResolvingTheTileTargetBeforeFetching:
 
         assert result.outcome is AcquisitionOutcome.FAILED
         assert not argv_log.exists()
+
+
+class TestWhatIsBeingFetched:
+    """The sources a fetch is running against, which the storage governor must not evict."""
+
+    def test_a_source_is_named_while_its_fetch_runs_and_not_after(self, service, acq_settings):
+        work, source = _work_with_source(service)
+        seen: list[frozenset[str]] = []
+
+        @contextmanager
+        def open_stream(_url: str):
+            seen.append(acquisition.fetching())
+            yield iter([_jpeg_bytes()])
+
+        acquisition = _acquisition(service, acq_settings, open_stream)
+
+        acquisition.acquire(work.id)
+
+        assert seen == [frozenset({source.id})]
+        assert acquisition.fetching() == frozenset()
+
+    def test_a_fetch_that_fails_stops_being_named(self, service, acq_settings):
+        work, _ = _work_with_source(service)
+        acquisition = _acquisition(service, acq_settings, _refuses(OSError("connection reset")))
+
+        acquisition.acquire(work.id)
+
+        assert acquisition.fetching() == frozenset()
+
+
+class TestOneImageHeldOnceAcrossWorks:
+    """Works sharing a museum image share its file, and the second fetches nothing."""
+
+    def test_a_second_work_from_the_same_url_is_linked_rather_than_fetched(self, service, acq_settings):
+        first, _ = _work_with_source(service)
+        second, _ = _work_with_source(service)
+        _acquisition(service, acq_settings, _serves(_jpeg_bytes())).acquire(first.id)
+
+        result = _acquisition(service, acq_settings, _refuses(AssertionError("fetched again"))).acquire(second.id)
+
+        assert result.outcome is AcquisitionOutcome.ACQUIRED
+        assert "nothing was fetched" in result.detail
+        held = [service.get_original(work.id) for work in (first, second)]
+        assert held[0].content_hash == held[1].content_hash
+        paths = [acq_settings.art_root / original.relative_path for original in held]
+        assert paths[0] != paths[1]
+        assert paths[0].samefile(paths[1])
+
+    def test_the_reused_fetch_is_recorded_on_the_second_works_source(self, service, acq_settings):
+        first, _ = _work_with_source(service)
+        second, source = _work_with_source(service, primary=False)
+        _acquisition(service, acq_settings, _serves(_jpeg_bytes())).acquire(first.id)
+
+        _acquisition(service, acq_settings, _serves(b"")).acquire(second.id, source_id=source.id)
+
+        refreshed = service.list_sources(second.id)[0]
+        assert refreshed.last_fetch_status is FetchStatus.OK
+        assert refreshed.is_primary
+
+    def test_a_work_refetching_its_own_source_fetches(self, service, acq_settings):
+        work, _ = _work_with_source(service)
+        _acquisition(service, acq_settings, _serves(_jpeg_bytes())).acquire(work.id)
+        asked: list[str] = []
+
+        @contextmanager
+        def open_stream(url: str):
+            asked.append(url)
+            yield iter([_jpeg_bytes(200, 100)])
+
+        _acquisition(service, acq_settings, open_stream).acquire(work.id)
+
+        assert asked
+        assert service.get_original(work.id).width == 200
+
+    def test_an_image_whose_file_no_longer_matches_its_row_is_fetched_afresh(self, service, acq_settings):
+        first, _ = _work_with_source(service)
+        second, _ = _work_with_source(service)
+        _acquisition(service, acq_settings, _serves(_jpeg_bytes())).acquire(first.id)
+        # Truncated by hand: both the work's path and the blob it links.
+        (acq_settings.art_root / service.get_original(first.id).relative_path).write_bytes(b"x")
+
+        result = _acquisition(service, acq_settings, _serves(_jpeg_bytes(200, 100))).acquire(second.id)
+
+        assert "nothing was fetched" not in result.detail
+        assert service.get_original(second.id).width == 200
+
+    def test_an_image_no_longer_held_by_any_work_is_removed(self, service, acq_settings):
+        work, _ = _work_with_source(service)
+        _acquisition(service, acq_settings, _serves(_jpeg_bytes())).acquire(work.id)
+        old = acq_settings.originals_path / "by-hash"
+        (before,) = [path for path in old.rglob("*.jpg")]
+
+        _acquisition(service, acq_settings, _serves(_jpeg_bytes(200, 100))).acquire(work.id)
+
+        (after,) = [path for path in old.rglob("*.jpg")]
+        assert not before.exists()
+        assert after.samefile(acq_settings.art_root / service.get_original(work.id).relative_path)
+
+    def test_the_catalogue_reports_what_sharing_saved(self, service, acq_settings):
+        payload = _jpeg_bytes()
+        for _ in range(3):
+            work, _ = _work_with_source(service)
+            _acquisition(service, acq_settings, _serves(payload)).acquire(work.id)
+
+        footprint = service.measure_originals()
+
+        assert (footprint.originals, footprint.images) == (3, 1)
+        assert footprint.deduplicated_bytes == 2 * len(payload)
@@ -8,16 +8,17 @@ every hop is re-checked.
 
 import pytest
 
+from curation.acquisition.direct import ResumeFrom
 from curation.acquisition.transport import MAX_REDIRECTS, http_stream
 from curation.acquisition.urls import UrlRefused
 from curation.services.errors import ServiceError
 
 
 class _Response:
-    def __init__(self, status, *, url, location=None, body=b""):
+    def __init__(self, status, *, url, location=None, body=b"", headers=None):
         self.status_code = status
         self.url = _Url(url)
-        self.headers = {} if location is None else {"location": location}
+        self.headers = ({} if location is None else {"location": location}) | (headers or {})
         self._body = body
 
     @property
@@ -47,9 +48,11 @@ class _Client:
     def __init__(self, script):
         self._script = script
         self.requested = []
+        self.headers = []
 
-    def stream(self, _method, url, **_kwargs):
+    def stream(self, _method, url, **kwargs):
         self.requested.append(url)
+        self.headers.append(kwargs.get("headers", {}))
         return self._script[url]
 
     def __enter__(self):
@@ -165,3 +168,46 @@ def test_an_error_status_is_reported_as_a_refusal(patched):
     with pytest.raises(ServiceError, match="HTTP 404"):
         with http_stream("ua", check=_checks_everything([]))("https://m.example.com/a.jpg") as chunks:
             b"".join(chunks)
+
+
+class TestResuming:
+    URL = "https://m.example.com/a.tif"
+
+    def test_a_resume_asks_for_the_rest_of_the_same_file_on_every_hop(self, patched):
+        client = patched(
+            {
+                self.URL: _Response(302, url=self.URL, location="https://cdn.example.com/a.tif"),
+                "https://cdn.example.com/a.tif": _Response(
+                    206, url="https://cdn.example.com/a.tif", body=b"rest", headers={"content-range": "bytes 100-103/104"}
+                ),
+            }
+        )
+        resume = ResumeFrom(offset=100, validator='"v1"')
+
+        with http_stream("ua", check=_checks_everything([]))(self.URL, resume=resume) as body:
+            assert (body.offset, b"".join(body)) == (100, b"rest")
+
+        assert [(sent["Range"], sent["If-Range"]) for sent in client.headers] == [("bytes=100-", '"v1"')] * 2
+
+    def test_a_validator_is_offered_only_by_a_server_that_serves_ranges(self, patched):
+        patched({self.URL: _Response(200, url=self.URL, body=b"x", headers={"etag": '"v1"'})})
+        with http_stream("ua", check=_checks_everything([]))(self.URL) as body:
+            assert body.validator is None
+
+        patched({self.URL: _Response(200, url=self.URL, body=b"x", headers={"etag": '"v1"', "accept-ranges": "bytes"})})
+        with http_stream("ua", check=_checks_everything([]))(self.URL) as body:
+            assert (body.offset, body.validator) == (0, '"v1"')
+
+    def test_a_weak_etag_gives_way_to_the_modification_date(self, patched):
+        headers = {"etag": 'W/"v1"', "last-modified": "Tue, 01 Sep 2026 10:00:00 GMT", "accept-ranges": "bytes"}
+        patched({self.URL: _Response(200, url=self.URL, body=b"x", headers=headers)})
+
+        with http_stream("ua", check=_checks_everything([]))(self.URL) as body:
+            assert body.validator == "Tue, 01 Sep 2026 10:00:00 GMT"
+
+    def test_a_range_that_does_not_say_where_it_starts_is_refused(self, patched):
+        patched({self.URL: _Response(206, url=self.URL, body=b"x")})
+
+        with pytest.raises(ServiceError, match="did not say which"):
+            with http_stream("ua", check=_checks_everything([]))(self.URL, resume=ResumeFrom(1, '"v1"')) as body:
+                b"".join(body)
@@ -0,0 +1,54 @@
+"""Learning a file's hash and head while it is written, and the one path that cannot."""
+
+import hashlib
+import io
+
+import pytest
+from PIL import Image
+
+from curation.acquisition.witness import HEAD_BYTES, Witness, WitnessedWriter, witness_file
+from curation.services.imaging import measure_head
+
+
+def test_the_head_is_the_start_of_the_file_and_no_more():
+    witness = Witness()
+    for _ in range(3):
+        witness.update(b"x" * (HEAD_BYTES // 2))
+
+    seen = witness.witnessed()
+
+    assert seen.byte_size == 3 * (HEAD_BYTES // 2)
+    assert len(seen.head) == HEAD_BYTES
+    assert seen.content_hash == hashlib.sha256(b"x" * seen.byte_size).hexdigest()
+
+
+def test_pillow_writes_through_the_writer_rather_than_around_it(tmp_path):
+    # Offered a `fileno`, Pillow's encoder writes to the descriptor and the
+    # witness would see nothing; the writer offers none, and this is the proof.
+    witness = Witness()
+    staged = tmp_path / "stitched.jpg"
+    with staged.open("wb") as out:
+        Image.new("RGB", (300, 200), (40, 40, 90)).save(WitnessedWriter(out, witness), format="JPEG")
+
+    seen = witness.witnessed()
+
+    assert seen.content_hash == hashlib.sha256(staged.read_bytes()).hexdigest()
+    assert measure_head(seen.head) == (300, 200)
+
+
+def test_a_file_read_back_counts_every_byte_as_reread(tmp_path):
+    written = tmp_path / "assembled.jpg"
+    written.write_bytes(b"assembled elsewhere")
+
+    seen = witness_file(written)
+
+    assert (seen.byte_size, seen.reread_bytes) == (19, 19)
+    assert seen.head == b"assembled elsewhere"
+
+
+def test_a_head_that_stops_short_of_the_header_refuses_rather_than_guesses():
+    buffer = io.BytesIO()
+    Image.new("RGB", (300, 200)).save(buffer, format="JPEG")
+
+    with pytest.raises((OSError, SyntaxError)):
+        measure_head(buffer.getvalue()[:16])
@@ -15,7 +15,7 @@ import json
 import httpx
 import pytest
 
-from curation.discovery.artic import PROVIDER, ArticImageSearch
+from curation.discovery.artic import _PREPARED_HELD, PROVIDER, ArticImageSearch
 from curation.discovery.images import ImageQuery, ImageSearchFailure
 from curation.discovery.phase_two import PhaseTwoEngine
 from curation.persistence.records import AcquisitionMethod, RightsStatus, SourceClass
@@ -514,3 +514,119 @@ class TestResolvingAnObjectsImageService:
     def test_the_client_reports_the_provider_its_instances_are_recorded_under(self):
         """Wiring keys resolvers by this rather than repeating the name."""
         assert _client(lambda request: httpx.Response(200, json=GOLDEN_BIRD_OBJECT)).provider == PROVIDER
+
+
+class TestAskingARunsSearchesTogether:
+    """A run's searches sent as multi-searches, and every work still answered alone.
+
+    The multi-search response shape is the API documentation's, not a recorded
+    measurement, so the fallbacks are tested as hard as the batching: a shape
+    this client does not expect must cost round trips, never a work's result.
+    """
+
+    @staticmethod
+    def _museum(*, batch=None):
+        """Answers a multi-search with `batch(bodies)`, or one search per body by default."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            if request.url.path.endswith("/msearch"):
+                bodies = json.loads(request.content)
+                answer = batch(bodies) if batch else [_body(AMERICAN_GOTHIC) for _ in bodies]
+                return answer if isinstance(answer, httpx.Response) else httpx.Response(200, json=answer)
+            return httpx.Response(200, json=_body(AMERICAN_GOTHIC))
+
+        return handler, sent
+
+    def test_a_forty_work_run_is_two_requests_rather_than_forty(self):
+        handler, sent = self._museum()
+        client = _client(handler)
+        queries = [ImageQuery(title=f"Study {number}") for number in range(40)]
+
+        client.prepare(queries)
+        found = [client.find_images(query) for query in queries]
+
+        assert len(sent) == 2
+        assert [len(json.loads(request.content)) for request in sent] == [20, 20]
+        assert all(len(images) == 1 for images in found)
+
+    def test_each_body_asks_what_the_single_search_would(self):
+        handler, sent = self._museum()
+        client = _client(handler)
+
+        client.prepare([ImageQuery(title="American Gothic", artist="Grant Wood")])
+
+        (body,) = json.loads(sent[0].content)
+        assert body["q"] == "American Gothic"
+        assert body["limit"] == 10
+        assert "image_id" in body["fields"]
+        assert sent[0].headers["AIC-User-Agent"] == USER_AGENT
+
+    def test_a_batch_answer_is_used_once(self):
+        handler, sent = self._museum()
+        client = _client(handler)
+        query = ImageQuery(title="American Gothic")
+
+        client.prepare([query])
+        client.find_images(query)
+        client.find_images(query)
+
+        assert [request.url.path for request in sent] == ["/api/v1/msearch", "/api/v1/artworks/search"]
+
+    def test_answers_no_run_asked_for_are_not_held_without_bound(self):
+        handler, sent = self._museum()
+        client = _client(handler)
+        abandoned = [ImageQuery(title=f"Study {number}") for number in range(_PREPARED_HELD)]
+        query = ImageQuery(title="American Gothic")
+
+        client.prepare(abandoned)
+        client.prepare([query])
+        batched = len(sent)
+        for asked in (abandoned[0], abandoned[1], query):
+            client.find_images(asked)
+
+        # The oldest answer made way for the newest, and only it is asked again.
+        (alone,) = sent[batched:]
+        assert alone.url.path == "/api/v1/artworks/search"
+        assert alone.url.params["q"] == "Study 0"
+
+    def test_the_same_title_twice_is_asked_once(self):
+        handler, sent = self._museum()
+        client = _client(handler)
+
+        client.prepare([ImageQuery(title="American Gothic"), ImageQuery(title="American Gothic")])
+
+        assert len(json.loads(sent[0].content)) == 1
+
+    @pytest.mark.parametrize(
+        "batch",
+        [
+            lambda bodies: httpx.Response(503),
+            lambda bodies: {"data": []},
+            lambda bodies: [_body(AMERICAN_GOTHIC)],
+        ],
+        ids=["refused", "not_a_list", "wrong_length"],
+    )
+    def test_a_batch_that_cannot_be_read_leaves_every_work_to_its_own_search(self, batch):
+        handler, sent = self._museum(batch=batch)
+        client = _client(handler)
+        queries = [ImageQuery(title="American Gothic"), ImageQuery(title="Nighthawks")]
+
+        client.prepare(queries)
+        found = [client.find_images(query) for query in queries]
+
+        assert len(sent) == 3
+        assert all(len(images) == 1 for images in found)
+
+    def test_one_malformed_entry_costs_only_its_own_work(self):
+        handler, sent = self._museum(batch=lambda bodies: [_body(AMERICAN_GOTHIC), {"error": "shard failure"}])
+        client = _client(handler)
+        queries = [ImageQuery(title="American Gothic"), ImageQuery(title="Nighthawks")]
+
+        client.prepare(queries)
+        for query in queries:
+            client.find_images(query)
+
+        assert [request.url.path for request in sent] == ["/api/v1/msearch", "/api/v1/artworks/search"]
+        assert "Nighthawks" in str(sent[1].url)
@@ -0,0 +1,170 @@
+"""The content-hashed client bundle: names that change exactly when bytes do.
+
+The property everything here defends is the one `immutable` rests on. A browser
+told to keep a file forever will keep it forever, so a bundled name that could
+outlive a change to what it serves — directly, or through something it imports —
+is a curator looking at yesterday's client with nothing to tell them so.
+"""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from curation.http.assets import accepts_gzip, build_bundle
+from curation.http.pages import ASSETS_PATH, STATIC_DIR
+
+
+def _tree(root: Path, files: dict[str, str]) -> Path:
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return root
+
+
+SHELL = '<link rel="stylesheet" href="/static/app.css" />\n<script type="module" src="/static/app.js"></script>\n'
+
+
+@pytest.fixture
+def client(tmp_path):
+    """A three-module client with a screen importing from `core/`, as the real one does."""
+    return _tree(
+        tmp_path / "static",
+        {
+            "index.html": SHELL,
+            "app.css": "body { margin: 0; }\n",
+            "app.js": 'import { view } from "./screens/home.js";\nview();\n',
+            "screens/home.js": 'import { render } from "../core/render.js";\nexport function view() { render(); }\n',
+            "core/render.js": "export function render() {}\n",
+        },
+    )
+
+
+# -- naming -------------------------------------------------------------------
+
+
+def test_every_file_is_named_by_its_content(client):
+    bundle = build_bundle(client, prefix="/assets")
+
+    assert set(bundle.names) == {"app.css", "app.js", "screens/home.js", "core/render.js"}
+    assert bundle.names["core/render.js"].startswith("core/render.")
+    assert bundle.names["core/render.js"].endswith(".js")
+    assert set(bundle.assets) == set(bundle.names.values())
+
+
+def test_imports_name_the_hashed_files_and_stay_relative(client):
+    bundle = build_bundle(client, prefix="/assets")
+
+    home = bundle.assets[bundle.names["screens/home.js"]].body.decode()
+    hashed = bundle.names["core/render.js"].removeprefix("core/")
+    assert f'from "../core/{hashed}"' in home
+
+
+def test_the_shell_names_the_bundle_under_its_prefix(client):
+    bundle = build_bundle(client, prefix="/assets")
+
+    shell = bundle.shell.body.decode()
+    assert f'href="/assets/{bundle.names["app.css"]}"' in shell
+    assert f'src="/assets/{bundle.names["app.js"]}"' in shell
+    assert "/static/" not in shell
+
+
+def test_a_change_deep_in_the_graph_renames_everything_that_imports_it(client):
+    """The reason modules are hashed after their imports rather than before.
+
+    `app.js` does not mention `render` at all, and it still has to move: a
+    browser holding the old `app.js` forever would import the old `home.js`,
+    which would import the old `render.js`, forever.
+    """
+    before = build_bundle(client, prefix="/assets")
+    (client / "core" / "render.js").write_text("export function render() { return 1; }\n", encoding="utf-8")
+    after = build_bundle(client, prefix="/assets")
+
+    for name in ("core/render.js", "screens/home.js", "app.js"):
+        assert before.names[name] != after.names[name], name
+    assert before.names["app.css"] == after.names["app.css"]
+    assert before.shell.etag != after.shell.etag
+
+
+def test_an_unchanged_tree_bundles_to_the_same_names(client):
+    """A restart must not cost every phone a cold load of a client that did not change."""
+    first = build_bundle(client, prefix="/assets")
+    second = build_bundle(client, prefix="/assets")
+
+    assert first.names == second.names
+    assert first.shell.etag == second.shell.etag
+
+
+def test_a_cycle_is_refused_rather_than_hashed(tmp_path):
+    client = _tree(
+        tmp_path / "static",
+        {
+            "index.html": SHELL,
+            "app.js": 'import "./core/a.js";\n',
+            "core/a.js": 'import { b } from "./b.js";\nexport const a = 1;\n',
+            "core/b.js": 'import { a } from "./a.js";\nexport const b = 2;\n',
+        },
+    )
+
+    with pytest.raises(ValueError, match="cycle"):
+        build_bundle(client, prefix="/assets")
+
+
+def test_an_import_of_a_missing_file_is_left_as_written(tmp_path):
+    client = _tree(tmp_path / "static", {"index.html": SHELL, "app.js": 'import "./gone.js";\n'})
+
+    bundle = build_bundle(client, prefix="/assets")
+
+    assert bundle.assets[bundle.names["app.js"]].body.decode() == 'import "./gone.js";\n'
+
+
+def test_the_shipped_client_bundles_whole():
+    """Every module the browser can reach has a hashed name, and no import was missed."""
+    bundle = build_bundle(STATIC_DIR, prefix=ASSETS_PATH)
+
+    modules = {path.relative_to(STATIC_DIR).as_posix() for path in STATIC_DIR.rglob("*.js")}
+    assert modules <= set(bundle.names)
+    for name in modules:
+        body = bundle.assets[bundle.names[name]].body.decode()
+        for source in modules:
+            plain = source.rsplit("/", 1)[-1]
+            assert f'/{plain}"' not in body, f"{name} still imports {plain} by its plain name"
+
+
+# -- compression --------------------------------------------------------------
+
+
+def test_the_compressed_copy_is_the_same_bytes():
+    bundle = build_bundle(STATIC_DIR, prefix=ASSETS_PATH)
+
+    for asset in bundle.assets.values():
+        if asset.gzipped is not None:
+            assert gzip.decompress(asset.gzipped) == asset.body
+            assert len(asset.gzipped) < len(asset.body)
+
+
+def test_a_file_gzip_would_grow_is_sent_as_it_is(tmp_path):
+    client = _tree(tmp_path / "static", {"index.html": SHELL, "app.css": "a{}"})
+
+    bundle = build_bundle(client, prefix="/assets")
+
+    assert bundle.assets[bundle.names["app.css"]].gzipped is None
+
+
+@pytest.mark.parametrize(
+    ("header", "accepted"),
+    [
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.8", True),
+        ("GZIP", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("br", False),
+        ("identity", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_accept_encoding_is_read_rather_than_searched(header, accepted):
+    assert accepts_gzip(header) is accepted
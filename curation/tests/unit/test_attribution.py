@@ -8,10 +8,14 @@ one painter, including the two that reach the merge without either name
 resembling the other: an unattributed work, and a name that normalises away.
 """
 
+import random
+
 import pytest
 
+from curation.discovery.dedup import artist_key, clean_name
 from curation.persistence.records import Artist
-from curation.services.attribution import resolve
+from curation.services import attribution
+from curation.services.attribution import AttributionIndex, HeldArtists, resolve
 
 
 def artist(name: str) -> Artist:
@@ -234,3 +238,95 @@ def test_an_empty_catalogue_mints_without_reporting():
 
     assert result.mint == "Salvador Dalí"
     assert result.near_misses == ()
+
+
+def scanned(proposed: str | None, artists: list[Artist]) -> tuple[Artist | None, str | None, list[Artist]]:
+    """The rule as a scan of every row, as it was written before the index.
+
+    The index is held to this answer for every name, so the rule itself lives in
+    the tests above and this only pins that indexing changed nothing.
+    """
+    key = artist_key(proposed) if proposed is not None else ""
+    if not key:
+        return None, None, []
+    for held in artists:
+        if artist_key(held.name) == key:
+            return held, None, []
+    tokens = key.split()
+    near = []
+    for held in artists:
+        other = artist_key(held.name).split()
+        shared = set(tokens) & set(other)
+        if other and (tokens[-1] in shared or other[-1] in shared):
+            near.append(held)
+    return None, clean_name(proposed), near
+
+
+def test_the_index_answers_every_name_as_the_scan_did():
+    """Seeded names drawn from a small vocabulary, so keys collide and tokens are shared."""
+    chance = random.Random(11)
+    words = ["van", "de", "Ruisdael", "Hals", "Jacob", "Hans", "Li", "Wu", "the", "Younger", "Dalí", "(Jan)", "-", "J."]
+    names = [" ".join(chance.choices(words, k=chance.randint(1, 4))) for _ in range(400)]
+    held = [Artist(id=f"a{n}", name=name) for n, name in enumerate(names[:300])]
+    index = HeldArtists(held)
+
+    for proposed in [*names, None, "", "???"]:
+        answer = index.resolve(proposed)
+        assert (answer.matched, answer.mint, list(answer.near_misses)) == scanned(proposed, held), proposed
+
+
+class TestTheIndexIsKept:
+    @pytest.fixture
+    def derived(self, monkeypatch) -> list[str]:
+        """Every name the index derives a key for, in order."""
+        seen: list[str] = []
+
+        def counting(name: str) -> str:
+            seen.append(name)
+            return artist_key(name)
+
+        monkeypatch.setattr(attribution, "artist_key", counting)
+        return seen
+
+    def test_the_artists_are_listed_and_keyed_once_while_nothing_commits(self, derived):
+        index = AttributionIndex()
+        listings: list[int] = []
+
+        def listing() -> list[Artist]:
+            listings.append(1)
+            return [artist("Edward Hopper"), artist("Grant Wood")]
+
+        for _ in range(3):
+            index.held(generation=4, rules="r1", artists=listing).resolve("Edward Hopper")
+
+        assert len(listings) == 1
+        assert derived.count("Edward Hopper") == 1 + 3, "once for the row, and once per proposal"
+
+    def test_a_commit_relists_and_keys_only_the_rows_not_seen_before(self, derived):
+        index = AttributionIndex()
+        held = [artist("Edward Hopper")]
+        index.held(generation=1, rules="r1", artists=lambda: held)
+        held.append(artist("Grant Wood"))
+
+        answer = index.held(generation=2, rules="r1", artists=lambda: held).resolve("Grant Wood")
+
+        assert answer.matched == held[1]
+        assert derived == ["Edward Hopper", "Grant Wood", "Grant Wood"]
+
+    def test_a_renamed_row_is_keyed_under_its_new_name(self):
+        index = AttributionIndex()
+        index.held(generation=1, rules="r1", artists=lambda: [Artist(id="a1", name="Jacob Ruisdael")])
+
+        renamed = index.held(generation=2, rules="r1", artists=lambda: [Artist(id="a1", name="Edward Hopper")])
+
+        assert renamed.resolve("Jacob Ruisdael").matched is None
+        assert renamed.resolve("Edward Hopper").matched is not None
+
+    def test_new_rules_derive_every_key_again(self, derived):
+        index = AttributionIndex()
+        held = [artist("Edward Hopper")]
+        index.held(generation=1, rules="r1", artists=lambda: held)
+
+        index.held(generation=1, rules="r2", artists=lambda: held)
+
+        assert derived == ["Edward Hopper", "Edward Hopper"]
@@ -14,11 +14,14 @@ being legible.
 import logging
 from dataclasses import replace
 from datetime import UTC, datetime
+from decimal import Decimal
 from types import SimpleNamespace
 
 import pytest
 
 from curation.acquisition.dezoomify import DezoomifyUnavailable
+from curation.acquisition.preparation import PreparationOutcome, PreparationResult
+from curation.acquisition.queue import JobState
 from curation.acquisition.service import _DEPLOYMENT_FAULTS, AcquisitionOutcome, AcquisitionResult
 from curation.acquisition.space import NotEnoughSpace
 from curation.acquisition.tiles import TileTargetUnavailable
@@ -26,6 +29,7 @@ from curation.mcp.bindings import (
     _RUN_DETAIL_ONLY,
     MAX_WORKS_LISTED,
     _acquisition_notice,
+    _prepare_batch,
     _retry_acquisition,
     _run_fields,
     _run_notice,
@@ -377,6 +381,45 @@ def test_a_deployment_fault_is_translated_into_a_remedy(condition, caplog):
     assert events == [], "the binding journalled a fault the service already journals; an MCP refusal would be logged twice"
 
 
+# -- preparing a batch -----------------------------------------------------------
+
+
+def test_a_batch_is_prepared_in_one_call_and_says_what_it_spent_and_what_it_left():
+    """The works the batch holds go to `prepare_many` together; the ones still fetching are counted, not waited on."""
+    asked = []
+
+    class _Preparation:
+        def prepare_many(self, artwork_ids, *, force=False):
+            asked.append((list(artwork_ids), force))
+            return [
+                PreparationResult(
+                    artwork_id=artwork_id,
+                    outcome=PreparationOutcome.PREPARED,
+                    detail="composed",
+                    mat_hex="#27285b",
+                    mat_method="vision_model",
+                    relative_path=f"ready/{artwork_id}.jpg",
+                    cost_usd=Decimal("0.000063"),
+                )
+                for artwork_id in artwork_ids
+            ]
+
+    acquisitions = SimpleNamespace(
+        status=lambda *, batch_id: SimpleNamespace(
+            jobs=[SimpleNamespace(state=JobState.FINISHED), SimpleNamespace(state=JobState.RUNNING)]
+        ),
+        held=lambda batch_id: ["art-1", "art-2"],
+    )
+    services = SimpleNamespace(acquisitions=acquisitions, preparation=_Preparation())
+
+    payload = _prepare_batch(services, {"batch_id": "batch-1"})
+
+    assert asked == [(["art-1", "art-2"], False)]
+    assert [work["artwork_id"] for work in payload["works"]] == ["art-1", "art-2"]
+    assert (payload["count"], payload["still_fetching"]) == (2, 1)
+    assert payload["cost_usd"] == "0.000126"
+
+
 # -- the run listing's cap -------------------------------------------------------
 
 
@@ -148,6 +148,19 @@ def test_matching_a_held_artist_reports_no_duplicate(discovery, resolved_work):
     assert outcome.duplicate_candidates == ()
 
 
+def test_an_artist_the_catalogue_gained_since_the_last_acceptance_is_matched(discovery, resolved_work, service):
+    """The keyed artists are kept between acceptances, and a commit elsewhere is what retires them."""
+    first = resolved_work("Nighthawks", dedup_key="nighthawks", proposed_artist="Edward Hopper")
+    discovery.set_verdict(first.id, Verdict.ACCEPTED)
+    held = service.add_artist(name="Grant Wood")
+    second = resolved_work("American Gothic", dedup_key="american-gothic", proposed_artist="Grant Wood")
+
+    outcome = discovery.set_verdict(second.id, Verdict.ACCEPTED)
+
+    assert outcome.minted_artist is None
+    assert service.get_artwork(outcome.work.artwork_id).artist == held
+
+
 def test_a_rejection_mints_no_artist(discovery, resolved_work, service):
     """Attribution is a consequence of entering the catalogue, not of being judged."""
     work = resolved_work("Nighthawks", proposed_artist="Edward Hopper")
@@ -2,7 +2,8 @@
 
 import pytest
 
-from curation.persistence.records import ArtworkStatus
+from curation.persistence.records import AcquisitionMethod, ArtworkStatus, RightsStatus, SourceClass
+from curation.services.catalogue import NewArtist, NewWork
 from curation.services.errors import ServiceError
 
 
@@ -123,6 +124,45 @@ def test_a_blank_title_is_refused_rather_than_stored(service):
         service.add_artwork(title="   ")
 
 
+def _new_work(title, *, artist_id=None):
+    return NewWork(
+        title=title,
+        url=f"https://museum.example/{title.lower()}",
+        provider="museum.example",
+        source_class=SourceClass.INSTITUTIONAL,
+        acquisition_method=AcquisitionMethod.DIRECT_HTTP,
+        rights_status=RightsStatus.UNKNOWN,
+        artist_id=artist_id,
+    )
+
+
+def test_works_added_together_each_arrive_with_their_primary_source(service):
+    (hopper,) = service.add_artists([NewArtist(name="Edward Hopper")])
+
+    works = service.add_works([_new_work("Nighthawks", artist_id=hopper.id), _new_work("Automat", artist_id=hopper.id)])
+
+    assert [work.title for work in works] == ["Nighthawks", "Automat"]
+    assert all(work.status is ArtworkStatus.ACCEPTED for work in works)
+    for work in works:
+        (source,) = service.list_sources(work.id)
+        assert source.is_primary is True
+        assert source.url.endswith(work.title.lower())
+
+
+def test_one_bad_work_refuses_the_batch_before_anything_is_written(service):
+    with pytest.raises(ServiceError, match="title cannot be empty"):
+        service.add_works([_new_work("Nighthawks"), _new_work("   ")])
+
+    assert service.list_artworks().total == 0
+
+
+def test_works_added_together_cannot_point_at_an_artist_that_does_not_exist(service):
+    with pytest.raises(ServiceError, match="No artist with id 'ghost'"):
+        service.add_works([_new_work("Nighthawks", artist_id="ghost")])
+
+    assert service.list_artworks().total == 0
+
+
 def test_themes_round_trip(display):
     theme = display.add_theme(name="American Modernists", description="Precisionists and their neighbours")
 
@@ -12,6 +12,7 @@ from pathlib import Path
 
 import pytest
 
+from curation.acquisition.service import TileFetcher
 from curation.config import (
     CATALOGUE_FILENAME,
     DEFAULT_HOST,
@@ -264,6 +265,44 @@ def test_a_flag_that_is_neither_is_refused_rather_than_guessed(monkeypatch, tmp_
         Settings.from_env()
 
 
+def test_the_tile_fetcher_defaults_to_the_binary_and_is_chosen_by_name(monkeypatch, tmp_path):
+    monkeypatch.setenv("ART_ROOT", str(tmp_path))
+    monkeypatch.delenv("TILE_FETCHER", raising=False)
+
+    assert Settings.from_env().tile_fetcher is TileFetcher.DEZOOMIFY
+
+    monkeypatch.setenv("TILE_FETCHER", "IIIF")
+
+    assert Settings.from_env().tile_fetcher is TileFetcher.IIIF
+
+
+def test_each_cache_directory_has_a_budget_and_zero_only_measures_it(monkeypatch, tmp_path):
+    monkeypatch.setenv("ART_ROOT", str(tmp_path))
+    for name in ("TILE_CACHE_BUDGET_BYTES", "PREVIEWS_BUDGET_BYTES", "THUMBNAILS_BUDGET_BYTES", "MUSEUM_CACHE_BUDGET_BYTES"):
+        monkeypatch.delenv(name, raising=False)
+
+    shipped = Settings.from_env().storage_budgets
+    assert shipped.tile_cache_bytes and shipped.previews_bytes and shipped.thumbnails_bytes and shipped.museum_cache_bytes
+
+    monkeypatch.setenv("TILE_CACHE_BUDGET_BYTES", "0")
+    monkeypatch.setenv("THUMBNAILS_BUDGET_BYTES", "1048576")
+
+    chosen = Settings.from_env().storage_budgets
+    assert (chosen.tile_cache_bytes, chosen.previews_bytes, chosen.thumbnails_bytes) == (
+        0,
+        shipped.previews_bytes,
+        1048576,
+    )
+
+
+def test_a_tile_fetcher_nobody_built_is_refused_with_the_choices(monkeypatch, tmp_path):
+    monkeypatch.setenv("ART_ROOT", str(tmp_path))
+    monkeypatch.setenv("TILE_FETCHER", "wget")
+
+    with pytest.raises(ConfigError, match="one of dezoomify, iiif, got 'wget'"):
+        Settings.from_env()
+
+
 @pytest.mark.parametrize(
     "name",
     ["ROTATION_INTERVAL_SECONDS", "TV_PANEL_WIDTH_PX", "TV_PANEL_HEIGHT_PX"],
@@ -752,3 +791,17 @@ def test_the_api_key_never_appears_in_the_redacted_configuration(monkeypatch, tm
     assert "sk-or-v1-should-never-be-logged" not in str(redacted)
     assert redacted["openrouter_api_key"] == "<set>"
     assert set(redacted) == set(Settings.__dataclass_fields__), "every field is accounted for, secret or not"
+
+
+def test_statement_profiling_is_off_until_a_deployment_asks_for_it(monkeypatch, tmp_path):
+    monkeypatch.setenv("ART_ROOT", str(tmp_path))
+    monkeypatch.delenv("STORE_PROFILING", raising=False)
+    monkeypatch.delenv("STORE_SLOW_QUERY_MS", raising=False)
+
+    assert Settings.from_env().store_profiling is False
+
+    monkeypatch.setenv("STORE_PROFILING", "true")
+    monkeypatch.setenv("STORE_SLOW_QUERY_MS", "25")
+    settings = Settings.from_env()
+
+    assert (settings.store_profiling, settings.slow_query_ms) == (True, 25)
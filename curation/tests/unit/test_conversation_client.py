@@ -260,3 +260,71 @@ def test_the_single_shot_path_still_sends_exactly_what_it_did():
     assert "reasoning" not in sent[0]
     assert sent[0]["max_tokens"] == 2000
     assert sent[0]["usage"] == {"include": True}
+
+
+def streaming(name: str, *, size: int = 16, content: str | None = None):
+    """A capture sent the way a streamed answer arrives, and what was asked of it.
+
+    The content goes in `size`-character pieces, one `data:` event each, and the
+    capture's own usage block rides the last one *as text*, so its cost notation
+    reaches the client exactly as the provider wrote it.
+    """
+    status, body = capture(name)
+    whole = json.loads(body)
+    text = whole["choices"][0]["message"]["content"] if content is None else content
+    usage = body[body.index('"usage": ') + len('"usage": ') : -1]
+    events = [
+        json.dumps({"model": whole["model"], "choices": [{"delta": {"content": text[start : start + size]}}]})
+        for start in range(0, len(text), size)
+    ]
+    finish = json.dumps({"model": whole["model"], "choices": [{"delta": {}, "finish_reason": "stop"}]})
+    events.append(f'{finish[:-1]}, "usage": {usage}}}')
+    stream = ": OPENROUTER PROCESSING\n\n" + "".join(f"data: {event}\n\n" for event in events) + "data: [DONE]\n\n"
+    sent: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(status, text=stream, headers={"content-type": "text/event-stream"})
+
+    return handler, sent
+
+
+def test_a_streamed_thread_hands_on_each_piece_and_reads_as_the_whole_answer_would():
+    """The pieces are for reading along; what comes back is the answer `complete_thread` gives."""
+    handler, sent = streaming("c2")
+    whole_handler, _ = answering("c2")
+    pieces: list[str] = []
+
+    streamed = client_over(handler).stream_thread(messages=A_THREAD, on_text=pieces.append)
+    whole = client_over(whole_handler).complete_thread(messages=A_THREAD)
+
+    assert sent[0]["stream"] is True
+    assert len(pieces) > 1
+    assert "".join(pieces) == streamed.content == whole.content
+    assert (streamed.cost_usd, streamed.input_tokens, streamed.output_tokens) == (
+        whole.cost_usd,
+        whole.input_tokens,
+        whole.output_tokens,
+    )
+    assert str(streamed.cost_usd) == "0.00001896"
+
+
+def test_a_refused_stream_says_what_was_wrong_as_the_unstreamed_call_does():
+    """A refusal arrives as an ordinary error body, before any stream begins."""
+    handler, _ = answering("null_content_echo")
+    with pytest.raises(OpenRouterError, match="The content field is a required field"):
+        client_over(handler).stream_thread(messages=A_THREAD, on_text=lambda piece: None)
+
+
+def test_a_stream_the_provider_breaks_off_is_a_failure_and_not_a_short_answer():
+    """After a 200 the status cannot carry a failure, so the stream's own error event does."""
+    stream = (
+        'data: {"choices": [{"delta": {"content": "Agnes"}}]}\n\n'
+        'data: {"error": {"code": 502, "message": "Upstream provider went away"}}\n\n'
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=stream, headers={"content-type": "text/event-stream"})
+
+    with pytest.raises(OpenRouterError, match="broke off the answer: Upstream provider went away"):
+        client_over(handler).stream_thread(messages=A_THREAD, on_text=lambda piece: None)
@@ -14,6 +14,7 @@ the API really sent.
 """
 
 import json
+import logging
 import pathlib
 
 import httpx
@@ -26,6 +27,7 @@ from curation.discovery.conversation import (
     Suggestion,
     ThreadTurn,
     UnavailableConversation,
+    _ReplyText,
 )
 from curation.discovery.openrouter import OpenRouterClient
 from curation.persistence.discovery_records import SpendCategory, TurnRole
@@ -215,3 +217,84 @@ def test_a_deployment_with_no_key_refuses_and_names_what_fixes_it():
 
     assert "OPENROUTER_API_KEY" in str(failure.value)
     assert UnavailableConversation(NO_CONVERSATION_KEY).unavailable_reason == NO_CONVERSATION_KEY
+
+
+def streaming_with(name: str, content, *, size: int = 7):
+    """The named capture streamed in `size`-character pieces, its reply swapped as above."""
+    payload = json.loads((FIXTURES / f"{name}.json").read_text())
+    body = json.loads(payload["body"])
+    text = content if isinstance(content, str) else json.dumps(content)
+    events = [
+        {"model": body["model"], "choices": [{"delta": {"content": text[at : at + size]}}]} for at in range(0, len(text), size)
+    ]
+    events.append({"model": body["model"], "choices": [{"delta": {}, "finish_reason": "stop"}], "usage": body["usage"]})
+    stream = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+    sent: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(payload["status"], text=stream, headers={"content-type": "text/event-stream"})
+
+    return handler, sent
+
+
+class TestStreaming:
+    def test_only_the_reply_s_own_text_reaches_the_screen_and_the_turn_is_unchanged(self):
+        """The envelope streams; a curator reading along sees no brace and no suggestion list."""
+        handler, sent = streaming_with("c2", A_REPLY)
+        whole, _ = answering_with("c2", A_REPLY)
+        pieces: list[str] = []
+
+        streamed = engine_over(handler).answer(a_thread("Something calm."), on_text=pieces.append)
+
+        assert sent[0]["stream"] is True
+        assert len(pieces) > 1
+        assert "".join(pieces) == A_REPLY["reply"]
+        assert streamed == engine_over(whole).answer(a_thread("Something calm."))
+
+    def test_a_turn_nobody_watches_is_not_streamed(self):
+        handler, sent = answering_with("c2", A_REPLY)
+        engine_over(handler).answer(a_thread("Something calm."))
+
+        assert "stream" not in sent[0]
+
+    def test_how_long_the_first_words_took_is_logged_beside_the_whole_wait(self, caplog):
+        handler, _ = streaming_with("c2", A_REPLY)
+        with caplog.at_level(logging.INFO):
+            engine_over(handler).answer(a_thread("Something calm."), on_text=lambda piece: None)
+
+        (answered,) = [record for record in caplog.records if getattr(record, "event", None) == "conversation.answered"]
+        assert answered.streamed is True
+        assert 0 <= answered.first_token_seconds <= answered.seconds
+
+    def test_a_reply_with_escapes_is_handed_on_decoded_however_it_was_cut(self):
+        """An escape split across pieces waits for its other half, a surrogate pair included."""
+        envelope = json.dumps({"reply": 'A "quiet" wall\nby Ōtake 🎨.', "suggested": []})
+        for size in range(1, 12):
+            pieces: list[str] = []
+            reading = _ReplyText(pieces.append)
+            for at in range(0, len(envelope), size):
+                reading.feed(envelope[at : at + size])
+
+            assert "".join(pieces) == 'A "quiet" wall\nby Ōtake 🎨.'
+
+    def test_a_fragment_that_will_not_decode_ends_the_pieces_and_not_the_turn(self):
+        """What the model wrote past a bad escape is not shown; the whole is still read once it is in."""
+        for broken in ("\\uZZZZ", "\x01"):
+            envelope = '{"reply": "A calm wall' + broken + ' by the sea.", "suggested": []}'
+            pieces: list[str] = []
+            reading = _ReplyText(pieces.append)
+            for at in range(0, len(envelope), 3):
+                reading.feed(envelope[at : at + 3])
+
+            # Up to the piece the bad fragment arrived in, and nothing after.
+            said = "".join(pieces)
+            assert said.startswith("A calm wa")
+            assert "A calm wall".startswith(said)
+
+    def test_a_streamed_reply_that_will_not_decode_fails_as_a_turn_and_carries_its_bill(self):
+        handler, _ = streaming_with("c2", '{"reply": "A calm wall\\uZZZZ by the sea.", "suggested": []}')
+        with pytest.raises(ConversationFailure) as failure:
+            engine_over(handler).answer(a_thread("Something calm."), on_text=lambda piece: None)
+
+        assert failure.value.spend
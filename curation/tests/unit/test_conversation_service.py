@@ -145,6 +145,32 @@ def test_retrying_an_answered_thread_is_refused_rather_than_spending_again(talki
         talking.speak(conversation_id)
 
 
+def test_a_turn_watched_as_it_is_written_is_recorded_as_one_that_was_not(talking, conversation_engine, discovery):
+    """The pieces are for the screen; the transcript and the ledger never see them."""
+    conversation_id = talking.start().conversation.id
+    pieces: list[str] = []
+
+    view = talking.speak(conversation_id, "Something calm.", on_text=pieces.append)
+
+    assert "".join(pieces) == conversation_engine.reply
+    assert [turn.turn.text for turn in view.turns] == ["Something calm.", conversation_engine.reply]
+    (record,) = discovery._store.list_spend_records()
+    assert record.conversation_turn_id == view.turns[-1].turn.id
+
+
+def test_a_refused_question_is_refused_before_anything_is_asked(talking, conversation_engine):
+    """`ask` is where a streaming surface learns of a refusal, so it must refuse everything `speak` does."""
+    conversation_id = talking.start().conversation.id
+
+    with pytest.raises(ServiceError, match="nothing to retry"):
+        talking.ask(conversation_id)
+    asked = talking.ask(conversation_id, "Something calm.")
+
+    assert asked.turn.role is TurnRole.CURATOR
+    assert asked.view.unanswered == asked.turn
+    assert conversation_engine.threads == []
+
+
 def test_a_turn_names_things_and_shows_a_few_pictures_for_each(services, conversation_engine, discovery_store, runner):
     """Samples come from the collection the product already browses, and are free.
 
@@ -18,6 +18,8 @@ from decimal import Decimal
 import pytest
 
 from curation.persistence.discovery_records import InitiatedBy, ResolutionStatus, RunStatus, SpendCategory, Verdict
+from curation.persistence.records import AcquisitionMethod, SourceClass
+from curation.services.discovery import FoundInstance, Proposal
 from curation.services.errors import ServiceError
 
 # -- 7. Suppression has two scopes and they never share a key ------------------
@@ -54,6 +56,23 @@ def test_the_curator_may_reconsider_a_work_they_declined(discovery, resolved_wor
     assert propose("Nighthawks", reconsider=True).proposed_title == "Nighthawks"
 
 
+def test_one_declined_work_refuses_a_batch_of_proposals_whole(discovery, resolved_work):
+    work = resolved_work("Nighthawks")
+    discovery.set_verdict(work.id, Verdict.REJECTED)
+    fresh = discovery.start_discovery_run(intent_text="American realism", initiated_by=InitiatedBy.MCP_CLIENT)
+
+    with pytest.raises(ServiceError, match="already been proposed and rejected"):
+        discovery.propose_works(
+            run_id=fresh.id,
+            works=[
+                Proposal(proposed_title="Automat", rationale="Hopper, as asked.", work_dedup_key="automat"),
+                Proposal(proposed_title="Nighthawks", rationale="Hopper, as asked.", work_dedup_key="nighthawks"),
+            ],
+        )
+
+    assert discovery.list_candidate_works(fresh.id) == []
+
+
 def test_a_work_still_under_review_does_not_suppress_itself(discovery, resolved_work):
     work = resolved_work("Nighthawks")
 
@@ -112,6 +131,29 @@ def test_a_second_instance_does_not_displace_the_selection_by_arriving(discovery
     assert second.is_selected is False
 
 
+def test_a_batch_of_instances_is_selected_as_though_each_arrived_in_turn(discovery, propose):
+    work = propose()
+
+    def found(url):
+        return FoundInstance(
+            url=url,
+            provider="artic",
+            source_class=SourceClass.INSTITUTIONAL,
+            acquisition_method=AcquisitionMethod.DEZOOMIFY,
+            confidence=0.9,
+        )
+
+    recorded = discovery.record_images(
+        work.id, [found("https://museum.example/1"), found("https://museum.example/2"), found("https://museum.example/1")]
+    )
+
+    # The repeated URL is answered with the row the batch already made for it,
+    # rather than becoming a second row a rejection would not reach.
+    assert recorded[2] == recorded[0]
+    assert [image.is_selected for image in recorded[:2]] == [True, False]
+    assert sorted(image.id for image in discovery.list_candidate_images(work.id)) == sorted({recorded[0].id, recorded[1].id})
+
+
 def test_choosing_an_instance_stands_the_previous_one_down(discovery, propose, add_image):
     work = propose()
     first = add_image(work)
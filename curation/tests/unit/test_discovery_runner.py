@@ -533,3 +533,54 @@ def test_an_engine_that_offered_no_strategy_leaves_the_run_without_one(services,
     runner = DiscoveryRunner(services.discovery, engine, settings.discovery_settings, spawn=lambda work: work())
 
     assert services.discovery.get_run(start(runner).id).strategy is None
+
+
+# -- being told rather than asking ----------------------------------------------
+
+
+def test_a_watcher_is_told_each_time_a_run_changes(runner):
+    told = []
+    runner.watch(lambda: told.append(True))
+
+    run = start(runner)
+    after_start = len(told)
+    assert after_start > 0, "a run began and nobody watching was told"
+
+    runner.cancel(run.id)
+    assert len(told) > after_start
+
+
+def test_a_watcher_that_stopped_is_told_nothing_more(runner):
+    told = []
+    stop = runner.watch(lambda: told.append(True))
+    stop()
+
+    start(runner)
+
+    assert told == []
+
+
+def test_a_watcher_that_raises_is_dropped_and_the_run_carries_on(runner, services, caplog):
+    """A stream whose loop has closed raises from `call_soon_threadsafe`; the run is not its to end."""
+    told = []
+
+    def closed() -> None:
+        raise RuntimeError("Event loop is closed")
+
+    runner.watch(closed)
+    runner.watch(lambda: told.append(True))
+
+    with caplog.at_level("ERROR", logger="curation.services.runner"):
+        run = start(runner)
+        runner.cancel(run.id)
+
+    assert [record.event for record in caplog.records] == ["run.watcher_dropped"]
+    assert len(told) > 1, "a watcher beside the broken one stopped being told"
+    assert services.discovery.get_run(run.id).status is not RunStatus.FAILED
+
+
+def test_stopping_twice_is_harmless(runner):
+    """A stream torn down by a disconnect and by its own end both take the listener back."""
+    stop = runner.watch(lambda: None)
+    stop()
+    stop()
@@ -347,6 +347,57 @@ def test_instances_read_with_the_chosen_one_first(discovery_store):
     assert [image.id for image in discovery_store.list_candidate_images("c1")] == ["i1", "i2"]
 
 
+def test_reclaimable_previews_come_a_batch_of_whole_paths_at_a_time(discovery_store):
+    """`limit` counts files, not rows, and a path a live work names is never offered.
+
+    A shared file cut across two batches would have its first half forgotten and
+    its second half still naming it, which is the one state the sweep must never
+    leave a row in.
+    """
+    decided = {Verdict.ACCEPTED, Verdict.REJECTED}
+    discovery_store.add_run(_run())
+    discovery_store.add_candidate_work(_work(id="done", verdict=Verdict.REJECTED))
+    discovery_store.add_candidate_work(_work(id="also-done", work_dedup_key="k2", verdict=Verdict.ACCEPTED))
+    discovery_store.add_candidate_work(_work(id="live", work_dedup_key="k3"))
+    discovery_store.add_candidate_image(_image(id="a1", candidate_work_id="done", url="u/a1", preview_path="previews/a.jpg"))
+    discovery_store.add_candidate_image(_image(id="a2", candidate_work_id="also-done", url="u/a2", preview_path="previews/a.jpg"))
+    discovery_store.add_candidate_image(_image(id="b1", candidate_work_id="done", url="u/b1", preview_path="previews/b.jpg"))
+    discovery_store.add_candidate_image(_image(id="b2", candidate_work_id="live", url="u/b2", preview_path="previews/b.jpg"))
+    discovery_store.add_candidate_image(_image(id="c1", candidate_work_id="done", url="u/c1", preview_path="previews/c.jpg"))
+    discovery_store.add_candidate_image(_image(id="d1", candidate_work_id="done", url="u/d1"))
+
+    first = discovery_store.list_reclaimable_previews(decided=decided, after="", limit=1)
+    second = discovery_store.list_reclaimable_previews(decided=decided, after=first[-1].preview_path, limit=1)
+    third = discovery_store.list_reclaimable_previews(decided=decided, after=second[-1].preview_path, limit=1)
+
+    assert [image.id for image in first] == ["a1", "a2"], "one path, with every row naming it"
+    assert [image.id for image in second] == ["c1"], "b is held by a live work and skipped whole"
+    assert third == []
+    assert discovery_store.count_retained_previews(decided=decided) == 1
+
+
+def test_the_sweeps_question_is_answered_from_the_preview_index(tmp_path):
+    """Asked on a timer against a table that only grows, so a scan would be a cost
+    that rises with every run a curator has ever started."""
+    path = tmp_path / "catalogue.sqlite"
+    open_catalogue_file(path).close()
+
+    connection = sqlite3.connect(path)
+    try:
+        plan = " ".join(
+            row[3]
+            for row in connection.execute(
+                "EXPLAIN QUERY PLAN SELECT preview_path FROM candidate_images "
+                "WHERE preview_path IS NOT NULL AND preview_path > ? GROUP BY preview_path",
+                ("",),
+            )
+        )
+    finally:
+        connection.close()
+
+    assert "candidate_images_by_preview" in plan
+
+
 def test_runs_read_newest_first_because_a_run_list_is_a_history(discovery_store):
     discovery_store.add_run(_run(id="older", started_at=_STARTED))
     discovery_store.add_run(_run(id="newer", started_at=_FINISHED))
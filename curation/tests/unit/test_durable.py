@@ -10,6 +10,9 @@ which is how a duplicate id and a missing parent could have swapped messages
 without a single test noticing.
 """
 
+import sqlite3
+from contextlib import closing
+
 import pytest
 
 from curation.persistence.catalogue import StorageError, StoreMisuseError
@@ -187,6 +190,83 @@ def test_a_refusal_carries_the_bare_reason_for_a_caller_that_knows_the_subject(s
     assert caught.value.reason == "it is already stored."
 
 
+# -- writing in batches -------------------------------------------------------
+
+
+def test_a_batch_writes_every_row_and_counts_them(store):
+    written = store.upsert_many(
+        "things", [{"id": f"t{n}", "label": f"Cup {n}"} for n in range(3)], pk=("id",), on_conflict="raise"
+    )
+
+    assert written == 3
+    assert [row["label"] for row in store.scan("things")] == ["Cup 0", "Cup 1", "Cup 2"]
+
+
+def test_a_batch_under_update_changes_rows_already_there(store):
+    _thing(store, "t1", "Kettle", kind="vessel")
+
+    store.upsert_many("things", [{"id": "t1", "label": "Teapot"}, {"id": "t2", "label": "Jug"}], pk=("id",))
+
+    assert store.fetch_one("things", {"id": "t1"})["label"] == "Teapot"
+    assert store.fetch_one("things", {"id": "t1"})["kind"] == "vessel"
+    assert store.fetch_one("things", {"id": "t2"})["label"] == "Jug"
+
+
+def test_one_refused_row_refuses_the_whole_batch(store):
+    _thing(store, "t2", "Kettle")
+
+    with pytest.raises(StorageError, match="already stored"):
+        store.upsert_many(
+            "things",
+            [{"id": "t1", "label": "Cup"}, {"id": "t2", "label": "Teapot"}, {"id": "t3", "label": "Jug"}],
+            pk=("id",),
+            on_conflict="raise",
+        )
+
+    # The row before the refusal went with it, rather than being left behind as
+    # the first half of a list the caller was told had failed.
+    assert store.fetch_one("things", {"id": "t1"}) is None
+    assert store.fetch_one("things", {"id": "t2"})["label"] == "Kettle"
+
+
+def test_a_batch_inside_a_transaction_leaves_the_decision_to_the_transaction(store):
+    with pytest.raises(RuntimeError), store.transaction():
+        store.upsert_many("things", [{"id": "t1", "label": "Cup"}], pk=("id",), on_conflict="raise")
+        raise RuntimeError("abandoned")
+
+    assert store.fetch_one("things", {"id": "t1"}) is None
+
+
+def test_rows_naming_different_columns_are_refused_rather_than_written_short(store):
+    with pytest.raises(StoreMisuseError, match="must name the same columns"):
+        store.upsert_many("things", [{"id": "t1", "label": "Cup"}, {"id": "t2", "kind": "vessel"}], pk=("id",))
+
+    assert store.scan("things") == []
+
+
+def test_an_empty_batch_writes_nothing_and_is_not_an_error(store):
+    assert store.upsert_many("things", [], pk=("id",), on_conflict="raise") == 0
+
+
+def test_a_batch_is_validated_against_the_schema_like_a_single_write(store):
+    with pytest.raises(StoreMisuseError, match="no column named 'colour'"):
+        store.upsert_many("things", [{"id": "t1", "colour": "blue"}], pk=("id",))
+
+
+def test_a_statement_is_composed_once_per_shape_however_often_it_is_written(store, monkeypatch):
+    _thing(store, "t0", "Saucer")
+    validated = []
+    real = store._validate
+    monkeypatch.setattr(store, "_validate", lambda table, columns: validated.append(table) or real(table, columns))
+
+    for n in range(1, 4):
+        _thing(store, f"t{n}", "Kettle")
+    store.upsert_many("things", [{"id": "t9", "label": "Cup", "kind": None, "maker_id": None}], pk=("id",), on_conflict="raise")
+
+    # The single write and the batch share the shape `_thing` already composed.
+    assert validated == []
+
+
 # -- deleting -----------------------------------------------------------------
 
 
@@ -518,6 +598,92 @@ def test_the_known_schema_is_read_from_the_file_not_from_the_ddl_just_run(tmp_pa
         reopened.close()
 
 
+# -- reopening an unchanged file ----------------------------------------------
+#
+# A file opened under the same schema and migrations as last time skips the
+# widening, the script and the introspection, and takes what it knows from the
+# record the last full open left. What these pin is that the shortcut is never
+# taken when anything it would have skipped could have found work to do.
+
+
+def test_reopening_an_unchanged_file_skips_the_schema_work(tmp_path, monkeypatch):
+    path = tmp_path / "store.sqlite"
+    SqliteDurableStore(path, _SCHEMA).close()
+
+    def _refuse(*_):
+        raise AssertionError("an unchanged file was widened")
+
+    monkeypatch.setattr(SqliteDurableStore, "_widen_existing_tables", _refuse)
+    reopened = SqliteDurableStore(path, _SCHEMA)
+    try:
+        _thing(reopened, "t1", "Kettle")
+        assert reopened.fetch_one("things", {"id": "t1"})["label"] == "Kettle"
+        with pytest.raises(StoreMisuseError, match="no column named 'colour'"):
+            reopened.scan("things", {"colour": "red"})
+    finally:
+        reopened.close()
+
+
+def test_a_changed_schema_is_opened_the_long_way(tmp_path):
+    path = tmp_path / "store.sqlite"
+    SqliteDurableStore(path, _SCHEMA).close()
+
+    reopened = SqliteDurableStore(path, _SCHEMA + "CREATE TABLE IF NOT EXISTS shelves (id TEXT PRIMARY KEY);")
+    try:
+        reopened.upsert("shelves", {"id": "s1"}, pk=("id",), on_conflict="raise")
+        assert reopened.fetch_one("shelves", {"id": "s1"}) is not None
+    finally:
+        reopened.close()
+
+
+def test_a_file_altered_since_it_was_last_opened_is_read_again(tmp_path):
+    """The DDL is unchanged, but the file is not — something else widened it.
+
+    SQLite's own schema counter moves with every change to the file's schema, so
+    a column added behind the store's back invalidates the record as surely as a
+    change to the DDL would.
+    """
+    path = tmp_path / "store.sqlite"
+    SqliteDurableStore(path, _SCHEMA).close()
+    with closing(sqlite3.connect(path)) as connection:
+        connection.execute("ALTER TABLE things ADD COLUMN colour TEXT")
+        connection.commit()
+
+    reopened = SqliteDurableStore(path, _SCHEMA)
+    try:
+        assert reopened.scan("things", {"colour": "red"}) == []
+    finally:
+        reopened.close()
+
+
+def test_the_store_remembers_a_fact_about_the_file_across_opens(tmp_path):
+    path = tmp_path / "store.sqlite"
+    first = SqliteDurableStore(path, _SCHEMA)
+    assert first.read_meta("rules") is None
+    first.write_meta("rules", "v1")
+    first.write_meta("rules", "v2")
+    first.close()
+
+    reopened = SqliteDurableStore(path, _SCHEMA)
+    try:
+        assert reopened.read_meta("rules") == "v2"
+    finally:
+        reopened.close()
+
+
+def test_a_remembered_fact_rolls_back_with_the_transaction_it_was_written_in(store):
+    with pytest.raises(RuntimeError), store.transaction():
+        store.write_meta("rules", "v1")
+        raise RuntimeError("the work it recorded failed")
+
+    assert store.read_meta("rules") is None
+
+
+def test_the_stores_own_bookkeeping_is_not_a_table_callers_can_reach(store):
+    with pytest.raises(StoreMisuseError, match="store_meta"):
+        store.scan("store_meta")
+
+
 # -- transactions --------------------------------------------------------------
 #
 # Several catalogue rules span rows and are applied as a clear-then-set pair. A
@@ -628,6 +794,75 @@ def test_a_rolled_back_transaction_never_reached_the_file(tmp_path):
         reopened.close()
 
 
+# -- the generation -----------------------------------------------------------
+#
+# What a reader compares to decide whether an answer it already holds is still
+# the answer. A missed count serves a stale listing as current, which is the
+# failure that matters; an extra one costs a recomputation and nothing else.
+
+
+def test_the_generation_does_not_move_while_nothing_is_committed(store):
+    before = store.generation()
+    store.scan("things")
+    store.fetch_one("things", {"id": "t1"})
+
+    assert store.generation() == before
+
+
+def test_a_write_outside_a_transaction_moves_the_generation(store):
+    before = store.generation()
+    _thing(store, "t1", "Kettle")
+
+    assert store.generation() > before
+
+
+def test_a_transaction_moves_the_generation_once_and_only_when_it_commits(store):
+    before = store.generation()
+    with store.transaction():
+        _thing(store, "t1", "First")
+        _thing(store, "t2", "Second")
+        assert store.generation() == before, "a reader inside the group saw a commit that has not happened"
+
+    assert store.generation() == before + 1
+
+
+def test_an_abandoned_transaction_leaves_the_generation_where_it_was(store):
+    before = store.generation()
+    with pytest.raises(RuntimeError), store.transaction():
+        _thing(store, "t1", "First")
+        raise RuntimeError("abandoned")
+
+    assert store.generation() == before
+
+
+def test_a_refused_write_leaves_the_generation_where_it_was(store):
+    _thing(store, "t1", "Kettle")
+    before = store.generation()
+    with pytest.raises(StorageError):
+        _thing(store, "t1", "Kettle again")
+
+    assert store.generation() == before
+
+
+def test_a_commit_from_another_connection_moves_the_generation(tmp_path):
+    """The file has one writer by design; a maintenance script is the exception.
+
+    A reader trusting the number across that script's commit would go on being
+    told its answer from before the script was still current.
+    """
+    path = tmp_path / "store.sqlite"
+    durable = SqliteDurableStore(path, _SCHEMA)
+    try:
+        before = durable.generation()
+        with closing(sqlite3.connect(path)) as connection:
+            connection.execute("INSERT INTO things (id, label) VALUES ('t1', 'Kettle')")
+            connection.commit()
+
+        assert durable.generation() > before
+    finally:
+        durable.close()
+
+
 # -- ordering additions --------------------------------------------------------
 
 
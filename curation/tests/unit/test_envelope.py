@@ -1,6 +1,7 @@
 """The result envelope, and the derivation that keeps it honest."""
 
 import json
+from decimal import Decimal
 
 from curation.mcp.envelope import failure, is_error, ok, to_call_tool_result
 
@@ -35,6 +36,27 @@ def test_the_payload_goes_out_as_both_text_and_structured_content():
     assert json.loads(result.content[0].text) == {"success": True, "count": 2}
 
 
+def test_the_text_carries_names_as_written_rather_than_escaped():
+    """A model reading `D\\u00fcrer` pays more for a name it reads less reliably."""
+    result = to_call_tool_result(ok(artist="Albrecht Dürer", title="“Melencolia I”"))
+
+    assert "Albrecht Dürer" in result.content[0].text
+    assert "\\u" not in result.content[0].text
+    assert json.loads(result.content[0].text)["title"] == "“Melencolia I”"
+
+
+def test_a_value_json_cannot_spell_is_written_as_its_text():
+    """The fallback `json.dumps(default=str)` gave, kept: a stray value is shown rather than fatal."""
+    result = to_call_tool_result(ok(amount=Decimal("0.10"), unknown=_Opaque()))
+
+    assert json.loads(result.content[0].text) == {"success": True, "amount": "0.10", "unknown": "opaque"}
+
+
+class _Opaque:
+    def __str__(self) -> str:
+        return "opaque"
+
+
 def test_every_error_points_at_help():
     payload = failure("Unknown action: 'lst'", tool="art_catalogue")
 
@@ -59,6 +59,9 @@ class OneRecord:
     def provider(self) -> str:
         return "artic"
 
+    def prepare(self, queries) -> None:
+        pass
+
     def find_images(self, query: ImageQuery):
         return (self._found,)
 
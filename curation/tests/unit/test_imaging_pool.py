@@ -0,0 +1,200 @@
+"""The imaging pool: inline, on real worker processes, and at its ceilings.
+
+The workers here are real processes rather than a fake executor, because what
+is pinned is exactly what a fake would assume — that an exception survives the
+trip back by its own name, that a worker out of memory or time answers rather
+than takes the caller with it, and that a worker dying leaves the pool usable.
+Every task is a module-level function for the reason `ImagingPool.run` gives.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from curation.services.imaging import encode_downscaled
+from curation.services.imaging_pool import ImagingAborted, ImagingPool
+
+# Ceilings small enough to reach in a test and large enough for an interpreter
+# to start under. The memory one is not enforceable on macOS.
+_MEMORY_MB = 512
+_TASK_SECONDS = 1
+
+linux_only = pytest.mark.skipif(sys.platform != "linux", reason="the memory ceiling is enforced on Linux only")
+
+
+def _add(a, b):
+    return a + b
+
+
+def _refuse(message):
+    raise LookupError(message)
+
+
+def _hoard(megabytes):
+    return len(bytearray(megabytes * 1024 * 1024))
+
+
+def _spin(seconds):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+    return "finished"
+
+
+def _grind_in_c():
+    # One call that never returns to the interpreter until it is done: the
+    # shape of a decode stuck in a codec, without depending on how fast this
+    # machine decodes.
+    return hashlib.pbkdf2_hmac("sha256", b"picture", b"salt", 2**31 - 1)
+
+
+def _die():
+    os._exit(1)
+
+
+@pytest.fixture
+def pool():
+    started = ImagingPool(workers=1, memory_mb=_MEMORY_MB, task_seconds=_TASK_SECONDS)
+    yield started
+    started.shutdown()
+
+
+@pytest.fixture
+def picture(tmp_path):
+    path = tmp_path / "master.jpg"
+    Image.new("RGB", (1200, 800), (180, 40, 40)).save(path, format="JPEG")
+    return path
+
+
+# -- inline -------------------------------------------------------------------
+
+
+def test_inline_runs_on_the_calling_thread_and_still_counts():
+    pool = ImagingPool(workers=0)
+
+    assert pool.run("sum", _add, 2, b=3) == 5
+
+    (kind,) = pool.profile().kinds
+    assert (kind.kind, kind.calls, kind.failed) == ("sum", 1, 0)
+    assert pool.profile().workers == 0
+
+
+def test_a_task_that_raises_is_counted_as_failed_and_raises_unchanged():
+    pool = ImagingPool(workers=0)
+
+    with pytest.raises(LookupError, match="no such picture"):
+        pool.run("lookup", _refuse, "no such picture")
+
+    (kind,) = pool.profile().kinds
+    assert (kind.calls, kind.failed) == (1, 1)
+    assert pool.profile().in_flight == 0
+
+
+def test_kinds_are_reported_costliest_first():
+    pool = ImagingPool(workers=0)
+    pool.run("quick", _add, 1, 1)
+    pool.run("slow", _spin, 0.05)
+
+    assert [kind.kind for kind in pool.profile().kinds] == ["slow", "quick"]
+
+
+def test_a_pool_refuses_a_negative_size_or_a_ceiling_of_nothing():
+    with pytest.raises(ValueError, match="zero or more"):
+        ImagingPool(workers=-1)
+    with pytest.raises(ValueError, match="positive"):
+        ImagingPool(workers=1, task_seconds=0)
+
+
+# -- on a worker --------------------------------------------------------------
+
+
+def test_a_worker_answers_with_what_the_task_returned(pool, picture):
+    frame = pool.run("preview", encode_downscaled, picture, max_edge=300, quality=80)
+
+    assert (frame.width, frame.height) == (300, 200)
+    (kind,) = pool.profile().kinds
+    assert kind.calls == 1
+    assert kind.run_ms > 0
+
+
+def test_an_exception_comes_back_by_its_own_name(pool):
+    with pytest.raises(LookupError, match="no such picture"):
+        pool.run("lookup", _refuse, "no such picture")
+
+
+def test_pillows_own_bomb_refusal_still_arrives_by_its_own_name(pool, picture):
+    # Refused at the header in the worker, before the memory ceiling is ever
+    # reached — the ceiling is for the image that slips under this.
+    with pytest.raises(Image.DecompressionBombError):
+        pool.run("preview", _open_with_a_tiny_bomb_limit, picture)
+
+
+def _open_with_a_tiny_bomb_limit(path):
+    Image.MAX_IMAGE_PIXELS = 1000
+    with Image.open(path) as image:
+        image.load()
+
+
+@linux_only
+def test_a_task_past_the_memory_ceiling_is_aborted_rather_than_fatal(pool):
+    with pytest.raises(ImagingAborted, match="more memory"):
+        pool.run("bomb", _hoard, _MEMORY_MB * 2)
+
+    # The worker that refused is still there for the next task.
+    assert pool.run("sum", _add, 1, 2) == 3
+
+
+def test_a_task_past_the_time_ceiling_is_aborted(pool):
+    with pytest.raises(ImagingAborted, match=f"more than {_TASK_SECONDS}s"):
+        pool.run("spin", _spin, 60)
+
+    # And the next task is measured from where it starts, not charged the last one's time.
+    assert pool.run("spin", _spin, 0.1) == "finished"
+
+
+def test_a_task_stuck_in_c_past_the_time_ceiling_is_killed_and_replaced(pool):
+    # The interruption at the ceiling cannot reach a task that never returns to
+    # Python; the kernel's kill a few seconds later does.
+    with pytest.raises(ImagingAborted, match="stopped"):
+        pool.run("grind", _grind_in_c)
+
+    assert pool.run("sum", _add, 2, 3) == 5
+
+
+def test_a_task_queued_behind_one_that_was_killed_runs_again_rather_than_failing(pool, caplog):
+    """The executor breaks for everything in flight; only the task that broke it is told it stopped."""
+    answers: dict[str, object] = {}
+
+    def ask(name, task, *args):
+        try:
+            answers[name] = pool.run(name, task, *args)
+        except ImagingAborted as exc:
+            answers[name] = exc
+
+    grinding = threading.Thread(target=ask, args=("grind", _grind_in_c))
+    with caplog.at_level("INFO", logger="curation.services.imaging_pool"):
+        grinding.start()
+        # Behind it on the pool's one worker, so never started when it breaks.
+        time.sleep(0.5)
+        ask("sum", _add, 2, 3)
+        grinding.join()
+
+    assert isinstance(answers["grind"], ImagingAborted)
+    assert answers["sum"] == 5
+    assert "imaging.task_retried" in [record.event for record in caplog.records]
+
+
+def test_a_worker_that_dies_is_replaced(pool, caplog):
+    with caplog.at_level("WARNING", logger="curation.services.imaging_pool"), pytest.raises(ImagingAborted, match="stopped"):
+        pool.run("crash", _die)
+
+    # Broken too soon to have spent its allowance, so it is given one more worker before it is failed.
+    assert [record.event for record in caplog.records] == ["imaging.worker_lost", "imaging.worker_lost"]
+    assert pool.run("sum", _add, 4, 5) == 9
+    crashed = next(kind for kind in pool.profile().kinds if kind.kind == "crash")
+    assert crashed.failed == 1
@@ -336,6 +336,61 @@ class TestTheFallback:
         assert rgb_to_lab(parse_hex(choice.hex_rgb)).l < dominant_lightness
 
 
+class TestSeveralAtOnce:
+    """A batch asks the model about every work together, and settles each as `choose` would."""
+
+    @staticmethod
+    def _batching(handle) -> OpenRouterClient:
+        transport = httpx.MockTransport(handle)
+        return OpenRouterClient(
+            "test-key",
+            model="qwen/qwen3.7-flash",
+            max_output_tokens=2000,
+            client=httpx.Client(transport=transport),
+            async_client=httpx.AsyncClient(transport=transport),
+        )
+
+    def test_each_work_gets_the_choice_its_own_call_produced(self, artwork, tmp_path):
+        second = tmp_path / "second.jpg"
+        Image.new("RGB", (600, 900), (120, 90, 40)).save(second, format="JPEG", quality=90)
+        answers = iter([_answered(GOOD_ANSWER), _answered("not json")])
+        engine = MatEngine(self._batching(lambda request: httpx.Response(200, json=next(answers))), image_max_edge=768)
+
+        first_choice, second_choice = engine.choose_many([artwork, second], in_flight=1)
+
+        assert (first_choice.method, first_choice.hex_rgb) == (MatMethod.VISION_MODEL, "#27285b")
+        assert second_choice.method is MatMethod.DOMINANT_COLOR_FALLBACK
+        assert second_choice.cost_usd == Decimal("0.00006626")
+
+    def test_a_spent_key_falls_every_work_back_without_asking_again(self, artwork):
+        sent: list[httpx.Request] = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(403, json={"error": {"message": "Key limit exceeded"}})
+
+        engine = MatEngine(self._batching(handle), image_max_edge=768)
+
+        choices = engine.choose_many([artwork] * 3, in_flight=1)
+
+        assert len(sent) == 1
+        assert {choice.method for choice in choices} == {MatMethod.DOMINANT_COLOR_FALLBACK}
+        assert "Not sent" in choices[2].fallback_detail
+
+    def test_an_unreadable_work_refuses_the_batch_before_anything_is_sent(self, artwork, tmp_path):
+        broken = tmp_path / "not-an-image.jpg"
+        broken.write_bytes(b"certainly not a JPEG")
+        sent: list[httpx.Request] = []
+        engine = MatEngine(
+            self._batching(lambda request: sent.append(request) or httpx.Response(200, json=_answered(GOOD_ANSWER))),
+            image_max_edge=768,
+        )
+
+        with pytest.raises(ServiceError, match="could not be read"):
+            engine.choose_many([artwork, broken])
+        assert sent == []
+
+
 class TestTheDominantColour:
     def test_a_flat_image_reports_its_own_colour(self, tmp_path):
         path = tmp_path / "flat.png"
@@ -0,0 +1,270 @@
+"""The museum's answers, kept between runs and revalidated rather than re-asked.
+
+Driven through the real clients over `httpx.MockTransport`, for the reason the
+client tests are: what matters is which requests reach the museum, and only the
+real request-building can say.
+"""
+
+import logging
+
+import httpx
+import pytest
+from fakes import FakeImageSearch, a_work, an_image
+
+from curation.discovery.artic import ArticCollectionBrowse, ArticImageSearch
+from curation.discovery.browse import BrowseQuery
+from curation.discovery.engine import WorkList
+from curation.discovery.images import ImageQuery, ImageSearchFailure
+from curation.discovery.phase_two import PhaseTwoEngine
+from curation.discovery.response_cache import HIT, MISS, ResponseCache
+from curation.logs import current_run_id, run_context
+from curation.persistence.discovery_records import InitiatedBy
+from curation.services.previews import PreviewCache, PreviewSettings
+from curation.services.runner import DiscoveryRunner
+
+USER_AGENT = "samsung-frame-art-loader (test@example.org)"
+
+_DAY = 24 * 3600.0
+
+_SEARCH = {
+    "data": [
+        {
+            "_score": 120.0,
+            "id": 6565,
+            "api_link": "https://api.artic.edu/api/v1/artworks/6565",
+            "title": "American Gothic",
+            "artist_title": "Grant Wood",
+            "thumbnail": {"width": 6949, "height": 8400},
+            "image_id": "b272df73-a965-ac37-4172-be4e99483637",
+            "is_public_domain": False,
+        }
+    ],
+    "config": {"iiif_url": "https://www.artic.edu/iiif/2"},
+}
+
+_OBJECT = {"data": {"id": 6565, "image_id": "b272df73"}, "config": {"iiif_url": "https://www.artic.edu/iiif/2"}}
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock) -> ResponseCache:
+    return ResponseCache(tmp_path / "museum-cache", clock=clock)
+
+
+def _museum(body, *, headers=None, status=200):
+    """A handler answering every request alike, and the requests it was sent."""
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        etag = (headers or {}).get("ETag")
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(status, json=body, headers=headers or {})
+
+    return handler, sent
+
+
+def _search(handler, cache) -> ArticImageSearch:
+    return ArticImageSearch(user_agent=USER_AGENT, client=httpx.Client(transport=httpx.MockTransport(handler)), cache=cache)
+
+
+def test_a_search_asked_again_within_the_day_is_answered_without_the_museum(cache):
+    handler, sent = _museum(_SEARCH)
+    search = _search(handler, cache)
+
+    first = search.find_images(ImageQuery(title="American Gothic"))
+    second = search.find_images(ImageQuery(title="American Gothic"))
+
+    assert len(sent) == 1
+    assert first == second
+
+
+def test_a_different_question_is_a_different_entry(cache):
+    handler, sent = _museum(_SEARCH)
+    search = _search(handler, cache)
+
+    search.find_images(ImageQuery(title="American Gothic"))
+    search.find_images(ImageQuery(title="Nighthawks"))
+
+    assert len(sent) == 2
+
+
+def test_a_stale_answer_with_an_etag_is_revalidated_and_kept_on_a_304(cache, clock):
+    handler, sent = _museum(_SEARCH, headers={"ETag": '"v1"'})
+    search = _search(handler, cache)
+    search.find_images(ImageQuery(title="American Gothic"))
+    clock.now += 2 * _DAY
+
+    found = search.find_images(ImageQuery(title="American Gothic"))
+
+    assert [request.headers.get("If-None-Match") for request in sent] == [None, '"v1"']
+    assert [image.title for image in found] == ["American Gothic"]
+    # Dated afresh by the 304, so the next ask within the day sends nothing.
+    search.find_images(ImageQuery(title="American Gothic"))
+    assert len(sent) == 2
+
+
+def test_a_stale_answer_without_validators_is_asked_in_full(cache, clock):
+    handler, sent = _museum(_SEARCH)
+    search = _search(handler, cache)
+    search.find_images(ImageQuery(title="American Gothic"))
+    clock.now += 2 * _DAY
+
+    search.find_images(ImageQuery(title="American Gothic"))
+
+    assert len(sent) == 2
+    assert "If-None-Match" not in sent[1].headers
+
+
+def test_an_objects_image_service_is_kept_for_longer_than_a_search(cache, clock):
+    handler, sent = _museum(_OBJECT)
+    search = _search(handler, cache)
+    search.tile_url("https://api.artic.edu/api/v1/artworks/6565")
+    clock.now += 7 * _DAY
+
+    assert search.tile_url("https://api.artic.edu/api/v1/artworks/6565") == "https://www.artic.edu/iiif/2/b272df73"
+    assert len(sent) == 1
+
+
+def test_a_failure_is_not_answered_from_a_stale_entry(cache, clock):
+    handler, _ = _museum(_SEARCH)
+    search = _search(handler, cache)
+    search.find_images(ImageQuery(title="American Gothic"))
+    clock.now += 2 * _DAY
+
+    broken = _search(lambda request: httpx.Response(503), cache)
+    with pytest.raises(ImageSearchFailure):
+        broken.find_images(ImageQuery(title="American Gothic"))
+
+
+def test_a_torn_entry_is_asked_again_and_replaced(cache):
+    handler, sent = _museum(_SEARCH)
+    search = _search(handler, cache)
+    search.find_images(ImageQuery(title="American Gothic"))
+    (entry,) = cache.directory.rglob("*.json")
+    entry.write_text("{not json", encoding="utf-8")
+
+    search.find_images(ImageQuery(title="American Gothic"))
+    search.find_images(ImageQuery(title="American Gothic"))
+
+    assert len(sent) == 2
+
+
+def test_a_browse_is_kept_and_never_asked_conditionally(cache, clock):
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(
+            200,
+            json={"aggregations": {"by_facet": {"buckets": {"Grant Wood": {"doc_count": 0}}}}},
+            headers={"ETag": '"b1"'},
+        )
+
+    browse = ArticCollectionBrowse(
+        user_agent=USER_AGENT, client=httpx.Client(transport=httpx.MockTransport(handler)), cache=cache
+    )
+    queries = [BrowseQuery(artist="Grant")]
+
+    browse.browse(queries, per_query=3)
+    browse.browse(queries, per_query=3)
+    assert len(sent) == 1
+    clock.now += 2 * _DAY
+    browse.browse(queries, per_query=3)
+
+    assert len(sent) == 2
+    assert "If-None-Match" not in sent[1].headers
+
+
+def test_questions_are_counted_against_the_run_asking_them_and_reported_once(cache):
+    handler, _ = _museum(_SEARCH)
+    search = _search(handler, cache)
+
+    search.find_images(ImageQuery(title="American Gothic"))
+    with run_context("run-1"):
+        search.find_images(ImageQuery(title="American Gothic"))
+        search.find_images(ImageQuery(title="Nighthawks"))
+
+    counts = cache.take("run-1")
+    assert (counts.hits, counts.revalidated, counts.misses) == (1, 0, 1)
+    assert counts.hit_rate == 0.5
+    assert cache.take("run-1").hit_rate is None
+
+
+def test_a_runs_closing_line_says_what_the_museum_was_spared(services, engine, settings, cache, caplog):
+    museum = FakeImageSearch(holdings={"The Elephants": (an_image("The Elephants"),)})
+    answer = museum.find_images
+
+    def find_images(query):
+        # Stands for the client's own counting, which is tested above.
+        cache.count(HIT)
+        cache.count(MISS)
+        return answer(query)
+
+    museum.find_images = find_images
+    runner = DiscoveryRunner(
+        services.discovery,
+        engine,
+        settings.discovery_settings,
+        images=PhaseTwoEngine(museum, box=settings.tv_artwork_box),
+        previews=PreviewCache(
+            PreviewSettings(art_root=settings.art_root, directory=settings.previews_path), museum.fetch_preview
+        ),
+        museum_cache=cache,
+        spawn=lambda work: work(),
+    )
+    engine.result = WorkList(works=(a_work("The Elephants"),))
+
+    with caplog.at_level(logging.INFO):
+        runner.start(intent_text="Surrealist paintings", initiated_by=InitiatedBy.MCP_CLIENT)
+
+    (closing,) = [record for record in caplog.records if getattr(record, "event", None) == "run.completed"]
+    assert closing.museum_cache == {"hits": 1, "revalidated": 0, "misses": 1, "hit_rate": 0.5}
+
+
+def test_a_run_cancelled_mid_search_reports_its_counts_and_leaves_none_behind(services, engine, settings, cache, caplog):
+    museum = FakeImageSearch(holdings={"The Elephants": (an_image("The Elephants"),)})
+    answer = museum.find_images
+    runner = None
+
+    def find_images(query):
+        cache.count(MISS)
+        run_id = current_run_id()
+        runner.cancel(run_id)
+        # Asked after the cancel reported the run, before the worker noticed it.
+        cache.count(HIT)
+        return answer(query)
+
+    museum.find_images = find_images
+    runner = DiscoveryRunner(
+        services.discovery,
+        engine,
+        settings.discovery_settings,
+        images=PhaseTwoEngine(museum, box=settings.tv_artwork_box),
+        previews=PreviewCache(
+            PreviewSettings(art_root=settings.art_root, directory=settings.previews_path), museum.fetch_preview
+        ),
+        museum_cache=cache,
+        spawn=lambda work: work(),
+    )
+    engine.result = WorkList(works=(a_work("The Elephants"), a_work("Le Rêve")))
+
+    with caplog.at_level(logging.INFO):
+        run = runner.start(intent_text="Surrealist paintings", initiated_by=InitiatedBy.MCP_CLIENT)
+
+    (cancelled,) = [record for record in caplog.records if getattr(record, "event", None) == "run.cancelled"]
+    assert cancelled.museum_cache == {"hits": 0, "revalidated": 0, "misses": 1, "hit_rate": 0.0}
+    assert cache.take(run.id).hit_rate is None
@@ -9,6 +9,7 @@ Driven through `httpx.MockTransport`, so the code under test is the real client
 with its real request-building — only the socket is replaced.
 """
 
+import asyncio
 import json
 from decimal import Decimal
 
@@ -19,6 +20,9 @@ from curation.discovery.openrouter import (
     BASE_URL,
     COMPLETION_TIMEOUT_SECONDS,
     KEY_TIMEOUT_SECONDS,
+    AsyncOpenRouterClient,
+    Completion,
+    CompletionCall,
     KeyExhausted,
     OpenRouterClient,
     OpenRouterError,
@@ -560,3 +564,120 @@ def test_an_uncapped_key_reports_no_limit_rather_than_zero():
     assert status.limit_usd is None
     assert status.remaining_usd is None
     assert status.usage_usd == Decimal("1.5")
+
+
+# -- asking several at once -----------------------------------------------------
+
+
+def batching_over(handler, **kwargs) -> OpenRouterClient:
+    """A real client whose batches go through the same function its single calls do."""
+    transport = httpx.MockTransport(handler)
+    options = {"model": "deepseek/deepseek-v4-flash", "max_output_tokens": 8000} | kwargs
+    return OpenRouterClient(
+        "sk-or-v1-test",
+        client=httpx.Client(transport=transport),
+        async_client=httpx.AsyncClient(transport=transport),
+        **options,
+    )
+
+
+def echoing(request: httpx.Request) -> httpx.Response:
+    """Answers each call with its own prompt, so an answer can be matched to its question."""
+    prompt = json.loads(request.content)["messages"][0]["content"]
+    return httpx.Response(200, json=UNSEARCHED | {"choices": [{"finish_reason": "stop", "message": {"content": prompt}}]})
+
+
+def test_a_batch_is_answered_in_the_order_it_was_asked():
+    answers = batching_over(echoing).complete_many(
+        [CompletionCall(prompt=prompt) for prompt in ("one", "two", "three")], concurrency=2
+    )
+
+    assert [answer.content for answer in answers] == ["one", "two", "three"]
+
+
+def test_a_batch_keeps_no_more_than_its_concurrency_in_flight():
+    flight = {"now": 0, "most": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        flight["now"] += 1
+        flight["most"] = max(flight["most"], flight["now"])
+        await asyncio.sleep(0.01)
+        flight["now"] -= 1
+        return httpx.Response(200, json=UNSEARCHED)
+
+    client = OpenRouterClient(
+        "sk-or-v1-test",
+        model="deepseek/deepseek-v4-flash",
+        max_output_tokens=8000,
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    client.complete_many([CompletionCall(prompt="anything")] * 7, concurrency=3)
+
+    assert flight["most"] == 3
+
+
+def test_one_refusal_in_a_batch_costs_the_others_nothing():
+    """Returned in its place rather than raised: the calls beside it were
+    billed, and an exception would carry none of their costs out."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)["messages"][0]["content"] == "broken":
+            return httpx.Response(500, json={"error": {"message": "Internal error"}})
+        return echoing(request)
+
+    answers = batching_over(handler).complete_many(
+        [CompletionCall(prompt=prompt) for prompt in ("fine", "broken", "also fine")], concurrency=3
+    )
+
+    assert isinstance(answers[1], OpenRouterError)
+    assert [answer.cost_usd for answer in (answers[0], answers[2])] == [Decimal("0.00002717")] * 2
+
+
+def test_a_spent_key_stops_the_calls_not_yet_sent():
+    """A 403 refuses every call after it identically, so sending them would be a
+    batch of requests whose answers are already known."""
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(403, json={"error": {"message": "Key limit exceeded"}})
+
+    answers = batching_over(handler).complete_many([CompletionCall(prompt="anything")] * 4, concurrency=1)
+
+    assert len(sent) == 1
+    assert all(isinstance(answer, KeyExhausted) for answer in answers)
+    assert all("Not sent" in str(answer) for answer in answers[1:])
+
+
+def test_an_unaffordable_call_does_not_stop_the_rest():
+    """402 prices one request's reservation, and the next may fit."""
+    answers = iter([httpx.Response(402, json={"error": {"message": "Requested 8000 tokens"}})])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return next(answers, None) or httpx.Response(200, json=UNSEARCHED)
+
+    results = batching_over(handler).complete_many([CompletionCall(prompt="anything")] * 3, concurrency=1)
+
+    assert isinstance(results[0], RequestUnaffordable)
+    assert all(isinstance(result, Completion) for result in results[1:])
+
+
+def test_the_async_client_sends_exactly_what_the_sync_one_does():
+    """One request builder for both, so a batch cannot drift from a single call
+    on the reservation, the cost reporting or the search plugin."""
+    captured: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured.append(json.loads(request.content))
+        return httpx.Response(200, json=SEARCHED)
+
+    options = {"model": "deepseek/deepseek-v4-flash", "max_output_tokens": 8000, "search_engine": "exa"}
+    client_over(handler, search_engine="exa").complete(prompt="anything", search_results=5)
+    asynchronous = AsyncOpenRouterClient(
+        "sk-or-v1-test", client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **options
+    )
+    completion = asyncio.run(asynchronous.complete(prompt="anything", search_results=5))
+
+    assert captured[0] == captured[1]
+    assert completion.search_cost_usd == Decimal("0.005")
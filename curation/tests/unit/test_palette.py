@@ -0,0 +1,108 @@
+"""The array colour arithmetic, held to the scalar reference it transcribes.
+
+`color.py` is proven against Sharma's published pairs in `test_color.py`. This
+file does not re-derive that proof; it proves the array versions are the *same
+function*, on the same pairs and across the displayable gamut, so the fallback's
+distances and the corpus report's distances cannot disagree about two colours.
+"""
+
+import numpy as np
+import pytest
+from test_color import SHARMA_PAIRS
+
+from curation.acquisition.color import Lab, delta_e, rgb_to_lab
+from curation.acquisition.palette import covering_colours, delta_e_array, kmeans_lab, rgb_to_lab_array
+
+
+def test_ciede2000_over_arrays_matches_the_published_reference_pairs():
+    """All the pairs in one call, which is the point — and the wrap-around rows
+    are where a `where` chain written from the formula rather than the scalar goes
+    wrong."""
+    one = np.array([pair[0] for pair in SHARMA_PAIRS])
+    two = np.array([pair[1] for pair in SHARMA_PAIRS])
+
+    assert delta_e_array(one, two) == pytest.approx([pair[2] for pair in SHARMA_PAIRS], abs=1e-4)
+
+
+def test_ciede2000_over_arrays_agrees_with_the_scalar_across_the_gamut():
+    """A lattice of sRGB colours, each against its neighbour in the lattice,
+    which includes the zero-chroma greys the scalar special-cases."""
+    lattice = np.array([(r, g, b) for r in range(0, 256, 51) for g in range(0, 256, 51) for b in range(0, 256, 51)])
+    neighbours = np.roll(lattice, 1, axis=0)
+
+    arrays = delta_e_array(rgb_to_lab_array(lattice), rgb_to_lab_array(neighbours))
+
+    scalars = [delta_e(rgb_to_lab(tuple(one)), rgb_to_lab(tuple(two))) for one, two in zip(lattice, neighbours, strict=True)]
+    assert arrays == pytest.approx(scalars, abs=1e-9)
+
+
+def test_lab_over_arrays_agrees_with_the_scalar_on_every_grey_and_the_corners():
+    colours = [(level, level, level) for level in range(256)] + [(255, 0, 0), (0, 255, 0), (0, 0, 255), (39, 40, 91)]
+
+    converted = rgb_to_lab_array(np.array(colours, dtype=np.uint8))
+
+    for colour, lab in zip(colours, converted, strict=True):
+        expected = rgb_to_lab(colour)
+        assert tuple(lab) == pytest.approx((expected.l, expected.a, expected.b), abs=1e-9)
+
+
+def test_lab_over_arrays_keeps_the_shape_of_an_image():
+    """A decoded frame goes in as height x width x 3 and must come out that way,
+    or every caller has to remember a reshape."""
+    frame = np.zeros((4, 7, 3), dtype=np.uint8)
+
+    assert rgb_to_lab_array(frame).shape == (4, 7, 3)
+
+
+def test_the_clustering_is_the_same_on_every_run():
+    """Seeded. A k-means seeded from the clock gives a work a different mat each
+    time it is prepared, which no re-encode test would catch."""
+    generator = np.random.default_rng(7)
+    pixels = generator.integers(0, 256, size=(64, 64, 3), dtype=np.uint8)
+
+    assert covering_colours(pixels, 5) == covering_colours(pixels.copy(), 5)
+
+
+def test_fewer_colours_than_clusters_are_each_their_own():
+    labs = rgb_to_lab_array(np.array([(10, 10, 10), (200, 30, 30)], dtype=np.uint8))
+
+    assert np.array_equal(kmeans_lab(labs, np.array([5, 9]), 5), labs)
+
+
+def test_shades_a_histogram_bin_merges_are_still_answered_exactly():
+    """The centres come from a coarse histogram; the answer must not. Two colours
+    that share a bin still come back as one of themselves, never as the bin."""
+    pixels = np.array([[(200, 40, 40)] * 60 + [(203, 42, 41)] * 40], dtype=np.uint8)
+
+    [(count, colour)] = covering_colours(pixels, 5)
+
+    assert count == 100
+    assert colour in {(200, 40, 40), (203, 42, 41)}
+
+
+def test_a_cluster_answers_with_a_colour_the_picture_contains():
+    """Two shades of one blue in equal measure average to a blue that is in
+    neither — and an invented colour is what the fallback must never paint."""
+    pixels = np.array([[(20, 40, 160)] * 50 + [(40, 60, 200)] * 50 + [(230, 220, 10)] * 30], dtype=np.uint8)
+
+    answered = covering_colours(pixels, 2)
+
+    assert {colour for _, colour in answered} <= {(20, 40, 160), (40, 60, 200), (230, 220, 10)}
+    assert sum(count for count, _ in answered) == 130
+
+
+def test_clusters_account_for_every_pixel():
+    generator = np.random.default_rng(11)
+    pixels = generator.integers(0, 256, size=(32, 48, 3), dtype=np.uint8)
+
+    assert sum(count for count, _ in covering_colours(pixels, 5)) == 32 * 48
+
+
+def test_a_scalar_lab_and_an_array_one_are_interchangeable_in_the_distance():
+    """The fallback groups with the array distance and the corpus report measures
+    with the scalar one; this is the sentence that lets both be quoted together."""
+    one, two = Lab(l=22.7233, a=20.0904, b=-46.6940), Lab(l=23.0331, a=14.9730, b=-42.5619)
+
+    assert float(delta_e_array(np.array([one.l, one.a, one.b]), np.array([two.l, two.a, two.b]))) == pytest.approx(
+        delta_e(one, two), abs=1e-12
+    )
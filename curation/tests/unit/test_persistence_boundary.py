@@ -23,6 +23,10 @@ _MAY_IMPORT_SQLITE = {
     # this one reaches the driver by necessity rather than by convenience. It
     # stays inside the persistence package, which is the line this guard draws.
     "curation.persistence.migrations",
+    # The statement profiler reads a slow statement's `EXPLAIN QUERY PLAN` back
+    # on the connection it ran on, which the durable store hands it with the
+    # lock held. It is that store's instrument and is fed by nothing else.
+    "curation.persistence.profiler",
 }
 
 _DRIVER = "sqlite3"
@@ -88,6 +92,11 @@ _MAY_REACH_THE_NETWORK = {
     # and `urllib.parse` splits the URL. It sends no request, and its resolver is
     # an argument so the rules can be exercised against stated answers.
     "curation.acquisition.urls",
+    # The in-process tile fetcher — a transport in the same place as the one
+    # above, standing in for a subprocess that reached the network anyway. It is
+    # chosen by `TILE_FETCHER` and never by default, and every address it is
+    # handed or told about goes through the fetch policy first.
+    "curation.acquisition.iiif",
     # `urllib.parse` only, to read the host out of a citation's own URL. A
     # cited hostname and a title's last word are the same shape — `tate.org.uk`
     # and `No.5` are both dot-joined word characters — so the only thing that
@@ -95,6 +104,10 @@ _MAY_REACH_THE_NETWORK = {
     # *that* wrong merges two works under one identity. Standard parsing rather
     # than a hand-rolled split for exactly that reason. No request is made.
     "curation.discovery.dedup",
+    # The per-host pacing and breakers. It wraps the transport a client already
+    # has and opens no connection of its own; every request it sees was issued
+    # by one of the clients above.
+    "curation.providers",
 }
 
 _REACHES_THE_NETWORK = {"httpx", "requests", "urllib", "urllib3", "http", "socket", "aiohttp", "openai", "anthropic"}
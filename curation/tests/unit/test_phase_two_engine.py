@@ -51,6 +51,9 @@ class StubSearch:
     def provider(self) -> str:
         return "artic"
 
+    def prepare(self, queries) -> None:
+        pass
+
     def find_images(self, query: ImageQuery):
         if self._fails:
             raise ImageSearchFailure("the museum could not be reached")
@@ -78,6 +78,17 @@ def test_a_run_that_finds_images_completes_under_its_own_power(services, engine,
     assert images[0].selection_rationale, "the card has to be able to say why this one"
 
 
+def test_the_provider_is_told_every_work_before_the_first_is_asked(services, engine, runner, museum):
+    """So a provider that can batch its searches has all of them in hand at once."""
+    engine.result = a_list("The Elephants", "The Persistence of Memory", "Swans Reflecting Elephants")
+
+    start(runner)
+
+    (prepared,) = museum.prepared
+    assert sorted(prepared) == sorted(["The Elephants", "The Persistence of Memory", "Swans Reflecting Elephants"])
+    assert sorted(museum.asked) == sorted(prepared)
+
+
 def test_the_selected_instance_carries_the_facts_a_review_card_needs(services, engine, runner, museum):
     engine.result = a_list("The Elephants")
     museum.holdings = {"The Elephants": (an_image("The Elephants", width=6949, height=8400),)}
@@ -140,6 +140,15 @@ class TestPreparingAWorkForTheFirstTime:
         [view] = service.list_renditions(work.id)
         assert view.stale is False
 
+    def test_the_new_canvas_is_handed_on_for_its_thumbnails(self, service, settings, prep_settings):
+        """A thumbnail is drawn from the canvas once there is one, so the old one is now stale."""
+        work, _ = _work_with_original(service, settings)
+        warmed: list[str] = []
+
+        PreparationService(service, MatEngine(None, image_max_edge=256), prep_settings, warm=warmed.append).prepare(work.id)
+
+        assert warmed == [work.id]
+
     def test_a_deployment_with_no_key_records_the_mechanical_method(self, prep, service, settings):
         """The suite wires no model client, which is the keyless deployment
         exactly. The colour is real and it says where it came from."""
@@ -492,6 +501,50 @@ class TestWhatItCosts:
         assert result.mat_fallback_detail is not None
 
 
+class TestPreparingSeveral:
+    def test_each_unmatted_work_reports_what_its_own_mat_cost(self, service, settings, prep_settings):
+        first, _ = _work_with_original(service, settings)
+        second, _ = _work_with_original(service, settings, content_hash="hash-two")
+        prep = PreparationService(service, _spending_engine("#27285b", Decimal("0.00006626")), prep_settings)
+        prep.prepare(first.id)
+
+        results = prep.prepare_many([first.id, second.id])
+
+        assert [result.cost_usd for result in results] == [Decimal(0), Decimal("0.00006626")]
+        assert [result.outcome for result in results] == [PreparationOutcome.UNCHANGED, PreparationOutcome.PREPARED]
+        assert service.current_mat_color(second.id).hex_rgb == "#27285b"
+
+    def test_the_mats_are_chosen_in_one_batch(self, service, settings, prep_settings):
+        works = [_work_with_original(service, settings, content_hash=f"hash-{n}")[0] for n in range(3)]
+        batches: list[int] = []
+
+        class _Counting(MatEngine):
+            def choose_many(self, image_paths, *, in_flight=4):  # noqa: ARG002 - a canned answer
+                batches.append(len(image_paths))
+                return [MatChoice(hex_rgb="#27285b", method=MatMethod.VISION_MODEL, reason="Canned.") for _ in image_paths]
+
+        PreparationService(service, _Counting(None, image_max_edge=256), prep_settings).prepare_many([work.id for work in works])
+
+        assert batches == [3]
+
+    def test_a_work_with_no_original_refuses_the_batch_before_anything_is_spent(self, service, settings, prep_settings):
+        held, _ = _work_with_original(service, settings)
+        missing = service.add_artwork(title="Never acquired")
+        asked: list[Path] = []
+
+        class _Watching(MatEngine):
+            def choose(self, image_path):
+                asked.append(image_path)
+                return super().choose(image_path)
+
+        prep = PreparationService(service, _Watching(None, image_max_edge=256), prep_settings)
+
+        with pytest.raises(ServiceError, match="no acquired original"):
+            prep.prepare_many([held.id, missing.id])
+        assert asked == []
+        assert service.current_mat_color(held.id) is None
+
+
 class TestAnUndecodableOriginal:
     """**The divergence `services/imaging.py` was written to prevent, reproduced.**
     The mat engine translated Pillow's failures and the compositor did not, so an
@@ -270,6 +270,40 @@ def test_one_unreclaimable_file_does_not_stop_the_others(discovery, sweep, propo
     assert (result.deleted, result.failed) == (1, 1)
 
 
+def test_a_pass_larger_than_one_batch_reaches_every_path(discovery, sweep, propose, add_image, preview, monkeypatch, settings):
+    """Batches bound the lock, not the pass. A path the first batch failed on must
+    not be what every later batch starts from, or one stubborn file would stop
+    the sweep reclaiming anything that sorts after it."""
+    monkeypatch.setattr(sweep_module, "_SWEEP_BATCH_PATHS", 2)
+    work = propose("The Persistence of Memory")
+    for name in ("a", "b", "c", "d", "e"):
+        add_image(work, url=f"https://museum.example/{name}", preview_path=preview(f"{name}.jpg"))
+    decide(discovery, work, Verdict.REJECTED)
+    real_unlink = pathlib.Path.unlink
+
+    def refuse_one(self, *args, **kwargs):
+        if self.name == "a.jpg":
+            raise PermissionError("read-only file system")
+        return real_unlink(self, *args, **kwargs)
+
+    monkeypatch.setattr("pathlib.Path.unlink", refuse_one)
+
+    result = sweep.run()
+
+    assert (result.deleted, result.forgotten, result.failed) == (4, 4, 1)
+    assert [entry.name for entry in (settings.art_root / "previews").iterdir()] == ["a.jpg"]
+
+
+def test_every_pass_reports_how_long_it_took(sweep, caplog):
+    """Even the empty one: a duration creeping upward is how a sweep that has
+    started to cost something shows itself before the plane stalls behind it."""
+    with caplog.at_level(logging.INFO):
+        result = sweep.run()
+
+    [swept] = [record for record in caplog.records if record.__dict__.get("event") == "preview.swept"]
+    assert swept.__dict__["duration_ms"] == result.duration_ms >= 0
+
+
 # -- works with no previews at all --------------------------------------------
 
 
@@ -547,3 +581,55 @@ def test_the_loop_returns_as_soon_as_it_is_asked_to_stop():
     run_periodically(counting, interval_seconds=3600, stop=stop)
 
     assert counting.passes == 1, "the pass it had already started, and no wait"
+
+
+class _CountingGovernor:
+    """Stands in for the storage governor, recording when it ran relative to the sweep."""
+
+    def __init__(self, sweep: _CountingSweep, *, fail: bool = False) -> None:
+        self.after_passes: list[int] = []
+        self._sweep = sweep
+        self._fail = fail
+
+    def run(self):
+        self.after_passes.append(self._sweep.passes)
+        if self._fail:
+            raise OSError("the card went read-only")
+        return None
+
+
+def test_the_governor_runs_on_the_same_timer_after_the_sweep():
+    """Reclaimed by verdict first, so nothing is evicted by age that the sweep would have taken."""
+    counting = _CountingSweep()
+    governor = _CountingGovernor(counting)
+    stop = threading.Event()
+
+    run_periodically(counting, interval_seconds=0, stop=stop, after_pass=stop.set, governor=governor)
+
+    assert governor.after_passes == [1]
+
+
+def test_a_failed_sweep_still_holds_the_caches_to_budget():
+    counting = _CountingSweep(fail_on=1)
+    governor = _CountingGovernor(counting)
+    stop = threading.Event()
+
+    run_periodically(counting, interval_seconds=0, stop=stop, after_pass=stop.set, governor=governor)
+
+    assert governor.after_passes == [1], "the sweep's failure skipped the governor"
+
+
+def test_a_failed_governor_does_not_end_the_loop(caplog):
+    counting = _CountingSweep()
+    governor = _CountingGovernor(counting, fail=True)
+    stop = threading.Event()
+
+    def stop_after_two() -> None:
+        if counting.passes >= 2:
+            stop.set()
+
+    with caplog.at_level(logging.ERROR):
+        run_periodically(counting, interval_seconds=0, stop=stop, after_pass=stop_after_two, governor=governor)
+
+    assert counting.passes == 2
+    assert any(record.__dict__.get("event") == "storage.govern_error" for record in caplog.records)
@@ -197,7 +197,7 @@ def test_a_run_completes_when_no_preview_can_be_written(services, settings, engi
     """The consequence, through the runner that actually joins the two.
 
     `store` returning `None` is only worth anything if the caller carries on, and
-    the caller is `DiscoveryRunner._record_instance` — so this drives a whole run
+    the caller is `DiscoveryRunner._found_instance` — so this drives a whole run
     rather than calling the engine and the cache side by side, which would prove
     each half works and nothing about the seam between them.
     """
@@ -0,0 +1,197 @@
+"""The durable store's statement profiler, against a schema of its own.
+
+Its own schema for the reason `test_durable.py` gives: the profiler counts
+statements and knows nothing about artworks. What is pinned here is the part an
+operator acts on — that a shape is one entry whatever its `IN` list's length,
+that waiting for the lock is never folded into executing, and that a slow
+statement arrives in the journal with its plan attached.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from curation.persistence.durable import SqliteDurableStore
+from curation.persistence.profiler import StatementProfiler, statement_shape
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS things (
+    id     TEXT PRIMARY KEY,
+    label  TEXT NOT NULL
+);
+"""
+
+
+def _store(tmp_path, profiler=None):
+    return SqliteDurableStore(tmp_path / "store.sqlite", _SCHEMA, profiler=profiler)
+
+
+def _thing(store, id_, label):
+    store.upsert("things", {"id": id_, "label": label}, pk=("id",), on_conflict="raise")
+
+
+def _profile(profiler, fragment):
+    """The one shape whose text contains `fragment`."""
+    (found,) = [profile for profile in profiler.snapshot().statements if fragment in profile.shape]
+    return found
+
+
+@pytest.fixture
+def slow(caplog):
+    """Every `store.slow_query` event journalled during the test."""
+
+    def events():
+        return [record for record in caplog.records if getattr(record, "event", None) == "store.slow_query"]
+
+    with caplog.at_level("WARNING", logger="curation.persistence.profiler"):
+        yield events
+
+
+# -- shapes -------------------------------------------------------------------
+
+
+def test_a_shape_does_not_depend_on_the_length_of_its_in_list():
+    two = statement_shape("SELECT * FROM things WHERE id IN (?, ?)")
+    five = statement_shape("SELECT * FROM things\n  WHERE id IN (?,?, ?,  ?, ?)")
+
+    assert two == five == "SELECT * FROM things WHERE id IN (?, …)"
+
+
+def test_a_lone_placeholder_is_left_as_it_is():
+    assert statement_shape("SELECT * FROM things WHERE id = ?") == "SELECT * FROM things WHERE id = ?"
+
+
+# -- counting -----------------------------------------------------------------
+
+
+def test_every_call_of_a_shape_is_counted_with_the_rows_it_returned(tmp_path):
+    profiler = StatementProfiler()
+    store = _store(tmp_path, profiler)
+    for n in range(3):
+        _thing(store, f"t{n}", "Kettle")
+
+    store.scan("things")
+    store.scan("things")
+    store.close()
+
+    scans = _profile(profiler, 'SELECT * FROM "things"')
+    assert (scans.calls, scans.rows) == (2, 6)
+    assert scans.slow == 0
+    assert scans.plan is None
+
+
+def test_a_write_counts_the_rows_it_changed(tmp_path):
+    profiler = StatementProfiler()
+    store = _store(tmp_path, profiler)
+
+    _thing(store, "t1", "Kettle")
+    store.close()
+
+    assert _profile(profiler, 'INSERT INTO "things"').rows == 1
+
+
+def test_the_costliest_shape_by_total_time_leads(tmp_path):
+    profiler = StatementProfiler()
+    profiler.record(sqlite3.connect(":memory:"), "SELECT 1", (), seconds=0.002, rows=1)
+    for _ in range(5):
+        profiler.record(sqlite3.connect(":memory:"), "SELECT 2", (), seconds=0.001, rows=1)
+
+    assert [profile.shape for profile in profiler.snapshot().statements] == ["SELECT 2", "SELECT 1"]
+
+
+# -- waiting versus working ---------------------------------------------------
+
+
+def test_lock_wait_is_charged_to_the_next_statement_and_not_to_its_execution():
+    profiler = StatementProfiler()
+    connection = sqlite3.connect(":memory:")
+
+    profiler.waited(0.25)
+    profiler.record(connection, "SELECT 1", (), seconds=0.001, rows=1)
+    profiler.record(connection, "SELECT 1", (), seconds=0.001, rows=1)
+
+    (profile,) = profiler.snapshot().statements
+    assert profile.lock_wait_ms == pytest.approx(250)
+    assert profile.total_ms == pytest.approx(2)
+
+
+def test_a_read_queued_behind_a_transaction_reports_the_queue_as_waiting(tmp_path):
+    profiler = StatementProfiler()
+    store = _store(tmp_path, profiler)
+    _thing(store, "t1", "Kettle")
+    holding = threading.Event()
+
+    def hold():
+        with store.transaction():
+            holding.set()
+            time.sleep(0.2)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    holding.wait()
+    store.fetch_one("things", {"id": "t1"})
+    holder.join()
+    store.close()
+
+    fetched = _profile(profiler, 'WHERE "id" = ?')
+    assert fetched.lock_wait_ms >= 100
+    # Executing a point lookup is nowhere near the time it spent queued; a
+    # figure that summed them would send its reader to add an index.
+    assert fetched.total_ms < fetched.lock_wait_ms
+
+
+# -- slow statements ----------------------------------------------------------
+
+
+def test_a_slow_statement_is_journalled_with_its_plan(tmp_path, slow):
+    profiler = StatementProfiler(slow_query_ms=0)
+    store = _store(tmp_path, profiler)
+    _thing(store, "t1", "Kettle")
+
+    store.fetch_one("things", {"id": "t1"})
+    store.close()
+
+    (event,) = [record for record in slow() if 'WHERE "id" = ?' in record.shape]
+    assert "things" in event.plan
+    assert event.rows == 1
+    assert _profile(profiler, 'WHERE "id" = ?').plan == event.plan
+
+
+def test_the_plan_is_read_once_per_shape_however_often_it_is_slow(tmp_path, slow, monkeypatch):
+    from curation.persistence import profiler as module
+
+    explained = []
+    real = module._explain
+    monkeypatch.setattr(module, "_explain", lambda *args: explained.append(args[1]) or real(*args))
+    profiler = StatementProfiler(slow_query_ms=0)
+    store = _store(tmp_path, profiler)
+
+    for _ in range(3):
+        store.scan("things")
+    store.close()
+
+    assert sum('FROM "things"' in statement for statement in explained) == 1
+    assert sum('FROM "things"' in record.shape for record in slow()) == 3
+
+
+def test_a_plan_that_cannot_be_read_is_reported_in_its_place_rather_than_raised(slow):
+    profiler = StatementProfiler(slow_query_ms=0)
+
+    profiler.record(sqlite3.connect(":memory:"), "SELECT * FROM nowhere", (), seconds=0.5, rows=0)
+
+    (event,) = slow()
+    assert event.plan.startswith("(the plan could not be read")
+
+
+# -- off ----------------------------------------------------------------------
+
+
+def test_an_unprofiled_store_answers_exactly_as_before(tmp_path):
+    store = _store(tmp_path)
+    _thing(store, "t1", "Kettle")
+
+    assert store.fetch_one("things", {"id": "t1"})["label"] == "Kettle"
+    assert store.fetch_one("things", {"id": "absent"}) is None
+    store.close()
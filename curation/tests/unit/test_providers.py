@@ -0,0 +1,262 @@
+"""One pacing and one breaker per host, shared by every client in the process.
+
+Driven through real `httpx` clients over `MockTransport`, with the guard's
+transport between them: what matters is which requests reach the far side, and
+which are refused before they leave.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+from fakes import FakeImageSearch
+
+from curation.discovery.artic import ArticImageSearch
+from curation.discovery.images import ImageQuery, ImageSearchFailure
+from curation.providers import HostPolicy, HostState, HostUnavailable, ProviderGuard
+from curation.services.container import Services
+from curation.services.previews import PreviewSettings
+
+
+class _Clock:
+    """Monotonic time that only moves when a test, or a wait, moves it."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+#: Most tests are about breaking, and a host that is never paced keeps the
+#: clock still for them.
+_UNPACED = HostPolicy(requests_per_second=None)
+
+
+def _guard(clock: _Clock, *, policy: HostPolicy = _UNPACED) -> ProviderGuard:
+    return ProviderGuard(policies={}, default=policy, clock=clock, sleep=clock.sleep)
+
+
+def _client(guard: ProviderGuard, answer) -> tuple[httpx.Client, list[httpx.Request]]:
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return answer(request)
+
+    return httpx.Client(transport=guard.transport(httpx.MockTransport(handler))), sent
+
+
+def _failing(client: httpx.Client, times: int) -> None:
+    for _ in range(times):
+        client.get("https://museum.example/a")
+
+
+class TestPacing:
+    def test_a_burst_goes_at_once_and_the_rest_wait_their_turn(self, clock):
+        guard = _guard(clock, policy=HostPolicy(requests_per_second=2.0, burst=3))
+        client, sent = _client(guard, lambda request: httpx.Response(200))
+
+        for _ in range(5):
+            client.get("https://museum.example/a")
+
+        assert len(sent) == 5
+        assert clock.slept == [0.5, 0.5]
+
+    def test_two_clients_asking_one_host_share_its_pace(self, clock):
+        guard = _guard(clock, policy=HostPolicy(requests_per_second=1.0, burst=1))
+        first, _ = _client(guard, lambda request: httpx.Response(200))
+        second, _ = _client(guard, lambda request: httpx.Response(200))
+
+        first.get("https://museum.example/a")
+        second.get("https://museum.example/b")
+
+        assert clock.slept == [1.0]
+        (host,) = guard.reading().hosts
+        assert (host.admitted, host.waited_seconds) == (2, 1.0)
+
+    def test_different_hosts_are_paced_apart(self, clock):
+        guard = _guard(clock, policy=HostPolicy(requests_per_second=1.0, burst=1))
+        client, _ = _client(guard, lambda request: httpx.Response(200))
+
+        client.get("https://museum.example/a")
+        client.get("https://other.example/a")
+
+        assert clock.slept == []
+
+
+class TestBreaking:
+    def test_consecutive_failures_open_the_host_and_it_then_fails_fast(self, clock):
+        guard = _guard(clock)
+        client, sent = _client(guard, lambda request: httpx.Response(503))
+        _failing(client, 5)
+
+        with pytest.raises(HostUnavailable, match="museum.example is failing"):
+            client.get("https://museum.example/a")
+
+        assert len(sent) == 5
+        (host,) = guard.reading().hosts
+        assert (host.state, host.consecutive_failures, host.refused) == (HostState.OPEN, 5, 1)
+        assert host.last_failure == "HTTP 503"
+
+    def test_an_answer_that_is_not_an_outage_resets_the_count(self, clock):
+        answers = iter([503, 503, 503, 503, 404, 503])
+        guard = _guard(clock)
+        client, sent = _client(guard, lambda request: httpx.Response(next(answers)))
+        _failing(client, 6)
+
+        (host,) = guard.reading().hosts
+        assert (host.state, host.consecutive_failures) == (HostState.CLOSED, 1)
+
+    def test_a_transport_error_counts_and_is_raised_as_it_was(self, clock):
+        guard = _guard(clock)
+
+        def refuse(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client, _ = _client(guard, refuse)
+        for _ in range(5):
+            with pytest.raises(httpx.ConnectError):
+                client.get("https://museum.example/a")
+
+        with pytest.raises(HostUnavailable, match="connection refused"):
+            client.get("https://museum.example/a")
+
+    def test_after_the_pause_one_trial_is_let_through_and_its_answer_closes_the_host(self, clock):
+        answers = iter([503] * 5 + [200])
+        guard = _guard(clock)
+        client, sent = _client(guard, lambda request: httpx.Response(next(answers)))
+        _failing(client, 5)
+        clock.now += 30
+
+        assert guard.reading().hosts[0].state is HostState.TRIAL
+        assert client.get("https://museum.example/a").status_code == 200
+        assert guard.reading().hosts[0].state is HostState.CLOSED
+
+    def test_a_failed_trial_opens_the_host_again_at_once(self, clock):
+        guard = _guard(clock)
+        client, sent = _client(guard, lambda request: httpx.Response(503))
+        _failing(client, 5)
+        clock.now += 30
+
+        client.get("https://museum.example/a")
+
+        with pytest.raises(HostUnavailable):
+            client.get("https://museum.example/a")
+        assert len(sent) == 6
+
+    def test_only_one_trial_is_in_flight_at_a_time(self, clock):
+        guard = _guard(clock)
+        client, _ = _client(guard, lambda request: httpx.Response(503))
+        _failing(client, 5)
+        clock.now += 30
+
+        guard.admit("museum.example")
+
+        with pytest.raises(HostUnavailable, match="trial"):
+            guard.admit("museum.example")
+
+
+class TestRetryAfter:
+    def test_a_429_saying_when_opens_the_host_until_then_on_its_first_answer(self, clock):
+        guard = _guard(clock)
+        client, sent = _client(guard, lambda request: httpx.Response(429, headers={"Retry-After": "120"}))
+        client.get("https://museum.example/a")
+
+        clock.now += 119
+        with pytest.raises(HostUnavailable):
+            client.get("https://museum.example/a")
+        clock.now += 1
+        client.get("https://museum.example/a")
+
+        assert len(sent) == 2
+
+    def test_a_date_is_read_as_well_as_a_number(self, clock):
+        guard = _guard(clock)
+        when = format_datetime(datetime.now(UTC) + timedelta(seconds=300), usegmt=True)
+        client, _ = _client(guard, lambda request: httpx.Response(503, headers={"Retry-After": when}))
+        client.get("https://museum.example/a")
+
+        clock.now += 200
+        with pytest.raises(HostUnavailable):
+            client.get("https://museum.example/a")
+
+    def test_a_pause_of_a_week_is_held_to_ten_minutes(self, clock):
+        guard = _guard(clock)
+        client, _ = _client(guard, lambda request: httpx.Response(429, headers={"Retry-After": str(7 * 24 * 3600)}))
+        client.get("https://museum.example/a")
+
+        clock.now += 600
+        guard.admit("museum.example")
+
+    def test_an_unreadable_header_is_an_ordinary_failure(self, clock):
+        guard = _guard(clock)
+        client, _ = _client(guard, lambda request: httpx.Response(429, headers={"Retry-After": "soon"}))
+        client.get("https://museum.example/a")
+
+        assert guard.reading().hosts[0].state is HostState.CLOSED
+
+
+def test_an_async_client_is_broken_by_the_same_host_state(clock):
+    guard = _guard(clock)
+    sync, _ = _client(guard, lambda request: httpx.Response(503))
+    _failing(sync, 5)
+
+    async def ask() -> None:
+        transport = guard.async_transport(httpx.MockTransport(lambda request: httpx.Response(200)))
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://museum.example/tile.jpg")
+
+    with pytest.raises(HostUnavailable):
+        asyncio.run(ask())
+
+
+def test_a_museum_that_is_down_is_reported_in_the_clients_own_words(clock):
+    guard = _guard(clock)
+    search = ArticImageSearch(
+        user_agent="samsung-frame-art-loader (test@example.org)",
+        client=httpx.Client(transport=guard.transport(httpx.MockTransport(lambda request: httpx.Response(502)))),
+    )
+    for _ in range(5):
+        with pytest.raises(ImageSearchFailure):
+            search.find_images(ImageQuery(title="American Gothic"))
+
+    with pytest.raises(ImageSearchFailure, match="not asked again"):
+        search.find_images(ImageQuery(title="American Gothic"))
+
+
+def test_the_health_panel_shows_every_host_asked(
+    store, discovery_store, wall_settings, thumbnail_settings, settings, engine, clock
+):
+    guard = _guard(clock)
+    client, _ = _client(guard, lambda request: httpx.Response(503))
+    _failing(client, 5)
+    services = Services.bind(
+        catalogue=store,
+        discovery=discovery_store,
+        display_settings=wall_settings,
+        thumbnails=thumbnail_settings,
+        artwork_box=settings.tv_artwork_box,
+        engine=engine,
+        discovery_settings=settings.discovery_settings,
+        image_search=FakeImageSearch(holdings={}),
+        previews=PreviewSettings(art_root=settings.art_root, directory=settings.previews_path),
+        providers=guard,
+    )
+
+    (host,) = services.health.observe().providers.hosts
+
+    assert (host.host, host.state, host.admitted) == ("museum.example", HostState.OPEN, 5)
+    assert host.open_until is not None
@@ -13,6 +13,7 @@ from PIL import Image
 
 from curation.persistence.discovery_records import RunKind
 from curation.services.errors import ServiceError
+from curation.services.imaging_pool import ImagingPool
 from curation.services.previews import INLINE_MAX_EDGE_PX, inline_preview
 from curation.services.review import MAX_REVIEW_LIMIT
 
@@ -150,7 +151,7 @@ def test_a_preview_that_is_not_a_jpeg_is_re_encoded_as_one(services, propose, ad
 
 
 def test_inline_preview_reports_absence_for_a_file_that_is_not_there(tmp_path):
-    assert inline_preview(tmp_path / "nothing.jpg") is None
+    assert inline_preview(tmp_path / "nothing.jpg", imaging=ImagingPool(workers=0)) is None
 
 
 # -- what stands for the work --------------------------------------------------
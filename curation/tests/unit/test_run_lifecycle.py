@@ -14,7 +14,7 @@ from decimal import Decimal
 
 import pytest
 
-from curation.discovery.dedup import work_dedup_key
+from curation.discovery.dedup import RULES_VERSION, work_dedup_key
 from curation.persistence.discovery_records import InitiatedBy, RunKind, RunStatus, Verdict
 from curation.services.errors import ServiceError
 
@@ -478,7 +478,7 @@ def test_recleaning_stored_titles_says_how_many_a_curator_was_shown(discovery, r
 
 
 def test_recleaning_a_stored_title_is_done_after_the_first_start(discovery, run, propose, caplog):
-    """Idempotent, because it runs at every start rather than once.
+    """Idempotent, because it runs again whenever the rules change.
 
     A repair that kept finding work to do would rewrite the same rows forever and
     report a fresh repair on a catalogue that had none.
@@ -496,6 +496,33 @@ def test_recleaning_a_stored_title_is_done_after_the_first_start(discovery, run,
     assert [record for record in caplog.records if getattr(record, "event", None) == "works.recleaned"] == []
 
 
+def test_a_start_under_rules_already_applied_does_not_walk_the_stored_titles(discovery, discovery_store, run, propose):
+    """The walk is paid once per version of the rules, not once per start.
+
+    The engine seam cleans every title it writes, so under unchanged rules a
+    damaged row can only arrive by going around it — which is what `propose`
+    does here, and what makes a skipped walk observable at all. Repairing it
+    would mean the start walked every candidate row to find nothing it owed.
+    """
+    work = propose(DAMAGED_TITLE, dedup_key="dali::lobster telephone 1938 cited from tate org uk")
+    discovery_store.record_dedup_rules_applied(RULES_VERSION)
+
+    discovery.reconcile()
+
+    assert discovery.get_candidate_work(work.id).proposed_title == DAMAGED_TITLE
+
+
+def test_a_change_to_the_rules_owes_the_stored_titles_one_more_walk(discovery, discovery_store, run, propose):
+    """Editing `dedup.py` moves its version, and the next start re-cleans and says so."""
+    work = propose(DAMAGED_TITLE, dedup_key="dali::lobster telephone 1938 cited from tate org uk")
+    discovery_store.record_dedup_rules_applied("rules since edited")
+
+    discovery.reconcile()
+
+    assert discovery.get_candidate_work(work.id).proposed_title == "Lobster Telephone (1938)"
+    assert discovery_store.dedup_rules_applied() == RULES_VERSION
+
+
 @pytest.mark.parametrize("ending", ["fail_run", "halt_run_for_budget"])
 def test_a_run_waiting_for_the_curator_cannot_break_or_be_halted(discovery, run, propose, ending):
     """Nothing is executing there, so neither ending describes something that happened.
@@ -0,0 +1,248 @@
+"""Holding the cache directories to their budgets, and what each may never lose."""
+
+import logging
+import os
+from pathlib import Path
+
+import pytest
+from fakes import FakeImageSearch
+
+from curation.services.container import Services
+from curation.services.previews import PreviewSettings
+from curation.services.storage import GovernedCache, StorageBudgets, StorageGovernor
+
+#: An hour, so every file's age is unambiguous to a filesystem with coarse timestamps.
+_HOUR = 3600.0
+
+
+def _write(path: Path, size: int, *, age_hours: float) -> Path:
+    """A file of `size` bytes, last used `age_hours` ago."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    when = path.stat().st_mtime - age_hours * _HOUR
+    os.utime(path, (when, when))
+    return path
+
+
+def _governor(directory: Path, budget: int, **fields) -> StorageGovernor:
+    return StorageGovernor([GovernedCache("thumbs", directory, budget, **fields)])
+
+
+class TestEviction:
+    def test_the_least_recently_used_go_first_and_only_until_within_budget(self, tmp_path):
+        oldest = _write(tmp_path / "a.jpg", 100, age_hours=3)
+        older = _write(tmp_path / "b.jpg", 100, age_hours=2)
+        newest = _write(tmp_path / "c.jpg", 100, age_hours=1)
+
+        (usage,) = _governor(tmp_path, 200).run().caches
+
+        assert (oldest.exists(), older.exists(), newest.exists()) == (False, True, True)
+        assert (usage.used_bytes, usage.entries, usage.evicted, usage.evicted_bytes) == (200, 2, 1, 100)
+
+    def test_a_file_read_recently_outlives_one_written_recently(self, tmp_path):
+        # Recency is the later of access and modification, so a thumbnail served
+        # this morning is kept over one drawn this morning and never looked at.
+        read = _write(tmp_path / "read.jpg", 100, age_hours=5)
+        written = _write(tmp_path / "written.jpg", 100, age_hours=2)
+        os.utime(read, (written.stat().st_mtime + _HOUR, read.stat().st_mtime))
+
+        _governor(tmp_path, 100).run()
+
+        assert (read.exists(), written.exists()) == (True, False)
+
+    def test_a_cache_within_budget_loses_nothing(self, tmp_path):
+        kept = _write(tmp_path / "a.jpg", 100, age_hours=9)
+
+        (usage,) = _governor(tmp_path, 100).run().caches
+
+        assert kept.exists()
+        assert usage.evicted == 0
+
+    def test_a_budget_of_zero_measures_and_evicts_nothing(self, tmp_path):
+        _write(tmp_path / "a.jpg", 100, age_hours=9)
+        _write(tmp_path / "nested" / "b.jpg", 50, age_hours=9)
+
+        (usage,) = _governor(tmp_path, 0).run().caches
+
+        assert (usage.used_bytes, usage.entries, usage.evicted) == (150, 2, 0)
+
+    def test_files_in_subdirectories_are_entries_of_their_own(self, tmp_path):
+        old = _write(tmp_path / "240" / "a.jpg", 100, age_hours=3)
+        new = _write(tmp_path / "960" / "a.jpg", 100, age_hours=1)
+
+        _governor(tmp_path, 100).run()
+
+        assert (old.exists(), new.exists()) == (False, True)
+
+    def test_a_directory_entry_goes_whole_and_is_dated_by_its_newest_file(self, tmp_path):
+        # A source's tiles: half of them is a resume that fetches the other half.
+        stale = tmp_path / "source-a"
+        _write(stale / "0_0.jpg", 100, age_hours=4)
+        _write(stale / "0_1.jpg", 100, age_hours=4)
+        touched = tmp_path / "source-b"
+        _write(touched / "0_0.jpg", 100, age_hours=9)
+        _write(touched / "0_1.jpg", 100, age_hours=1)
+
+        (usage,) = _governor(tmp_path, 250, by_directory=True).run().caches
+
+        assert (stale.exists(), touched.exists()) == (False, True)
+        assert (usage.entries, usage.evicted_bytes) == (1, 200)
+
+    def test_a_missing_directory_is_an_empty_cache(self, tmp_path):
+        (usage,) = _governor(tmp_path / "never-made", 100).run().caches
+
+        assert (usage.used_bytes, usage.entries) == (0, 0)
+
+
+class TestWhatMustStay:
+    def test_a_held_entry_is_kept_however_old_and_reported_as_held(self, tmp_path):
+        held = _write(tmp_path / "held.jpg", 100, age_hours=9)
+        free = _write(tmp_path / "free.jpg", 100, age_hours=1)
+
+        (usage,) = _governor(tmp_path, 100, holds=lambda entries: [e for e in entries if e == held]).run().caches
+
+        assert (held.exists(), free.exists()) == (True, False)
+        assert usage.held_bytes == 100
+
+    def test_a_cache_held_over_budget_says_so_rather_than_deleting_to_fit(self, tmp_path):
+        _write(tmp_path / "a.jpg", 100, age_hours=2)
+        _write(tmp_path / "b.jpg", 100, age_hours=1)
+
+        (usage,) = _governor(tmp_path, 50, holds=lambda entries: entries).run().caches
+
+        assert (usage.used_bytes, usage.held_bytes, usage.evicted) == (200, 200, 0)
+
+    def test_an_unfinished_file_is_never_evicted(self, tmp_path):
+        staging = _write(tmp_path / "a.jpg.3f2c.tmp", 100, age_hours=9)
+        partial = _write(tmp_path / "b.jpg.partial", 100, age_hours=9)
+        finished = _write(tmp_path / "c.jpg", 100, age_hours=1)
+
+        _governor(tmp_path, 100).run()
+
+        assert (staging.exists(), partial.exists(), finished.exists()) == (True, True, False)
+
+    def test_an_entry_wanted_during_the_pass_is_asked_about_again_and_kept(self, tmp_path):
+        old = _write(tmp_path / "a.jpg", 100, age_hours=2)
+        _write(tmp_path / "b.jpg", 100, age_hours=1)
+        asked: list[int] = []
+
+        def holds(entries):
+            # Nothing held when the directory is surveyed; wanted by the time
+            # the entry itself is about to go.
+            asked.append(len(entries))
+            return [] if len(asked) == 1 else entries
+
+        _governor(tmp_path, 100, holds=holds).run()
+
+        assert old.exists()
+
+    def test_an_entry_that_will_not_go_is_counted_and_the_rest_still_go(self, tmp_path, monkeypatch, caplog):
+        stuck = _write(tmp_path / "a.jpg", 100, age_hours=3)
+        movable = _write(tmp_path / "b.jpg", 100, age_hours=2)
+        _write(tmp_path / "c.jpg", 100, age_hours=1)
+        unlink = Path.unlink
+
+        def refuse(self, missing_ok=False):
+            if self == stuck:
+                raise PermissionError("read-only file system")
+            unlink(self, missing_ok=missing_ok)
+
+        monkeypatch.setattr(Path, "unlink", refuse)
+        with caplog.at_level(logging.WARNING):
+            (usage,) = _governor(tmp_path, 200).run().caches
+
+        assert (stuck.exists(), movable.exists()) == (True, False)
+        assert (usage.failed, usage.evicted) == (1, 1)
+        assert any(record.__dict__.get("event") == "storage.evict_failed" for record in caplog.records)
+
+
+class TestTheReading:
+    def test_nothing_is_claimed_before_the_first_pass(self, tmp_path):
+        (usage,) = _governor(tmp_path, 100).reading().caches
+
+        assert (usage.used_bytes, usage.entries, usage.held_bytes, usage.measured_at) == (None, None, None, None)
+
+    def test_evictions_accumulate_across_passes(self, tmp_path):
+        governor = _governor(tmp_path, 100)
+        _write(tmp_path / "a.jpg", 100, age_hours=2)
+        _write(tmp_path / "b.jpg", 100, age_hours=1)
+        governor.run()
+        _write(tmp_path / "c.jpg", 100, age_hours=0)
+        governor.run()
+
+        (usage,) = governor.reading().caches
+
+        assert (usage.evicted, usage.evicted_bytes) == (2, 200)
+
+    def test_every_pass_says_so_even_when_it_evicts_nothing(self, tmp_path, caplog):
+        with caplog.at_level(logging.INFO, logger="curation.services.storage"):
+            _governor(tmp_path, 100).run()
+
+        assert any(record.__dict__.get("event") == "storage.governed" for record in caplog.records)
+
+
+# -- the rules the plane wires -------------------------------------------------
+
+
+@pytest.fixture
+def services(store, discovery_store, wall_settings, thumbnail_settings, settings, engine) -> Services:
+    """A plane with phase 2 on and every cache given a budget of one small file."""
+    return Services.bind(
+        catalogue=store,
+        discovery=discovery_store,
+        display_settings=wall_settings,
+        thumbnails=thumbnail_settings,
+        artwork_box=settings.tv_artwork_box,
+        engine=engine,
+        discovery_settings=settings.discovery_settings,
+        image_search=FakeImageSearch(holdings={}),
+        previews=PreviewSettings(art_root=settings.art_root, directory=settings.previews_path),
+        storage=StorageBudgets(tile_cache_bytes=100, previews_bytes=100, thumbnails_bytes=100),
+    )
+
+
+def _cache(services, name):
+    return next(usage for usage in services.storage.run().caches if usage.name == name)
+
+
+def test_a_preview_an_instance_names_is_kept_and_an_orphan_is_not(services, settings, propose, add_image):
+    named = _write(settings.previews_path / "named.jpg", 100, age_hours=9)
+    orphan = _write(settings.previews_path / "orphan.jpg", 100, age_hours=1)
+    add_image(propose(), preview_path="previews/named.jpg")
+
+    usage = _cache(services, "previews")
+
+    assert (named.exists(), orphan.exists()) == (True, False)
+    assert usage.held_bytes == 100
+
+
+def test_no_preview_is_evicted_while_a_run_is_working(services, settings, monkeypatch):
+    # A run writes a preview before the row that names it.
+    orphan = _write(settings.previews_path / "orphan.jpg", 200, age_hours=9)
+    monkeypatch.setattr(services.runner, "working", lambda: True)
+
+    _cache(services, "previews")
+
+    assert orphan.exists()
+
+
+def test_the_tiles_of_a_source_being_fetched_are_kept(services, settings, monkeypatch):
+    fetching = _write(settings.tile_cache_path / "source-a" / "0_0.jpg", 100, age_hours=9)
+    idle = _write(settings.tile_cache_path / "source-b" / "0_0.jpg", 100, age_hours=1)
+    monkeypatch.setattr(services.acquisition, "fetching", lambda: frozenset({"source-a"}))
+
+    _cache(services, "tile-cache")
+
+    assert (fetching.exists(), idle.exists()) == (True, False)
+
+
+def test_the_health_panel_reads_the_last_pass(services, settings):
+    _write(settings.thumbnails_path / "240" / "a.jpg", 100, age_hours=2)
+    _write(settings.thumbnails_path / "240" / "b.jpg", 100, age_hours=1)
+    services.storage.run()
+
+    reading = services.health.observe().storage
+
+    assert [usage.name for usage in reading.caches] == ["tile-cache", "previews", "thumbs"]
+    thumbs = reading.caches[-1]
+    assert (thumbs.used_bytes, thumbs.evicted) == (100, 1)
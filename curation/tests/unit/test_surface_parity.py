@@ -32,11 +32,12 @@ from datetime import UTC, datetime
 
 import pytest
 
+from curation.acquisition.queue import AcquisitionJob, JobState
 from curation.http import api as http_api
 from curation.http import models as http_models
 from curation.mcp import bindings
 from curation.persistence.discovery_records import CandidateWork, DiscoveryRun, InitiatedBy, RunKind, RunStatus
-from curation.persistence.records import Artist, Artwork, Theme
+from curation.persistence.records import AcquisitionMethod, Artist, Artwork, Theme
 from curation.services.discovery import VerdictOutcome
 
 WHEN = datetime(2026, 8, 6, 12, 0, tzinfo=UTC)
@@ -95,6 +96,23 @@ def test_the_theme_projections_carry_the_same_field_names():
     check_parity("Theme", set(bindings._theme_fields(theme)), _fields(http_models.ThemeOut))
 
 
+def test_the_acquisition_job_projections_carry_the_same_field_names():
+    job = AcquisitionJob(
+        id="job_1",
+        batch_id="batch_1",
+        artwork_id="art_1",
+        source_id="src_1",
+        provider="artic",
+        method=AcquisitionMethod.DEZOOMIFY,
+        priority=0,
+        expected_bytes=1,
+        state=JobState.QUEUED,
+        enqueued_at=WHEN,
+    )
+
+    check_parity("AcquisitionJob", set(bindings._acquisition_job_fields(job)), _fields(http_models.AcquisitionJobOut))
+
+
 def test_the_artist_projections_carry_the_same_field_names():
     artist = Artist(id="art_1", name="Hokusai")
 
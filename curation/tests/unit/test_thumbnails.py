@@ -16,6 +16,7 @@ in front of them — are what the tests below hold.
 """
 
 import logging
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -33,11 +34,14 @@ from curation.persistence.records import (
 )
 from curation.services.errors import ServiceError
 from curation.services.thumbnails import (
+    THUMBNAIL_EDGES_PX,
     THUMBNAIL_MAX_EDGE_PX,
     ThumbnailSettings,
     ThumbnailSource,
     ThumbnailUnavailable,
+    ThumbnailWarmer,
     _drawn_from,
+    thumbnail_edge,
 )
 
 
@@ -294,8 +298,12 @@ class TestGenerating:
         """No stored path is absolute, so a catalogue survives being restored elsewhere."""
         artwork = work()
         thumbnails.thumbnail(artwork.id)
-        row = next(v.rendition for v in service.list_renditions(artwork.id) if v.rendition.kind is RenditionKind.THUMBNAIL)
-        assert row.relative_path == f"thumbs/{artwork.id}.jpg"
+        rows = {
+            v.rendition.target_width: v.rendition.relative_path
+            for v in service.list_renditions(artwork.id)
+            if v.rendition.kind is RenditionKind.THUMBNAIL
+        }
+        assert rows == {240: f"thumbs/{artwork.id}-240.jpg", 480: f"thumbs/{artwork.id}.jpg", 960: f"thumbs/{artwork.id}-960.jpg"}
 
     def test_a_second_ask_reuses_the_file_rather_than_re_encoding_it(self, thumbnails, work):
         artwork = work()
@@ -533,6 +541,114 @@ class TestGenerating:
             assert produced.mode == "RGB"
 
 
+class TestTheLadder:
+    """Three sizes in two encodings, from one decode, going stale together."""
+
+    @pytest.mark.parametrize(
+        ("width", "edge"),
+        [(None, THUMBNAIL_MAX_EDGE_PX), (1, 240), (240, 240), (241, 480), (480, 480), (700, 960), (4000, 960)],
+    )
+    def test_a_width_is_served_by_the_smallest_size_that_covers_it(self, width, edge):
+        """Never smaller, so a browser does not upscale; never larger than the ladder holds."""
+        assert thumbnail_edge(width) == edge
+
+    def test_a_width_that_is_not_a_size_is_refused(self):
+        with pytest.raises(ServiceError, match="positive"):
+            thumbnail_edge(0)
+
+    def test_every_size_and_encoding_is_drawn_on_the_first_ask(self, thumbnails, settings, work):
+        artwork = work(width=1600, height=1200)
+        thumbnails.thumbnail(artwork.id)
+        for edge in THUMBNAIL_EDGES_PX:
+            stem = artwork.id if edge == THUMBNAIL_MAX_EDGE_PX else f"{artwork.id}-{edge}"
+            for suffix, codec in (("jpg", "JPEG"), ("webp", "WEBP")):
+                with Image.open(settings.thumbnails_path / f"{stem}.{suffix}") as produced:
+                    assert produced.format == codec
+                    assert max(produced.size) == edge
+
+    def test_the_width_asked_for_picks_the_file(self, thumbnails, work):
+        artwork = work(width=1600, height=1200)
+        with Image.open(thumbnails.thumbnail(artwork.id, width=200)) as small:
+            assert max(small.size) == 240
+        with Image.open(thumbnails.thumbnail(artwork.id, width=900, webp=True)) as large:
+            assert (large.format, max(large.size)) == ("WEBP", 960)
+
+    def test_the_webp_is_smaller_than_the_jpeg_it_sits_beside(self, thumbnails, work):
+        """The reason it is offered at all."""
+        artwork = work(width=1600, height=1200)
+        jpeg = thumbnails.thumbnail(artwork.id)
+        webp = thumbnails.thumbnail(artwork.id, webp=True)
+        assert webp.stat().st_size < jpeg.stat().st_size
+
+    def test_one_missing_size_redraws_the_ladder_rather_than_one_file(self, thumbnails, settings, work):
+        artwork = work()
+        default = thumbnails.thumbnail(artwork.id)
+        stamp = default.stat().st_mtime_ns
+        (settings.thumbnails_path / f"{artwork.id}-240.jpg").unlink()
+        time.sleep(0.01)
+
+        thumbnails.thumbnail(artwork.id, width=240)
+
+        assert default.stat().st_mtime_ns != stamp
+
+    def test_a_current_ladder_is_not_warmed_again(self, thumbnails, work):
+        artwork = work()
+        assert thumbnails.warm(artwork.id) is True
+        assert thumbnails.warm(artwork.id) is False
+
+    def test_a_missing_webp_is_enough_to_warm(self, thumbnails, settings, work):
+        """The request path checks one file; warming has to check all six."""
+        artwork = work()
+        thumbnails.warm(artwork.id)
+        (settings.thumbnails_path / f"{artwork.id}-960.webp").unlink()
+        assert thumbnails.warm(artwork.id) is True
+        assert (settings.thumbnails_path / f"{artwork.id}-960.webp").is_file()
+
+
+class TestTheWarmer:
+    def test_an_enqueued_work_is_drawn_without_anyone_asking(self, thumbnails, settings, work):
+        artwork = work()
+        warmer = ThumbnailWarmer(thumbnails)
+        halt = warmer.start()
+        try:
+            warmer.enqueue(artwork.id)
+            assert _eventually(lambda: (settings.thumbnails_path / f"{artwork.id}-960.webp").is_file())
+        finally:
+            halt()
+
+    def test_an_unstarted_warmer_forgets_what_it_is_handed(self, thumbnails, settings, work):
+        """A plane that never asked for warming must not grow a queue nobody drains."""
+        artwork = work()
+        warmer = ThumbnailWarmer(thumbnails)
+        warmer.enqueue(artwork.id)
+        halt = warmer.start()
+        halt()
+        assert _leftovers(settings) == []
+
+    def test_a_work_that_cannot_be_drawn_does_not_stop_the_next(self, thumbnails, settings, work, caplog):
+        broken, sound = work(), work()
+        (settings.art_root / f"raw/{broken.id}.jpg").write_bytes(b"this is not a picture")
+        warmer = ThumbnailWarmer(thumbnails)
+        halt = warmer.start()
+        try:
+            with caplog.at_level(logging.INFO, logger="curation.services.thumbnails"):
+                warmer.enqueue(broken.id)
+                warmer.enqueue(sound.id)
+                assert _eventually(lambda: (settings.thumbnails_path / f"{sound.id}.jpg").is_file())
+        finally:
+            halt()
+        assert [record.event for record in caplog.records if record.event == "thumbnail.unwarmed"] == ["thumbnail.unwarmed"]
+
+    def test_starting_twice_is_refused(self, thumbnails):
+        warmer = ThumbnailWarmer(thumbnails)
+        halt = warmer.start()
+        try:
+            with pytest.raises(ServiceError, match="already running"):
+                warmer.start()
+        finally:
+            halt()
+
+
 class TestWhereTheCacheMayLive:
     def test_a_cache_outside_the_art_root_is_refused_at_wiring_time(self, tmp_path):
         """Caught here it names both directories; caught later it is a ValueError mid-request."""
@@ -562,3 +678,13 @@ def _leftovers(settings) -> list:
     if not settings.thumbnails_path.exists():
         return []
     return sorted(settings.thumbnails_path.glob("*"))
+
+
+def _eventually(condition, *, within: float = 5.0) -> bool:
+    """Poll a condition a background thread is expected to make true."""
+    deadline = time.monotonic() + within
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
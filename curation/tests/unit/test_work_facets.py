@@ -15,7 +15,8 @@ control that had none of this. The catalogues built here are small and
 *deliberately sparse*: each has combinations that do not exist.
 """
 
-from contextlib import contextmanager
+import sqlite3
+from contextlib import closing, contextmanager
 from dataclasses import replace
 
 import pytest
@@ -23,7 +24,7 @@ import pytest
 from curation.persistence.catalogue import StorageError, WorkQuery
 from curation.persistence.durable import SqliteDurableStore
 from curation.persistence.file import open_catalogue_file
-from curation.persistence.records import FacetDerivation, VocabularyKind
+from curation.persistence.records import ArtworkStatus, FacetDerivation, VocabularyKind
 from curation.persistence.sqlite import CATALOGUE_SCHEMA, SqliteCatalogue
 from curation.persistence.sqlite_discovery import DISCOVERY_SCHEMA
 from curation.services.catalogue import MAX_FACET_VALUES, MAX_SEARCH_TERMS, CatalogueService
@@ -514,28 +515,33 @@ class TestTheCollectionIsNotAskedTheSameQuestionSixTimes:
         """
         faceted.list_artworks(limit=5)
 
-        assert len([statement for statement in statements if "COUNT(*) AS tally" in statement]) == 1
+        assert len([statement for statement in statements if " AS tally" in statement]) == 1
 
     def test_a_filtered_kind_gets_a_query_of_its_own_and_the_rest_still_share_one(self, faceted, statements):
         faceted.list_artworks(facets={"movement": ["Baroque"]}, limit=5)
-        counting = [statement for statement in statements if "COUNT(*) AS tally" in statement]
+        counting = [statement for statement in statements if " AS tally" in statement]
 
         assert len(counting) == 2
 
-    def test_an_unnarrowed_query_does_not_restrict_the_facet_tables_to_every_work(self, faceted, statements):
-        """ "Which works? All of them" is not a subquery worth writing.
+    def test_an_unnarrowed_query_reads_the_summary_and_not_the_facet_table(self, faceted, statements):
+        """The collection's first screen, answered by lookup.
 
-        Left in, SQLite builds an ephemeral index of every work and probes it once
-        per facet row to arrive at the set it started with — measured at 7.0 ms
-        against 0.5 ms for one kind on the 4,000-work corpus. The collection's
-        first screen is exactly this case.
+        Before the summary this was a `GROUP BY` over every facet row — cheap
+        only because the "which works? all of them" subquery had already been
+        dropped from it, which took one kind from 7.0 ms to 0.5 ms on the
+        4,000-work corpus. Now nothing on this screen reads `work_facets` at all.
         """
         faceted.list_artworks(limit=5)
-        over_facets = [statement for statement in statements if "FROM work_facets" in statement]
+        over_facets = [statement for statement in statements if "facet" in statement]
 
         assert over_facets, "no facet statement was issued at all, so this proves nothing"
         for statement in over_facets:
-            assert "artworks" not in statement, f"an unnarrowed read still went through the works table: {statement}"
+            assert "FROM facet_counts" in statement, f"an unnarrowed read still counted the facet table: {statement}"
+
+    def test_a_status_alone_is_still_answered_by_the_summary(self, faceted, statements):
+        faceted.list_artworks(status="accepted", limit=5)
+
+        assert not [statement for statement in statements if "FROM work_facets" in statement]
 
     def test_a_narrowed_query_does_restrict_them(self, faceted, statements):
         """The other side of the branch: when something narrows, the restriction is there."""
@@ -545,6 +551,94 @@ class TestTheCollectionIsNotAskedTheSameQuestionSixTimes:
         assert any("FROM artworks" in statement for statement in over_facets)
 
 
+class TestTheSummaryAgreesWithTheFacetTable:
+    """`facet_counts` is a second copy of a number, and this is what keeps it one number.
+
+    Every write that can move a count — recording a facet, removing one,
+    archiving or restoring the work — is followed by the same comparison: the
+    summary, read the way the listing reads it, against a `GROUP BY` over the
+    facet table itself. A trigger that missed a case would leave the first
+    screen offering counts the filtered grid then contradicts.
+    """
+
+    @staticmethod
+    def _live(catalogue_file, status):
+        """What the facet table says, counted the way the summary replaced."""
+        rows = catalogue_file.select_rows(
+            "SELECT f.kind AS kind, f.value AS value, COUNT(*) AS tally "
+            "FROM work_facets f JOIN artworks a ON a.id = f.artwork_id "
+            "WHERE ? IS NULL OR a.status = ? GROUP BY f.kind, f.value",
+            (status, status),
+        )
+        return {(row["kind"], row["value"].lower()): row["tally"] for row in rows}
+
+    @staticmethod
+    def _summarised(store, status):
+        counted = store.count_facet_values(list(VocabularyKind), WorkQuery(status=status))
+        return {(str(kind), value.lower()): tally for kind, tallies in counted.items() for value, tally in tallies.items()}
+
+    def _agree(self, store, catalogue_file):
+        for status in (None, ArtworkStatus.ACCEPTED, ArtworkStatus.ARCHIVED):
+            assert self._summarised(store, status) == self._live(catalogue_file, None if status is None else str(status))
+            vocabulary = store.facet_vocabulary(status=status)
+            held = {(str(kind), value.lower()) for kind, values in vocabulary.items() for value in values}
+            assert held == set(self._live(catalogue_file, None if status is None else str(status)))
+
+    def test_recording_and_removing_facets_moves_the_summary_with_them(self, faceted, store, catalogue_file):
+        self._agree(store, catalogue_file)
+        work = faceted.list_artworks(facets={"movement": ["Colour Field"]}).entries[0].artwork
+        (movement,) = [facet for facet in faceted.facets_for(work.id) if facet.kind is VocabularyKind.MOVEMENT]
+
+        faceted.remove_facet(work.id, facet_id=movement.id)
+        self._agree(store, catalogue_file)
+        faceted.record_facet(
+            artwork_id=work.id, kind=VocabularyKind.MOVEMENT, value="baroque", derivation=FacetDerivation.INFERRED
+        )
+
+        self._agree(store, catalogue_file)
+
+    def test_archiving_and_restoring_a_work_moves_its_facets_between_statuses(self, faceted, store, catalogue_file):
+        work = faceted.list_artworks(facets={"movement": ["Colour Field"]}).entries[0].artwork
+
+        faceted.archive_artwork(work.id)
+        self._agree(store, catalogue_file)
+        assert options(faceted.list_artworks(status="archived"), VocabularyKind.MOVEMENT) == {"Colour Field": 1}
+        assert "Colour Field" not in options(faceted.list_artworks(status="accepted"), VocabularyKind.MOVEMENT)
+
+        faceted.restore_artwork(work.id)
+        self._agree(store, catalogue_file)
+
+    def test_rewriting_a_work_without_changing_its_status_leaves_the_counts_alone(self, faceted, store, catalogue_file):
+        work = faceted.list_artworks().entries[0].artwork
+
+        store.update_artwork(replace(work, title="Retitled"))
+
+        self._agree(store, catalogue_file)
+
+    def test_a_file_with_facets_and_no_summary_is_counted_when_it_is_opened(self, tmp_path):
+        """A catalogue from before the summary gains it whole, not from the next write on."""
+        path = tmp_path / "catalogue.sqlite"
+        first = open_catalogue_file(path)
+        service = CatalogueService(SqliteCatalogue(first))
+        work = service.add_artwork(title="Interior with Four Windows")
+        service.record_facet(
+            artwork_id=work.id, kind=VocabularyKind.MOVEMENT, value="Baroque", derivation=FacetDerivation.INFERRED
+        )
+        # What a file written before the table holds: the facets, and nothing
+        # counting them. Dropping the stamp makes the next open the long one, as
+        # the schema change that introduced the table did.
+        first.close()
+        with closing(sqlite3.connect(path)) as connection:
+            connection.executescript('DELETE FROM facet_counts; DELETE FROM "store_meta";')
+
+        reopened = open_catalogue_file(path)
+        try:
+            listing = CatalogueService(SqliteCatalogue(reopened)).list_artworks()
+            assert options(listing, VocabularyKind.MOVEMENT) == {"Baroque": 1}
+        finally:
+            reopened.close()
+
+
 class TestTheFileCarriesFacetsWithoutAWrittenMigration:
     """A catalogue that predates the table gains it on the next open, and nothing else does.
 
@@ -558,9 +652,21 @@ class TestTheFileCarriesFacetsWithoutAWrittenMigration:
 
     @staticmethod
     def _without_facets() -> str:
-        """The catalogue schema as a file written before `work_facets` existed holds it."""
-        kept = [statement for statement in CATALOGUE_SCHEMA.split(";") if "work_facets" not in statement and statement.strip()]
-        return ";".join(kept) + ";"
+        """The catalogue schema as a file written before `work_facets` existed holds it.
+
+        Split where SQLite says a statement is complete rather than at every
+        semicolon, because a trigger's body holds several.
+        """
+        statements: list[str] = []
+        pending = ""
+        for fragment in CATALOGUE_SCHEMA.split(";"):
+            pending += fragment + ";"
+            if sqlite3.complete_statement(pending):
+                statements.append(pending)
+                pending = ""
+        return "".join(
+            statement for statement in statements if not any(table in statement for table in ("work_facets", "facet_counts"))
+        )
 
     def test_an_older_file_gains_the_table_and_its_uniqueness(self, tmp_path):
         path = tmp_path / "catalogue.sqlite"
@@ -0,0 +1,92 @@
+"""Weigh what loading the client costs a phone, before and after the bundle.
+
+Two loads, each two ways:
+
+* **Cold** — nothing cached. The plain tree moves every byte as it sits on disk;
+  the bundle moves each file's gzip sibling.
+* **Warm** — everything cached from an earlier load. The plain tree is served
+  with validators and no lifetime, so every file is asked about again and
+  answered with an empty 304; the bundle's files are `immutable`, so only the
+  shell is asked about.
+
+Bytes are counted from the real files and the real bundle. **Time is modelled,
+not measured in a browser**, on the throttled profile named below: a module is
+not requested until the module importing it has arrived and been parsed, so a
+load costs a round trip per level of the import graph plus its bytes over the
+link. That leaves out parse and execution time, which the bundle does not
+change, and it is the figure a real throttled profile is dominated by.
+
+    cd curation
+    uv run python tools/asset_weight.py
+    uv run python tools/asset_weight.py --rtt-ms 170 --mbps 9
+
+**The recorded result is in the commit that introduced the bundle.** Re-run
+after adding a module or changing how the client is served, and say what moved.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+_CURATION = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_CURATION / "src"))
+
+from curation.http.assets import SHELL, build_bundle  # noqa: E402
+from curation.http.pages import ASSETS_PATH, STATIC_DIR  # noqa: E402
+
+#: Relative imports, as the bundle reads them.
+_IMPORT = re.compile(r"""\b(?:from|import)\s*\(?\s*["'](\.{1,2}/[^"'\s]+)["']""")
+
+#: A 304 is headers only, and a few hundred bytes of them.
+_REVALIDATION_BYTES = 250
+
+
+def _say(line: str = "") -> None:
+    print(line)  # noqa: T201 - this tool's output IS a printed report
+
+
+def _depth(name: str, memo: dict[str, int]) -> int:
+    """How many round trips it takes to discover every module under `name`."""
+    if name not in memo:
+        source = STATIC_DIR / name
+        imports = _IMPORT.findall(source.read_text(encoding="utf-8"))
+        targets = [source.parent.joinpath(spec).resolve().relative_to(STATIC_DIR).as_posix() for spec in imports]
+        memo[name] = 1 + max((_depth(target, memo) for target in targets), default=0)
+    return memo[name]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rtt-ms", type=float, default=562.5, help="Round trip. Default 562.5, DevTools' Slow 4G.")
+    parser.add_argument("--mbps", type=float, default=1.6, help="Downlink. Default 1.6, DevTools' Slow 4G.")
+    arguments = parser.parse_args()
+
+    bundle = build_bundle(STATIC_DIR, prefix=ASSETS_PATH)
+    plain = {name: len((STATIC_DIR / name).read_bytes()) for name in bundle.names}
+    plain_shell = len((STATIC_DIR / SHELL).read_bytes())
+    sent = {name: len(bundle.assets[hashed].gzipped or bundle.assets[hashed].body) for name, hashed in bundle.names.items()}
+    sent_shell = len(bundle.shell.gzipped or bundle.shell.body)
+    # The shell, then the stylesheet and `app.js` beside each other, then the
+    # import graph under `app.js` one level at a time.
+    trips = 1 + _depth("app.js", {})
+
+    def seconds(round_trips: int, moved: int) -> float:
+        return round_trips * arguments.rtt_ms / 1000 + moved * 8 / (arguments.mbps * 1_000_000)
+
+    requests = 1 + len(plain)
+    rows = (
+        ("cold, plain", requests, plain_shell + sum(plain.values()), seconds(trips, plain_shell + sum(plain.values()))),
+        ("cold, bundled", requests, sent_shell + sum(sent.values()), seconds(trips, sent_shell + sum(sent.values()))),
+        ("warm, plain", requests, requests * _REVALIDATION_BYTES, seconds(trips, requests * _REVALIDATION_BYTES)),
+        ("warm, bundled", 1, _REVALIDATION_BYTES, seconds(1, _REVALIDATION_BYTES)),
+    )
+    _say(f"\n{len(plain)} client files; the import graph is {trips - 1} requests deep under the shell.")
+    _say(f"Modelled on {arguments.rtt_ms:g}ms round trips over {arguments.mbps:g}Mbps.\n")
+    for label, count, moved, elapsed in rows:
+        _say(f"{label:>14}: {count:3d} requests, {moved / 1024:7.1f}KiB moved, ~{elapsed:5.2f}s before the client can run")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
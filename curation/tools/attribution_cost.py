@@ -0,0 +1,168 @@
+"""Time what attributing a batch of acceptances costs against a large artist table.
+
+Accepting a work resolves its proposed painter against every artist the
+catalogue holds. That used to derive every held artist's key on every
+acceptance — once to look for the match, and again to look for near misses
+when none was found — so a batch accepted from the review grid cost the artist
+table's size in key derivations per work. `AttributionIndex` keys the table
+once and keeps it between acceptances. This times both, two ways:
+
+1. **Resolving alone**: every proposed name resolved against the table, keyed
+   afresh per name (`attribution.resolve`, the cost before the index) and
+   against one kept `HeldArtists`.
+2. **Accepting a batch**: `set_verdict(ACCEPTED)` for every work, end to end
+   through `DiscoveryService` — the transaction, the listing, the artwork and
+   source rows — with the index kept, and with it rebuilt from nothing for
+   every acceptance. The second is a floor under what the scan cost rather
+   than the scan itself: the scan keyed the table a second time for a name it
+   minted.
+
+The proposals are split between painters the table holds, new painters who
+share a surname with one it holds, and new painters who share nothing, so every
+path through `resolve` is in the batch. Both ways are checked to have attributed
+every work alike before either number is printed.
+
+**It writes nothing** outside a temporary directory it makes and leaves behind
+for the OS. No catalogue row, no file under a real `ART_ROOT`, no network.
+
+    cd curation
+    uv run python tools/attribution_cost.py
+    uv run python tools/attribution_cost.py --artists 10000 --works 400
+
+**The recorded result is in the commit that introduced the index.** Re-run it
+after changing `dedup.artist_key` or how acceptance attributes a work.
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+_CURATION = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_CURATION / "src"))
+# Imported rather than copied, for the reason `search_latency.py` gives.
+sys.path.insert(0, str(_CURATION / "tests"))
+
+from conftest import _GIVEN_NAMES, _SURNAMES  # noqa: E402
+
+from curation.discovery.dedup import RULES_VERSION  # noqa: E402
+from curation.persistence.discovery_records import InitiatedBy, Verdict  # noqa: E402
+from curation.persistence.file import open_catalogue_file  # noqa: E402
+from curation.persistence.records import AcquisitionMethod, Artist, SourceClass  # noqa: E402
+from curation.persistence.sqlite import SqliteCatalogue  # noqa: E402
+from curation.persistence.sqlite_discovery import SqliteDiscovery  # noqa: E402
+from curation.services import attribution  # noqa: E402
+from curation.services.catalogue import CatalogueService  # noqa: E402
+from curation.services.discovery import DiscoveryService  # noqa: E402
+
+
+def _say(line: str = "") -> None:
+    print(line)  # noqa: T201 - this tool's output IS a printed report
+
+
+def _painters(count: int, chance: random.Random) -> list[str]:
+    """Distinct three-part names, so the table shares forenames and surnames as a real one does."""
+    names = [f"{first} {second} {last}" for first, second, last in itertools.product(_GIVEN_NAMES, _GIVEN_NAMES, _SURNAMES)]
+    if count > len(names):
+        raise SystemExit(f"--artists may be at most {len(names)}: that is every name this tool can make")
+    return chance.sample(names, count)
+
+
+def _proposals(held: list[str], count: int, chance: random.Random) -> list[str]:
+    """Half painters the table holds, a quarter new ones sharing a held surname, a quarter sharing nothing."""
+    proposals = []
+    for n in range(count):
+        if n % 2 == 0:
+            proposals.append(chance.choice(held))
+        elif n % 4 == 1:
+            proposals.append(f"Nadia {chance.choice(held).split()[-1]}")
+        else:
+            proposals.append(f"Unheld Painter {n}")
+    return proposals
+
+
+def _accepting(directory: Path, painters: list[str], proposals: list[str], *, kept: bool) -> tuple[float, list[str]]:
+    """The batch, accepted against a fresh file: seconds taken, and who each work went to."""
+    catalogue_file = open_catalogue_file(directory / f"{uuid.uuid4().hex}.db")
+    try:
+        catalogue = CatalogueService(SqliteCatalogue(catalogue_file))
+        discovery = DiscoveryService(SqliteDiscovery(catalogue_file), catalogue)
+        with catalogue_file.transaction():
+            for name in painters:
+                catalogue.add_artist(name=name)
+            run = discovery.start_discovery_run(intent_text="Harbour scenes", initiated_by=InitiatedBy.MCP_CLIENT)
+            works = []
+            for n, proposed in enumerate(proposals):
+                work = discovery.propose_work(
+                    run_id=run.id,
+                    proposed_title=f"Harbour study no. {n}",
+                    rationale="The intent asked for harbours.",
+                    work_dedup_key=f"harbour study {n}",
+                    proposed_artist=proposed,
+                )
+                discovery.record_image(
+                    candidate_work_id=work.id,
+                    url=f"https://museum.example/{n}",
+                    provider="artic",
+                    source_class=SourceClass.INSTITUTIONAL,
+                    acquisition_method=AcquisitionMethod.DEZOOMIFY,
+                    confidence=0.9,
+                )
+                works.append(discovery.record_resolution(work.id).work)
+        if not kept:
+            # The table keyed from nothing on every acceptance, which is what
+            # the scan cost before the index existed.
+            discovery._attribution.held = lambda *, generation, rules, artists: attribution.HeldArtists(artists())
+        started = time.perf_counter()
+        outcomes = [discovery.set_verdict(work.id, Verdict.ACCEPTED) for work in works]
+        seconds = time.perf_counter() - started
+        names = [catalogue.get_artwork(outcome.work.artwork_id).artist.name for outcome in outcomes]
+        return seconds, names
+    finally:
+        catalogue_file.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--artists", type=int, default=5000, help="How many artists the catalogue holds. Default 5000.")
+    parser.add_argument("--works", type=int, default=200, help="How many works the batch accepts. Default 200.")
+    arguments = parser.parse_args()
+
+    chance = random.Random(20261019)
+    painters = _painters(arguments.artists, chance)
+    proposals = _proposals(painters, arguments.works, chance)
+    artists = [Artist(id=f"artist-{n}", name=name) for n, name in enumerate(painters)]
+
+    started = time.perf_counter()
+    afresh = [attribution.resolve(proposed, artists) for proposed in proposals]
+    afresh_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    index = attribution.AttributionIndex()
+    held = index.held(generation=0, rules=RULES_VERSION, artists=lambda: artists)
+    indexed = [held.resolve(proposed) for proposed in proposals]
+    indexed_seconds = time.perf_counter() - started
+    if afresh != indexed:
+        raise SystemExit("the kept index attributed a name differently from keying afresh — nothing below is comparable")
+
+    scratch = Path(tempfile.mkdtemp(prefix="attribution-cost-"))
+    before, before_names = _accepting(scratch, painters, proposals, kept=False)
+    after, after_names = _accepting(scratch, painters, proposals, kept=True)
+    if before_names != after_names:
+        raise SystemExit("the two batches attributed a work differently — nothing below is comparable")
+
+    per_work = 1000 / arguments.works
+    _say(f"\n{arguments.artists} artists; a batch of {arguments.works} proposals. Milliseconds.\n")
+    _say(f"{'':>28} {'whole batch':>12} {'per work':>9}")
+    _say(f"{'resolving, keyed afresh':>28} {afresh_seconds * 1000:12.1f} {afresh_seconds * per_work:9.3f}")
+    _say(f"{'resolving, index kept':>28} {indexed_seconds * 1000:12.1f} {indexed_seconds * per_work:9.3f}")
+    _say(f"{'accepting, keyed afresh':>28} {before * 1000:12.1f} {before * per_work:9.3f}")
+    _say(f"{'accepting, index kept':>28} {after * 1000:12.1f} {after * per_work:9.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,158 @@
+"""Split what a hundred-row listing costs into reading, shaping and encoding.
+
+The large listings — `/api/works`, `/api/runs/{id}/candidates` and the MCP
+`art_catalogue(action='list')` — are up to a hundred nested objects each, and it is
+tempting to blame the JSON encoder for what they cost. This times each stage
+separately, at the thousands scale, so the blame lands where the time is:
+
+1. **Reading**: the service call, which is every statement the page needs.
+2. **Shaping**: turning the service's records into the response models (HTTP) or
+   the payload dict (MCP).
+3. **Encoding**: the bytes. For HTTP this is the path FastAPI takes for a
+   declared response model — pydantic-core straight to bytes, with no
+   intermediate dict. For MCP it is the envelope's text block, timed beside the
+   `json.dumps` it replaced.
+
+**It writes nothing** outside a temporary directory it makes and leaves behind
+for the OS. No catalogue row, no file under a real `ART_ROOT`, no network.
+
+    cd curation
+    uv run python tools/listing_cost.py
+    uv run python tools/listing_cost.py --works 8000 --repeats 100
+
+**The recorded result is in the commit that moved the envelope onto
+pydantic-core.** Re-run after changing how any of these listings is read or
+written, and say which stage moved.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_CURATION = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_CURATION / "src"))
+# Imported rather than copied, for the reason `search_latency.py` gives.
+sys.path.insert(0, str(_CURATION / "tests"))
+
+from conftest import _open_seeded_catalogue  # noqa: E402
+from fakes import FakeEngine  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from curation.config import Settings  # noqa: E402
+from curation.http import api  # noqa: E402
+from curation.http.models import CandidatePageOut, WorkPageOut  # noqa: E402
+from curation.mcp.bindings import BINDINGS  # noqa: E402
+from curation.mcp.envelope import to_call_tool_result  # noqa: E402
+from curation.persistence.discovery_records import InitiatedBy  # noqa: E402
+from curation.persistence.sqlite import SqliteCatalogue  # noqa: E402
+from curation.persistence.sqlite_discovery import SqliteDiscovery  # noqa: E402
+from curation.services.container import Services  # noqa: E402
+from curation.services.display import DisplaySettings  # noqa: E402
+from curation.services.review import MAX_REVIEW_LIMIT, CandidatePage  # noqa: E402
+from curation.services.survey import WorkSurveyPage  # noqa: E402
+from curation.services.thumbnails import ThumbnailSettings  # noqa: E402
+
+#: The page size the works listings are timed at. The candidate grid is timed at
+#: its own ceiling, `MAX_REVIEW_LIMIT`, which is smaller.
+_ROWS = 100
+
+
+def _say(line: str = "") -> None:
+    print(line)  # noqa: T201 - this tool's output IS a printed report
+
+
+def _ms(step: Callable[[], Any], repeats: int) -> tuple[float, Any]:
+    result = step()
+    started = time.perf_counter()
+    for _ in range(repeats):
+        step()
+    return (time.perf_counter() - started) / repeats * 1000, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--works", type=int, default=4000, help="How many works the catalogue holds. Default 4000.")
+    parser.add_argument("--repeats", type=int, default=50, help="How many times each stage is timed. Default 50.")
+    arguments = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix="listing-cost-"))
+    os.environ["ART_ROOT"] = str(scratch)
+    settings = Settings.from_env()
+    catalogue_file, _, _ = _open_seeded_catalogue(settings.catalogue_path, size=arguments.works, seed=7)
+    try:
+        services = Services.bind(
+            catalogue=SqliteCatalogue(catalogue_file),
+            discovery=SqliteDiscovery(catalogue_file),
+            display_settings=DisplaySettings(
+                art_root=settings.art_root,
+                rotation_interval_seconds=settings.rotation_interval_seconds,
+                shuffle=settings.rotation_shuffle,
+            ),
+            thumbnails=ThumbnailSettings(art_root=settings.art_root, directory=settings.thumbnails_path),
+            artwork_box=settings.tv_artwork_box,
+            engine=FakeEngine(),
+            discovery_settings=settings.discovery_settings,
+        )
+        run = services.discovery.start_discovery_run(intent_text="Harbour scenes", initiated_by=InitiatedBy.MCP_CLIENT)
+        for n in range(MAX_REVIEW_LIMIT):
+            services.discovery.propose_work(
+                run_id=run.id,
+                proposed_title=f"Harbour study no. {n}",
+                rationale="The intent asked for harbours.",
+                work_dedup_key=f"harbour study {n}",
+            )
+
+        rows: list[tuple[str, float, float, float]] = []
+
+        def read_works() -> WorkSurveyPage:
+            return services.survey.list_works(status=None, q=None, facets={}, limit=_ROWS, offset=0)
+
+        read, page = _ms(read_works, arguments.repeats)
+
+        def shape_works() -> WorkPageOut:
+            return WorkPageOut(
+                works=[api._work(entry) for entry in page.entries],
+                total=page.total,
+                limit=page.limit,
+                offset=page.offset,
+                truncated=page.truncated,
+                facets=[api._facet_group(group) for group in page.facets],
+            )
+
+        shape, model = _ms(shape_works, arguments.repeats)
+        works_out = TypeAdapter(WorkPageOut)
+        encode, _ = _ms(lambda: works_out.dump_json(model), arguments.repeats)
+        rows.append(("GET /api/works", read, shape, encode))
+
+        def read_candidates() -> CandidatePage:
+            return services.review.list_works(run.id, limit=MAX_REVIEW_LIMIT, offset=0, pictures=False)
+
+        read, candidates = _ms(read_candidates, arguments.repeats)
+        shape, model = _ms(lambda: api._candidate_page(candidates), arguments.repeats)
+        candidates_out = TypeAdapter(CandidatePageOut)
+        encode, _ = _ms(lambda: candidates_out.dump_json(model), arguments.repeats)
+        rows.append((f"GET /api/runs/{{id}}/candidates ({MAX_REVIEW_LIMIT})", read, shape, encode))
+
+        listed, payload = _ms(lambda: BINDINGS[("art_catalogue", "list")](services, {"limit": _ROWS}), arguments.repeats)
+        encode, _ = _ms(lambda: to_call_tool_result(payload), arguments.repeats)
+        before, _ = _ms(lambda: json.dumps(payload, indent=2, default=str), arguments.repeats)
+
+        _say(f"\n{arguments.works} works; pages of {_ROWS} unless marked. Milliseconds per page.\n")
+        _say(f"{'':>34} {'read':>7} {'shape':>7} {'encode':>7}")
+        for label, read, shape, encode_ms in rows:
+            _say(f"{label:>34} {read:7.2f} {shape:7.2f} {encode_ms:7.2f}")
+        _say(f"{'art_catalogue list':>34} {listed:15.2f} {encode:7.2f}   (reading and shaping are one binding)")
+        _say(f"{'... with json.dumps, as was':>34} {'':>15} {before:7.2f}")
+    finally:
+        catalogue_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
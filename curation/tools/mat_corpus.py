@@ -32,6 +32,7 @@ import json
 import os
 import re
 import sys
+import time
 from pathlib import Path
 
 import httpx
@@ -136,7 +137,13 @@ def main() -> int:
         path = images / f"{index:02d}.jpg"
         path.write_bytes(body)
 
+        # Timed per work because this corpus is also the mat engine's regression
+        # set for speed: with `--no-model` the figure is the fallback's whole cost
+        # — decode, clustering and the ceiling — on the same 41 real paintings
+        # the colours are judged on.
+        started = time.perf_counter()
         choice = engine.choose(path)
+        seconds = time.perf_counter() - started
         spent += float(choice.cost_usd)
         fallbacks += choice.method.value == "dominant_color_fallback"
         distance = hex_distance(record.mat_hex, choice.hex_rgb)
@@ -151,9 +158,13 @@ def main() -> int:
                 "reason": choice.reason,
                 "fallback_detail": choice.fallback_detail,
                 "cost_usd": str(choice.cost_usd),
+                "seconds": round(seconds, 4),
             }
         )
-        print(f"    2024 {record.mat_hex}   now {choice.hex_rgb}  dE {distance:5.1f}  {choice.method.value}")  # noqa: T201
+        print(  # noqa: T201
+            f"    2024 {record.mat_hex}   now {choice.hex_rgb}  dE {distance:5.1f}  {choice.method.value}"
+            f"  {seconds * 1000:6.1f} ms"
+        )
 
         with Image.open(path) as source:
             work = source.convert("RGB")
@@ -176,10 +187,14 @@ def main() -> int:
 
     (arguments.out / "report.json").write_text(json.dumps({"compared": rows, "skipped": skipped}, indent=2))
     distances = sorted(row["delta_e"] for row in rows)
+    timings = sorted(row["seconds"] * 1000 for row in rows)
     print(  # noqa: T201
         f"\n{len(rows)} of {len(records)} works compared | mechanical fallbacks {fallbacks} | spent ${spent:.4f}\n"
         f"dE to the 2024 colour: min {distances[0] if distances else 0} "
-        f"median {distances[len(distances) // 2] if distances else 0} max {distances[-1] if distances else 0}"
+        f"median {distances[len(distances) // 2] if distances else 0} max {distances[-1] if distances else 0}\n"
+        f"ms per work: min {timings[0] if timings else 0:.1f} "
+        f"median {timings[len(timings) // 2] if timings else 0:.1f} max {timings[-1] if timings else 0:.1f} "
+        f"total {sum(timings):.0f}"
     )
     if skipped:
         # Named individually, not just counted: which works are missing decides
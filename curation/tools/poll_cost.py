@@ -0,0 +1,155 @@
+"""Measure what the screens' polling costs the plane while nothing is changing.
+
+The browser re-asks for its listings on a timer — the run view every two
+seconds, and every screen on every repaint — and on a quiet afternoon almost all
+of those asks land on a catalogue no commit has touched since the last one. This
+times a polling cycle over the five listings a screen repaints from, against a
+catalogue at the thousands scale, two ways:
+
+1. **Unconditional**, which is what every poll was before the listings carried
+   a validator: the answer computed and serialised from scratch.
+2. **Revalidated**, sending back the `ETag` the previous answer carried, which
+   is what `core/api.js` does now. Between commits that is an empty 304.
+
+The figure reported is process CPU, which is what a Pi shares with everything
+else it runs, scaled to a minute at the run view's two-second cadence. It
+includes the in-process client's own share of each request, which is the same
+in both columns — so the difference between them is the server's, and the
+ratio understates the saving rather than flattering it.
+
+**It writes nothing** outside a temporary directory it makes and leaves behind
+for the OS. No catalogue row, no file under a real `ART_ROOT`, no network, no
+money.
+
+    cd curation
+    uv run python tools/poll_cost.py
+    uv run python tools/poll_cost.py --works 8000 --cycles 200
+
+**The recorded result is in the commit that introduced the validators**, beside
+the figure it replaced. Re-run this after any change to how a listing is
+answered, and say what moved.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_CURATION = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_CURATION / "src"))
+# The corpus builder and the engine fake live with the fixtures that use them.
+# Imported rather than copied, for the reason `search_latency.py` gives: a second
+# builder would drift from the one the suite measures against.
+sys.path.insert(0, str(_CURATION / "tests"))
+
+from conftest import _open_seeded_catalogue  # noqa: E402
+from fakes import FakeEngine  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from curation.app import create_app  # noqa: E402
+from curation.config import Settings  # noqa: E402
+from curation.persistence.discovery_records import InitiatedBy  # noqa: E402
+from curation.persistence.sqlite import SqliteCatalogue  # noqa: E402
+from curation.persistence.sqlite_discovery import SqliteDiscovery  # noqa: E402
+from curation.services.container import Services  # noqa: E402
+from curation.services.display import DisplaySettings  # noqa: E402
+from curation.services.thumbnails import ThumbnailSettings  # noqa: E402
+
+#: The run view's cadence, `RUN_POLL_MS` in `screens/run.js`.
+_POLLS_PER_MINUTE = 30
+
+
+def _say(line: str = "") -> None:
+    print(line)  # noqa: T201 - this tool's output IS a printed report
+
+
+def _cycle(client: TestClient, paths: list[str], tags: dict[str, str] | None) -> None:
+    """Ask for every listing once, revalidating when there are tags to send."""
+    for path in paths:
+        headers = {} if tags is None or path not in tags else {"If-None-Match": tags[path]}
+        response = client.get(path, headers=headers)
+        if response.status_code not in (200, 304):
+            raise SystemExit(f"{path} answered {response.status_code}: {response.text}")
+        if tags is not None and "etag" in response.headers:
+            tags[path] = response.headers["etag"]
+
+
+def _cpu_per_cycle(client: TestClient, paths: list[str], cycles: int, *, revalidate: bool) -> float:
+    tags: dict[str, str] | None = {} if revalidate else None
+    _cycle(client, paths, tags)
+    started = time.process_time()
+    for _ in range(cycles):
+        _cycle(client, paths, tags)
+    return (time.process_time() - started) / cycles
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--works", type=int, default=4000, help="How many works the catalogue holds. Default 4000.")
+    parser.add_argument("--members", type=int, default=200, help="How many works the hanging theme holds. Default 200.")
+    parser.add_argument("--candidates", type=int, default=60, help="How many works the run proposes. Default 60.")
+    parser.add_argument("--cycles", type=int, default=100, help="How many polling cycles to time. Default 100.")
+    arguments = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix="poll-cost-"))
+    # The process environment wins over `.env`, so this is the one deployment
+    # value the tool has to state; everything else is the shipped default.
+    os.environ["ART_ROOT"] = str(scratch)
+    settings = Settings.from_env()
+    catalogue_file, _, works = _open_seeded_catalogue(settings.catalogue_path, size=arguments.works, seed=7)
+    try:
+        services = Services.bind(
+            catalogue=SqliteCatalogue(catalogue_file),
+            discovery=SqliteDiscovery(catalogue_file),
+            display_settings=DisplaySettings(
+                art_root=settings.art_root,
+                rotation_interval_seconds=settings.rotation_interval_seconds,
+                shuffle=settings.rotation_shuffle,
+            ),
+            thumbnails=ThumbnailSettings(art_root=settings.art_root, directory=settings.thumbnails_path),
+            artwork_box=settings.tv_artwork_box,
+            engine=FakeEngine(),
+            discovery_settings=settings.discovery_settings,
+        )
+        wall = services.display.survey_walls()[0].wall
+        theme = services.display.add_theme(name="Hanging")
+        with catalogue_file.transaction():
+            for work in works[: arguments.members]:
+                services.display.add_to_theme(theme_id=theme.id, artwork_id=work.id)
+        services.display.activate_theme(theme.id, wall_id=wall.id)
+        run = services.discovery.start_discovery_run(intent_text="Harbour scenes", initiated_by=InitiatedBy.MCP_CLIENT)
+        for n in range(arguments.candidates):
+            services.discovery.propose_work(
+                run_id=run.id,
+                proposed_title=f"Harbour study no. {n}",
+                rationale="The intent asked for harbours.",
+                work_dedup_key=f"harbour study {n}",
+            )
+
+        paths = [
+            "/api/works?offset=0",
+            "/api/themes",
+            "/api/walls",
+            f"/api/runs/{run.id}/candidates?offset=0",
+            f"/api/manifest?wall_id={wall.id}",
+        ]
+        with TestClient(create_app(services)) as client:
+            unconditional = _cpu_per_cycle(client, paths, arguments.cycles, revalidate=False)
+            revalidated = _cpu_per_cycle(client, paths, arguments.cycles, revalidate=True)
+
+        _say(f"\n{arguments.works} works, a {arguments.members}-work theme hanging, {arguments.candidates} candidates.")
+        _say(f"One cycle is {len(paths)} listings; a minute is {_POLLS_PER_MINUTE} cycles.\n")
+        for label, seconds in (("unconditional", unconditional), ("revalidated", revalidated)):
+            _say(
+                f"{label:>14}: {seconds * 1000:7.2f}ms CPU per cycle, "
+                f"{seconds * _POLLS_PER_MINUTE * 1000:8.1f}ms CPU per idle polling minute"
+            )
+    finally:
+        catalogue_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -146,6 +146,8 @@ def _measure(
 
     _heading("The whole answer a curator waits for — page, total, and a count per facet kind:")
     _report("unfiltered, first page", _time(lambda: service.list_artworks(limit=25), repeats=repeats))
+    _report("unfiltered, second page", _time(lambda: service.list_artworks(limit=25, offset=25), repeats=repeats))
+    _report("accepted only, first page", _time(lambda: service.list_artworks(status="accepted", limit=25), repeats=repeats))
     for label, term in _TERMS:
         matched = service.list_artworks(q=term, limit=25).total
         _report(
@@ -0,0 +1,147 @@
+"""Time the first look at a freshly accepted batch, with and without warming.
+
+A curator accepts a run, the works are acquired, and the next thing they do is
+open the grid. Every card on that first page asks for a thumbnail nobody has
+drawn yet, so each one waits on a decode of a master that can run to tens of
+megapixels. This times the first page of cards two ways, over works whose
+masters are real textured JPEGs at a museum scan's size:
+
+1. **Cold**, which is what every card did before thumbnails were warmed: the
+   request path decodes the master and draws the ladder while the browser
+   waits.
+2. **Warmed**, with `ThumbnailService.warm` run over the batch first — what the
+   warming thread does between acquisition and the curator's first click — so
+   each card is a row check and a file that is already there.
+
+It also reports what the grid moves over the wire per card at each size and
+encoding, which is the other half of what the ladder is for.
+
+**It writes nothing** outside a temporary directory it makes and leaves behind
+for the OS. No file under a real `ART_ROOT`, no network.
+
+    cd curation
+    uv run python tools/thumbnail_warmth.py
+    uv run python tools/thumbnail_warmth.py --works 100 --page 40 --edge 6000
+
+**The recorded result is in the commit that introduced warming.** Re-run after
+changing the ladder, the encoders or how a thumbnail is looked up, and say what
+moved.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_CURATION = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_CURATION / "src"))
+
+from PIL import Image, ImageFilter  # noqa: E402
+
+from curation.config import Settings  # noqa: E402
+from curation.persistence.file import open_catalogue_file  # noqa: E402
+from curation.persistence.records import AcquisitionMethod, FetchStatus, RightsStatus, SourceClass  # noqa: E402
+from curation.persistence.sqlite import SqliteCatalogue  # noqa: E402
+from curation.services.catalogue import CatalogueService  # noqa: E402
+from curation.services.thumbnails import THUMBNAIL_EDGES_PX, ThumbnailService, ThumbnailSettings  # noqa: E402
+
+
+def _say(line: str = "") -> None:
+    print(line)  # noqa: T201 - this tool's output IS a printed report
+
+
+def _hold(service: CatalogueService, art_root: Path, master: bytes, *, count: int, size: tuple[int, int]) -> list[str]:
+    """Catalogue `count` works, each holding a copy of `master` as its original."""
+    ids = []
+    for n in range(count):
+        work = service.add_artwork(title=f"Harbour study no. {n}")
+        source = service.add_source(
+            artwork_id=work.id,
+            url=f"https://museum.example/{n}",
+            provider="artic",
+            source_class=SourceClass.INSTITUTIONAL,
+            acquisition_method=AcquisitionMethod.DEZOOMIFY,
+            rights_status=RightsStatus.PUBLIC_DOMAIN,
+            is_primary=True,
+        )
+        relative = f"raw/{work.id}.jpg"
+        (art_root / relative).write_bytes(master)
+        service.record_original(
+            artwork_id=work.id,
+            source_id=source.id,
+            path=relative,
+            width=size[0],
+            height=size[1],
+            byte_size=len(master),
+            content_hash=f"hash-{n}",
+            fetch_status=FetchStatus.OK,
+        )
+        ids.append(work.id)
+    return ids
+
+
+def _page(thumbnails: ThumbnailService, ids: list[str]) -> float:
+    """Seconds to answer every card on one page of the grid, as the route does."""
+    started = time.perf_counter()
+    for artwork_id in ids:
+        thumbnails.thumbnail(artwork_id, webp=True)
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--works", type=int, default=100, help="How many works the batch accepted. Default 100.")
+    parser.add_argument("--page", type=int, default=40, help="Cards on the grid's first page. Default 40.")
+    parser.add_argument("--edge", type=int, default=4000, help="The masters' long edge in pixels. Default 4000.")
+    arguments = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix="thumbnail-warmth-"))
+    os.environ["ART_ROOT"] = str(scratch)
+    settings = Settings.from_env()
+    (settings.art_root / "raw").mkdir(parents=True, exist_ok=True)
+    size = (arguments.edge, arguments.edge * 3 // 4)
+    # Blurred noise in three channels rather than a flat fill, so the encoders
+    # have texture at about a brushstroke's scale to encode. A flat fill
+    # flatters both; raw noise is the one picture no codec can do anything with,
+    # and no painting looks like it.
+    channels = [Image.effect_noise(size, 96).filter(ImageFilter.GaussianBlur(arguments.edge / 800)) for _ in range(3)]
+    frame = Image.merge("RGB", channels)
+    staged = scratch / "master.jpg"
+    frame.save(staged, format="JPEG", quality=90)
+    master = staged.read_bytes()
+
+    catalogue_file = open_catalogue_file(settings.catalogue_path)
+    try:
+        service = CatalogueService(SqliteCatalogue(catalogue_file))
+        with catalogue_file.transaction():
+            cold = _hold(service, settings.art_root, master, count=arguments.works, size=size)
+            warmed = _hold(service, settings.art_root, master, count=arguments.works, size=size)
+        thumbnails = ThumbnailService(service, ThumbnailSettings(art_root=settings.art_root, directory=settings.thumbnails_path))
+
+        cold_seconds = _page(thumbnails, cold[: arguments.page])
+
+        started = time.perf_counter()
+        for artwork_id in warmed:
+            thumbnails.warm(artwork_id)
+        warming_seconds = time.perf_counter() - started
+        warmed_seconds = _page(thumbnails, warmed[: arguments.page])
+
+        mib = len(master) / 1_048_576
+        _say(f"\n{arguments.works} works, masters {size[0]}x{size[1]} ({mib:.1f} MiB); first page of {arguments.page}.\n")
+        _say(f"{'cold':>8}: {cold_seconds:7.2f}s for the page, {cold_seconds / arguments.page * 1000:7.1f}ms a card")
+        _say(f"{'warmed':>8}: {warmed_seconds:7.2f}s for the page, {warmed_seconds / arguments.page * 1000:7.1f}ms a card")
+        _say(f"{'':>8}  (warming the batch beforehand took {warming_seconds:.1f}s, off the request path)\n")
+        sample = warmed[0]
+        for edge in THUMBNAIL_EDGES_PX:
+            jpeg = thumbnails.thumbnail(sample, width=edge).stat().st_size
+            webp = thumbnails.thumbnail(sample, width=edge, webp=True).stat().st_size
+            _say(f"{edge:>6}px: JPEG {jpeg / 1024:6.1f}KiB, WebP {webp / 1024:6.1f}KiB ({webp / jpeg:.0%})")
+    finally:
+        catalogue_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+"""Time the catalogue's two widest writes: a thousands-scale seed and a theme renumber.
+
+`search_latency.py` measures what a curator waits for when they *read* the
+collection. This measures the two places the plane writes many rows in one go,
+because both were written row by row and both grow with the collection rather
+than with anything a curator does:
+
+1. **Seeding a 4,000-work index** into an empty catalogue through
+   `seed_catalogue` — the whole run, artists, works, sources and mat colours,
+   with no image files on disk (the notes those produce are part of a real run
+   against a tree that has not been copied yet, and no image is decoded here).
+2. **Renumbering a 200-member theme** by moving its last work to the front
+   through `DisplayService.move_in_theme`, which rewrites every position in the
+   theme — the widest write a single curator gesture makes.
+
+**It writes nothing** outside a temporary directory it makes and leaves behind
+for the OS. No catalogue row, no file under `ART_ROOT`, no network, no money.
+
+    cd curation
+    uv run python tools/write_latency.py
+    uv run python tools/write_latency.py --works 8000 --members 400 --repeats 50
+
+**The recorded result is in the commit that introduced the bulk writes**, beside
+the figure it replaced. Re-run this after any change to how either path writes,
+and say what moved; a figure with no way to reproduce it is a figure nobody can
+challenge.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+_CURATION = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_CURATION / "src"))
+
+from curation.persistence.file import open_catalogue_file  # noqa: E402
+from curation.persistence.records import AcquisitionMethod, SourceClass  # noqa: E402
+from curation.persistence.sqlite import SqliteCatalogue  # noqa: E402
+from curation.seed.ingest import seed_catalogue  # noqa: E402
+from curation.seed.legacy import LegacyRecord, ParsedArtist  # noqa: E402
+from curation.services.catalogue import CatalogueService  # noqa: E402
+from curation.services.display import DisplayService, DisplaySettings  # noqa: E402
+
+
+def _say(line: str = "") -> None:
+    print(line)  # noqa: T201 - this tool's output IS a printed report
+
+
+def _records(works: int) -> Sequence[LegacyRecord]:
+    """A synthetic index: one work per record, an artist per eight works.
+
+    Deterministic and plain on purpose. What is timed is how many rows are
+    written and how, and nothing about the records' text changes that.
+    """
+    return [
+        LegacyRecord(
+            url=f"https://example.org/works/{n}",
+            title=f"Study no. {n}",
+            artist=ParsedArtist(name=f"Painter {n % max(1, works // 8)}", nationality="Dutch", born=1800),
+            raw_path=f"raw/{n}.jpg",
+            ready_path=f"ready/{n}.jpg",
+            mat_hex="#f4f1ea",
+            provider="example.org",
+            source_class=SourceClass.INSTITUTIONAL,
+            acquisition_method=AcquisitionMethod.DIRECT_HTTP,
+            medium="Oil on canvas",
+        )
+        for n in range(works)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--works", type=int, default=4000, help="How many records to seed. Default 4000.")
+    parser.add_argument("--members", type=int, default=200, help="How many works the renumbered theme holds. Default 200.")
+    parser.add_argument("--repeats", type=int, default=20, help="How many renumbers to time. Default 20.")
+    arguments = parser.parse_args()
+
+    scratch = Path(tempfile.mkdtemp(prefix="write-latency-"))
+    catalogue_file = open_catalogue_file(scratch / "catalogue.sqlite")
+    try:
+        catalogue = SqliteCatalogue(catalogue_file)
+        service = CatalogueService(catalogue)
+        records = _records(arguments.works)
+
+        started = time.perf_counter()
+        report = seed_catalogue(records, catalogue=service, art_root=scratch)
+        seeded = time.perf_counter() - started
+        _say(f"\nSeeded {len(report.created)} works from {len(records)} records in {seeded:.2f}s.")
+
+        display = DisplayService(
+            catalogue, service, DisplaySettings(art_root=scratch, rotation_interval_seconds=600, shuffle=False)
+        )
+        theme = display.add_theme(name="Renumbered")
+        members = [work.work_id for work in report.works[: arguments.members]]
+        for artwork_id in members:
+            display.add_to_theme(theme_id=theme.id, artwork_id=artwork_id)
+
+        samples = []
+        for _ in range(arguments.repeats):
+            last = display.theme_works(theme.id)[-1].artwork.id
+            started = time.perf_counter()
+            display.move_in_theme(theme_id=theme.id, artwork_id=last, position=0)
+            samples.append(time.perf_counter() - started)
+        ordered = sorted(samples)
+        _say(
+            f"Moved the last of {len(members)} members to the front: median {statistics.median(ordered) * 1000:.1f}ms, "
+            f"worst {ordered[-1] * 1000:.1f}ms over {arguments.repeats} moves."
+        )
+    finally:
+        catalogue_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())